@@ -0,0 +1,42 @@
+#Measures the time to the first chart. Load the page as benchmark.html?eager to import the interactive editing code (dragtools)
+#at startup as well, as happened before it was split from dragcanvas, and compare.
+#Load it as benchmark.html?leak to also create and destroy charts 1000 times, and check that memory and the number of
+#keydown handlers on the document stay flat (the JS heap size is only available in Chromium-based browsers).
+from browser import document, html, window
+eager = "eager" in window.location.search
+
+timings = [("Brython ready", window.performance.now())]
+start = window.performance.now()
+import brycharts
+if eager: import brycharts.dragtools
+timings.append(("import brycharts" + (" and dragtools" if eager else ""), window.performance.now()-start))
+
+start = window.performance.now()
+freqdata = brycharts.FrequencyData(rawdata=list("HELLOWORLD"))
+brycharts.PieChart(document, freqdata, height="60vh")
+timings.append(("first chart", window.performance.now()-start))
+timings.append(("time to first chart", window.performance.now()))
+
+if not eager:
+    start = window.performance.now()
+    import brycharts.dragtools
+    timings.append(("dragtools (loaded on demand)", window.performance.now()-start))
+
+def leakcheck(cycles=1000):
+    data = brycharts.FrequencyData(rawdata=list("HELLOWORLD"))
+    pairs = brycharts.PairedData("x", "y", [(x, x*x) for x in range(50)])
+    memory = getattr(window.performance, "memory", None)
+    results = []
+    for i in range(1, cycles+1):
+        for chart in [brycharts.PieChart(document, data, height="20vh"), brycharts.LineGraph(document, pairs, height="20vh")]:
+            chart.destroy()
+        if i in (100, cycles):
+            heap = f"{memory.usedJSHeapSize/1048576:.1f} MB" if memory else "not available"
+            results.append((f"after {i} cycles: JS heap {heap}, keydown handlers", len(document.events("keydown"))))
+    return results
+
+if "leak" in window.location.search: timings.extend(leakcheck())
+
+rows = [html.TR(html.TD(name) + html.TD(f"{value:.0f} ms" if isinstance(value, float) else value)) for (name, value) in timings]
+document <= html.TABLE(rows)
+for (name, value) in timings: print(f"{name}: {value:.0f} ms" if isinstance(value, float) else f"{name}: {value}")
@@ -4,8 +4,9 @@ import brycharts
 
 def drawgraph():
     def oncomplete(request):
-        global count
+        global count, chart
         count += 1
+        if chart is not None: chart.destroy()
         document.clear()
         data = json.loads(request.responseText)
         ld = {}
@@ -23,10 +24,10 @@ def drawgraph():
 
         if count > 1:
             pdd = brycharts.PairedDataDict("Time", "Bikes available", timeseries)
-            brycharts.LineGraph(document, pdd, title)
+            chart = brycharts.LineGraph(document, pdd, title)
         else:
             ld = brycharts.LabelledData(ld, "Bikes available")
-            brycharts.BarChart(document, ld, title)
+            chart = brycharts.BarChart(document, ld, title)
         if count == 30: timer.clear_interval(timerid)
 
     req = ajax.ajax()
@@ -39,6 +40,7 @@ url = "https://api.tfl.gov.uk/BikePoint/"
 bikepoints = {85:"Tanner Street", 201:"Dorset Square", 307:"Black Lion Gate", 392:"Imperial College", 428:"Exhibition Road", 785:"Olympic Aquatic Centre"}
 timeseries = {place:[] for place in bikepoints.values()}
 count = 0
+chart = None
 title = "Bikes available at six bikepoints"
 drawgraph()
 timerid = timer.set_interval(drawgraph, 60000)
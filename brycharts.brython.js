@@ -1,3 +1,3 @@
 __BRYTHON__.use_VFS = true;
-var scripts = {"$timestamp": 1625231669019, "brycharts.bryaxes": [".py", "#!/usr/bin/python\n\n\n\n\n\n\n\n\nimport time\nfrom math import log10,floor,ceil\nimport browser.svg as svg\nfrom . import dragcanvas as SVG\nfrom .timeclasses import *\n\ndef rounddown(x,n):\n return floor(x /n)*n\n \ndef roundup(x,n):\n return ceil(x /n)*n\n \ndef getscaleintervals(xmin,xmax,mindivs):\n interval=xmax -xmin\n if interval ==0:return 1,1,1\n if mindivs <2:return interval,interval,interval\n X=interval /(mindivs -1)\n L=10 **floor(log10(X))\n xx=X /L\n Y=1 if xx <=2 else 2 if xx <=5 else 5 if xx <=10 else 10\n scaleinterval=Y *L\n if Y in {1,2,10}:\n  majordivisor,minordivisor=2,5\n elif Y ==5:\n  majordivisor,minordivisor=1,5\n return scaleinterval,majordivisor,minordivisor\n \nclass ScaledObjectMixin():\n def rescale(self,canvas):\n  (x,y)=self.anchorPoint\n  \n  self.attrs[\"transform\"]=f\"translate({x},{y}) scale({canvas.xScaleFactor},{-canvas.yScaleFactor}) translate({-x},{-y})\"\n  \nclass AxesTextObject(SVG.TextObject,ScaledObjectMixin):\n def __init__(self,canvas,string=\"\",anchorpoint=(0,0),anchorposition=1,fontsize=12):\n  super().__init__(string,anchorpoint,anchorposition,fontsize)\n  self.anchorPoint=anchorpoint\n  self.rescale(canvas)\n  canvas.scaledObjects.append(self)\n  \nclass AxesWrappingTextObject(SVG.WrappingTextObject,ScaledObjectMixin):\n def __init__(self,canvas,string=\"\",anchorpoint=(0,0),width=80,anchorposition=2,fontsize=12):\n  super().__init__(canvas,string,anchorpoint,width /canvas.xScaleFactor,anchorposition,fontsize)\n  self.anchorPoint=anchorpoint\n  self.rescale(canvas)\n  canvas.scaledObjects.append(self)\n  \nclass AxesPoint(svg.circle,ScaledObjectMixin):\n def __init__(self,canvas,XY=(0,0),colour=\"black\",objid=None ):\n  (x,y)=XY\n  sf=canvas.scaleFactor\n  svg.circle.__init__(self,cx=float(x),cy=y,r=3,style={\"stroke\":\"#00000000\",\"stroke-width\":5,\"fill\":colour,\"vector-effect\":\"non-scaling-stroke\"})\n  self.anchorPoint=self.XY=SVG.Point(XY)\n  self.rescale(canvas)\n  if objid:self.id=objid\n  canvas.scaledObjects.append(self)\n  \n def _update(self):\n  pass\n  \nclass AxesPolyline(SVG.PolylineObject):\n def __init__(self,canvas,pointlist=[(0,0)],linecolour=\"black\",linewidth=1,fillcolour=\"none\",objid=None ):\n  super().__init__(pointlist,linecolour,linewidth,fillcolour,objid)\n  \n  newobj=SVG.PolylineObject(pointlist,linecolour,linewidth,fillcolour,objid)\n  newobj.style.strokeWidth=6 if canvas.mouseDetected else 10\n  newobj.style.opacity=0\n  for event in SVG.MOUSEEVENTS:newobj.bind(event,canvas._onHitTargetMouseEvent)\n  for event in SVG.TOUCHEVENTS:newobj.bind(event,canvas._onHitTargetTouchEvent)\n  newobj.reference=self\n  self.hitTarget=newobj\n  canvas.hittargets.append(newobj)\n  canvas.attachObject(newobj)\n  \nclass AxesLine(SVG.LineObject):\n def __init__(self,pointlist=[(0,0),(0,0)],style=\"solid\",linecolour=\"black\",linewidth=1,fillcolour=\"none\",objid=None ):\n  super().__init__(pointlist,style,linecolour,linewidth,fillcolour,objid)\n  self.style.vectorEffect=\"non-scaling-stroke\"\n  \nclass AxesGroup(svg.g):\n def __init__(self,objlist=[],objid=None ):\n  svg.g.__init__(self)\n  for obj in objlist:self.attach(obj)\n  if objid:self.id=objid\n  \nclass Axis(object):\n def __init__(self,minvalue,maxvalue,label=\"\",axisoptions={}):\n  defaults={\"showAxis\":True ,\"axisType\":\"float\",\"showArrow\":False ,\"fontSize\":12,\n  \"showScale\":True ,\"scaleInterval\":None ,\"majorDivisor\":None ,\"minorDivisor\":None ,\n  \"showMajorTicks\":True ,\"showMinorTicks\":True ,\"showMajorGrid\":True ,\"showMinorGrid\":False }\n  self.label=label\n  defaults.update(axisoptions)\n  for argname,value in defaults.items():\n   setattr(self,argname,value)\n  self.calculateDefaultTicks(minvalue,maxvalue,5)\n  self.min=roundtimedown(minvalue,self.scaleInterval)if self.axisType ==\"time\"else rounddown(minvalue,self.scaleInterval)\n  self.max=roundtimeup(maxvalue,self.scaleInterval)if self.axisType ==\"time\"else roundup(maxvalue,self.scaleInterval)\n  \n def calculateDefaultTicks(self,minvalue,maxvalue,mindivs):\n  if self.axisType ==\"time\":\n   self.scaleInterval,self.majorDivisor,self.minorDivisor=gettimescaleintervals(minvalue,maxvalue,mindivs)\n  else :\n   self.scaleInterval,self.majorDivisor,self.minorDivisor=getscaleintervals(minvalue,maxvalue,mindivs)\n   \n   \nclass BasicAxis(AxesGroup):\n def __init__(self,canvas,axis):\n  super().__init__()\n  axismin,axismax=float(axis.min),float(axis.max)\n  if axis.direction ==\"x\":\n   self.attach([AxesLine([(axismin,axis.position),(axismax,axis.position)]),\n   AxesTextObject(canvas,axis.label,(axismax,axis.position -3 *axis.tickLength),3,fontsize=axis.fontSize)])\n   if axis.showArrow:\n    self.attach([AxesLine([(axismax,axis.position),(axismax -axis.arrowLength,axis.position -axis.tickLength)]),\n    AxesLine([(axismax,axis.position),(axismax -axis.arrowLength,axis.position+axis.tickLength)])])\n  else :\n   self.attach([AxesLine([(axis.position,axismin),(axis.position,axismax)]),\n   AxesTextObject(canvas,axis.label,(axis.position,axismax),7,fontsize=axis.fontSize)])\n   if axis.showArrow:\n    self.attach([AxesLine([(axis.position,axismax),(axis.position -axis.tickLength,axismax -axis.arrowLength)]),\n    AxesLine([(axis.position,axismax),(axis.position+axis.tickLength,axismax -axis.arrowLength)])])\n    \nclass Ticks(AxesGroup):\n def __init__(self,axis,ticktype):\n  values=axis.majorTickValues if ticktype ==\"major\"else axis.minorTickValues\n  ticklength=axis.tickLength if ticktype ==\"major\"else axis.tickLength /2\n  tickend=axis.position -ticklength\n  super().__init__()\n  for v in values:\n   if axis.direction ==\"x\":\n    self.attach(AxesLine([(v,axis.position),(v,tickend)]))\n   else :\n    self.attach(AxesLine([(axis.position,v),(tickend,v)]))\n  axis.axisObjects.attach(self)\n  \nclass GridLines(AxesGroup):\n def __init__(self,axis,gridtype):\n  values=axis.majorTickValues if gridtype ==\"major\"else axis.minorTickValues\n  linemin,linemax=axis.gridMin,axis.gridMax\n  linestyle=\"faintdash1\"if gridtype ==\"major\"else \"faintdash2\"\n  super().__init__()\n  for v in values:\n   if axis.direction ==\"x\":\n    self.attach(AxesLine([(v,linemin),(v,linemax)],linestyle))\n   else :\n    self.attach(AxesLine([(linemin,v),(linemax,v)],linestyle))\n  axis.axisObjects.attach(self)\n  \nclass ScaleValues(AxesGroup):\n def __init__(self,canvas,axis):\n  super().__init__()\n  v=axis.min\n  while v <=axis.max:\n   v1=float(v)\n   if v1 !=axis.omitScale:\n    n=int(1 -log10(axis.scaleInterval))\n    scalestring=str(v)if axis.axisType ==\"time\"else str(int(v))if int(v)==v else f\"{v:.{n}f}\"\n    if axis.direction ==\"x\":\n     self.attach(AxesTextObject(canvas,scalestring,(v1,axis.position -axis.tickLength),2,fontsize=axis.fontSize))\n    else :\n     self.attach(AxesTextObject(canvas,scalestring,(axis.position -axis.tickLength,v1),6,fontsize=axis.fontSize))\n   v +=axis.scaleInterval\n  axis.axisObjects.attach(self)\n  \nclass AxesCanvas(SVG.CanvasObject):\n def __init__(self,parent,width,height,xAxis=None ,yAxis=None ,title=None ,objid=None ):\n  tt=time.time()\n  super().__init__(width,height,objid=objid)\n  parent <=self\n  self.attrs[\"preserveAspectRatio\"]=\"none\"\n  self.container=SVG.GroupObject(objid=\"panel\")\n  \n  self.container.attrs[\"transform\"]=\"scale(1,-1)\"\n  self.addObject(self.container)\n  self.mouseMode=SVG.MouseMode.PAN\n  self.lineWidthScaling=False\n  self.title=title\n  self.tooltip=None\n  self.bestFit=None\n  self.scaledObjects=[]\n  self.bind(\"touchstart\",self.clearTooltip)\n  self.bind(\"mousemove\",self.onMouseMove)\n  \n  tt=time.time()\n  \n  self.drawAxes(xAxis,yAxis)\n  \n  tt=time.time()\n  \n def attachObject(self,svgobject,fixed=False ):\n  if isinstance(svgobject,(AxesGroup,AxesLine,ScaledObjectMixin)):\n   self.container.attach(svgobject)\n  else :\n   self.container.addObject(svgobject,fixed)\n   \n def attachObjects(self,objectlist):\n  for obj in objectlist:\n   if isinstance(obj,(list,tuple)):\n    self.attachObjects(obj)\n   else :\n    self.attachObject(obj)\n    \n def removeObject(self,svgobject):\n  self.container.removeChild(svgobject)\n  if isinstance(svgobject,ScaledObjectMixin):\n   self.scaledObjects.remove(svgobject)\n   \n def rescaleObjects(self):\n \n  for obj in self.scaledObjects:\n   obj.rescale(self)\n   \n def fitContents(self):\n  if self.bestFit:\n   self.setViewBox(self.bestFit)\n   return self.bestFit\n  else :\n   super().fitContents()\n   self.rescaleObjects()\n   viewwindow=super().fitContents()\n   return viewwindow\n   \n def onMouseMove(self,event):\n  if not self.mouseDetected:\n   self.mouseDetected=True\n   for obj in self.objectDict.values():\n    if hasattr(obj,\"reference\"):\n     obj.style.strokeWidth=6\n     \n def clearTooltip(self,event):\n  if event.target !=self:return\n  if self.tooltip:self.tooltip.hide()\n  \n \"\"\"\n    def makeXScaleValue(self, x, y):\n        if param(xAxis,PiScaling)=1:\n            ApproxDecimaltoFraction(x/3.14159,99,FracPi())\n            if FracPi(0)=1:\n                Numerator=\"\"\n            elif FracPi(0)=-1:\n                Numerator=\"-\"\n            else:\n                Numerator=CStr(FracPi(0))\n\n            if FracPi(1)=1:\n                Denominator=\"\"\n            else:\n                Denominator=\"/\" & CStr(FracPi(1))\n                ScaleString=Numerator & \"\u03c0\" & Denominator\n        else:\n    \"\"\"\n \n def drawAxes(self,xAxis,yAxis):\n \n  xmin,xmax,ymin,ymax=float(xAxis.min),float(xAxis.max),float(yAxis.min),float(yAxis.max)\n  if xmax <=xmin or ymax <=ymin:return\n  self.setViewBox([(xmin,-ymax),(xmax,-ymin)])\n  (xAxis.direction,yAxis.direction)=(\"x\",\"y\")\n  xAxis.tickLength=yAxis.arrowLength=0.75 *xAxis.fontSize *self.yScaleFactor\n  yAxis.tickLength=xAxis.arrowLength=0.75 *yAxis.fontSize *self.xScaleFactor\n  xAxis.position=ymin if ymin >0 else ymax if ymax <0 else 0\n  yAxis.position=xmin if xmin >0 else xmax if xmax <0 else 0\n  xAxis.omitScale=yAxis.position if yAxis.showAxis and ymin <xAxis.position else None\n  yAxis.omitScale=xAxis.position if xAxis.showAxis and xmin <yAxis.position else None\n  xAxis.gridMin,xAxis.gridMax=ymin,ymax\n  yAxis.gridMin,yAxis.gridMax=xmin,xmax\n  self.container.clear()\n  \n  for axis in [xAxis,yAxis]:\n   if not axis.showAxis:continue\n   axis.basicAxis=BasicAxis(self,axis)\n   axis.axisObjects=AxesGroup(axis.basicAxis)\n   \n   axismin,axismax=float(axis.min),float(axis.max)\n   majortickinterval=float(axis.scaleInterval)/axis.majorDivisor\n   count=int(round((axismax -axismin)/majortickinterval))\n   majorcount=count if axis.showArrow else count+1\n   axis.majorTickValues=[axismin+i *majortickinterval for i in range(majorcount)]\n   if axis.showMinorTicks or axis.showMinorGrid:\n    minortickinterval=majortickinterval /axis.minorDivisor\n    count=count *axis.minorDivisor\n    axis.minorTickValues=[axismin+i *minortickinterval for i in range(count)if i %axis.minorDivisor !=0]\n    \n   if axis.showMinorTicks and minortickinterval >0.5 *axis.arrowLength:\n    axis.minorTicks=Ticks(axis,\"minor\")\n   if axis.showMajorTicks:\n    axis.majorTicks=Ticks(axis,\"major\")\n    \n    \n   if axis.showScale:\n    axis.scaleValues=ScaleValues(self,axis)\n    \n    \n    \n   if axis.showMinorGrid and minortickinterval >0.5 *axis.arrowLength:\n    axis.minorGrid=GridLines(axis,\"minor\")\n   if axis.showMajorGrid:\n    axis.majorGrid=GridLines(axis,\"major\")\n    \n   self.attachObject(axis.axisObjects)\n   \n   \n  self.xAxis=xAxis\n  self.yAxis=yAxis\n  if self.title:\n   self.attachObject(AxesTextObject(self,self.title,((xmin+xmax)/2,ymax+1.5 *yAxis.fontSize *self.yScaleFactor),8,yAxis.fontSize *1.25))\n  self.fitContents()\n", ["browser.svg", "brycharts", "brycharts.timeclasses", "math", "time"]], "brycharts.dragcanvas": [".py", "#!/usr/bin/python\n\n\n\n\n\n\nimport time\nfrom browser import document,alert,window\nimport browser.svg as svg\nimport browser.html as html\nfrom math import sin,cos,atan2,pi,hypot,floor,log10\nsvgbase=svg.svg(width=0,height=0)\nbasepoint=svgbase.createSVGPoint()\nlasttaptime=0\nMOUSEEVENTS=[\"mousedown\",\"mousemove\",\"mouseup\",\"mouseenter\",\"mouseleave\",\"click\"]\nTOUCHEVENTS=[\"touchstart\",\"touchmove\",\"touchend\"]\n\nclass Enum(list):\n def __init__(self,name,string):\n  values=string.split()\n  for i,value in enumerate(values):\n   setattr(self,value,i)\n   self.append(i)\n   \nMouseMode=Enum('MouseMode','NONE DRAG TRANSFORM DRAW EDIT PAN')\nTransformType=Enum('TransformType','NONE TRANSLATE ROTATE XSTRETCH YSTRETCH ENLARGE')\nPosition=Enum('Position','CONTAINS INSIDE OVERLAPS EQUAL DISJOINT')\n\nclass ObjectMixin(object):\n ''\n \n def cloneObject(self):\n  ''\n\n  \n  if isinstance(self,GroupObject):\n   newobject=self.__class__()\n   for obj in self.objectList:\n    if isinstance(obj,ObjectMixin):\n     newobj=obj.cloneObject()\n     newobject <=newobj\n     newobj.group=newobject\n     newobject.objectList.append(newobj)\n  elif isinstance(self,ObjectMixin):\n   if isinstance(self,ImageObject)and not self.imageloaded:raise RuntimeError(\"ImageObject cannot be cloned until fully loaded\")\n   if self.__class__ in shapetypes.values():\n    newobject=self.__class__()\n    \n   else :\n    for cls in self.__bases__:\n     if cls in shapetypes.values():\n      newobject=cls()\n      \n      break\n   for attrname in [\"XY\",\"pointList\",\"pointsetList\",\"angle\",\"fixed\",\"rotatestring\",\"centre\",\"_width\",\"_height\",\n   \"currentAspectRatio\",\"imageWidth\",\"imageHeight\",\"imageAspectRatio\",\"imageloaded\",\n   \"startangle\",\"endangle\",\"radius\"]:\n    attr=getattr(self,attrname,\"NO_SUCH_ATTRIBUTE\")\n    if attr ==\"NO_SUCH_ATTRIBUTE\":continue\n    newattr=list(attr)if isinstance(attr,list)else attr\n    setattr(newobject,attrname,newattr)\n  else :\n   return None\n   \n   \n  for key in self.attrs:\n   value=self.attrs[key]\n   newobject.attrs[key]=value\n  newobject.id=\"\"\n  return newobject\n  \n def setPointList(self,pointlist):\n  ''\n  self.pointList=[Point(coords)for coords in pointlist]\n  if isinstance(self,BezierObject):self.pointsetList=self._getpointsetlist(pointlist)\n  self._update()\n  self._updatehittarget()\n  \n def setStyle(self,attribute,value):\n  ''\n  self.style={attribute:value}\n  \n def _updatehittarget(self):\n  ''\n  hittarget=getattr(self,\"hitTarget\",None )\n  if hittarget:\n   hittarget.pointList=self.pointList\n   if isinstance(self,BezierObject):hittarget.pointsetList=self.pointsetList\n   if isinstance(self,(RectangleObject,EllipseObject,ImageObject,UseObject)):hittarget.angle=self.angle\n   hittarget._update()\n   \n def _transformedpointlist(self,matrix):\n  ''\n  newpointlist=[]\n  for point in self.pointList:\n   (basepoint.x,basepoint.y)=point\n   newpt=basepoint.matrixTransform(matrix)\n   newpointlist.append(Point((newpt.x,newpt.y)))\n  return newpointlist\n  \n def __repr__(self):\n  return f\"{self.__class__}{self.id}\"\n  \nclass SmoothBezierMixin(object):\n ''\n def _calculatecontrolpoints(self,points):\n  ''\n  [(x1,y1),(x2,y2),(x3,y3)]=points\n  (dx1,dy1)=((x2 -x1),(y2 -y1))\n  (dx3,dy3)=((x2 -x3),(y2 -y3))\n  d1=hypot(dx1,dy1)\n  d2=hypot(dx3,dy3)\n  if d1 ==0 or d2 ==0:return ((x2,y2),(x2,y2))\n  cos1,sin1=dx1 /d1,dy1 /d1\n  cos2,sin2=dx3 /d2,dy3 /d2\n  \n  (c1x,c1y)=(x2 -d1 *(cos1 -cos2)/2,y2 -d1 *(sin1 -sin2)/2)\n  (c2x,c2y)=(x2+d2 *(cos1 -cos2)/2,y2+d2 *(sin1 -sin2)/2)\n  c1=((c1x+x2)/2,(c1y+y2)/2)\n  c2=((c2x+x2)/2,(c2y+y2)/2)\n  return (Point(c1),Point(c2))\n  \n '''The following XxxObject classes share various common parameters and attributes.\n    ###Common Parameters\n    When created, as well as the paramters listed for each type of Object, they all share the following optional parameters:\n    `objid`: id of the object (for referencing in the document or using `canvas.getSelectedObject(id)`\n    (The following are not applicable to TextObject, WrappingTextObject, PointObject or UseObject)\n    `linecolour`: colour of the \"stroke\" or outline of the shape\n    `linewidth`: width of the outline of the shape (its \"stroke-width\")\n    `fillcolour`: colour of the interior of the shape (not applicable to LineObject). Use \"none\" if no fill desired.\n\n    ### Common Attributes\n    After creation and adding to the canvas using `canvas.addObject()`, they have following attributes:\n    `obj.fixed` (read/write): If set to `True`, the object cannot be dragged or transformed with the mouse (default `False`)\n    `obj.canvas` (read only): A reference to the canvas which contains the object\n    `obj.pointList` (read only): See individual object definitions for its meaning. (Not applicable to TextObject, WrappingTextObject or PointObject.)\n\n    They also share the following methods:\n    `obj.setPointList()`, `obj.setStyle()`, `obj.cloneObject`\n    '''\nclass LineObject(svg.line,ObjectMixin):\n ''\n\n \n def __init__(self,pointlist=[(0,0),(0,0)],style=\"solid\",linecolour=\"black\",linewidth=1,fillcolour=\"none\",objid=None ):\n  [(x1,y1),(x2,y2)]=pointlist\n  \n  if style ==\"faintdash1\":\n   dasharray=\"10,5\"\n   linecolour=\"grey\"\n  elif style ==\"faintdash2\":\n   dasharray=\"2,2\"\n   linecolour=\"lightgrey\"\n  else :\n   dasharray=None\n   \n  svg.line.__init__(self,x1=x1,y1=y1,x2=x2,y2=y2,style={\"stroke\":linecolour,\"strokeDasharray\":dasharray,\"stroke-width\":linewidth,\"fill\":\"none\"})\n  self.pointList=[Point(coords)for coords in pointlist]\n  if objid:self.id=objid\n  \n def _update(self):\n  [(x1,y1),(x2,y2)]=self.pointList\n  self.attrs[\"x1\"]=x1\n  self.attrs[\"y1\"]=y1\n  self.attrs[\"x2\"]=x2\n  self.attrs[\"y2\"]=y2\n  \nclass TextObject(svg.text,ObjectMixin):\n ''\n\n\n\n\n \n def __init__(self,string=\"\",anchorpoint=(0,0),anchorposition=1,fontsize=12,style=\"normal\",ignorescaling=False ,canvas=None ,objid=None ):\n  (x,y)=anchorpoint\n  stringlist=string.split(\"\\n\")\n  rowcount=len(stringlist)\n  if anchorposition in [3,6,9]:\n   horizpos=\"end\"\n  elif anchorposition in [2,5,8]:\n   horizpos=\"middle\"\n  else :\n   horizpos=\"start\"\n  lineheight=fontsize *1.2\n  if ignorescaling and canvas:\n   fontsize *=canvas.scaleFactor\n   lineheight *=canvas.scaleFactor\n  if anchorposition in [1,2,3]:\n   yoffset=fontsize\n  elif anchorposition in [4,5,6]:\n   yoffset=fontsize -lineheight *rowcount /2\n  else :\n   yoffset=fontsize -lineheight *rowcount\n   \n  svg.text.__init__(self,stringlist[0],x=x,y=y+yoffset,font_size=fontsize,text_anchor=horizpos)\n  for s in stringlist[1:]:\n   self <=svg.tspan(s,x=x,dy=lineheight)\n  if objid:self.id=objid\n  \nclass WrappingTextObject(svg.text):\n ''\n \n def __init__(self,canvas,string,anchorpoint,width,anchorposition=1,fontsize=12,style=\"normal\",ignorescaling=False ,objid=None ):\n  (x,y)=anchorpoint\n  lineheight=fontsize *1.2\n  if ignorescaling:\n   fontsize *=canvas.scaleFactor\n   lineheight *=canvas.scaleFactor\n  words=string.split()\n  svg.text.__init__(self,\"\",x=x,font_size=fontsize)\n  canvas <=self\n  tspan=svg.tspan(words.pop(0),x=x,dy=0)\n  self <=tspan\n  rowcount=1\n  for word in words:\n   tspan.text +=\" \"+word\n   if tspan.getComputedTextLength()>width:\n    tspan.text=tspan.text[:-len(word)-1]\n    tspan=svg.tspan(word,x=x,dy=lineheight)\n    self <=tspan\n    rowcount +=1\n    \n  if anchorposition in [3,6,9]:\n   horizpos=\"end\"\n  elif anchorposition in [2,5,8]:\n   horizpos=\"middle\"\n  else :\n   horizpos=\"start\"\n  self.attrs[\"text-anchor\"]=horizpos\n  if anchorposition in [1,2,3]:\n   yoffset=fontsize\n  elif anchorposition in [4,5,6]:\n   yoffset=fontsize *(1 -rowcount /2)\n  else :\n   yoffset=fontsize *(1 -rowcount)\n  self.attrs[\"y\"]=y+yoffset\n  if objid:self.id=objid\n  \nclass PolylineObject(svg.polyline,ObjectMixin):\n ''\n \n def __init__(self,pointlist=[(0,0)],linecolour=\"black\",linewidth=1,fillcolour=\"none\",objid=None ):\n  svg.polyline.__init__(self,style={\"stroke\":linecolour,\"stroke-width\":linewidth,\"fill\":fillcolour})\n  self.pointList=[Point(coords)for coords in pointlist]\n  self._update()\n  if objid:self.id=objid\n  \n def _update(self):\n  self.attrs[\"points\"]=\" \".join([str(point[0])+\",\"+str(point[1])for point in self.pointList])\n  \nclass PolygonObject(svg.polygon,ObjectMixin):\n ''\n \n def __init__(self,pointlist=[(0,0)],linecolour=\"black\",linewidth=1,fillcolour=\"yellow\",objid=None ):\n  svg.polygon.__init__(self,style={\"stroke\":linecolour,\"stroke-width\":linewidth,\"fill\":fillcolour})\n  self.attrs[\"points\"]=\" \".join([str(point[0])+\",\"+str(point[1])for point in pointlist])\n  if objid:self.id=objid\n  \n def _update(self):\n  self.attrs[\"points\"]=\" \".join([str(point[0])+\",\"+str(point[1])for point in self._pointList])\n  \n def __repr__(self):\n  return f\"polygon {self.id}\"if self.id else f\"polygon {id(self)}\"\n  \n def __str__(self):\n  return self.__repr__()\n  \n @property\n def pointList(self):\n  if getattr(self,\"_pointList\",None )is None :\n  \n   P=self.points\n   L=P.numberOfItems\n   self._pointList=[Point([P.getItem(i).x,P.getItem(i).y])for i in range(L)]\n  return self._pointList\n  \n @pointList.setter\n def pointList(self,pointlist):\n  self._pointList=[Point(coords)for coords in pointlist]\n  self._update()\n  \n def setPointList(self,pointlist):\n  self._pointList=[Point(coords)for coords in pointlist]\n  self._update()\n  \n def cloneObject(self):\n  newobject=self.__class__()\n  for key in self.attrs:\n   value=self.attrs[key]\n   newobject.attrs[key]=value\n  newobject.id=\"\"\n  \n  P=self.points\n  P2=newobject.points\n  L=P.numberOfItems\n  P2.clear()\n  for i in range(L):\n   pt=P.getItem(i)\n   P2.appendItem(pt)\n   \n  return newobject\n  \n def _transformpoints(self,points,matrix):\n  L=points.numberOfItems\n  for i in range(L):\n   pt=points.getItem(i)\n   newpt=pt.matrixTransform(matrix)\n   points.replaceItem(newpt,i)\n   \nclass RectangleObject(svg.rect,ObjectMixin):\n ''\n\n\n\n\n\n\n\n\n \n def __init__(self,pointlist=None ,centre=(0,0),width=0,height=None ,angle=0,linecolour=\"black\",linewidth=1,fillcolour=\"yellow\",objid=None ):\n  svg.rect.__init__(self,style={\"stroke\":linecolour,\"stroke-width\":linewidth,\"fill\":fillcolour})\n  self.angle=angle\n  if pointlist:\n   self.setPointList(pointlist)\n  else :\n   self.centre=Point(centre)\n   if not height:height=width\n   if height and not width:width=height\n   self._width=width\n   self._height=height\n   self.setPosition()\n  if objid:self.id=objid\n  \n def setPosition(self,centre=None ,width=None ,height=None ,angle=None ,preserveaspectratio=False ):\n  ''\n\n  \n  if centre:self.centre=Point(centre)\n  if width:\n   self._width=width\n   if preserveaspectratio and not height:self._height=width *self.currentAspectRatio\n  if height:\n   self._height=height\n   if preserveaspectratio and not width:self._width=height /self.currentAspectRatio\n  if angle is not None :self.angle=angle\n  \n  (cx,cy)=self.centre\n  self.pointList=[(cx -self._width /2,cy -self._height /2),(cx+self._width /2,cy+self._height /2)]\n  t=svgbase.createSVGTransform()\n  t.setRotate(self.angle,cx,cy)\n  self.pointList=self._transformedpointlist(t.matrix)\n  self._update()\n  self._updatehittarget()\n  \n def _update(self):\n  [(x1,y1),(x2,y2)]=self.pointList\n  (cx,cy)=((x1+x2)/2,(y1+y2)/2)\n  self.centre=Point((cx,cy))\n  self.rotatestring=self.style.transform=f\"translate({cx}px,{cy}px) rotate({self.angle}deg) translate({-cx}px,{-cy}px)\"\n  \n  t=svgbase.createSVGTransform()\n  t.setRotate(-self.angle,cx,cy)\n  basepointlist=self._transformedpointlist(t.matrix)\n  [(x1,y1),(x2,y2)]=basepointlist\n  self._width=abs(x2 -x1)\n  self._height=abs(y2 -y1)\n  if self._width !=0:self.currentAspectRatio=self._height /self._width\n  self.attrs[\"x\"]=x2 if x2 <x1 else x1\n  self.attrs[\"y\"]=y2 if y2 <y1 else y1\n  self.attrs[\"width\"]=self._width\n  self.attrs[\"height\"]=self._height\n  \nclass EllipseObject(svg.ellipse,ObjectMixin):\n ''\n\n\n\n\n\n\n\n\n\n \n def __init__(self,pointlist=None ,centre=(0,0),width=0,height=None ,angle=0,linecolour=\"black\",linewidth=1,fillcolour=\"yellow\",objid=None ):\n  svg.ellipse.__init__(self,style={\"stroke\":linecolour,\"stroke-width\":linewidth,\"fill\":fillcolour})\n  self.angle=angle\n  if pointlist:\n   self.setPointList(pointlist)\n  else :\n   self.centre=Point(centre)\n   if not height:height=width\n   if height and not width:width=height\n   self._width=width\n   self._height=height\n   self.setPosition()\n  if objid:self.id=objid\n  \n def setPosition(self,centre=None ,width=None ,height=None ,angle=None ,preserveaspectratio=False ):\n  ''\n\n  \n  if centre:self.centre=Point(centre)\n  if width:\n   self._width=width\n   if preserveaspectratio and not height:self._height=width *self.currentAspectRatio\n  if height:\n   self._height=height\n   if preserveaspectratio and not width:self._width=height /self.currentAspectRatio\n  if angle is not None :self.angle=angle\n  \n  (cx,cy)=self.centre\n  self.pointList=[(cx -self._width /2,cy -self._height /2),(cx+self._width /2,cy+self._height /2)]\n  t=svgbase.createSVGTransform()\n  t.setRotate(self.angle,cx,cy)\n  self.pointList=self._transformedpointlist(t.matrix)\n  self._update()\n  self._updatehittarget()\n  \n def _update(self):\n  [(x1,y1),(x2,y2)]=self.pointList\n  (cx,cy)=((x1+x2)/2,(y1+y2)/2)\n  self.centre=Point((cx,cy))\n  self.rotatestring=self.style.transform=f\"translate({cx}px,{cy}px) rotate({self.angle}deg) translate({-cx}px,{-cy}px)\"\n  \n  t=svgbase.createSVGTransform()\n  t.setRotate(-self.angle,cx,cy)\n  basepointlist=self._transformedpointlist(t.matrix)\n  [(x1,y1),(x2,y2)]=basepointlist\n  self._width=abs(x2 -x1)\n  self._height=abs(y2 -y1)\n  if self._width !=0:self.currentAspectRatio=self._height /self._width\n  self.attrs[\"cx\"]=(x1+x2)/2\n  self.attrs[\"cy\"]=(y1+y2)/2\n  self.attrs[\"rx\"]=self._width /2\n  self.attrs[\"ry\"]=self._height /2\n  \nclass CircleObject(svg.circle,ObjectMixin):\n ''\n\n \n def __init__(self,centre=(0,0),radius=0,pointlist=None ,linecolour=\"black\",linewidth=1,fillcolour=\"yellow\",objid=None ):\n  if pointlist:\n   self.pointList=[Point(coords)for coords in pointlist]\n  else :\n   (x,y)=centre\n   self.pointList=[Point((x,y)),Point((x+radius,y))]\n  svg.circle.__init__(self,style={\"stroke\":linecolour,\"stroke-width\":linewidth,\"fill\":fillcolour})\n  self._update()\n  if objid:self.id=objid\n  \n def _update(self):\n  [(x1,y1),(x2,y2)]=self.pointList\n  self.attrs[\"cx\"]=x1\n  self.attrs[\"cy\"]=y1\n  self.attrs[\"r\"]=hypot(x2 -x1,y2 -y1)\n  \nclass SectorObject(svg.path,ObjectMixin):\n ''\n\n\n\n \n def __init__(self,centre=(0,0),radius=0,startangle=0,endangle=0,pointlist=None ,linecolour=\"black\",linewidth=1,fillcolour=\"yellow\",objid=None ):\n  self.centre=Point(centre)\n  self.radius=radius\n  self.startangle=startangle\n  self.endangle=endangle\n  if pointlist:\n   self.pointList=pointlist\n  else :\n   (cx,cy)=centre\n   point1=Point((cx+radius *sin(startangle *pi /180),cy -radius *cos(startangle *pi /180)))\n   point2=Point((cx+radius *sin(endangle *pi /180),cy -radius *cos(endangle *pi /180)))\n   self.pointList=[self.centre,point1,point2]\n  svg.path.__init__(self,style={\"stroke\":linecolour,\"stroke-width\":linewidth,\"fill\":fillcolour})\n  self._update()\n  if objid:self.id=objid\n  \n def _update(self):\n  [(x0,y0),(x1,y1)]=self.pointList[:2]\n  (x2,y2)=self.pointList[-1]\n  r=hypot(x1 -x0,y1 -y0)\n  largeArcFlag=1 if (self.endangle -self.startangle)%360 >180 else 0\n  self.attrs[\"d\"]=f\"M {x0} {y0} L {x1} {y1} A {r} {r} 0 {largeArcFlag} 1 {x2} {y2} Z\"\n  \nclass UseObject(svg.use,ObjectMixin):\n ''\n\n\n\n\n\n\n\n\n \n def __init__(self,href=None ,origin=None ,centre=(0,0),width=None ,height=None ,angle=0,scale=None ,objid=None ):\n  svg.use.__init__(self,href=href)\n  document <=svgbase\n  tempgroup=svg.g()\n  tempgroup <=self\n  svgbase <=tempgroup\n  bbox=tempgroup.getBBox()\n  svgbase.removeChild(tempgroup)\n  document.body.removeChild(svgbase)\n  self._origwidth=bbox.width\n  self._origheight=bbox.height\n  self._origaspectratio=self._origheight /self._origwidth\n  (cx,cy)=(bbox.x+bbox.width /2,bbox.y+bbox.height /2)\n  self.originoffset=Point((-cx,-cy))\n  \n  if width and height:\n   (self._width,self._height)=(width,height)\n  elif width:\n   (self._width,self._height)=(width,width *self._origaspectratio)\n  elif height:\n   (self._width,self._height)=(height /self._origaspectratio,height)\n  else :\n   (self._width,self._height)=(self._origwidth,self._origheight)\n   \n   \n  if origin:\n   scalefactors=(self._width /self._origwidth,self._height /self._origheight)\n   self.centre=Point(origin)-self.originoffset *scalefactors\n  else :\n   self.centre=Point(centre)\n  self.angle=angle\n  self.setPosition()\n  if objid:self.id=objid\n  \n def setPosition(self,origin=None ,centre=None ,width=None ,height=None ,angle=None ,preserveaspectratio=False ):\n  ''\n\n\n  \n  if width:\n   self._width=width\n   if preserveaspectratio and not height:self._height=width *self.currentAspectRatio\n  if height:\n   self._height=height\n   if preserveaspectratio and not width:self._width=height /self.currentAspectRatio\n  if self._width !=0:self.currentAspectRatio=self._height /self._width\n  \n  if origin:\n   scalefactors=(self._width /self._origwidth,self._height /self._origheight)\n   self.centre=Point(origin)-self.originoffset *scalefactors\n  elif centre:\n   self.centre=Point(centre)\n  if angle is not None :self.angle=angle\n  \n  (cx,cy)=self.centre\n  self.pointList=[(cx -self._width /2,cy -self._height /2),(cx+self._width /2,cy+self._height /2)]\n  t=svgbase.createSVGTransform()\n  t.setRotate(self.angle,cx,cy)\n  self.pointList=self._transformedpointlist(t.matrix)\n  self._update()\n  self._updatehittarget()\n  \n def _update(self):\n  [(x1,y1),(x2,y2)]=self.pointList\n  (cx,cy)=((x1+x2)/2,(y1+y2)/2)\n  self.centre=Point((cx,cy))\n  self.rotatestring=f\"translate({cx}px,{cy}px) rotate({self.angle}deg) translate({-cx}px,{-cy}px)\"\n  (xscale,yscale)=(self._width /self._origwidth,self._height /self._origheight)\n  self.scalestring=f\"translate({cx}px,{cy}px) scale({xscale},{yscale}) translate({-cx}px,{-cy}px)\"\n  self.style.transform=self.rotatestring+self.scalestring\n  self.origin=self.centre+self.originoffset\n  (self.attrs[\"x\"],self.attrs[\"y\"])=self.origin\n  \nclass ImageObject(svg.image,ObjectMixin):\n ''\n\n\n\n\n\n\n\n\n\n \n def __init__(self,href=None ,pointlist=None ,centre=(0,0),width=0,height=None ,angle=0,objid=None ):\n  def initialise(event):\n   nonlocal width,height\n   self.imageWidth=img.naturalWidth\n   self.imageHeight=img.naturalHeight\n   \n   self.imageAspectRatio=self.imageHeight /self.imageWidth\n   \n   self.attrs[\"preserveAspectRatio\"]=\"none\"\n   self.angle=angle\n   if pointlist:\n    self.setPointList(pointlist)\n   else :\n    self.centre=Point(centre)\n    if not width and not height:\n     width=self.imageWidth\n     height=self.imageHeight\n    elif not height:\n     height=width *self.imageAspectRatio\n    elif not width:\n     width=height /self.imageAspectRatio\n    self._width=width\n    self._height=height\n    self._setuppointlist()\n   self.style.visibility=\"visible\"\n   self.imageloaded=True\n   loadcomplete=window.Event.new(\"loadcomplete\")\n   self.dispatchEvent(loadcomplete)\n   \n  super().__init__()\n  if objid:self.id=objid\n  self.imageloaded=False\n  self.style.visibility=\"hidden\"\n  if not href:return\n  self.attrs[\"href\"]=href\n  img=html.IMG()\n  img.bind(\"load\",initialise)\n  img.attrs[\"src\"]=href\n  \n def setPosition(self,centre=None ,width=None ,height=None ,angle=None ,preserveaspectratio=False ):\n  ''\n\n  \n  def set_position(event=None ):\n  \n   if centre:self.centre=Point(centre)\n   if width:\n    self._width=width\n    if preserveaspectratio and not height:self._height=width *self.currentAspectRatio\n   if height:\n    self._height=height\n    if preserveaspectratio and not width:self._width=height /self.currentAspectRatio\n   if angle is not None :self.angle=angle\n   self._setuppointlist()\n   \n  if self.imageloaded:\n   set_position()\n  else :\n   self.bind(\"loadcomplete\",set_position)\n   \n def _setuppointlist(self):\n  (cx,cy)=self.centre\n  self.pointList=[(cx -self._width /2,cy -self._height /2),(cx+self._width /2,cy+self._height /2)]\n  t=svgbase.createSVGTransform()\n  t.setRotate(self.angle,cx,cy)\n  self.pointList=self._transformedpointlist(t.matrix)\n  self._update()\n  self._updatehittarget()\n  \n def _update(self):\n  [(x1,y1),(x2,y2)]=self.pointList\n  (cx,cy)=((x1+x2)/2,(y1+y2)/2)\n  self.centre=Point((cx,cy))\n  self.rotatestring=self.style.transform=f\"translate({cx}px,{cy}px) rotate({self.angle}deg) translate({-cx}px,{-cy}px)\"\n  \n  t=svgbase.createSVGTransform()\n  t.setRotate(-self.angle,cx,cy)\n  basepointlist=self._transformedpointlist(t.matrix)\n  [(x1,y1),(x2,y2)]=basepointlist\n  self._width=abs(x2 -x1)\n  self._height=abs(y2 -y1)\n  if self._width !=0:self.currentAspectRatio=self._height /self._width\n  self.attrs[\"x\"]=x2 if x2 <x1 else x1\n  self.attrs[\"y\"]=y2 if y2 <y1 else y1\n  self.attrs[\"width\"]=self._width\n  self.attrs[\"height\"]=self._height\n  \nclass BezierObject(svg.path,ObjectMixin):\n ''\n\n\n\n\n \n def __init__(self,pointsetlist=None ,pointlist=[(0,0),(0,0)],linecolour=\"black\",linewidth=1,fillcolour=\"none\",objid=None ):\n  def toPoint(coords):\n   return None if coords is None else Point(coords)\n  svg.path.__init__(self,style={\"stroke\":linecolour,\"stroke-width\":linewidth,\"fill\":fillcolour})\n  if pointsetlist:\n   self.pointList=[Point(pointset[1])for pointset in pointsetlist]\n  else :\n   self.pointList=[Point(coords)for coords in pointlist]\n   pointsetlist=self._getpointsetlist(self.pointList)\n  self.pointsetList=[[toPoint(coords)for coords in pointset]for pointset in pointsetlist]\n  self._update()\n  if objid:self.id=objid\n  \n def _getpointsetlist(self,pointlist):\n  pointsetlist=[[None ,pointlist[0],(pointlist[0]+pointlist[1])/2]]\n  for i in range(1,len(pointlist)-1):\n   pointsetlist.append([(pointlist[i -1]+pointlist[i])/2,pointlist[i],(pointlist[i]+pointlist[i+1])/2])\n  pointsetlist.append([(pointlist[-2]+pointlist[-1])/2,pointlist[-1],None ])\n  return pointsetlist\n  \n def _updatepointsetlist(self):\n  if len(self.pointList)==2:\n   self.pointsetList=[[None ]+self.pointList,self.pointList+[None ]]\n  else :\n   cpoint=(self.pointList[-1]+self.pointList[-2])/2\n   self.pointsetList[-1]=[cpoint,self.pointList[-1],None ]\n   self.pointsetList[-2][2]=cpoint\n   \n def _update(self):\n  (dummy,(x1,y1),(c1x,c1y))=self.pointsetList[0]\n  ((c2x,c2y),(x2,y2),dummy)=self.pointsetList[-1]\n  self.plist=[\"M\",x1,y1,\"C\",c1x,c1y]+[x for p in self.pointsetList[1:-1]for c in p for x in c]+[c2x,c2y,x2,y2]\n  self.attrs[\"d\"]=\" \".join(str(x)for x in self.plist)\n  \nclass ClosedBezierObject(BezierObject):\n ''\n\n\n\n \n def __init__(self,pointsetlist=None ,pointlist=[(0,0),(0,0)],linecolour=\"black\",linewidth=1,fillcolour=\"yellow\",objid=None ):\n  svg.path.__init__(self,style={\"stroke\":linecolour,\"stroke-width\":linewidth,\"fill\":fillcolour})\n  if pointsetlist:\n   self.pointList=[Point(pointset[1])for pointset in pointsetlist]\n  else :\n   self.pointList=[Point(coords)for coords in pointlist]\n   pointsetlist=self._getpointsetlist(self.pointList)\n  self.pointsetList=[[Point(coords)for coords in pointset]for pointset in pointsetlist]\n  self._update()\n  if objid:self.id=objid\n  \n def _getpointsetlist(self,pointlist):\n  pointsetlist=[[(pointlist[0]+pointlist[-1])/2,pointlist[0],(pointlist[0]+pointlist[1])/2]]\n  for i in range(1,len(pointlist)-1):\n   pointsetlist.append([(pointlist[i -1]+pointlist[i])/2,pointlist[i],(pointlist[i]+pointlist[i+1])/2])\n  pointsetlist.append([(pointlist[-2]+pointlist[-1])/2,pointlist[-1],(pointlist[0]+pointlist[-1])/2])\n  return pointsetlist\n  \n def _updatepointsetlist(self):\n  if len(self.pointList)==2:\n   self.pointsetList=self._getpointsetlist(self.pointList)\n  else :\n   cpoint1,cpoint2=(self.pointList[-1]+self.pointList[-2])/2,(self.pointList[-1]+self.pointList[0])/2\n   self.pointsetList[-1]=(cpoint1,self.pointList[-1],cpoint2)\n   self.pointsetList[-2][2]=cpoint1\n   self.pointsetList[0][0]=cpoint2\n   \n def _update(self):\n  ((c1x,c1y),(x,y),(c2x,c2y))=self.pointsetList[0]\n  self.plist=[\"M\",x,y,\"C\",c2x,c2y]+[x for p in self.pointsetList[1:]for c in p for x in c]+[c1x,c1y,x,y]\n  self.attrs[\"d\"]=\" \".join(str(x)for x in self.plist)\n  \nclass SmoothBezierObject(SmoothBezierMixin,BezierObject):\n ''\n\n \n def __init__(self,pointlist=[(0,0),(0,0)],linecolour=\"black\",linewidth=1,fillcolour=\"none\",objid=None ):\n  self.pointList=[Point(coords)for coords in pointlist]\n  pointsetlist=self._getpointsetlist(self.pointList)\n  BezierObject.__init__(self,pointsetlist,linecolour=linecolour,linewidth=linewidth,fillcolour=fillcolour,objid=objid)\n  \n def _getpointsetlist(self,pointlist):\n  if len(pointlist)==2:return [[None ]+pointlist,pointlist+[None ]]\n  for i in range(1,len(pointlist)-1):\n   (c1,c2)=self._calculatecontrolpoints(pointlist[i -1:i+2])\n   if i ==1:\n    pointsetlist=[[None ,pointlist[0],(pointlist[0]+c1)/2]]\n   pointsetlist.append([c1,pointlist[i],c2])\n  pointsetlist.append([(pointlist[-1]+c2)/2,pointlist[-1],None ])\n  return pointsetlist\n  \n def _updatepointsetlist(self):\n  if len(self.pointList)==2:\n   self.pointsetList=[[None ]+self.pointList,self.pointList+[None ]]\n  else :\n   (c1,c2)=self._calculatecontrolpoints(self.pointList[-3:])\n   self.pointsetList[-1]=[(self.pointList[-1]+c2)/2,self.pointList[-1],None ]\n   self.pointsetList[-2]=[c1,self.pointList[-2],c2]\n   \nclass SmoothClosedBezierObject(SmoothBezierMixin,ClosedBezierObject):\n ''\n\n\n \n def __init__(self,pointlist=[(0,0),(0,0)],linecolour=\"black\",linewidth=1,fillcolour=\"yellow\",objid=None ):\n  self.pointList=[Point(coords)for coords in pointlist]\n  pointsetlist=self._getpointsetlist(self.pointList)\n  ClosedBezierObject.__init__(self,pointsetlist,linecolour=linecolour,linewidth=linewidth,fillcolour=fillcolour,objid=objid)\n  \n def _getpointsetlist(self,pointlist):\n  pointlist=[pointlist[-1]]+pointlist[:]+[pointlist[0]]\n  pointsetlist=[]\n  for i in range(1,len(pointlist)-1):\n   (c1,c2)=self._calculatecontrolpoints(pointlist[i -1:i+2])\n   pointsetlist.append([c1,pointlist[i],c2])\n  return pointsetlist\n  \n def _updatepointsetlist(self):\n  if len(self.pointList)==2:\n   self.pointsetList=self._getpointsetlist(self.pointList)\n  else :\n   L=len(self.pointList)\n   pointlist=self.pointList[:]+self.pointList[:2]\n   for j in range(L -2,L+1):\n    (c1,c2)=self._calculatecontrolpoints(pointlist[j -1:j+2])\n    self.pointsetList[j %L]=[c1,pointlist[j],c2]\n    \nclass PointObject(svg.circle,ObjectMixin):\n ''\n\n \n def __init__(self,XY=(0,0),colour=\"black\",pointsize=2,canvas=None ,objid=None ):\n  (x,y)=XY\n  sf=canvas.scaleFactor if canvas else 1\n  svg.circle.__init__(self,cx=x,cy=y,r=pointsize *sf,style={\"stroke\":colour,\"stroke-width\":1,\"fill\":colour,\"vector-effect\":\"non-scaling-stroke\"})\n  self._XY=None\n  self.XY=Point(XY)\n  if objid:self.id=objid\n  \n def _update(self):\n  pass\n  \n @property\n def XY(self):\n  return self._XY\n  \n @XY.setter\n def XY(self,XY):\n  self._XY=Point(XY)\n  self.attrs[\"cx\"]=self._XY[0]\n  self.attrs[\"cy\"]=self._XY[1]\n  \nclass RegularPolygon(PolygonObject):\n ''\n\n\n\n \n def __init__(self,sidecount=0,centre=None ,radius=None ,startpoint=None ,sidelength=None ,offsetangle=0,linecolour=\"black\",linewidth=1,fillcolour=\"yellow\",objid=None ):\n  pointlist=[]\n  if sidecount >0:\n   angle=2 *pi /sidecount\n   radoffset=offsetangle *pi /180\n   if not radius:radius=sidelength /(2 *sin(pi /sidecount))\n   if not centre:\n    (x,y)=startpoint\n    centre=(x -radius *sin(radoffset),y+radius *cos(radoffset))\n   (cx,cy)=centre\n   for i in range(sidecount):\n    t=radoffset+i *angle\n    pointlist.append(Point((cx+radius *sin(t),cy -radius *cos(t))))\n  PolygonObject.__init__(self,pointlist,linecolour,linewidth,fillcolour,objid)\n  if objid:self.id=objid\n  \nclass GroupObject(svg.g,ObjectMixin):\n ''\n\n\n\n\n\n\n\n \n def __init__(self,objlist=[],objid=None ):\n  svg.g.__init__(self)\n  if not isinstance(objlist,list):objlist=[objlist]\n  self.objectList=[]\n  self._canvas=None\n  for obj in objlist:\n   self.addObject(obj)\n  if objid:self.id=objid\n  \n def addObject(self,svgobject,fixed=False ):\n  canvas=self.canvas\n  if canvas is not None :canvas.addObject(svgobject,fixed)\n  self <=svgobject\n  svgobject.group=self\n  self.objectList.append(svgobject)\n  \n def addObjects(self,objectlist,fixed=False ):\n  canvas=self.canvas\n  for obj in objectlist:\n   if canvas is not None :canvas.addObject(obj,fixed)\n   self <=obj\n   obj.group=self\n   self.objectList.append(obj)\n   \n def _update(self):\n  pass\n  \n def removeObject(self,svgobject):\n  if not self.contains(svgobject):return\n  self.removeChild(svgobject)\n  self.objectList.remove(svgobject)\n  svgobject.group=None\n  try :\n   del self.canvas.objectDict[svgobject.id]\n  except (AttributeError,KeyError):\n   pass\n   \n def deleteAll(self):\n  if self.canvas:\n   for obj in self.objectList:del self.canvas.objectDict[obj.id]\n  while self.firstChild:self.removeChild(self.firstChild)\n  self.objectList=[]\n  \n def setStyle(self,attribute,value):\n  for obj in self.objectList:\n   obj.setStyle(attribute,value)\n   \n @property\n def canvas(self):\n  return self._canvas\n  \n @canvas.setter\n def canvas(self,canvas):\n  self._canvas=canvas\n  for obj in self.objectList:obj.canvas=canvas\n  \n @property\n def fixed(self):\n  return self._fixed\n  \n @fixed.setter\n def fixed(self,fixedvalue):\n  self._fixed=fixedvalue\n  for obj in self.objectList:obj.fixed=fixedvalue\n  \nclass Button(GroupObject):\n ''\n\n\n\n\n\n\n\n \n def __init__(self,position,size,text,onclick,fontsize=None ,fillcolour=\"lightgrey\",canvas=None ,objid=None ):\n  GroupObject.__init__(self)\n  if objid:self.id=objid\n  (x,y),(width,height)=position,size\n  self.button=RectangleObject([(x,y),(x+width,y+height)],fillcolour=fillcolour)\n  self.button.attrs[\"rx\"]=height /3\n  rowcount=text.count(\"\\n\")+1\n  if not fontsize:fontsize=height *0.75 /rowcount\n  self.label=TextObject(text,(x+width /2,y+height /2 -fontsize /8),anchorposition=5,fontsize=fontsize)\n  self.addObjects([self.button,self.label])\n  self.fixed=True\n  self.bind(\"mousedown\",self._onMouseDown)\n  self.bind(\"mouseup\",self._onMouseUp)\n  self.bind(\"click\",onclick)\n  self.bind(\"touchstart\",onclick)\n  self.attrs[\"cursor\"]=\"pointer\"\n  \n def _onMouseDown(self,event):\n  event.stopPropagation()\n  \n def _onMouseUp(self,event):\n  event.stopPropagation()\n  \n def setFillColour(self,colour):\n  self.button.style.fill=colour\n  \nclass ImageButton(GroupObject):\n ''\n\n\n \n def __init__(self,position,size,image,onclick,fontsize=None ,fillcolour=\"lightgrey\",canvas=None ,objid=None ):\n  GroupObject.__init__(self)\n  if objid:self.id=objid\n  (x,y),(width,height)=position,size\n  self.button=RectangleObject([(x,y),(x+width,y+height)],fillcolour=fillcolour)\n  self.button.attrs[\"rx\"]=height /3\n  image.style.transform=f\"translate({x+width/2}px,{y+height/2}px)\"\n  if canvas:\n   canvas <=image\n   bbox=image.getBBox()\n   canvas.removeChild(image)\n   scalefactor=min(width /bbox.width,height /bbox.height)*0.7\n   image.style.transform +=f\" scale({scalefactor})\"\n  self.addObjects([self.button,image])\n  self.fixed=True\n  self.bind(\"mousedown\",self._onMouseDown)\n  self.bind(\"mouseup\",self._onMouseUp)\n  self.bind(\"click\",onclick)\n  self.bind(\"touchstart\",onclick)\n  self.attrs[\"cursor\"]=\"pointer\"\n  \n def _onMouseDown(self,event):\n  event.stopPropagation()\n  \n def _onMouseUp(self,event):\n  event.stopPropagation()\n  \n def setFillColour(self,colour):\n  self.button.style.fill=colour\n  \nclass Definitions(svg.defs):\n ''\n\n \n def __init__(self,objlist=[],filename=None ):\n  svg.defs.__init__(self)\n  if filename:\n   self.innerHTML=open(filename).read()\n  for obj in objlist:self <=obj\n  \nclass CanvasObject(svg.svg):\n ''\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n \n \n def __init__(self,width=None ,height=None ,colour=\"white\",objid=None ):\n  svg.svg.__init__(self,style={\"backgroundColor\":colour})\n  if width:self.style.width=width\n  if height:self.style.height=height\n  self.id=objid if objid else f\"canvas{id(self)}\"\n  self.objectDict={}\n  \n  \n  self.mouseMode=MouseMode.NONE\n  self.vertexSnap=False\n  self.snapDistance=10\n  self.lineWidthScaling=True\n  \n  self.edgeSnap=False\n  self.snapAngle=10\n  self.transformTypes=TransformType\n  self.penColour=\"black\"\n  self.fillColour=\"yellow\"\n  self.penWidth=3\n  \n  \n  self.scaleFactor=1\n  self.mouseDetected=False\n  self.mouseOwner=None\n  self.selectedObject=None\n  self.dragStartCoords=None\n  self.viewWindow=None\n  self.tool=\"select\"\n  \n  \n  self.panning=False\n  self.centre=None\n  self.nextid=0\n  self.objectDict={}\n  self.hittargets=[]\n  self.handles=None\n  self.controlhandles=None\n  self.transformHandles=[]\n  self.selectedhandle=None\n  self.transformorigin=None\n  self.transformBBox=RectangleObject(linecolour=\"blue\",fillcolour=\"none\")\n  self.transformBBox.style.vectorEffect=\"non-scaling-stroke\"\n  self.rotateLine=LineObject(linecolour=\"blue\")\n  self.rotateLine.style.vectorEffect=\"non-scaling-stroke\"\n  self.attrs[\"preserveAspectRatio\"]=\"xMidYMid meet\"\n  \n  self.bind(\"mousedown\",self._onMouseDown)\n  self.bind(\"mousemove\",self._onMouseMove)\n  self.bind(\"mouseup\",self._onLeftUp)\n  self.bind(\"touchstart\",self._onTouchStart)\n  self.bind(\"touchmove\",self._onMouseMove)\n  self.bind(\"touchend\",self._onLeftUp)\n  self.bind(\"dragstart\",self._onDragStart)\n  self.bind(\"dblclick\",self._onDoubleClick)\n  self.bind(\"contextmenu\",self._onRightClick)\n  self.bind(\"wheel\",self._onWheel)\n  document.bind(\"keydown\",self._onKeyDown)\n  \n  \n def setViewBox(self,pointlist):\n  ''\n\n\n  \n  ((x1,y1),(x2,y2))=pointlist\n  self.attrs[\"viewBox\"]=f\"{x1} {y1} {x2-x1} {y2-y1}\"\n  self.viewBoxRect=[Point((x1,y1)),Point((x2,y2))]\n  self.centre=Point(((x1+x2)/2,(y1+y2)/2))\n  self.xScaleFactor,self.yScaleFactor=self._getScaleFactors()\n  self.scaleFactor=max(self.xScaleFactor,self.yScaleFactor)\n  bcr=self.getBoundingClientRect()\n  pt=self.createSVGPoint()\n  (pt.x,pt.y)=(bcr.left,bcr.top)\n  SVGpt=pt.matrixTransform(self.getScreenCTM().inverse())\n  (x1,y1)=(SVGpt.x,SVGpt.y)\n  (pt.x,pt.y)=(bcr.left+bcr.width,bcr.top+bcr.height)\n  SVGpt=pt.matrixTransform(self.getScreenCTM().inverse())\n  (x2,y2)=(SVGpt.x,SVGpt.y)\n  self.viewWindow=[Point((x1,y1)),Point((x2,y2))]\n  return self.viewWindow\n  \n def _getDimensions(self):\n  ''\n\n  \n  bcr=self.getBoundingClientRect()\n  self.attrs[\"width\"]=bcr.width\n  self.attrs[\"height\"]=bcr.height\n  return bcr.width,bcr.height\n  \n def fitContents(self):\n  ''\n  \n  bbox=self.getBBox()\n  if bbox.width ==0 or bbox.height ==0:return\n  wmargin,hmargin=bbox.width /50,bbox.height /50\n  self.viewWindow=self.setViewBox(((bbox.x -wmargin,bbox.y -hmargin),(bbox.x+bbox.width+wmargin,bbox.y+bbox.height+hmargin)))\n  return self.viewWindow\n  \n def getSVGcoords(self,event):\n  ''\n  x=event.changedTouches[0].clientX if \"touch\"in event.type else event.clientX\n  y=event.changedTouches[0].clientY if \"touch\"in event.type else event.clientY\n  pt=self.createSVGPoint()\n  (pt.x,pt.y)=(x,y)\n  SVGpt=pt.matrixTransform(self.getScreenCTM().inverse())\n  return Point((SVGpt.x,SVGpt.y))\n  \n def addObject(self,svgobject,fixed=False ):\n  ''\n\n\n\n\n\n  \n  def AddToDict(svgobj):\n   if not svgobj.id:\n    svgobj.id=f\"{self.id}_id{self.nextid}\"\n    self.nextid +=1\n   self.objectDict[svgobj.id]=svgobj\n   if not getattr(svgobj.style,\"vectorEffect\",None ):\n    if self.lineWidthScaling is False :svgobj.style.vectorEffect=\"non-scaling-stroke\"\n   if isinstance(svgobj,GroupObject):\n    for obj in svgobj.objectList:\n     AddToDict(obj)\n  if not hasattr(svgobject,\"fixed\"):svgobject.fixed=fixed\n  self <=svgobject\n  AddToDict(svgobject)\n  svgobject.canvas=self\n  return svgobject\n  \n def addObjects(self,objectlist,fixed=False ):\n  ''\n  for obj in objectlist:\n   if isinstance(obj,(list,tuple)):\n    self.addObjects(obj,fixed=fixed)\n   else :\n    self.addObject(obj,fixed=fixed)\n    \n def deleteObject(self,svgobject):\n  ''\n  def deletefromdict(svgobj):\n   if isinstance(svgobj,GroupObject):\n    for obj in svgobj.objectList:\n     deletefromdict(obj)\n   hittarget=getattr(svgobj,\"hitTarget\",None )\n   if hittarget:self.deleteObject(hittarget)\n   if svgobj.id in self.objectDict:del self.objectDict[svgobj.id]\n   \n  if not self.contains(svgobject):return\n  self.removeChild(svgobject)\n  deletefromdict(svgobject)\n  \n def deleteAll(self,event=None ):\n  ''\n  while self.firstChild:\n   self.removeChild(self.firstChild)\n  self.objectDict={}\n  \n def deleteSelection(self):\n  ''\n  if self.selectedObject:\n   if self.handles:self.deleteObject(self.handles)\n   if self.controlhandles:self.deleteObject(self.controlhandles)\n   hittarget=getattr(self.selectedObject,\"hitTarget\",None )\n   if hittarget:self.deleteObject(hittarget)\n   self.deleteObject(self.selectedObject)\n   self.selectedObject=self.handles=self.controlhandles=None\n   \n def translateObject(self,svgobject,offset):\n  ''\n  \n  offset=Point(offset)\n  if isinstance(svgobject,GroupObject):\n   for obj in svgobject.objectList:\n    self.translateObject(obj,offset)\n   boundary=getattr(svgobject,\"boundary\",None )\n   if boundary:self.translateObject(boundary,offset)\n  elif isinstance(svgobject,PointObject):\n   svgobject.XY +=offset\n  else :\n   svgobject.pointList=[point+offset for point in svgobject.pointList]\n   if isinstance(svgobject,BezierObject):\n    svgobject.pointsetList=[(p1+offset,p2+offset,p3+offset)for (p1,p2,p3)in svgobject.pointsetList]\n   svgobject._update()\n   svgobject._updatehittarget()\n   if isinstance(svgobject,PolygonObject):svgobject._segments=None\n   \n   \n def rotateElement(self,element,angle,centre=None ):\n  ''\n  \n  if not centre:\n   bbox=element.getBBox()\n   centre=(bbox.x+bbox.width /2,bbox.y+bbox.height /2)\n  (cx,cy)=centre\n  transformstring=f\"translate({cx}px,{cy}px) rotate({angle}deg) translate({-cx}px,{-cy}px)\"\n  element.style.transform=transformstring+element.style.transform\n  t=svgbase.createSVGTransform()\n  t.setRotate(angle,*centre)\n  \n  return t.matrix\n  \n def scaleElement(self,element,xscale,yscale=None ):\n  ''\n  \n  if not yscale:yscale=xscale\n  transformstring=f\"scale({xscale},{yscale})\"\n  element.style.transform=transformstring+element.style.transform\n  t=svgbase.createSVGTransform()\n  t.setScale(xscale,yscale)\n  \n  return t.matrix\n  \n def translateElement(self,element,vector):\n  ''\n  (dx,dy)=vector\n  transformstring=f\"translate({dx}px,{dy}px)\"\n  element.style.transform=transformstring+element.style.transform\n  t=svgbase.createSVGTransform()\n  t.setTranslate(*vector)\n  \n  return t.matrix\n  \n  \n @property\n def mouseMode(self):\n  return self._mouseMode\n  \n @mouseMode.setter\n def mouseMode(self,mm):\n  if mm in [MouseMode.DRAG,MouseMode.EDIT,MouseMode.TRANSFORM]:\n   self.createHitTargets()\n  currentmm=getattr(self,\"_mouseMode\",None )\n  if currentmm ==mm:return\n  if currentmm ==MouseMode.TRANSFORM:self.hideTransformHandles()\n  elif currentmm ==MouseMode.EDIT:self.deselectObject()\n  self._mouseMode=mm\n  if mm in [MouseMode.DRAG,MouseMode.PAN,MouseMode.TRANSFORM]:\n   self.tool=\"select\"\n   \n @property\n def lineWidthScaling(self):\n  return self._lineWidthScaling\n  \n @lineWidthScaling.setter\n def lineWidthScaling(self,lws):\n  currentlws=getattr(self,\"_lineWidthScaling\",None )\n  if currentlws ==lws:return\n  self._lineWidthScaling=lws\n  for objid in self.objectDict:\n   self.objectDict[objid].style.vectorEffect=\"none\"if lws else \"non-scaling-stroke\"\n   \n def _getScaleFactors(self):\n  ''\n  width,height=self._getDimensions()\n  \n  vbleft,vbtop,vbwidth,vbheight=[float(x)for x in self.attrs[\"viewBox\"].split()]\n  xScaleFactor=vbwidth /width if width !=0 else 1\n  yScaleFactor=vbheight /height if height !=0 else 1\n  return xScaleFactor,yScaleFactor\n  \n def createHitTargets(self):\n  try :\n   self._createEditHitTargets()\n  except AttributeError:\n   self._createHitTargets()\n   \n def _createHitTargets(self):\n  objlist=list(self.objectDict.values())\n  for obj in objlist:\n   if isinstance(obj,GroupObject):continue\n   if hasattr(obj,\"hitTarget\"):continue\n   if hasattr(obj,\"reference\"):continue\n   if isinstance(obj,UseObject):\n    newobj=RectangleObject(pointlist=obj.pointList,angle=obj.angle)\n   elif obj.style.fill !=\"none\"or obj.fixed:\n    continue\n   else :\n    newobj=obj.cloneObject()\n    newobj.style.strokeWidth=10 *self.scaleFactor if self.mouseDetected else 25 *self.scaleFactor\n   newobj.style.opacity=0\n   for event in MOUSEEVENTS:newobj.bind(event,self._onHitTargetMouseEvent)\n   for event in TOUCHEVENTS:newobj.bind(event,self._onHitTargetTouchEvent)\n   newobj.reference=obj\n   obj.hitTarget=newobj\n   self.hittargets.append(newobj)\n   \n   \n   \n   self.addObject(newobj)\n   \n def _onWheel(self,event):\n  if self.mouseMode ==MouseMode.PAN:\n   event.preventDefault()\n   zoomfactor=0.9 if event.deltaY <0 else 1.1\n   newviewbox=[self.centre+zoomfactor *(point -self.centre)for point in self.viewBoxRect]\n   self.setViewBox(newviewbox)\n   \n def _onRightClick(self,event):\n \n  pass\n  \n def _onDragStart(self,event):\n  event.preventDefault()\n  \n def _onTouchStart(self,event):\n  event.preventDefault()\n  global lasttaptime\n  latesttaptime=time.time()\n  if event.touches.length ==1 and latesttaptime -lasttaptime <0.3:\n   for function in self.events(\"dblclick\"):\n    function(event)\n  else :\n   self._onLeftDown(event)\n  lasttaptime=latesttaptime\n  \n def _onMouseDown(self,event):\n  event.preventDefault()\n  if not self.mouseDetected:\n   self.mouseDetected=True\n   for obj in self.objectDict.values():\n    if hasattr(obj,\"reference\"):\n     if isinstance(obj.reference,UseObject):continue\n     obj.style.strokeWidth=10 *self.scaleFactor\n  if event.button >0:return\n  self._onLeftDown(event)\n  \n def _onLeftDown(self,event):\n  if self.mouseMode ==MouseMode.DRAG:\n   self._prepareDrag(event)\n  elif self.mouseMode ==MouseMode.TRANSFORM:\n   self._prepareTransform(event)\n  elif self.mouseMode ==MouseMode.DRAW:\n   self._drawPoint(event)\n  elif self.mouseMode ==MouseMode.EDIT:\n   self._prepareEdit(event)\n  elif self.mouseMode ==MouseMode.PAN:\n   self._preparePan(event)\n   \n def _onMouseMove(self,event):\n  event.preventDefault()\n  if self.mouseMode ==MouseMode.PAN:\n   if self.panning:self._doPan(event)\n   return\n  if not self.mouseOwner:return\n  if self.mouseMode ==MouseMode.DRAG:\n   self._doDrag(event)\n  else :\n   self._movePoint(event)\n   \n def _onLeftUp(self,event):\n  if event.type ==\"mouseup\"and event.button >0:return\n  if self.mouseMode ==MouseMode.PAN:\n   self._endPan(event)\n   return\n  if not self.mouseOwner:return\n  if self.mouseMode ==MouseMode.DRAG:\n   self._endDrag(event)\n  elif self.mouseMode ==MouseMode.TRANSFORM:\n   self._endTransform(event)\n   self.mouseOwner=None\n  elif self.mouseMode ==MouseMode.EDIT:\n   self._endEdit(event)\n   \n def _onHitTargetMouseEvent(self,event):\n  eventdict={attr:getattr(event,attr)for attr in dir(event)}\n  eventdict[\"bubbles\"]=False\n  newevent=window.MouseEvent.new(event.type,eventdict)\n  obj=self.objectDict[event.target.id]\n  obj.reference.dispatchEvent(newevent)\n  \n def _onHitTargetTouchEvent(self,event):\n  eventdict={attr:getattr(event,attr)for attr in dir(event)}\n  eventdict[\"bubbles\"]=False\n  newevent=window.TouchEvent.new(event.type,eventdict)\n  obj=self.objectDict[event.target.id]\n  obj.reference.dispatchEvent(newevent)\n  latesttime=time.time()\n  if event.type ==\"touchend\"and latesttime -lasttaptime <0.6:\n   eventdict[\"clientX\"]=event.changedTouches[0].clientX\n   eventdict[\"clientY\"]=event.changedTouches[0].clientY\n   newevent=window.MouseEvent.new(\"click\",eventdict)\n   obj.reference.dispatchEvent(newevent)\n   \n def _onDoubleClick(self,event):\n  if self.mouseMode ==MouseMode.DRAW:\n   self.setTool(\"select\")\n  elif self.mouseMode ==MouseMode.PAN:\n   self.fitContents()\n   \n def _onKeyDown(self,event):\n  if event.keyCode ==46:self.deleteSelection()\n  \n def _prepareDrag(self,event):\n  self.dragStartCoords=self.getSVGcoords(event)\n  self.selectedObject=self.getSelectedObject(event.target.id)\n  if self.selectedObject and not self.selectedObject.fixed:\n   self.mouseOwner=self.selectedObject\n   self <=self.mouseOwner\n   if (hittarget :=getattr(self.mouseOwner,\"hitTarget\",None )):self <=hittarget\n   self.startx=event.targetTouches[0].clientX if \"touch\"in event.type else event.clientX\n   self.starty=event.targetTouches[0].clientY if \"touch\"in event.type else event.clientY\n   \n def _doDrag(self,event):\n  x=event.targetTouches[0].clientX if \"touch\"in event.type else event.clientX\n  y=event.targetTouches[0].clientY if \"touch\"in event.type else event.clientY\n  dx,dy=(x -self.startx)*self.scaleFactor,(y -self.starty)*self.scaleFactor\n  self.mouseOwner.style.transform=f\"translate({dx}px,{dy}px)\"\n  if isinstance(self.mouseOwner,[EllipseObject,RectangleObject,UseObject,ImageObject]):\n   self.mouseOwner.style.transform +=self.mouseOwner.rotatestring\n   if isinstance(self.mouseOwner,UseObject):self.mouseOwner.style.transform +=self.mouseOwner.scalestring\n   \n def _endDrag(self,event):\n  self.mouseOwner.style.transform=\"translate(0px,0px)\"\n  currentcoords=self.getSVGcoords(event)\n  offset=currentcoords -self.dragStartCoords\n  self.translateObject(self.mouseOwner,offset)\n  if self.edgeSnap:self._doEdgeSnap(self.mouseOwner)\n  elif self.vertexSnap:self._doVertexSnap(self.mouseOwner)\n  self.mouseOwner=None\n  \n def _preparePan(self,event):\n  if not self.centre:\n   (width,height)=self._getDimensions()\n   self.setViewBox([(0,0),(width,height)])\n  if \"touch\"in event.type and event.touches.length ==2:\n   point0=Point((event.touches[0].clientX,event.touches[0].clientY))\n   point1=Point((event.touches[1].clientX,event.touches[1].clientY))\n   self.startZoomLength=(point1 -point0).length()\n   \n  x=event.targetTouches[0].clientX if \"touch\"in event.type else event.clientX\n  y=event.targetTouches[0].clientY if \"touch\"in event.type else event.clientY\n  self.startPoint=Point((x,y))\n  self.startCentre=self.centre\n  self.panStart=self.viewBoxRect\n  self.panning=True\n  \n def _doPan(self,event):\n  if \"touch\"in event.type and event.touches.length ==2:\n   point0=Point((event.touches[0].clientX,event.touches[0].clientY))\n   point1=Point((event.touches[1].clientX,event.touches[1].clientY))\n   newzoomlength=(point1 -point0).length()\n   zoomfactor=self.startZoomLength /newzoomlength\n   \n   newviewbox=[self.centre+zoomfactor *(point -self.centre)for point in self.viewBoxRect]\n   self.setViewBox(newviewbox)\n   self.startZoomLength=newzoomlength\n  else :\n   x=event.targetTouches[0].clientX if \"touch\"in event.type else event.clientX\n   y=event.targetTouches[0].clientY if \"touch\"in event.type else event.clientY\n   sf=(self.xScaleFactor,self.yScaleFactor)if self.attrs[\"preserveAspectRatio\"]==\"none\"else self.scaleFactor\n   delta=(Point((x,y))-self.startPoint)*sf\n   \n   newviewbox=[point -delta for point in self.panStart]\n   self.setViewBox(newviewbox)\n   \n def _endPan(self,event):\n  self.panning=False\n  \n def getSelectedObject(self,objectid,getGroup=True ):\n  ''\n\n\n  \n  try :\n   svgobj=self.objectDict[objectid]\n  except KeyError:\n   return\n  try :\n   svgobj=svgobj.reference\n  except AttributeError:\n   pass\n  if getGroup:\n   while getattr(svgobj,\"group\",None ):\n    svgobj=svgobj.group\n  return svgobj\n  \n def _doVertexSnap(self,svgobject,checkpoints=None ):\n  if not hasattr(svgobject,\"pointList\"):return\n  snapd=self.snapDistance\n  bestdx=bestdy=bestd=None\n  bbox=svgobject.getBBox()\n  L,R,T,B=bbox.x,bbox.x+bbox.width,bbox.y,bbox.y+bbox.height\n  \n  if checkpoints is None :\n   checkpoints=[]\n   for objid in self.objectDict:\n    if objid ==svgobject.id:continue\n    obj=self.objectDict[objid]\n    if not hasattr(obj,\"pointList\"):continue\n    if hasattr(obj,\"reference\"):continue\n    if obj.style.visibility ==\"hidden\":continue\n    if objgroup :=getattr(obj,\"group\",None )and hasattr(objgroup,\"pointList\"):continue\n    bbox=obj.getBBox()\n    L1,R1,T1,B1=bbox.x,bbox.x+bbox.width,bbox.y,bbox.y+bbox.height\n    if L1 -R >snapd or R1 -L <-snapd or T1 -B >snapd or B1 -T <-snapd:continue\n    checkpoints.extend(obj.pointList)\n  if not checkpoints:return\n  checkpoints.sort(key=lambda p:p.coords)\n  objpoints=sorted(svgobject.pointList,key=lambda p:p.coords)\n  \n  checkstart=0\n  for i,point1 in enumerate(objpoints):\n   checkpoints=checkpoints[checkstart:]\n   if not checkpoints:break\n   try :\n    (tonextx,y)=objpoints[i+1]-point1\n   except IndexError:\n    tonextx=0\n   checkstart=0\n   for point2 in checkpoints:\n    (dx,dy)=point2 -point1\n    if abs(dx)<snapd and abs(dy)<snapd:\n     d=hypot(dx,dy)\n     if bestd is None or d <bestd:(bestd,bestdx,bestdy)=(d,dx,dy)\n    if tonextx -dx >snapd:checkstart +=1\n    if dx >snapd:break\n  if bestd:self.translateObject(svgobject,(bestdx,bestdy))\n  \nclass Point(object):\n ''\n def __init__(self,coords):\n  self.coords=list(coords.coords)if isinstance(coords,Point)else list(coords)\n  \n def __repr__(self):\n  return str(tuple(self.coords))\n  \n def __eq__(self,other):\n  if isinstance(other,Point):\n   return (self.coords ==other.coords)\n  elif isinstance(other,list):\n   return (self.coords ==other)\n  elif isinstance(other,tuple):\n   return (tuple(self.coords)==other)\n  else :\n   return False\n   \n def __lt__(self,other):\n  return self.coords <other.coords\n  \n def __add__(self,other):\n  if isinstance(other,Point):\n   return Point([xi+yi for (xi,yi)in zip(self.coords,other.coords)])\n  elif isinstance(other,(list,tuple)):\n   return Point([xi+yi for (xi,yi)in zip(self.coords,other)])\n  elif other is None :\n   return None\n  else :\n   return NotImplemented\n   \n def __radd__(self,other):\n  return self+other\n  \n def __iadd__(self,other):\n  if isinstance(other,(list,tuple)):\n   for i in range(len(self.coords)):\n    self.coords[i]+=other[i]\n  else :\n   for i in range(len(self.coords)):\n    self.coords[i]+=other.coords[i]\n  return self\n  \n def __sub__(self,other):\n  return Point([xi -yi for (xi,yi)in zip(self.coords,other.coords)])\n  \n def __rsub__(self,other):\n  return Point([xi -yi for (xi,yi)in zip(other.coords,self.coords)])\n  \n def __neg__(self):\n  return Point([-xi for xi in self.coords])\n  \n def __mul__(self,other):\n  if isinstance(other,(int,float)):\n   return Point([other *xi for xi in self.coords])\n  elif isinstance(other,(list,tuple)):\n   return Point([xi *yi for (xi,yi)in zip(self.coords,other)])\n  elif isinstance(other,Point):\n   return sum([xi *yi for (xi,yi)in zip(self.coords,other.coords)])\n  elif isinstance(other,Matrix):\n   return Point([self *col for col in other.cols])\n  else :\n   return NotImplemented\n   \n def __rmul__(self,other):\n  if isinstance(other,(int,float)):\n   return Point([other *xi for xi in self.coords])\n  elif isinstance(other,(list,tuple)):\n   return Point([xi *yi for (xi,yi)in zip(self.coords,other)])\n  elif isinstance(other,Point):\n   return sum([xi *yi for (xi,yi)in zip(self.coords,other.coords)])\n  else :\n   return NotImplemented\n   \n def __truediv__(self,other):\n  return Point([xi /other for xi in self.coords])\n  \n def __getitem__(self,i):\n  return self.coords[i]\n  \n def __hash__(self):\n  return hash(tuple(self.coords))\n  \n def __round__(self,n):\n  (x,y)=self.coords\n  return Point((round(float(x),n),round(float(y),n)))\n  \n def __len__(self):\n  return len(self.coords)\n  \n def length(self):\n  (x,y)=self.coords\n  return hypot(x,y)\n  \n def angle(self):\n  return atan2(self.coords[1],self.coords[0])\n  \n def anglefrom(self,other):\n  dot=other *self\n  cross=other.cross(self)\n  if cross ==0:cross=-0.0\n  angle=atan2(cross,dot)\n  return angle\n  \n def cross(self,other):\n  x1,y1=self.coords\n  x2,y2=other.coords\n  return x1 *y2 -y1 *x2\n  \n def roundsf(self,sf):\n  x,y=self.coords\n  return Point((roundsf(x,sf),roundsf(y,sf)))\n  \nclass Matrix(object):\n def __init__(self,rows):\n  self.rows=rows\n  self.cols=[Point([self.rows[i][j]for i in range(len(self.rows))])for j in range(len(self.rows[0]))]\n  \n def __str__(self):\n  return str(\"\\n\".join(str(row)for row in self.rows))\n  \n def __rmul__(self,other):\n  if isinstance(other,(list,tuple)):\n   return [Point([p *col for col in self.cols])for p in other]\n  else :\n   return Point([other *col for col in self.cols])\n   \ndef roundsf(x,sf=3):\n if x ==0:return 0\n return round(x,sf -int(floor(log10(abs(x))))-1)\n \nshapetypes={\"line\":LineObject,\"polygon\":PolygonObject,\"polyline\":PolylineObject,\n\"rectangle\":RectangleObject,\"ellipse\":EllipseObject,\"circle\":CircleObject,\"sector\":SectorObject,\n\"bezier\":BezierObject,\"closedbezier\":ClosedBezierObject,\"smoothbezier\":SmoothBezierObject,\"smoothclosedbezier\":SmoothClosedBezierObject}\n", ["browser", "browser.html", "browser.svg", "math", "time"]], "brycharts.statfns": [".py", "#!/usr/bin/python\n\n\n\n\n\n\ndef mean(values):\n return sum(values)/len(values)\n \ndef sum2(values):\n return sum(x *x for x in values)\n \ndef variance(values):\n return (sum2(values)/len(values)-mean(values)**2)\n \ndef stdev(values):\n return variance(values)**0.5\n \ndef percentileindex(p,n):\n x=n *p /100\n return (int(x),True )if x ==int(x)else (int(x)+1,False )\n \ndef quartiles(values):\n values.sort()\n n=len(values)\n i,exact=percentileindex(25,n)\n Q1=(values[i]+values[i+1])/2 if exact else values[i]\n i,exact=percentileindex(50,n)\n Q2=(values[i]+values[i+1])/2 if exact else values[i]\n i,exact=percentileindex(75,n)\n Q3=(values[i]+values[i+1])/2 if exact else values[i]\n return (Q1,Q2,Q3)\n \ndef regressioninfo(points):\n n=len(points)\n xvalues=[x[0]for x in points]\n yvalues=[x[1]for x in points]\n sx=sum(xvalues)\n sx2=sum2(xvalues)\n Sxx=sx2 -sx *sx /n\n sy=sum(yvalues)\n sy2=sum2(yvalues)\n Syy=sy2 -sy *sy /n\n sxy=sum(x *y for (x,y)in points)\n Sxy=sxy -sx *sy /n\n pmcc=Sxy /(Sxx *Syy)**0.5\n gradient=Sxy /Sxx\n yintercept=(sy -gradient *sx)/n\n return pmcc,gradient,yintercept\n \ndef convertifnumber(string):\n try :\n  x=float(string)\n except ValueError:\n  return string\n else :\n  n=int(x)\n  return n if n ==x else x\n  \nif __name__ ==\"__main__\":\n points=[(164,6.5),(153,3),(163,4),(157,8),(161,5),(155,4),(168,4),(174,7),(167,6),(164,7),(159,3),(167,6)]\n pmcc,gradient,yintercept=regressioninfo(points)\n print(pmcc,gradient,yintercept)\n", []], "brycharts": [".py", "from .brycharts import *\n", ["brycharts.brycharts"], 1], "brycharts.brycharts": [".py", "#!/usr/bin/python\n\n\n\n\n\n\nimport time\nimport json\nfrom math import sin,cos,pi,log10,exp,floor,ceil\nfrom . import dragcanvas as SVG\nfrom . import bryaxes\nfrom .statfns import *\nimport browser.svg as svg\n\nDEFAULT_COLOURS=[f\"hsl({a%360+22.5*(a//1080)},{(3-a//810)*100//3}%, 50%)\"for a in range(0,2160,135)]\nBARUNIT=10\n\ndef rounddown(x,n):\n return floor(x /n)*n\n \ndef roundup(x,n):\n return ceil(x /n)*n\n \ndef getscaleintervals(xmin,xmax,mindivs):\n interval=xmax -xmin\n if interval ==0:return 1,1,1\n if mindivs <2:return interval,interval,interval\n X=interval /(mindivs -1)\n L=10 **floor(log10(X))\n xx=X /L\n Y=1 if xx <=2 else 2 if xx <=5 else 5 if xx <=10 else 10\n scaleinterval=Y *L\n if Y in {1,2,10}:\n  majordivisor,minordivisor=2,5\n elif Y ==5:\n  majordivisor,minordivisor=1,5\n return scaleinterval,majordivisor,minordivisor\n \n \n \nclass LabelledData(dict):\n def __init__(self,data,valueslabel):\n  super().__init__(data)\n  self.valuesLabel=valueslabel\n  self.labels=list(self.keys())\n  self.Values=list(self.values())\n  self.maxValue=max(self.Values)\n  self.total=sum(self.Values)\n  self.percentages=[100 *value /self.total for value in self.Values]\n  \nclass LabelledDataDict(dict):\n def __init__(self,datadict,valueslabel):\n  if not isinstance(next(iter(datadict.values())),LabelledData):\n   datadict={key:LabelledData(ld,valueslabel)for (key,ld)in datadict.items()}\n  super().__init__(datadict)\n  self.maxValue=max(ld.maxValue for ld in self.values())\n  self.valuesLabel=valueslabel\n  labels=set()\n  for ld in self.values():labels.update(ld.keys())\n  self.labels=list(labels)\n  self.Values={label:[]for label in self.labels}\n  self.sums={label:[0]for label in self.labels}\n  for label in self.labels:\n   for ld in self.values():\n    value=ld.get(label,0)\n    self.Values[label].append(value)\n    self.sums[label].append(self.sums[label][-1]+value)\n  self.maxSum=max(sums[-1]for sums in self.sums.values())\n  \nclass FrequencyData(LabelledData):\n def __init__(self,data=None ,rawdata=None ,valueslabel=\"Frequency\"):\n  if rawdata:\n   data=self.fromRawData(rawdata)\n  super().__init__(data,valueslabel)\n  \n def fromRawData(self,rawdata):\n \n  counter={}\n  for x in rawdata:\n   if x in counter:\n    counter[x]+=1\n   else :\n    counter[x]=1\n  return sorted(counter.items())\n  \nclass FrequencyDataDict(LabelledDataDict):\n def __init__(self,datadict=None ,rawdatadict=None ,valueslabel=\"Frequency\"):\n  if rawdatadict:\n   fdd={key:FrequencyData(rawdata=rawdata,valueslabel=valueslabel)for (key,rawdata)in rawdatadict.items()}\n  else :\n   fdd={key:FrequencyData(data=data,valueslabel=valueslabel)for (key,data)in datadict.items()}\n  super().__init__(fdd,valueslabel)\n  \nclass PairedData(list):\n def __init__(self,xlabel,ylabel,data):\n  super().__init__(data)\n  self.xLabel=xlabel\n  self.yLabel=ylabel\n  self.xValues=[item[0]for item in data]\n  self.yValues=[item[1]for item in data]\n  self.xMin,self.xMax=min(self.xValues),max(self.xValues)\n  self.yMin,self.yMax=min(self.yValues),max(self.yValues)\n  \nclass TimeSeriesData(PairedData):\n def __init__(self,xlabel,ylabel,data):\n  if bryaxes.TimeCoord.startfloat ==0:\n   x0=min(x for (x,y)in data)\n   x1=max(x for (x,y)in data)\n   bryaxes.TimeCoord.startfloat=2 *x0.timestamp()-x1.timestamp()\n   hours=round((x1.timestamp()-x0.timestamp())/3600)\n   bryaxes.TimeCoord.scalefloat=hours if hours >0 else 1\n   bryaxes.TimeCoord.defaultformat=\"%H:%M:%S\"if hours <5 else \"%H:%M\"if hours <24 else \"%d/%m %H:%M\"if hours <840 else \"%d/%m/%y\"\n  data=[(bryaxes.TimeCoord(x),y)for (x,y)in data]\n  super().__init__(xlabel,ylabel,data)\n  \nclass PairedDataDict(dict):\n def __init__(self,xlabel,ylabel,datadict):\n  pdd={key:PairedData(xlabel,ylabel,pd)for (key,pd)in datadict.items()}\n  super().__init__(pdd)\n  self.xLabel=xlabel\n  self.yLabel=ylabel\n  self.xMin=min(pd.xMin for pd in pdd.values())\n  self.xMax=max(pd.xMax for pd in pdd.values())\n  self.yMin=min(pd.yMin for pd in pdd.values())\n  self.yMax=max(pd.yMax for pd in pdd.values())\n  \nclass TimeSeriesDataDict(dict):\n def __init__(self,xlabel,ylabel,datadict):\n  x0=min(x for data in datadict.values()for (x,y)in data)\n  x1=max(x for data in datadict.values()for (x,y)in data)\n  bryaxes.TimeCoord.startfloat=2 *x0.timestamp()-x1.timestamp()\n  hours=round((x1.timestamp()-x0.timestamp())/3600)\n  bryaxes.TimeCoord.scalefloat=hours if hours >0 else 1\n  bryaxes.TimeCoord.defaultformat=\"%H:%M:%S\"if hours <5 else \"%H:%M\"if hours <24 else \"%d/%m %H:%M\"if hours <840 else \"%d/%m/%y\"\n  pdd={key:TimeSeriesData(xlabel,ylabel,pd)for (key,pd)in datadict.items()}\n  super().__init__(pdd)\n  self.xLabel=xlabel\n  self.yLabel=ylabel\n  self.xMin=min(pd.xMin for pd in pdd.values())\n  self.xMax=max(pd.xMax for pd in pdd.values())\n  self.yMin=min(pd.yMin for pd in pdd.values())\n  self.yMax=max(pd.yMax for pd in pdd.values())\n  \nclass LabelledPairedData(dict):\n def __init__(self,xlabel,ylabel,data):\n  super().__init__(data)\n  self.xLabel=xlabel\n  self.yLabel=ylabel\n  self.xValues=[item[0]for item in data.values()]\n  self.yValues=[item[1]for item in data.values()]\n  self.xMin,self.xMax=min(self.xValues),max(self.xValues)\n  self.yMin,self.yMax=min(self.yValues),max(self.yValues)\n  \nclass LabelledPairedDataDict(dict):\n def __init__(self,xlabel,ylabel,datadict):\n  lpdd={key:LabelledPairedData(xlabel,ylabel,lpd)for (key,lpd)in datadict.items()}\n  super().__init__(lpdd)\n  self.xLabel=xlabel\n  self.yLabel=ylabel\n  self.xMin=min(lpd.xMin for lpd in lpdd.values())\n  self.xMax=max(lpd.xMax for lpd in lpdd.values())\n  self.yMin=min(lpd.yMin for lpd in lpdd.values())\n  self.yMax=max(lpd.yMax for lpd in lpdd.values())\n  \nclass BoxPlotData(list):\n def __init__(self,valueslabel,boxplotdata=None ,rawdata=None ):\n  if rawdata:\n   Q1,Q2,Q3=quartiles(rawdata)\n   boxplotdata=[min(rawdata),Q1,Q2,Q3,max(rawdata)]\n  super().__init__(boxplotdata)\n  self.valuesLabel=valueslabel\n  self.xMin=self[0]\n  self.xMax=self[-1]\n  \nclass BoxPlotDataDict(dict):\n def __init__(self,valueslabel,boxplotdatadict=None ,rawdatadict=None ):\n  if rawdatadict:\n   boxplotdatadict={}\n   for key,rawdata in rawdatadict.items():\n    boxplotdatadict[key]=BoxPlotData(valueslabel,rawdata=rawdata)\n  else :\n   boxplotdatadict={key:BoxPlotData(valueslabel,boxplotdata)for key,boxplotdata in boxplotdatadict.items()}\n  super().__init__(boxplotdatadict)\n  self.xMin=min(bpd.xMin for bpd in self.values())\n  self.xMax=max(bpd.xMax for bpd in self.values())\n  self.valuesLabel=valueslabel\n  \nclass GroupedFrequencyData(list):\n def __init__(self,valueslabel,data=None ,rawdata=None ,boundaries=None ,classwidth=None ):\n  if data:\n   (b,f)=data[-1]\n   if f !=0:data.append((2 *b -data[-2][0],0))\n  else :\n   datamin,datamax=min(rawdata),max(rawdata)\n   if not boundaries:\n    if not classwidth:classwidth,_,_=getscaleintervals(datamin,datamax,5)\n    minboundary=rounddown(datamin,classwidth)\n    maxboundary=roundup(datamax,classwidth)\n    boundaries=[minboundary]\n    while boundaries[-1]<maxboundary:boundaries.append(boundaries[-1]+classwidth)\n   else :\n    if datamin <boundaries[0]:\n     classwidth=boundaries[1]-boundaries[0]\n     boundaries.insert(0,rounddown(datamin,classwidth))\n    if datamax >boundaries[-1]:\n     classwidth=boundaries[-1]-boundaries[-2]\n     boundaries.append(roundup(datamax,classwidth))\n   data=self.fromRawData(rawdata,boundaries)\n  super().__init__(data)\n  self.boundaries=[item[0]for item in data]\n  self.frequencies=[item[1]for item in data]\n  self.xMin,self.xMax=self.boundaries[0],self.boundaries[-1]\n  self.maxFrequency=max(self.frequencies)\n  self.frequencyDensities=[]\n  for i in range(len(self.boundaries)-1):\n   self.frequencyDensities.append(self.frequencies[i]/(self.boundaries[i+1]-self.boundaries[i]))\n  self.maxFrequencyDensity=max(self.frequencyDensities)\n  self.valuesLabel=valueslabel\n  \n  \n  \n def fromRawData(self,rawdata,boundaries):\n  L=len(boundaries)\n  frequencies=[0]*L\n  for value in rawdata:\n   for i in range(L):\n    if value <boundaries[i+1]:\n     frequencies[i]+=1\n     break\n  return list(zip(boundaries,frequencies))\n  \n def mean(self):\n  self.midpoints=[(self[i][0]+self[i+1][0])/2 for i in range(len(self)-1)]\n  sumfx=sum(x *f for (x,f)in zip(self.midpoints,self.frequencies[:-1]))\n  sumf=sum(self.frequencies)\n  return sumfx /sumf\n  \n def variance(self):\n  m=self.mean()\n  sumfx2=sum(x *x *f for (x,f)in zip(self.midpoints,self.frequencies[:-1]))\n  sumf=sum(self.frequencies)\n  return sumfx2 /sumf -m *m\n  \nclass GroupedFrequencyDataDict(dict):\n def __init__(self,valueslabel,datadict=None ,rawdatadict=None ,boundaries=None ,classwidth=None ):\n  if rawdatadict:\n   gfdd={}\n   for key,rawdata in rawdatadict.items():\n    gfdd[key]=GroupedFrequencyData(valueslabel,rawdata=rawdata,boundaries=boundaries,classwidth=classwidth)\n  else :\n   gfdd={key:GroupedFrequencyData(valueslabel,gfd)for key,gfd in datadict.items()}\n  super().__init__(gfdd)\n  self.xMin=min(gfd.xMin for gfd in self.values())\n  self.xMax=max(gfd.xMax for gfd in self.values())\n  self.maxFrequency=max(gfd.maxFrequency for gfd in self.values())\n  self.maxFrequencyDensity=max(gfd.maxFrequencyDensity for gfd in self.values())\n  self.valuesLabel=valueslabel\n  \nclass CumulativeFrequencyData(list):\n def __init__(self,valueslabel,cumfreqdata=None ,groupedfreqdata=None ,rawdata=None ,boundaries=None ,classwidth=None ):\n  if rawdata:\n   groupedfreqdata=GroupedFrequencyData(valueslabel=valueslabel,rawdata=rawdata,boundaries=boundaries,classwidth=classwidth)\n  if groupedfreqdata:\n   cumfreqdata=self.fromGFD(groupedfreqdata)\n  else :\n   (b,f)=cumfreqdata[0]\n   if f !=0:cumfreqdata.insert(0,(2 *b -cft[1][0],0))\n  super().__init__(cumfreqdata)\n  self.boundaries=[item[0]for item in cumfreqdata]\n  self.cumfrequencies=[item[1]for item in cumfreqdata]\n  self.xMin,self.xMax=self.boundaries[0],self.boundaries[-1]\n  self.totalFrequency=self.cumfrequencies[-1]\n  self.valuesLabel=valueslabel\n  \n def fromGFD(self,groupedfreqdata):\n  (b,f)=groupedfreqdata[-1]\n  if f !=0:groupedfreqdata.append((2 *b -groupedfreqdata[-2][0],0))\n  L=len(groupedfreqdata)\n  boundaries,frequencies=zip(*groupedfreqdata)\n  cumfrequencies=[0]*L\n  for i in range(1,L):\n   cumfrequencies[i]=cumfrequencies[i -1]+frequencies[i -1]\n  return list(zip(boundaries,cumfrequencies))\n  \nclass CumulativeFrequencyDataDict(dict):\n def __init__(self,valueslabel,cfdatadict=None ,gfdatadict=None ,rawdatadict=None ,boundaries=None ,classwidth=None ):\n  if rawdatadict:\n   cfdd={}\n   for key,rawdata in rawdatadict.items():\n    cfdd[key]=CumulativeFrequencyData(valueslabel,rawdata=rawdata,boundaries=boundaries,classwidth=classwidth)\n  elif gfdatadict:\n   cfdd={key:CumulativeFrequencyData(valueslabel,groupedfreqdata=gfd)for key,gfd in gfdatadict.items()}\n  else :\n   cfdd={key:CumulativeFrequencyData(valueslabel,cfd)for key,cfd in cfdatadict.items()}\n  super().__init__(cfdd)\n  self.xMin=min(cfd.xMin for cfd in self.values())\n  self.xMax=max(cfd.xMax for cfd in self.values())\n  self.maxTotalFrequency=max(cfd.totalFrequency for cfd in self.values())\n  self.valuesLabel=valueslabel\n  \n  \n  \nclass PieChart(SVG.CanvasObject):\n def __init__(self,parent,data,title=\"\",colours=None ,usekey=True ,fontsize=14,width=\"95%\",height=\"95%\",objid=None ):\n  super().__init__(width,height,objid=objid)\n  parent <=self\n  self.tooltip=None\n  if not colours:colours=DEFAULT_COLOURS\n  if not usekey:\n   D=data.items()\n   n=len(D)\n   L=sorted(D,key=lambda x:x[1])\n   M=[]\n   for pair in zip(L[n //2:],L[:n //2]):M.extend(pair)\n   if n %2 ==1:M.append(L[-1])\n   data=LabelledData(M,data.valuesLabel)\n  angles=[0]\n  for percentage in data.percentages:\n   angles.append(angles[-1]+percentage *3.6)\n  self.sectors=[PieChartSector(self,(0,0),100,angles[i],angles[i+1],data.labels[i],data.Values[i],data.percentages[i],colours[i])for i in range(len(angles)-1)]\n  self.addObjects(self.sectors)\n  self.fitContents()\n  self.mouseMode=SVG.MouseMode.PAN\n  self.bind(\"touchstart\",self.clearTooltip)\n  \n  if usekey:\n   keysize=fontsize *1.25\n   keypos=SVG.Point((140,-len(data.labels)*keysize /2))\n   for i,label in enumerate(data.labels):\n    self.addObject(SVG.GroupObject([\n    SVG.RectangleObject([keypos,keypos+(fontsize,fontsize)],fillcolour=colours[i]),\n    SVG.TextObject(label,keypos+(keysize,fontsize /2),anchorposition=4,fontsize=fontsize)\n    ]))\n    keypos +=(0,keysize)\n   titlepos=(120,-110)\n  else :\n   anchorpositions=[7,4,1,3,6,9]\n   for i,label in enumerate(data.labels):\n    anglepos=(angles[i]+angles[i+1])/2\n    anchorposition=anchorpositions[int(anglepos //60)]\n    anchorpoint=(105 *sin(anglepos *pi /180),-105 *cos(anglepos *pi /180))\n    self.addObject(SVG.TextObject(label,anchorpoint,anchorposition,fontsize=fontsize))\n   titlepos=(0,-130)\n  if title:self.addObject(SVG.TextObject(title,titlepos,anchorposition=8,fontsize=fontsize *1.25))\n  self.fitContents()\n  \n def clearTooltip(self,event):\n  if event.target !=self:return\n  if self.tooltip:self.tooltip.hide()\n  \nclass BarChart(bryaxes.AxesCanvas):\n def __init__(self,parent,data,title=\"\",direction=\"vertical\",colour=\"yellow\",fontsize=14,axisoptions={},width=\"95%\",height=\"95%\",objid=None ):\n  xaxisoptions={\"showScale\":False ,\"showMajorTicks\":False ,\"showMinorTicks\":False ,\"showMajorGrid\":False }\n  xaxis=bryaxes.Axis(0,BARUNIT *len(data),\"\",xaxisoptions)\n  yaxis=bryaxes.Axis(0,data.maxValue,data.valuesLabel,axisoptions)\n  if direction ==\"horizontal\":xaxis,yaxis=yaxis,xaxis\n  super().__init__(parent,width,height,xAxis=xaxis,yAxis=yaxis,title=title,objid=objid)\n  self.attachObject(Bars(self,data,direction=direction,colour=colour))\n  for i in range(len(data)):\n   if direction ==\"horizontal\":\n    label=bryaxes.AxesWrappingTextObject(self,data.labels[i],(-10 *self.xScaleFactor,(i+0.6)*BARUNIT),80,anchorposition=6,fontsize=fontsize)\n   else :\n    label=bryaxes.AxesWrappingTextObject(self,data.labels[i],((i+0.6)*BARUNIT,0),0.8 *BARUNIT,fontsize=fontsize)\n   self.attachObject(label)\n  self.fitContents()\n  \nclass StackedBarChart(bryaxes.AxesCanvas):\n def __init__(self,parent,data,title=\"\",direction=\"vertical\",colours=None ,fontsize=14,axisoptions={},width=\"95%\",height=\"95%\",objid=None ):\n  if not colours:colours=DEFAULT_COLOURS\n  xaxisoptions={\"showScale\":False ,\"showMajorTicks\":False ,\"showMinorTicks\":False ,\"showMajorGrid\":False }\n  xaxis=bryaxes.Axis(0,BARUNIT *len(data.labels),\"\",xaxisoptions)\n  yaxis=bryaxes.Axis(0,data.maxSum,data.valuesLabel,axisoptions)\n  if direction ==\"horizontal\":xaxis,yaxis=yaxis,xaxis\n  super().__init__(parent,width,height,xAxis=xaxis,yAxis=yaxis,title=title,objid=objid)\n  for i,key in enumerate(data.keys()):\n   self.attachObject(Bars(self,data,\"stacked\",i,key,direction,colours[i]))\n  for i in range(len(data.labels)):\n   if direction ==\"horizontal\":\n    label=bryaxes.AxesWrappingTextObject(self,data.labels[i],(-10 *self.xScaleFactor,(i+0.6)*BARUNIT),80,anchorposition=6,fontsize=fontsize)\n   else :\n    label=bryaxes.AxesWrappingTextObject(self,data.labels[i],((i+0.6)*BARUNIT,0),0.8 *BARUNIT,fontsize=fontsize)\n   self.attachObject(label)\n  keywidth=20 *self.xScaleFactor\n  keyheight=fontsize *2 *self.yScaleFactor\n  keypos=SVG.Point((self.xAxis.max+keywidth,self.yAxis.min+keyheight))\n  for i,key in enumerate(data.keys()):\n   self.attachObject(SVG.GroupObject([\n   SVG.RectangleObject([keypos,keypos+(keywidth,keyheight /2)],fillcolour=colours[i]),\n   bryaxes.AxesTextObject(self,key,keypos+(keywidth *1.25,0),anchorposition=7,fontsize=fontsize)\n   ]))\n   keypos +=(0,keyheight)\n  self.bestFit=self.fitContents()\n  \nclass GroupedBarChart(bryaxes.AxesCanvas):\n def __init__(self,parent,data,title=\"\",direction=\"vertical\",colours=None ,fontsize=14,axisoptions={},width=\"95%\",height=\"95%\",objid=None ):\n  if not colours:colours=DEFAULT_COLOURS\n  xaxisoptions={\"showScale\":False ,\"showMajorTicks\":False ,\"showMinorTicks\":False ,\"showMajorGrid\":False }\n  xaxis=bryaxes.Axis(0,BARUNIT *len(data.labels),\"\",xaxisoptions)\n  yaxis=bryaxes.Axis(0,data.maxValue,data.valuesLabel,axisoptions)\n  if direction ==\"horizontal\":xaxis,yaxis=yaxis,xaxis\n  super().__init__(parent,width,height,xAxis=xaxis,yAxis=yaxis,title=title,objid=objid)\n  for i,key in enumerate(data.keys()):\n   self.attachObject(Bars(self,data,\"grouped\",i,key,direction,colours[i]))\n  for i in range(len(data.labels)):\n   if direction ==\"horizontal\":\n    label=bryaxes.AxesWrappingTextObject(self,data.labels[i],(-10 *self.xScaleFactor,(i+0.6)*BARUNIT),80,anchorposition=6,fontsize=fontsize)\n   else :\n    label=bryaxes.AxesWrappingTextObject(self,data.labels[i],((i+0.6)*BARUNIT,0),0.8 *BARUNIT,fontsize=fontsize)\n   self.attachObject(label)\n  keywidth=20 *self.xScaleFactor\n  keyheight=fontsize *2 *self.yScaleFactor\n  keypos=SVG.Point((self.xAxis.max+keywidth,self.yAxis.min+keyheight))\n  for i,key in enumerate(data.keys()):\n   self.attachObject(SVG.GroupObject([\n   SVG.RectangleObject([keypos,keypos+(keywidth,keyheight /2)],fillcolour=colours[i]),\n   bryaxes.AxesTextObject(self,key,keypos+(keywidth *1.25,0),anchorposition=7,fontsize=fontsize)\n   ]))\n   keypos +=(0,keyheight)\n  self.bestFit=self.fitContents()\n  \nclass ScatterGraph(bryaxes.AxesCanvas):\n def __init__(self,parent,data,title=\"\",colour=\"red\",showregressionline=False ,fontsize=14,xaxisoptions={},yaxisoptions={},width=\"95%\",height=\"95%\",objid=None ):\n  xaxis=bryaxes.Axis(data.xMin,data.xMax,data.xLabel,xaxisoptions)\n  yaxis=bryaxes.Axis(data.yMin,data.yMax,data.yLabel,yaxisoptions)\n  super().__init__(parent,width,height,xAxis=xaxis,yAxis=yaxis,title=title,objid=objid)\n  if showregressionline:\n   self.regressionLine=RegressionLine(self,data)\n   self.attachObject(self.regressionLine)\n  if isinstance(data,LabelledPairedData):\n   self.dataPoints=[DataPoint(self,label,coords,colour)for (label,coords)in data.items()]\n  else :\n   self.dataPoints=[DataPoint(self,None ,coords,colour)for coords in data]\n  self.container.attach(self.dataPoints)\n  \nclass BasicScatterGraph(bryaxes.AxesCanvas):\n def __init__(self,parent,data,title=\"\",colour=\"red\",showregressionline=False ,fontsize=14,xaxisoptions={},yaxisoptions={},width=\"95%\",height=\"95%\",objid=None ):\n  xaxis=bryaxes.Axis(data.xMin,data.xMax,data.xLabel,xaxisoptions)\n  yaxis=bryaxes.Axis(data.yMin,data.yMax,data.yLabel,yaxisoptions)\n  super().__init__(parent,width,height,xAxis=xaxis,yAxis=yaxis,title=title,objid=objid)\n  if showregressionline:\n   self.regressionLine=RegressionLine(self,data)\n   self.attachObject(self.regressionLine)\n  if isinstance(data,LabelledPairedData):\n   data=data.values()\n  basepoint=svg.circle(cx=0,cy=0,r=3,fill=colour,stroke=\"none\")\n  self.dataPoints=[]\n  for (x,y)in data:\n   point=basepoint.cloneNode(True )\n   (point.attrs[\"cx\"],point.attrs[\"cy\"])=(x,y)\n   point.attrs[\"transform\"]=f\"translate({x},{y}) scale({self.xScaleFactor},{-self.yScaleFactor}) translate({-x},{-y})\"\n   self.dataPoints.append(point)\n  self.container.attach(self.dataPoints)\n  \nclass MultiScatterGraph(bryaxes.AxesCanvas):\n def __init__(self,parent,data,title=\"\",colours=None ,showregressionlines=False ,fontsize=14,xaxisoptions={},yaxisoptions={},width=\"95%\",height=\"95%\",objid=None ):\n  xaxis=bryaxes.Axis(data.xMin,data.xMax,data.xLabel,xaxisoptions)\n  yaxis=bryaxes.Axis(data.yMin,data.yMax,data.yLabel,yaxisoptions)\n  super().__init__(parent,width,height,xAxis=xaxis,yAxis=yaxis,title=title,objid=objid)\n  if not colours:colours=DEFAULT_COLOURS\n  if showregressionlines ==True :showregressionlines=[True ]*len(data)\n  if showregressionlines ==False :showregressionlines=[False ]*len(data)\n  for i,(key,dataset)in enumerate(data.items()):\n   if showregressionlines[i]:\n    self.regressionLine=RegressionLine(self,dataset,colours[i])\n    self.attachObject(self.regressionLine)\n   if isinstance(dataset,LabelledPairedData):\n    self.dataPoints=[DataPoint(self,label,coords,colours[i])for (label,coords)in dataset.items()]\n   else :\n    self.dataPoints=[DataPoint(self,None ,coords,colours[i])for coords in dataset]\n   self.container.attach(self.dataPoints)\n  keywidth=20 *self.xScaleFactor\n  keyheight=fontsize *2 *self.yScaleFactor\n  keypos=SVG.Point((self.xAxis.max+keywidth,self.yAxis.min+keyheight))\n  for i,key in enumerate(data.keys()):\n   self.attachObject(SVG.GroupObject([\n   SVG.EllipseObject(pointlist=[keypos,keypos+(keywidth,keyheight /2)],fillcolour=colours[i]),\n   bryaxes.AxesTextObject(self,key,keypos+(keywidth *1.25,0),anchorposition=7,fontsize=fontsize)\n   ]))\n   keypos +=(0,keyheight)\n  self.bestFit=self.fitContents()\n  \nclass LineGraph(bryaxes.AxesCanvas):\n def __init__(self,parent,data,title=\"\",colours=None ,fontsize=14,xaxisoptions={},yaxisoptions={},width=\"95%\",height=\"95%\",objid=None ):\n  tt=time.time()\n  xaxisoptions[\"axisType\"]=\"time\"if isinstance(data,(TimeSeriesData,TimeSeriesDataDict))else \"float\"\n  xaxis=bryaxes.Axis(data.xMin,data.xMax,data.xLabel,xaxisoptions)\n  yaxis=bryaxes.Axis(data.yMin,data.yMax,data.yLabel,yaxisoptions)\n  \n  tt=time.time()\n  super().__init__(parent,width,height,xAxis=xaxis,yAxis=yaxis,title=title,objid=objid)\n  \n  tt=time.time()\n  if not colours:colours=DEFAULT_COLOURS\n  if isinstance(data,PairedData):\n   coordslist=[(float(x),y)for (x,y)in data]\n   self.attachObject(SVG.PolylineObject(coordslist,linecolour=colours[0]))\n  else :\n   keywidth=20 *self.xScaleFactor\n   keyheight=fontsize *2 *self.yScaleFactor\n   keypos=SVG.Point((float(self.xAxis.max)+keywidth,self.yAxis.max))\n   keydata=[]\n   for i,(key,pd)in enumerate(data.items()):\n    coordslist=[(float(x),y)for (x,y)in pd]\n    self.attachObject(SVG.PolylineObject(coordslist,linecolour=colours[i],linewidth=2))\n    self.attachObjects([DataPoint(self,key,coords,colours[i])for coords in pd])\n    keydata.append((coordslist[-1][1],key,colours[i]))\n   keydata.sort(key=lambda x:-x[0])\n   for (_,key,colour)in keydata:\n    self.attachObject(SVG.GroupObject([\n    SVG.LineObject([keypos,keypos+(keywidth,0)],linecolour=colour,linewidth=2),\n    bryaxes.AxesTextObject(self,key,keypos+(keywidth *1.25,0),anchorposition=4,fontsize=fontsize)\n    ]))\n    keypos +=(0,-keyheight)\n   self.bestFit=self.fitContents()\n   \n  tt=time.time()\n  \nclass BoxPlotCanvas(bryaxes.AxesCanvas):\n def __init__(self,parent,data,title=\"\",colour=\"yellow\",fontsize=14,axisoptions={},width=\"95%\",height=\"95%\",objid=None ):\n  if isinstance(data,BoxPlotData):data=BoxPlotDataDict(data.valuesLabel,{\"\":data})\n  xaxis=bryaxes.Axis(data.xMin,data.xMax,data.valuesLabel,axisoptions)\n  yaxis=bryaxes.Axis(0,50 *len(data),\"\",{\"showAxis\":False })\n  super().__init__(parent,width,height,xAxis=xaxis,yAxis=yaxis,title=title,objid=objid)\n  self.fitContents()\n  yheight=25\n  for label,boxplotdata in data.items():\n   self.attachObject(BoxPlot(boxplotdata,label,yheight,colour))\n   if label:self.attachObject(bryaxes.AxesWrappingTextObject(self,label,(xaxis.min -10 *self.xScaleFactor,yheight),100,6,fontsize))\n   yheight +=50\n  self.bestFit=self.fitContents()\n  \nclass Histogram(bryaxes.AxesCanvas):\n def __init__(self,parent,data,title=\"\",shownormalcurve=False ,colour=\"yellow\",fontsize=14,xaxisoptions={},yaxisoptions={},width=\"95%\",height=\"95%\",objid=None ):\n  xaxis=bryaxes.Axis(data.xMin,data.xMax,data.valuesLabel,xaxisoptions)\n  yaxis=bryaxes.Axis(0,data.maxFrequencyDensity,\"Frequency density\",yaxisoptions)\n  super().__init__(parent,width,height,xAxis=xaxis,yAxis=yaxis,title=title,objid=objid)\n  self.attachObject(HistogramBars(data,colour))\n  if shownormalcurve:\n   self.attachObject(NormalCurve(self,data))\n   \nclass CumulativeFrequencyGraph(bryaxes.AxesCanvas):\n def __init__(self,parent,data,title=\"\",colours=None ,fontsize=14,xaxisoptions={},axisoptions={},width=\"95%\",height=\"95%\",objid=None ):\n  if isinstance(data,CumulativeFrequencyData):data=CumulativeFrequencyDataDict(data.valuesLabel,{\"\":data})\n  xaxis=bryaxes.Axis(data.xMin,data.xMax,data.valuesLabel,xaxisoptions)\n  yaxis=bryaxes.Axis(0,data.maxTotalFrequency,\"Cumulative frequency\",yaxisoptions)\n  super().__init__(parent,width,height,xAxis=xaxis,yAxis=yaxis,title=title,objid=objid)\n  if not colours:colours=DEFAULT_COLOURS\n  for i,(key,cfd)in enumerate(data.items()):\n   self.attachObject(CumulativeFrequencyLine(self,key,cfd,colours[i]))\n  if len(data)>1:\n   keywidth=20 *self.xScaleFactor\n   keyheight=fontsize *2 *self.yScaleFactor\n   keypos=SVG.Point((self.xAxis.max+keywidth,self.yAxis.max))\n   for i,key in enumerate(data.keys()):\n    self.attachObject(SVG.GroupObject([\n    SVG.LineObject([keypos,keypos+(keywidth,0)],linecolour=colours[i],linewidth=2),\n    bryaxes.AxesTextObject(self,key,keypos+(keywidth *1.25,0),anchorposition=4,fontsize=fontsize)\n    ]))\n    keypos +=(0,-keyheight)\n   self.bestFit=self.fitContents()\n   \nclass CumulativePercentageGraph(bryaxes.AxesCanvas):\n def __init__(self,parent,data,title=\"\",colours=None ,fontsize=14,xaxisoptions={},yaxisoptions={},width=\"95%\",height=\"95%\",objid=None ):\n  if isinstance(data,CumulativeFrequencyData):data=CumulativeFrequencyDataDict(data.valuesLabel,{\"\":data})\n  xaxis=bryaxes.Axis(data.xMin,data.xMax,data.valuesLabel,xaxisoptions)\n  yaxis=bryaxes.Axis(0,100,\"Cumulative percentage\",yaxisoptions)\n  super().__init__(parent,width,height,xAxis=xaxis,yAxis=yaxis,title=title,objid=objid)\n  if not colours:colours=DEFAULT_COLOURS\n  for i,(key,cfd)in enumerate(data.items()):\n   self.attachObject(CumulativePercentageLine(self,key,cfd,colours[i]))\n  if len(data)>1:\n   keywidth=20 *self.xScaleFactor\n   keyheight=fontsize *2 *self.yScaleFactor\n   keypos=SVG.Point((self.xAxis.max+keywidth,self.yAxis.max))\n   for i,key in enumerate(data.keys()):\n    self.attachObject(SVG.GroupObject([\n    SVG.LineObject([keypos,keypos+(keywidth,0)],linecolour=colours[i],linewidth=2),\n    bryaxes.AxesTextObject(self,key,keypos+(keywidth *1.25,0),anchorposition=4,fontsize=fontsize)\n    ]))\n    keypos +=(0,-keyheight)\n   self.bestFit=self.fitContents()\n   \n   \n   \nclass PieChartSector(SVG.SectorObject):\n def __init__(self,canvas,centre,radius,startangle,endangle,label,value,percentage,colour):\n  super().__init__(centre,radius,startangle,endangle,fillcolour=colour)\n  self.canvas=canvas\n  self.centre=(self.pointList[0]+self.pointList[1]+self.pointList[2])/3\n  self.tooltiptext=f\"{label}\\n{value} ({percentage:.2f}%)\"\n  self.bind(\"mouseenter\",self.showtooltip)\n  self.bind(\"touchstart\",self.showtooltip)\n  self.bind(\"mouseleave\",self.hidetooltip)\n  \n def showtooltip(self,event):\n  if self.canvas.tooltip:self.canvas.tooltip.hide()\n  self.canvas.tooltip=Tooltip(self.canvas,self.tooltiptext,self.centre)\n  \n def hidetooltip(self,event):\n  self.canvas.tooltip.hide()\n  \nclass Tooltip(SVG.TextObject):\n def __init__(self,canvas,text,coords):\n  super().__init__(text,coords,anchorposition=5)\n  self.canvas=canvas\n  self.coords=coords\n  self._background=None\n  self.style.pointerEvents=\"none\"\n  self.canvas.addObject(self)\n  self.setBackground()\n  self.canvas <=self\n  \n def setBackground(self):\n  bbox=self.getBBox()\n  width,height=bbox.width,bbox.height\n  x,y=self.coords\n  self._background=SVG.RectangleObject([(x -width /2,y -height /2),(x+width /2,y+height /2)],linecolour=\"#d3d3d3d0\",fillcolour=\"#d3d3d3d0\")\n  self.canvas.addObject(self._background)\n  self._background.style.pointerEvents=\"none\"\n  \n def hide(self):\n  self.canvas.deleteObject(self._background)\n  self.canvas.deleteObject(self)\n  self.canvas.tooltip=None\n  \nclass AxesTooltip(bryaxes.AxesTextObject):\n def __init__(self,canvas,text,coords):\n  super().__init__(canvas,text,coords,anchorposition=8)\n  self.canvas=canvas\n  self.coords=coords\n  self._background=None\n  self.style.pointerEvents=\"none\"\n  self.canvas.attachObject(self)\n  self.setBackground()\n  self.canvas.container <=self\n  \n def setBackground(self):\n  bbox=self.getBBox()\n  width,height=bbox.width *self.canvas.xScaleFactor,bbox.height *self.canvas.yScaleFactor\n  x,y=self.coords\n  self._background=SVG.RectangleObject([(x -width /2,y+height),(x+width /2,y)],linecolour=\"#d3d3d3d0\",fillcolour=\"#d3d3d3d0\")\n  self.canvas.attachObject(self._background)\n  self._background.style.pointerEvents=\"none\"\n  \n def hide(self):\n  self.canvas.removeObject(self._background)\n  self.canvas.removeObject(self)\n  self.canvas.tooltip=None\n  \nclass Bar(SVG.RectangleObject):\n def __init__(self,canvas,pointlist,key,value,direction=\"vertical\",colour=\"yellow\"):\n  if direction ==\"horizontal\":pointlist=[(y,x)for (x,y)in pointlist]\n  super().__init__(pointlist,fillcolour=colour)\n  self.canvas=canvas\n  self.tooltiptext=f\"{key}\\n{value}\"if key else f\"{value}\"\n  self.centre=(self.pointList[0]+self.pointList[1])/2\n  self.bind(\"mouseenter\",self.showtooltip)\n  self.bind(\"touchstart\",self.showtooltip)\n  self.bind(\"mouseleave\",self.hidetooltip)\n  \n def showtooltip(self,event):\n  if self.canvas.tooltip:self.canvas.tooltip.hide()\n  self.canvas.tooltip=AxesTooltip(self.canvas,self.tooltiptext,self.centre)\n  \n def hidetooltip(self,event):\n  self.canvas.tooltip.hide()\n  \nclass Bars(SVG.GroupObject):\n def __init__(self,canvas,data,graphtype=None ,index=None ,key=None ,direction=\"vertical\",colour=\"yellow\"):\n  super().__init__()\n  if graphtype ==\"stacked\":\n   barminvalues=[sums[index]for sums in data.sums.values()]\n   barmaxvalues=[sums[index+1]for sums in data.sums.values()]\n   barwidth=0.8 *BARUNIT\n   offset=0.2 *BARUNIT\n  elif graphtype ==\"grouped\":\n   barminvalues=[0]*len(data.labels)\n   barmaxvalues=[values[index]for values in data.Values.values()]\n   barwidth=0.8 *BARUNIT /len(data)\n   offset=0.2 *BARUNIT+barwidth *index\n  else :\n   barminvalues=[0]*len(data)\n   barmaxvalues=data.Values\n   barwidth=0.8 *BARUNIT\n   offset=0.2 *BARUNIT\n   \n  for i,label in enumerate(data.labels):\n   [barstart,barend]=[i *BARUNIT+offset,i *BARUNIT+offset+barwidth]\n   value=data.Values[label][index]if key else data.Values[i]\n   if value >0:\n    self.addObject(Bar(canvas,[(barstart,barmaxvalues[i]),(barend,barminvalues[i])],key,value,direction,colour))\n    \nclass DataPoint(bryaxes.AxesPoint):\n def __init__(self,canvas,label,coords,colour=\"red\",objid=None ):\n  (x,y)=coords\n  super().__init__(canvas,(float(x),y),colour)\n  self.canvas=canvas\n  self.coords=(float(x),y)\n  self.tooltiptext=f\"{label}\\n{coords}\"if label else f\"{coords}\"\n  self.bind(\"mouseenter\",self.showtooltip)\n  self.bind(\"touchstart\",self.showtooltip)\n  self.bind(\"mouseleave\",self.hidetooltip)\n  \n def showtooltip(self,event):\n  if self.canvas.tooltip:self.canvas.tooltip.hide()\n  self.canvas.tooltip=AxesTooltip(self.canvas,self.tooltiptext,self.coords)\n  \n def hidetooltip(self,event):\n  self.canvas.tooltip.hide()\n  \nclass RegressionLine(bryaxes.AxesPolyline):\n def __init__(self,canvas,data,colour=\"black\"):\n  points=data.values()if isinstance(data,LabelledPairedData)else data\n  pmcc,gradient,yintercept=regressioninfo(points)\n  sign=\"\"if yintercept <0 else \"+\"\n  n1=2 -int(log10(gradient))\n  n2=2 -int(log10(yintercept))\n  self.tooltiptext=f\"y = {gradient:.{n1}f}x{sign}{yintercept:.{n2}f}\\n(PMCC = {pmcc:.2f})\"\n  x1,x2=data.xMin,data.xMax\n  y1,y2=gradient *x1+yintercept,gradient *x2+yintercept\n  super().__init__(canvas,[(x1,y1),(x2,y2)],linecolour=colour,linewidth=2)\n  \n  self.bind(\"mouseenter\",self.showtooltip)\n  self.bind(\"touchstart\",self.showtooltip)\n  self.bind(\"mouseleave\",self.hidetooltip)\n  \n def showtooltip(self,event):\n  if self.canvas.tooltip:self.canvas.tooltip.hide()\n  (x,y)=self.canvas.getSVGcoords(event)\n  self.canvas.tooltip=AxesTooltip(self.canvas,self.tooltiptext,(x,-y))\n  \n def hidetooltip(self,event):\n  self.canvas.tooltip.hide()\n  \nclass BoxPlot(SVG.GroupObject):\n def __init__(self,boxplotinfo,label,yheight,colour=\"yellow\"):\n  xmin,Q1,Q2,Q3,xmax=boxplotinfo\n  super().__init__([\n  SVG.LineObject([(xmin,yheight -5),(xmin,yheight+5)]),\n  SVG.LineObject([(xmin,yheight),(Q1,yheight)]),\n  SVG.RectangleObject([(Q1,yheight -15),(Q2,yheight+15)],fillcolour=colour),\n  SVG.RectangleObject([(Q2,yheight -15),(Q3,yheight+15)],fillcolour=colour),\n  SVG.LineObject([(Q3,yheight),(xmax,yheight)]),\n  SVG.LineObject([(xmax,yheight -5),(xmax,yheight+5)])\n  ])\n  self.tooltiptext=f\"{label}\\nMin={xmin}, Q1={Q1}, Q2={Q2}, Q3={Q3}, Max={xmax}\"\n  self.centre=((Q1+Q2)/2,yheight)\n  self.bind(\"mouseenter\",self.showtooltip)\n  self.bind(\"touchstart\",self.showtooltip)\n  self.bind(\"mouseleave\",self.hidetooltip)\n  \n def showtooltip(self,event):\n  if self.canvas.tooltip:self.canvas.tooltip.hide()\n  self.canvas.tooltip=AxesTooltip(self.canvas,self.tooltiptext,self.centre)\n  \n def hidetooltip(self,event):\n  self.canvas.tooltip.hide()\n  \nclass HistogramBar(SVG.RectangleObject):\n def __init__(self,gfd,i,colour=\"yellow\"):\n  [barleft,barright]=gfd.boundaries[i:i+2]\n  super().__init__([(barleft,gfd.frequencyDensities[i]),(barright,0)],fillcolour=colour)\n  self.tooltiptext=f\"{barleft}\u2264x<{barright}\\nFrequency: {gfd.frequencies[i]}\\nFrequency Density: {gfd.frequencyDensities[i]}\"\n  self.centre=((barleft+barright)/2,gfd.frequencyDensities[i]/2)\n  self.bind(\"mouseenter\",self.showtooltip)\n  self.bind(\"touchstart\",self.showtooltip)\n  self.bind(\"mouseleave\",self.hidetooltip)\n  \n def showtooltip(self,event):\n  if self.canvas.tooltip:self.canvas.tooltip.hide()\n  self.canvas.tooltip=AxesTooltip(self.canvas,self.tooltiptext,self.centre)\n  \n def hidetooltip(self,event):\n  self.canvas.tooltip.hide()\n  \nclass HistogramBars(SVG.GroupObject):\n def __init__(self,gfd,colour=\"yellow\"):\n  super().__init__()\n  for i in range(len(gfd)-1):\n   self.addObject(HistogramBar(gfd,i,colour))\n   \nclass NormalCurve(bryaxes.AxesPolyline):\n def __init__(self,canvas,gfd):\n  m=gfd.mean()\n  v=gfd.variance()\n  s=v **0.5\n  k=sum(gfd.frequencies)/(s *(2 *pi)**0.5)\n  x0=gfd.xMin\n  dx=(gfd.xMax -x0)/200\n  points=[(x0+i *dx,k *exp(-0.5 *(((x0+i *dx)-m)/s)**2))for i in range(201)]\n  super().__init__(canvas,points,linewidth=2)\n  self.tooltiptext=f\"\u00b5 = {m:.1f}\\n\u03c3\u00b2 = {v:.1f}\"\n  self.bind(\"mouseenter\",self.showtooltip)\n  self.bind(\"touchstart\",self.showtooltip)\n  self.bind(\"mouseleave\",self.hidetooltip)\n  \n def showtooltip(self,event):\n  if self.canvas.tooltip:self.canvas.tooltip.hide()\n  (x,y)=self.canvas.getSVGcoords(event)\n  self.canvas.tooltip=AxesTooltip(self.canvas,self.tooltiptext,(x,-y))\n  \n def hidetooltip(self,event):\n  self.canvas.tooltip.hide()\n  \n  \nclass CumulativeFrequencyLine(bryaxes.AxesPolyline):\n def __init__(self,canvas,key,cfd,colour):\n  super().__init__(canvas,cfd,linecolour=colour,linewidth=2)\n  self.key=key\n  self.bind(\"mouseenter\",self.showtooltip)\n  self.bind(\"touchstart\",self.showtooltip)\n  self.bind(\"mouseleave\",self.hidetooltip)\n  \n def showtooltip(self,event):\n  if self.canvas.tooltip:self.canvas.tooltip.hide()\n  (x,y)=self.canvas.getSVGcoords(event)\n  n=int(3 -log10(x))\n  tooltiptext=f\"{self.key}\\nNumber of values < {x:.{n}f}: {-y:.0f}\"\n  self.canvas.tooltip=AxesTooltip(self.canvas,tooltiptext,(x,-y))\n  \n def hidetooltip(self,event):\n  self.canvas.tooltip.hide()\n  \nclass CumulativePercentageLine(bryaxes.AxesPolyline):\n def __init__(self,canvas,key,cfd,colour):\n  total=cfd.totalFrequency\n  points=[(x,100 *y /total)for (x,y)in cfd]\n  super().__init__(canvas,points,linecolour=colour,linewidth=2)\n  self.key=key\n  self.bind(\"mouseenter\",self.showtooltip)\n  self.bind(\"touchstart\",self.showtooltip)\n  self.bind(\"mouseleave\",self.hidetooltip)\n  \n def showtooltip(self,event):\n  if self.canvas.tooltip:self.canvas.tooltip.hide()\n  (x,y)=self.canvas.getSVGcoords(event)\n  n=int(3 -log10(x))\n  tooltiptext=f\"{self.key}\\n%age of values < {x:.{n}f}: {-y:.0f}%\"\n  self.canvas.tooltip=AxesTooltip(self.canvas,tooltiptext,(x,-y))\n  \n def hidetooltip(self,event):\n  self.canvas.tooltip.hide()\n  \nclass DataTable(list):\n def __init__(self,csvfile=None ,jsonfile=None ,datasets=\"columns\",headers=True ):\n  if csvfile:\n   with open(csvfile)as datafile:\n    lines=datafile.readlines()\n    \n    \n   data=[line.strip().split(\",\")for line in lines]\n   data=[[convertifnumber(item)for item in row]for row in data]\n  elif jsonfile:\n   with open(jsonfile)as datafile:\n    data=json.load(datafile)\n    \n    \n  fieldnames=data[0]\n  datalist=[{key:value for key,value in zip(fieldnames,data[i])}for i in range(1,len(data))]\n  super().__init__(datalist)\n", ["browser.svg", "brycharts", "brycharts.statfns", "json", "math", "time"]], "brycharts.timeclasses": [".py", "import datetime,math\n\ntimeunits=[\"year\",\"month\",\"day\",\"hour\",\"minute\",\"second\"]\ntimeformats=[\"%d/%m/%y\",\"%d/%m/%y\",\"%H:%M\\n%d/%m\",\"%H:%M\",\"%H:%M\",\"%H:%M:%S\"]\ntimefactors=[1,12,30,24,60,60]\n\n\nclass TimeCoord():\n startfloat=0\n scalefloat=1\n defaultformat=\"%d/%m/%y %H:%M\"\n def __init__(self,date_time,timeformat=None ):\n  self.asDatetime=date_time\n  self.unitlist=[getattr(date_time,unit)for unit in timeunits]\n  if not timeformat:timeformat=self.defaultformat\n  self.asString=f\"{self.asDatetime:{timeformat} }\"\n  self.asFloat=(self.asDatetime.timestamp()-self.startfloat)/self.scalefloat\n  \n def __repr__(self):\n  return self.asString\n  \n def __str__(self):\n  return self.asString\n  \n def __float__(self):\n  return self.asFloat\n  \n  \n def __add__(self,other):\n  if isinstance(other,TimeInterval):\n   return TimeCoord(self.asDatetime+other.timedelta,other.timeformat)\n  else :\n   return NotImplemented\n   \n def __sub__(self,other):\n  return self.asDatetime -other.asDatetime\n  \n def __lt__(self,other):\n  return float(self)<float(other)\n  \n def __le__(self,other):\n  return float(self)<=float(other)\n  \n def __gt__(self,other):\n  return float(self)>float(other)\n  \n def __ge__(self,other):\n  return float(self)>=float(other)\n  \n def __eq__(self,other):\n  return self.asDatetime ==other.asDatetime\n  \nclass TimeInterval():\n def __init__(self,interval,unitindex=5,timeformat=None ):\n \n  unit=timeunits[unitindex]\n  args={unit+\"s\":interval}\n  self.timedelta=datetime.timedelta(**args)\n  self.unitIndex=unitindex\n  self.interval=interval\n  if timeformat:\n   self.timeformat=timeformat\n  else :\n   self.timeformat=timeformats[unitindex]\n   if unitindex ==3 and interval >=6:self.timeformat=timeformats[2]\n   if unitindex ==2 and interval >=28:self.timeformat=timeformats[1]\n   \n def __mul__(self,other):\n  return TimeInterval(other *self.interval,self.unitIndex,self.timeformat)\n  \n def __rmul__(self,other):\n  return TimeInterval(other *self.interval,self.unitIndex,self.timeformat)\n  \n def __str__(self):\n  return str(self.timedelta)\n  \n def __repr__(self):\n  return str(self.timedelta)\n  \n def __float__(self):\n  return self.timedelta.total_seconds()/TimeCoord.scalefloat\n  \ndef gettimescaleintervals(tc1,tc2,mindivs=5):\n def roundladder(x,ladder):\n  for i in range(len(ladder)-1):\n   if x <ladder[i+1]:return ladder[i]\n  return ladder[-1]\n  \n interval=(tc2.asDatetime.timestamp()-tc1.asDatetime.timestamp())/(mindivs -1)\n unitindex=5\n while unitindex >2:\n  newinterval=interval /timefactors[unitindex]\n  if newinterval <1:break\n  interval=newinterval\n  unitindex -=1\n  \n ladderlist=[None ,None ,[1,2,7,14,28,91,364],[1,2,3,4,6,12],[1,2,5,10,15,30],[1,2,5,10,15,30]]\n subdivisors=[None ,None ,{1:(2,3),2:(2,3),7:(1,7),14:(2,7),28:(2,2),91:(1,13),364:(1,13)},\n {1:(2,3),2:(2,3),3:(3,2),4:(4,2),6:(1,6),12:(3,4)},\n {1:(2,3),2:(2,3),5:(1,5),10:(2,5),15:(3,5),30:(3,2)},\n {1:(2,3),2:(2,3),5:(1,5),10:(2,5),15:(3,5),30:(3,2)}]\n scaleinterval=roundladder(interval,ladderlist[unitindex])\n (majordivisor,minordivisor)=subdivisors[unitindex][scaleinterval]\n \n return TimeInterval(scaleinterval,unitindex),majordivisor,minordivisor\n \ndef roundtimedown(tc,scaleinterval):\n i=scaleinterval.unitIndex\n x=tc.unitlist[i]\n roundx=math.floor(x /scaleinterval.interval)*scaleinterval.interval\n if i ==2 and roundx ==0:roundx=1\n roundedlist=tc.unitlist[:i]+[roundx]+[0]*(6 -i)\n return TimeCoord(datetime.datetime(*roundedlist),scaleinterval.timeformat)\n \ndef roundtimeup(tc,scaleinterval):\n tc0=roundtimedown(tc,scaleinterval)\n return tc0 if tc0.unitlist ==tc.unitlist else tc0+scaleinterval\n \n", ["datetime", "math"]]}
+var scripts = {"$timestamp": 1792437987193, "brycharts": [".py", "try:\n from browser import document\nexcept ImportError:\n from .datastructures import *\nelse:\n from .brycharts import *\n from .chartcache import ChartCache\n from .workers import WorkerPool\n", ["browser", "brycharts.brycharts", "brycharts.chartcache", "brycharts.datastructures", "brycharts.workers"], 1], "brycharts.bryaxes": [".py", "\n\n\n\n\n\n\n\n\nimport time\nfrom bisect import bisect_left, bisect_right\nfrom math import floor, hypot\nimport browser.svg as svg\nfrom browser import timer\nfrom . import dragcanvas as SVG\nfrom . import textmetrics\nfrom .timeclasses import *\nfrom .scales import *\nfrom .geometry import formatcoord, segmentspath, scaletransform, scaleddecimals\n\ndef segmentdistance(point, start, end):\n (x, y), (x1, y1), (x2, y2) = point, start, end\n (dx, dy) = (x2-x1, y2-y1)\n d2 = dx*dx + dy*dy\n t = 0 if d2 == 0 else max(0, min(1, ((x-x1)*dx + (y-y1)*dy)/d2))\n return hypot(x-x1-t*dx, y-y1-t*dy)\n\nclass PointIndex(object):\n\n\n def __init__(self, xmin, xmax, ymin, ymax, divisions=32):\n  self.cellWidth = (xmax-xmin)/divisions or 1\n  self.cellHeight = (ymax-ymin)/divisions or 1\n  self.cells = {}\n\n def _cell(self, x, y):\n  return (floor(x/self.cellWidth), floor(y/self.cellHeight))\n\n def add(self, coords, item):\n  (x, y) = coords\n  self.cells.setdefault(self._cell(x, y), []).append((x, y, item))\n\n def nearest(self, coords, radius, xscalefactor, yscalefactor):\n\n  (x, y) = coords\n  rx, ry = radius*xscalefactor, radius*yscalefactor\n  (i0, j0) = self._cell(x-rx, y-ry)\n  (i1, j1) = self._cell(x+rx, y+ry)\n  if (i1-i0+1)*(j1-j0+1) > len(self.cells):\n   cells = [cell for ((i, j), cell) in self.cells.items() if i0 <= i <= i1 and j0 <= j <= j1]\n  else:\n   cells = [self.cells[(i, j)] for i in range(i0, i1+1) for j in range(j0, j1+1) if (i, j) in self.cells]\n  best, bestd = None, radius\n  for cell in cells:\n   for (px, py, item) in cell:\n    d = hypot((px-x)/xscalefactor, (py-y)/yscalefactor)\n    if d <= bestd: best, bestd = item, d\n  return best\n\ndef fixedextent(obj, canvas):\n\n if isinstance(obj, ScaledObjectMixin): return None\n if hasattr(obj, \"objectList\"):\n  return SVG.unionextent([fixedextent(child, canvas) for child in obj.objectList]+[getattr(obj, \"markExtent\", None)])\n return obj.getExtent(canvas) if hasattr(obj, \"getExtent\") else None\n\nclass ScaledObjectMixin():\n pixelOffsets = True\n\n def rescale(self, canvas):\n  (x, y) = self.anchorPoint\n\n  decimals = scaleddecimals(SVG.decimals) if self.pixelOffsets else SVG.decimals\n  self.attrs[\"transform\"] = scaletransform((x, y), canvas.xScaleFactor, canvas.yScaleFactor, decimals)\n\n def scaledExtent(self, extent, canvas):\n\n  (x, y) = self.anchorPoint\n  (x1, y1, x2, y2) = extent\n  (sx, sy) = (canvas.xScaleFactor, canvas.yScaleFactor)\n  return (x+(x1-x)*sx, y-(y2-y)*sy, x+(x2-x)*sx, y-(y1-y)*sy)\n\nclass AxesTextObject(SVG.TextObject, ScaledObjectMixin):\n def __init__(self, canvas, string=\"\", anchorpoint=(0,0), anchorposition=1, fontsize=12, register=True):\n  super().__init__(string, anchorpoint, anchorposition, fontsize)\n  self.rescale(canvas)\n  if register: canvas.scaledObjects.append(self)\n\n def setText(self, string, anchorpoint):\n  previous = SVG.setdecimals(scaleddecimals(SVG.decimals))\n  super().setText(string, anchorpoint)\n  SVG.setdecimals(previous)\n  self.anchorPoint = anchorpoint\n\n def getExtent(self, canvas=None):\n  return self.scaledExtent(super().getExtent(canvas), canvas)\n\nclass AxesWrappingTextObject(SVG.WrappingTextObject, ScaledObjectMixin):\n def __init__(self, canvas, string=\"\", anchorpoint=(0,0), width=80, anchorposition=2, fontsize=12):\n  previous = SVG.setdecimals(scaleddecimals(SVG.decimals))\n  super().__init__(canvas, string, anchorpoint, width/canvas.xScaleFactor, anchorposition, fontsize)\n  SVG.setdecimals(previous)\n  self.anchorPoint = anchorpoint\n  self.rescale(canvas)\n  canvas.scaledObjects.append(self)\n\n def getExtent(self, canvas=None):\n  return self.scaledExtent(super().getExtent(canvas), canvas)\n\nclass AxesPoint(svg.circle, ScaledObjectMixin):\n\n pixelOffsets = False\n\n def __init__(self, canvas, XY=(0,0), classname=\"series-0\", objid=None):\n  (x, y) = XY\n  svg.circle.__init__(self, cx=SVG.svgcoord(float(x)), cy=SVG.svgcoord(y), r=3, Class=f\"data-point {classname}\")\n  self.anchorPoint = self.XY = SVG.Point(XY)\n  self.rescale(canvas)\n  if objid: self.id = objid\n  canvas.scaledObjects.append(self)\n\n def _update(self):\n  pass\n\n def getExtent(self, canvas=None):\n  (x, y) = self.anchorPoint\n  return self.scaledExtent((x-3, y-3, x+3, y+3), canvas)\n\nclass AxesTooltip(SVG.Tooltip):\n\n def __init__(self, canvas, fontsize=12):\n  super().__init__(canvas, fontsize, canvas.container)\n\n def _decimals(self):\n  return scaleddecimals(self.canvas.decimals)\n\n def _place(self, coords, width, height):\n  (x, y) = coords\n  c = lambda v: formatcoord(v, self.canvas.decimals)\n  self.attrs[\"transform\"] = f\"translate({c(x)},{c(y)}) scale({self.canvas.xScaleFactor},{-self.canvas.yScaleFactor})\"\n  return (-width/2, -height)\n\nclass AxesPolyline(SVG.PolylineObject):\n\n\n def __init__(self, canvas, pointlist=[(0,0)], linecolour=\"black\", linewidth=1, fillcolour=\"none\", objid=None, flatcoords=None, classname=None):\n  super().__init__(pointlist, linecolour, linewidth, fillcolour, objid, flatcoords, classname)\n\n  self.xValues = self.flatCoords[0::2]\n  self.xSorted = all(self.xValues[i] <= self.xValues[i+1] for i in range(len(self.xValues)-1))\n  canvas.hitLines.append(self)\n\n def distanceTo(self, coords, xscalefactor, yscalefactor, tolerance):\n\n\n  (x, y) = coords\n  start, end = 0, len(self.xValues)\n  if self.xSorted:\n   rx = tolerance*xscalefactor\n   start = max(bisect_left(self.xValues, x-rx)-1, 0)\n   end = min(bisect_right(self.xValues, x+rx)+1, end)\n  flat = self.flatCoords[2*start:2*end]\n  pixelpoints = [(flat[i]/xscalefactor, flat[i+1]/yscalefactor) for i in range(0, len(flat), 2)]\n  if not pixelpoints: return None\n  cursor = (x/xscalefactor, y/yscalefactor)\n  if len(pixelpoints) == 1: return hypot(cursor[0]-pixelpoints[0][0], cursor[1]-pixelpoints[0][1])\n  return min(segmentdistance(cursor, pixelpoints[i], pixelpoints[i+1]) for i in range(len(pixelpoints)-1))\n\nclass AxesLine(SVG.LineObject):\n def __init__(self, pointlist=[(0,0), (0,0)], style=\"solid\", linecolour=\"black\", linewidth=1, fillcolour=\"none\", objid=None, classname=None):\n  super().__init__(pointlist, style, linecolour, linewidth, fillcolour, objid, classname)\n  if not classname: self.style.vectorEffect = \"non-scaling-stroke\"\n\nclass AxesGroup(svg.g):\n\n\n def __init__(self, objlist=[], objid=None):\n  svg.g.__init__(self)\n  self.objectList = []\n  self.markExtent = None\n  for obj in getattr(objlist, \"objectList\", objlist): self.attach(obj)\n  if objid: self.id = objid\n\n def attach(self, objects):\n  super().attach(objects)\n  self.objectList.extend(objects if isinstance(objects, (list, tuple)) else [objects])\n\n def getExtent(self, canvas=None):\n  return SVG.unionextent([obj.getExtent(canvas) for obj in self.objectList if hasattr(obj, \"getExtent\")]+[self.markExtent])\n\nclass BasicAxis(AxesGroup):\n\n def __init__(self, canvas, axis):\n  super().__init__()\n  self.axisLine = AxesLine(classname=\"axis-line\")\n  self.axisLabel = AxesTextObject(canvas, axis.label, (0, 0), 3 if axis.direction == \"x\" else 7, fontsize=axis.fontSize)\n  self.arrowLines = [AxesLine(classname=\"axis-line\"), AxesLine(classname=\"axis-line\")] if axis.showArrow else []\n  self.attach([self.axisLine, self.axisLabel]+self.arrowLines)\n  self.update(axis)\n\n def update(self, axis):\n  axismin, axismax = float(axis.min), float(axis.max)\n  if axis.direction == \"x\":\n   self.axisLine.setPointList([(axismin, axis.position), (axismax, axis.position)])\n   self.axisLabel.setText(axis.label, (axismax, axis.position-3*axis.tickLength))\n   arrowpoints = [(axismax-axis.arrowLength, axis.position-axis.tickLength), (axismax-axis.arrowLength, axis.position+axis.tickLength)]\n   arrowhead = (axismax, axis.position)\n  else:\n   self.axisLine.setPointList([(axis.position, axismin), (axis.position, axismax)])\n   self.axisLabel.setText(axis.label, (axis.position, axismax))\n   arrowpoints = [(axis.position-axis.tickLength, axismax-axis.arrowLength), (axis.position+axis.tickLength, axismax-axis.arrowLength)]\n   arrowhead = (axis.position, axismax)\n  for (arrowline, arrowpoint) in zip(self.arrowLines, arrowpoints):\n   arrowline.setPointList([arrowhead, arrowpoint])\n\nclass Ticks(AxesGroup):\n\n def __init__(self, axis, ticktype):\n  super().__init__()\n  self.tickType = ticktype\n  self.path = svg.path(Class=\"ticks\")\n  self <= self.path\n  self.update(axis)\n  axis.axisObjects.attach(self)\n\n def update(self, axis):\n  values = axis.majorTickValues if self.tickType == \"major\" else axis.minorTickValues\n  ticklength = axis.tickLength if self.tickType == \"major\" else axis.tickLength/2\n  tickend = axis.position-ticklength\n  if axis.direction == \"x\":\n   segments = [((v, axis.position), (v, tickend)) for v in values]\n  else:\n   segments = [((axis.position, v), (tickend, v)) for v in values]\n  self.path.attrs[\"d\"] = segmentspath(segments, SVG.decimals)\n  self.markExtent = None\n  if values:\n   (vmin, vmax), (pmin, pmax) = (min(values), max(values)), sorted([axis.position, tickend])\n   self.markExtent = (vmin, pmin, vmax, pmax) if axis.direction == \"x\" else (pmin, vmin, pmax, vmax)\n\nclass GridLines(AxesGroup):\n\n def __init__(self, axis, gridtype):\n  super().__init__()\n  self.gridType = gridtype\n  self.path = svg.path(Class=f\"{gridtype}-grid\")\n  self <= self.path\n  self.update(axis)\n  axis.axisObjects.attach(self)\n\n def update(self, axis):\n  values = axis.majorTickValues if self.gridType == \"major\" else axis.minorTickValues\n  linemin, linemax = axis.gridMin, axis.gridMax\n  if axis.direction == \"x\":\n   segments = [((v, linemin), (v, linemax)) for v in values]\n  else:\n   segments = [((linemin, v), (linemax, v)) for v in values]\n  self.path.attrs[\"d\"] = segmentspath(segments, SVG.decimals)\n  self.markExtent = None\n  if values:\n   (vmin, vmax) = (min(values), max(values))\n   self.markExtent = (vmin, linemin, vmax, linemax) if axis.direction == \"x\" else (linemin, vmin, linemax, vmax)\n\nclass MarkGroup(SVG.GroupObject):\n\n\n def __init__(self):\n  super().__init__()\n  self.builder = SVG.MarkupBuilder()\n  self.tooltips = []\n  self.markExtent = None\n  self.bind(\"mouseover\", self.showtooltip)\n  self.bind(\"touchstart\", self.showtooltip)\n  self.bind(\"mouseout\", self.hidetooltip)\n\n def addRectangle(self, pointlist, colour, tooltiptext):\n  [(x1, y1), (x2, y2)] = pointlist\n  attrs = {\"x\":min(x1, x2), \"y\":min(y1, y2), \"width\":abs(x2-x1), \"height\":abs(y2-y1), \"class\":\"bar\", \"data-index\":len(self.tooltips)}\n  self.builder.add(\"rect\", attrs, {\"fill\":colour})\n  self.tooltips.append((tooltiptext, ((x1+x2)/2, (y1+y2)/2)))\n  self.markExtent = SVG.unionextent([self.markExtent, (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))])\n\n def getExtent(self, canvas=None):\n  return SVG.unionextent([super().getExtent(canvas), self.markExtent])\n\n def build(self):\n  self.builder.insertInto(self)\n\n def showtooltip(self, event):\n  index = event.target.getAttribute(\"data-index\")\n  if index is None: return\n  (tooltiptext, centre) = self.tooltips[int(index)]\n  self.canvas.tooltip.show(tooltiptext, centre)\n\n def hidetooltip(self, event):\n  self.canvas.tooltip.hide()\n\nclass ScaleValues(AxesGroup, ScaledObjectMixin):\n\n\n poolSize = 24\n\n def __init__(self, canvas, axis):\n  super().__init__()\n  self.anchorPosition = 2 if axis.direction == \"x\" else 6\n  self.labels = []\n  self.shown = []\n  self._addLabels(canvas, axis, self.poolSize)\n  self.update(canvas, axis, scalevalues(axis, axis.min, axis.max))\n  self.rescale(canvas)\n  axis.axisObjects.attach(self)\n  canvas.scaledObjects.append(self)\n\n def _addLabels(self, canvas, axis, count):\n  newlabels = [AxesTextObject(canvas, \"\", (0, 0), self.anchorPosition, axis.fontSize, register=False) for i in range(count)]\n  for label in newlabels:\n   label.scaleString = None\n   label.style.display = \"none\"\n  self.labels.extend(newlabels)\n  self.attach(newlabels)\n\n def update(self, canvas, axis, values):\n\n  current = {label.scaleString: label for label in self.shown}\n  kept = {scalestring: current[scalestring] for (v, scalestring) in values if scalestring in current}\n  spare = [label for label in self.labels if label.scaleString not in kept]\n  if len(spare) < len(values)-len(kept):\n   self._addLabels(canvas, axis, len(values)-len(kept)-len(spare))\n   spare = [label for label in self.labels if label.scaleString not in kept]\n  spare.reverse()\n  self.shown = []\n  for (v, scalestring) in values:\n   anchorpoint = (v, axis.position-axis.tickLength) if axis.direction == \"x\" else (axis.position-axis.tickLength, v)\n   label = kept.get(scalestring)\n   if label is None:\n    label = spare.pop()\n    if label.scaleString is None: label.style.display = \"inline\"\n    label.scaleString = scalestring\n    label.setText(scalestring, anchorpoint)\n   elif label.anchorPoint != anchorpoint:\n    label.setText(scalestring, anchorpoint)\n   self.shown.append(label)\n  for label in spare:\n   if label.scaleString is not None:\n    label.scaleString = None\n    label.style.display = \"none\"\n\n def rescale(self, canvas):\n  for label in self.shown:\n   label.rescale(canvas)\n\n def getExtent(self, canvas=None):\n  return SVG.unionextent([label.getExtent(canvas) for label in self.shown])\n\nclass AxesCanvas(SVG.CanvasObject):\n def __init__(self, parent, width, height, xAxis=None, yAxis=None, title=None, objid=None):\n  tt = time.time()\n  super().__init__(width, height, objid=objid)\n  if self.parentNode is None: parent <= self\n  self.attrs[\"preserveAspectRatio\"] = \"none\"\n  self.beginBuild()\n  self.container = SVG.GroupObject(objid=\"panel\")\n\n  self.container.attrs[\"transform\"] = \"scale(1,-1)\"\n  self.addObject(self.container)\n  self.mouseMode = SVG.MouseMode.PAN\n  self.lineWidthScaling = False\n  self.setClassStyles(AXESSTYLES)\n  self.title = title\n  self.tooltip = AxesTooltip(self)\n  self.bestFit = None\n  self.scaledObjects = []\n  self.fitObjects = []\n  self.fixedExtent = None\n  self.pointIndex = None\n  self.hitLines = []\n  self.hoverTarget = None\n  self.hoverRadius = 8\n  self.dynamicTicks = True\n  self.retickDelay = 150\n  self.retickTimer = None\n  self.marksScale = None\n  self.bind(\"touchstart\", self.clearTooltip)\n  self.bind(\"mousemove\", self.onMouseMove)\n  self.bind(\"mouseleave\", self.onMouseLeave)\n\n  tt = time.time()\n\n  self.drawAxes(xAxis, yAxis)\n\n  tt = time.time()\n\n def attachObject(self, svgobject, fixed=False):\n  if isinstance(svgobject, (AxesGroup, AxesLine, ScaledObjectMixin)):\n   self.container.attach(svgobject)\n  else:\n   self.container.addObject(svgobject, fixed)\n  self.fitObjects.append(svgobject)\n  self.fixedExtent = SVG.unionextent([self.fixedExtent, fixedextent(svgobject, self)])\n\n def attachObjects(self, objectlist):\n  for obj in objectlist:\n   if isinstance(obj, (list, tuple)):\n    self.attachObjects(obj)\n   else:\n    self.attachObject(obj)\n\n def removeObject(self, svgobject):\n  self.container.removeChild(svgobject)\n  if svgobject in self.fitObjects:\n   self.fitObjects.remove(svgobject)\n   self.fixedExtent = SVG.unionextent([fixedextent(obj, self) for obj in self.fitObjects])\n  if isinstance(svgobject, ScaledObjectMixin):\n   self.scaledObjects.remove(svgobject)\n  if isinstance(svgobject, AxesPolyline) and svgobject in self.hitLines:\n   self.hitLines.remove(svgobject)\n\n def destroy(self):\n\n\n  if getattr(self, \"retickTimer\", None) is not None: timer.clear_timeout(self.retickTimer)\n  self.retickTimer = None\n  self.scaledObjects = []\n  self.fitObjects = []\n  self.hitLines = []\n  self.pointIndex = self.hoverTarget = None\n  super().destroy()\n\n def setViewBox(self, pointlist):\n  viewwindow = super().setViewBox(pointlist)\n  if hasattr(self, \"xAxis\") and self.dynamicTicks and self.pixelSize is None:\n   if self.retickTimer is not None: timer.clear_timeout(self.retickTimer)\n   self.retickTimer = timer.set_timeout(self.retick, self.retickDelay)\n  return viewwindow\n\n def retick(self):\n\n\n\n\n\n  self.retickTimer = None\n  previous = SVG.setdecimals(self.decimals)\n  try:\n   self._retick()\n  finally:\n   SVG.setdecimals(previous)\n\n def _retick(self):\n  [(x1, y1), (x2, y2)] = self.viewWindow\n  self.setTickLengths()\n  for (axis, vmin, vmax) in [(self.xAxis, x1, x2), (self.yAxis, -y2, -y1)]:\n   if not axis.showAxis: continue\n   (axismin, axismax) = (float(axis.min), float(axis.max))\n   (vmin, vmax) = (max(vmin, axismin), min(vmax, axismax))\n   values = []\n   axis.majorTickValues = axis.minorTickValues = []\n   if vmin == axismin and vmax == axismax:\n\n    tickvalues(axis, axismin, axismin, axismax)\n    values = scalevalues(axis, axis.min, axis.max)\n   elif vmax > vmin:\n\n    if axis.axisType == \"time\":\n     intervals = gettimescaleintervals(floattotime(vmin), floattotime(vmax), 5)\n     start = roundtimeup(floattotime(vmin), intervals[0])\n    else:\n     intervals = getscaleintervals(vmin, vmax, 5)\n     start = roundup(vmin, intervals[0])\n    tickvalues(axis, float(start), vmin, vmax, intervals)\n    values = scalevalues(axis, start, vmax, intervals[0])\n   axis.basicAxis.update(axis)\n   for ticks in [axis.majorTicks, axis.minorTicks, axis.majorGrid, axis.minorGrid]:\n    if ticks is not None: ticks.update(axis)\n   if axis.scaleValues is not None: axis.scaleValues.update(self, axis, values)\n  self.rescaleAxes()\n  if (self.xScaleFactor, self.yScaleFactor) != self.marksScale: self.rescaleObjects()\n\n def updateAxes(self, xmin, xmax, ymin, ymax):\n\n\n  self.xAxis.setRange(xmin, xmax)\n  self.yAxis.setRange(ymin, ymax)\n  xmin, xmax, ymin, ymax = float(self.xAxis.min), float(self.xAxis.max), float(self.yAxis.min), float(self.yAxis.max)\n  if xmax <= xmin or ymax <= ymin: return\n  self.placeAxes()\n  self.setViewBox([(xmin, -ymax), (xmax, -ymin)])\n  self.retick()\n  if self.titleObject is not None:\n   previous = SVG.setdecimals(self.decimals)\n   self.titleObject.setText(self.title, self._titleAnchor())\n   SVG.setdecimals(previous)\n  self.fixedExtent = SVG.unionextent([fixedextent(obj, self) for obj in self.fitObjects])\n  self.fitContents()\n  if self.retickTimer is not None: timer.clear_timeout(self.retickTimer)\n  self.retickTimer = None\n\n def placeAxes(self):\n\n  (xAxis, yAxis) = (self.xAxis, self.yAxis)\n  xmin, xmax, ymin, ymax = float(xAxis.min), float(xAxis.max), float(yAxis.min), float(yAxis.max)\n  xAxis.position = ymin if ymin > 0 else ymax if ymax < 0 else 0\n  yAxis.position = xmin if xmin > 0 else xmax if xmax < 0 else 0\n  xAxis.omitScale = yAxis.position if yAxis.showAxis and ymin < xAxis.position else None\n  yAxis.omitScale = xAxis.position if xAxis.showAxis and xmin < yAxis.position else None\n  xAxis.gridMin, xAxis.gridMax = ymin, ymax\n  yAxis.gridMin, yAxis.gridMax = xmin, xmax\n\n def _titleAnchor(self):\n  return ((float(self.xAxis.min)+float(self.xAxis.max))/2, float(self.yAxis.max)+1.5*self.yAxis.fontSize*self.yScaleFactor)\n\n def setTickLengths(self):\n\n  self.xAxis.tickLength = self.yAxis.arrowLength = 0.75*self.xAxis.fontSize*self.yScaleFactor\n  self.yAxis.tickLength = self.xAxis.arrowLength = 0.75*self.yAxis.fontSize*self.xScaleFactor\n\n def rescaleObjects(self):\n\n  for obj in self.scaledObjects:\n   obj.rescale(self)\n  self.marksScale = (self.xScaleFactor, self.yScaleFactor)\n\n def rescaleAxes(self):\n\n  for axis in [self.xAxis, self.yAxis]:\n   if not axis.showAxis: continue\n   axis.basicAxis.axisLabel.rescale(self)\n   if axis.scaleValues is not None: axis.scaleValues.rescale(self)\n  if self.titleObject is not None: self.titleObject.rescale(self)\n\n def measureLabels(self, labels, fontsize):\n\n  textmetrics.measurewords([str(label) for label in labels], fontsize, SVG.fontfamily(self))\n\n def indexPoints(self, datapoints):\n\n  if self.pointIndex is None:\n   self.pointIndex = PointIndex(float(self.xAxis.min), float(self.xAxis.max), float(self.yAxis.min), float(self.yAxis.max))\n  for point in datapoints:\n   self.pointIndex.add(point.coords, point)\n\n def nearestLine(self, coords):\n  tolerance = 3 if self.mouseDetected else 5\n  best, bestd = None, tolerance\n  for line in self.hitLines:\n   d = line.distanceTo(coords, self.xScaleFactor, self.yScaleFactor, tolerance)\n   if d is not None and d <= bestd: best, bestd = line, d\n  return best\n\n def showHoverTarget(self, event):\n\n  (x, y) = self.getSVGcoords(event)\n  target = None\n  if self.pointIndex: target = self.pointIndex.nearest((x, -y), self.hoverRadius, self.xScaleFactor, self.yScaleFactor)\n  if target is None and self.hitLines: target = self.nearestLine((x, -y))\n  if target is not self.hoverTarget:\n   self.tooltip.hide()\n   self.hoverTarget = target\n   if target is not None: target.showtooltip(event)\n  return target\n\n def getExtent(self):\n\n\n\n  extent = SVG.unionextent([self.fixedExtent]+[obj.getExtent(self) for obj in self.scaledObjects])\n  if extent is None: return None\n  (x1, y1, x2, y2) = extent\n  return (x1, -y2, x2, -y1)\n\n def fitContents(self):\n  if self.bestFit:\n   self.setViewBox(self.bestFit)\n   return self.bestFit\n  else:\n   super().fitContents()\n   viewwindow = super().fitContents()\n   self.rescaleObjects()\n   return viewwindow\n\n def onMouseMove(self, event):\n  if not self.mouseDetected:\n   self.mouseDetected = True\n   for obj in self.objectDict.values():\n    if hasattr(obj, \"reference\"):\n     obj.style.strokeWidth = 6\n  if self.pointIndex or self.hitLines: self.showHoverTarget(event)\n\n def onMouseLeave(self, event):\n\n  self.tooltip.hide()\n  self.hoverTarget = None\n\n def clearTooltip(self, event):\n  if (self.pointIndex or self.hitLines) and self.showHoverTarget(event) is not None: return\n  if event.target != self: return\n  self.tooltip.hide()\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n def drawAxes(self, xAxis, yAxis):\n\n  xmin, xmax, ymin, ymax = float(xAxis.min), float(xAxis.max), float(yAxis.min), float(yAxis.max)\n  if xmax <= xmin or ymax <= ymin: return\n  self.setViewBox([(xmin, -ymax), (xmax, -ymin)])\n  (xAxis.direction, yAxis.direction) = (\"x\", \"y\")\n  (self.xAxis, self.yAxis) = (xAxis, yAxis)\n  self.setTickLengths()\n  self.placeAxes()\n  self.container.clear()\n  self.scaledObjects = []\n  self.fitObjects = []\n  self.fixedExtent = None\n\n  for axis in [xAxis, yAxis]:\n   if not axis.showAxis: continue\n   axis.basicAxis = BasicAxis(self, axis)\n   axis.axisObjects = AxesGroup(axis.basicAxis)\n   axis.majorTicks = axis.minorTicks = axis.majorGrid = axis.minorGrid = axis.scaleValues = None\n   tickvalues(axis, float(axis.min), float(axis.min), float(axis.max))\n\n   if axis.showMinorTicks:\n    axis.minorTicks = Ticks(axis, \"minor\")\n   if axis.showMajorTicks:\n    axis.majorTicks = Ticks(axis, \"major\")\n\n\n   if axis.showScale:\n    axis.scaleValues = ScaleValues(self, axis)\n\n\n\n   if axis.showMinorGrid:\n    axis.minorGrid = GridLines(axis, \"minor\")\n   if axis.showMajorGrid:\n    axis.majorGrid = GridLines(axis, \"major\")\n\n   self.attachObject(axis.axisObjects)\n\n\n  self.titleObject = None\n  if self.title:\n   self.titleObject = AxesTextObject(self, self.title, self._titleAnchor(), 8, yAxis.fontSize*1.25)\n   self.attachObject(self.titleObject)\n  self.fitContents()\n", ["bisect", "browser", "browser.svg", "brycharts", "brycharts.geometry", "brycharts.scales", "brycharts.timeclasses", "math", "time"]], "brycharts.brycharts": [".py", "\n\n\n\n\n\n\nimport time\nfrom math import sin, cos, pi, log10\nfrom . import dragcanvas as SVG\nfrom . import bryaxes\nfrom .scales import DEFAULT_COLOURS, BARUNIT, seriesstyles\nfrom .datastructures import *\nfrom .statfns import regressioninfo\nimport browser.svg as svg\nfrom browser import window\nfrom .scheduler import chartscheduler, Pending\nfrom .geometry import barrects, histogramrects, normalcurve, scaletransform\n\nBATCHSIZE = 500\nPREVIEWSIZE = 1000\n\ndef batches(items, size=BATCHSIZE):\n for i in range(0, len(items), size):\n  yield items[i:i+size]\n\ndef sample(items, size=PREVIEWSIZE):\n\n step = -(-len(items)//size)\n return items[::step] + ([items[-1]] if (len(items)-1)%step else [])\n\ndef pointmarks(canvas, coordslist, classname):\n\n\n builder = SVG.MarkupBuilder()\n (sx, sy) = (canvas.xScaleFactor, canvas.yScaleFactor)\n for (x, y) in coordslist:\n  transform = scaletransform((x, y), sx, sy, SVG.decimals)\n  builder.add(\"circle\", {\"cx\":x, \"cy\":y, \"r\":3, \"class\":f\"data-point {classname}\", \"transform\":transform})\n group = bryaxes.AxesGroup()\n builder.insertInto(group)\n group.markExtent = SVG.pointsextent(coordslist)\n return group\n\ndef seriesclasses(canvas, colours, linewidth=2):\n\n\n canvas.setClassStyles(seriesstyles(colours, linewidth))\n return [f\"series-{i}\" for i in range(len(colours))]\n\ndef polylinemarks(geometry, classname):\n\n\n builder = SVG.MarkupBuilder()\n builder.add(\"polyline\", {\"points\":geometry[\"points\"], \"class\":classname})\n group = bryaxes.AxesGroup()\n builder.insertInto(group)\n group.markExtent = tuple(geometry[\"extent\"])\n return group\n\ndef precisionsteps(chart, steps):\n\n while True:\n  previous = SVG.setdecimals(chart.decimals)\n  try:\n   step = next(steps)\n  except StopIteration:\n   return\n  finally:\n   SVG.setdecimals(previous)\n  yield step\n\ndef lazyinit(init):\n\n\n\n\n\n\n\n def __init__(self, parent, *args, lazy=False, sliced=False, onready=None, static=False, precision=None, **kwargs):\n  self.static = static\n  self.precision = precision\n  sliced = sliced or kwargs.get(\"progressive\", False) or kwargs.get(\"workerpool\") is not None\n  if lazy or sliced:\n   svg.svg.__init__(self, style={\"width\":kwargs.get(\"width\", \"95%\"), \"height\":kwargs.get(\"height\", \"95%\")})\n   parent <= self\n  def build():\n   steps = init(self, parent, *args, **kwargs)\n   if steps is None:\n    if onready: onready(self)\n   elif sliced:\n    chartscheduler.add(self, precisionsteps(self, steps), onready)\n   else:\n    for step in steps: pass\n    if onready: onready(self)\n  if lazy and hasattr(window, \"IntersectionObserver\"):\n   def onintersect(entries, observer):\n    if not any(entry.isIntersecting for entry in entries): return\n    observer.disconnect()\n    self.lazyObserver = None\n    build()\n   self.lazyObserver = window.IntersectionObserver.new(onintersect, {\"rootMargin\":\"100px\"})\n   self.lazyObserver.observe(self)\n  else:\n   build()\n return __init__\n\n\n\nclass PieChart(SVG.CanvasObject):\n @lazyinit\n def __init__(self, parent, data, title=\"\", colours=None, usekey=True, fontsize=14, width=\"95%\", height=\"95%\", objid=None):\n  super().__init__(width, height, objid=objid)\n  if self.parentNode is None: parent <= self\n  self.beginBuild()\n  self.tooltip = SVG.Tooltip(self)\n  if not colours: colours = DEFAULT_COLOURS\n  if not usekey:\n   D = data.items()\n   n = len(D)\n   L = sorted(D, key = lambda x:x[1])\n   M = []\n   for pair in zip(L[n//2:], L[:n//2]): M.extend(pair)\n   if n%2 == 1: M.append(L[-1])\n   data = LabelledData(M, data.valuesLabel)\n  angles = [0]\n  for percentage in data.percentages:\n   angles.append(angles[-1] + percentage*3.6)\n  self.sectors = [PieChartSector(self, (0,0), 100, angles[i], angles[i+1], data.labels[i], data.Values[i], data.percentages[i], colours[i]) for i in range(len(angles)-1)]\n  self.addObjects(self.sectors)\n  self.fitContents()\n  self.mouseMode = SVG.MouseMode.PAN\n  self.bind(\"touchstart\", self.clearTooltip)\n\n  if usekey:\n   keysize = fontsize*1.25\n   keypos = SVG.Point((140, -len(data.labels)*keysize/2))\n   for i, label in enumerate(data.labels):\n    self.addObject(SVG.GroupObject([\nSVG.RectangleObject([keypos, keypos+(fontsize,fontsize)], fillcolour=colours[i]),\nSVG.TextObject(label, keypos+(keysize,fontsize/2), anchorposition=4, fontsize=fontsize)\n]))\n    keypos += (0,keysize)\n   titlepos = (120, -110)\n  else:\n   anchorpositions = [7, 4, 1, 3, 6, 9]\n   for i, label in enumerate(data.labels):\n    anglepos = (angles[i] + angles[i+1]) / 2\n    anchorposition = anchorpositions[int(anglepos//60)]\n    anchorpoint = (105*sin(anglepos*pi/180), -105*cos(anglepos*pi/180))\n    self.addObject(SVG.TextObject(label, anchorpoint, anchorposition, fontsize=fontsize))\n   titlepos = (0, -130)\n  if title: self.addObject(SVG.TextObject(title, titlepos, anchorposition=8, fontsize=fontsize*1.25))\n  self.fitContents()\n  self.endBuild()\n\n def clearTooltip(self, event):\n  if event.target != self: return\n  self.tooltip.hide()\n\nclass BarChart(bryaxes.AxesCanvas):\n @lazyinit\n def __init__(self, parent, data, title=\"\", direction=\"vertical\", colour=\"yellow\", fontsize=14, axisoptions={}, width=\"95%\", height=\"95%\", objid=None):\n  xaxisoptions = {\"showScale\":False, \"showMajorTicks\":False, \"showMinorTicks\":False, \"showMajorGrid\":False}\n  xaxis = bryaxes.Axis(0, BARUNIT*len(data), \"\", xaxisoptions)\n  yaxis = bryaxes.Axis(0, data.maxValue, data.valuesLabel, axisoptions)\n  if direction == \"horizontal\": xaxis, yaxis = yaxis, xaxis\n  super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)\n  self.attachObject(Bars(self, data, direction=direction, colour=colour))\n  self.measureLabels(data.labels, fontsize)\n  for i in range(len(data)):\n   if direction == \"horizontal\":\n    label = bryaxes.AxesWrappingTextObject(self, data.labels[i], (-10*self.xScaleFactor, (i+0.6)*BARUNIT), 80, anchorposition=6, fontsize=fontsize)\n   else:\n    label = bryaxes.AxesWrappingTextObject(self, data.labels[i], ((i+0.6)*BARUNIT, 0), 0.8*BARUNIT, fontsize=fontsize)\n   self.attachObject(label)\n  self.fitContents()\n  self.endBuild()\n\nclass StackedBarChart(bryaxes.AxesCanvas):\n @lazyinit\n def __init__(self, parent, data, title=\"\", direction=\"vertical\", colours=None, fontsize=14, axisoptions={}, width=\"95%\", height=\"95%\", objid=None):\n  if not colours: colours = DEFAULT_COLOURS\n  xaxisoptions = {\"showScale\":False, \"showMajorTicks\":False, \"showMinorTicks\":False, \"showMajorGrid\":False}\n  xaxis = bryaxes.Axis(0, BARUNIT*len(data.labels), \"\", xaxisoptions)\n  yaxis = bryaxes.Axis(0, data.maxSum, data.valuesLabel, axisoptions)\n  if direction == \"horizontal\": xaxis, yaxis = yaxis, xaxis\n  super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)\n  for i, key in enumerate(data.keys()):\n   self.attachObject(Bars(self, data, \"stacked\", i, key, direction, colours[i]))\n  self.measureLabels(data.labels, fontsize)\n  for i in range(len(data.labels)):\n   if direction == \"horizontal\":\n    label = bryaxes.AxesWrappingTextObject(self, data.labels[i], (-10*self.xScaleFactor, (i+0.6)*BARUNIT), 80, anchorposition=6, fontsize=fontsize)\n   else:\n    label = bryaxes.AxesWrappingTextObject(self, data.labels[i], ((i+0.6)*BARUNIT, 0), 0.8*BARUNIT, fontsize=fontsize)\n   self.attachObject(label)\n  keywidth = 20*self.xScaleFactor\n  keyheight = fontsize*2*self.yScaleFactor\n  keypos = SVG.Point((self.xAxis.max + keywidth, self.yAxis.min+keyheight))\n  for i, key in enumerate(data.keys()):\n   self.attachObject(SVG.GroupObject([\nSVG.RectangleObject([keypos, keypos+(keywidth,keyheight/2)], fillcolour=colours[i]),\nbryaxes.AxesTextObject(self, key, keypos+(keywidth*1.25,0), anchorposition=7, fontsize=fontsize)\n]))\n   keypos += (0, keyheight)\n  self.bestFit = self.fitContents()\n  self.endBuild()\n\nclass GroupedBarChart(bryaxes.AxesCanvas):\n @lazyinit\n def __init__(self, parent, data, title=\"\", direction=\"vertical\", colours=None, fontsize=14, axisoptions={}, width=\"95%\", height=\"95%\", objid=None):\n  if not colours: colours = DEFAULT_COLOURS\n  xaxisoptions = {\"showScale\":False, \"showMajorTicks\":False, \"showMinorTicks\":False, \"showMajorGrid\":False}\n  xaxis = bryaxes.Axis(0, BARUNIT*len(data.labels), \"\", xaxisoptions)\n  yaxis = bryaxes.Axis(0, data.maxValue, data.valuesLabel, axisoptions)\n  if direction == \"horizontal\": xaxis, yaxis = yaxis, xaxis\n  super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)\n  for i, key in enumerate(data.keys()):\n   self.attachObject(Bars(self, data, \"grouped\", i, key, direction, colours[i]))\n  self.measureLabels(data.labels, fontsize)\n  for i in range(len(data.labels)):\n   if direction == \"horizontal\":\n    label = bryaxes.AxesWrappingTextObject(self, data.labels[i], (-10*self.xScaleFactor, (i+0.6)*BARUNIT), 80, anchorposition=6, fontsize=fontsize)\n   else:\n    label = bryaxes.AxesWrappingTextObject(self, data.labels[i], ((i+0.6)*BARUNIT, 0), 0.8*BARUNIT, fontsize=fontsize)\n   self.attachObject(label)\n  keywidth = 20*self.xScaleFactor\n  keyheight = fontsize*2*self.yScaleFactor\n  keypos = SVG.Point((self.xAxis.max + keywidth, self.yAxis.min+keyheight))\n  for i, key in enumerate(data.keys()):\n   self.attachObject(SVG.GroupObject([\nSVG.RectangleObject([keypos, keypos+(keywidth,keyheight/2)], fillcolour=colours[i]),\nbryaxes.AxesTextObject(self, key, keypos+(keywidth*1.25,0), anchorposition=7, fontsize=fontsize)\n]))\n   keypos += (0, keyheight)\n  self.bestFit = self.fitContents()\n  self.endBuild()\n\nclass ScatterGraph(bryaxes.AxesCanvas):\n @lazyinit\n def __init__(self, parent, data, title=\"\", colour=\"red\", showregressionline=False, fontsize=14, xaxisoptions={}, yaxisoptions={}, width=\"95%\", height=\"95%\", objid=None, progressive=False):\n  xaxis = bryaxes.Axis(data.xMin, data.xMax, data.xLabel, xaxisoptions)\n  yaxis = bryaxes.Axis(data.yMin, data.yMax, data.yLabel, yaxisoptions)\n  yield\n  super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)\n  yield\n  if showregressionline:\n   self.regressionLine = RegressionLine(self, data)\n   self.attachObject(self.regressionLine)\n  items = list(data.items()) if isinstance(data, LabelledPairedData) else [(None, coords) for coords in data]\n  [classname] = seriesclasses(self, [colour])\n  preview = None\n  if progressive and len(items) > PREVIEWSIZE:\n   preview = pointmarks(self, [coords for (label, coords) in sample(items)], classname)\n   self.attachObject(preview)\n   yield\n  marks = bryaxes.AxesGroup()\n  if preview is not None: marks.style.display = \"none\"\n  self.attachObject(marks)\n  self.dataPoints = []\n  for batch in batches(items):\n   datapoints = [DataPoint(self, label, coords, classname) for (label, coords) in batch]\n   marks.attach(datapoints)\n   self.indexPoints(datapoints)\n   self.dataPoints.extend(datapoints)\n   yield\n  if preview is not None:\n   self.removeObject(preview)\n   marks.style.display = \"inline\"\n  self.endBuild()\n\nclass BasicScatterGraph(bryaxes.AxesCanvas):\n @lazyinit\n def __init__(self, parent, data, title=\"\", colour=\"red\", showregressionline=False, fontsize=14, xaxisoptions={}, yaxisoptions={}, width=\"95%\", height=\"95%\", objid=None):\n  xaxis = bryaxes.Axis(data.xMin, data.xMax, data.xLabel, xaxisoptions)\n  yaxis = bryaxes.Axis(data.yMin, data.yMax, data.yLabel, yaxisoptions)\n  super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)\n  if showregressionline:\n   self.regressionLine = RegressionLine(self, data)\n   self.attachObject(self.regressionLine)\n  if isinstance(data, LabelledPairedData):\n   data = data.values()\n  [classname] = seriesclasses(self, [colour])\n  self.dataPoints = pointmarks(self, data, classname)\n  self.attachObject(self.dataPoints)\n  self.endBuild()\n\nclass MultiScatterGraph(bryaxes.AxesCanvas):\n @lazyinit\n def __init__(self, parent, data, title=\"\", colours=None, showregressionlines=False, fontsize=14, xaxisoptions={}, yaxisoptions={}, width=\"95%\", height=\"95%\", objid=None):\n  xaxis = bryaxes.Axis(data.xMin, data.xMax, data.xLabel, xaxisoptions)\n  yaxis = bryaxes.Axis(data.yMin, data.yMax, data.yLabel, yaxisoptions)\n  yield\n  super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)\n  yield\n  if not colours: colours = DEFAULT_COLOURS\n  if showregressionlines==True: showregressionlines = [True]*len(data)\n  if showregressionlines==False: showregressionlines = [False]*len(data)\n  classnames = seriesclasses(self, colours[:len(data)])\n  for i, (key, dataset) in enumerate(data.items()):\n   if showregressionlines[i]:\n    self.regressionLine = RegressionLine(self, dataset, colours[i])\n    self.attachObject(self.regressionLine)\n   items = list(dataset.items()) if isinstance(dataset, LabelledPairedData) else [(None, coords) for coords in dataset]\n   self.dataPoints = []\n   for batch in batches(items):\n    datapoints = [DataPoint(self, label, coords, classnames[i]) for (label, coords) in batch]\n    self.attachObjects(datapoints)\n    self.indexPoints(datapoints)\n    self.dataPoints.extend(datapoints)\n    yield\n  keywidth = 20*self.xScaleFactor\n  keyheight = fontsize*2*self.yScaleFactor\n  keypos = SVG.Point((self.xAxis.max + keywidth, self.yAxis.min+keyheight))\n  for i, key in enumerate(data.keys()):\n   self.attachObject(SVG.GroupObject([\nSVG.EllipseObject(pointlist=[keypos, keypos+(keywidth,keyheight/2)], fillcolour=colours[i]),\nbryaxes.AxesTextObject(self, key, keypos+(keywidth*1.25,0), anchorposition=7, fontsize=fontsize)\n]))\n   keypos += (0, keyheight)\n  self.bestFit = self.fitContents()\n  self.endBuild()\n\nclass LineGraph(bryaxes.AxesCanvas):\n @lazyinit\n def __init__(self, parent, data, title=\"\", colours=None, fontsize=14, xaxisoptions={}, yaxisoptions={}, width=\"95%\", height=\"95%\", objid=None, progressive=False, workerpool=None):\n  tt = time.time()\n  xaxisoptions[\"axisType\"] = \"time\" if isinstance(data, (TimeSeriesData, TimeSeriesDataDict)) else \"float\"\n  xaxis = bryaxes.Axis(data.xMin, data.xMax, data.xLabel, xaxisoptions)\n  yaxis = bryaxes.Axis(data.yMin, data.yMax, data.yLabel, yaxisoptions)\n\n  yield\n  tt = time.time()\n  super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)\n  yield\n\n  tt = time.time()\n  if not colours: colours = DEFAULT_COLOURS\n  if isinstance(data, PairedData):\n   coordslist = [(float(x), y) for (x, y) in data]\n   self.attachObject(SVG.PolylineObject(coordslist, linecolour=colours[0]))\n  else:\n   keywidth = 20*self.xScaleFactor\n   keyheight = fontsize*2*self.yScaleFactor\n   keypos = SVG.Point((float(self.xAxis.max) + keywidth, self.yAxis.max))\n   keydata = []\n   serieslist = [(key, list(pd), [(float(x), y) for (x, y) in pd]) for (key, pd) in data.items()]\n   classnames = seriesclasses(self, colours[:len(serieslist)])\n   preview = None\n   if progressive and max(len(pd) for (key, pd, coordslist) in serieslist) > PREVIEWSIZE:\n    preview = SVG.GroupObject([SVG.PolylineObject(sample(coordslist), classname=classnames[i])\nfor i, (key, pd, coordslist) in enumerate(serieslist)])\n    self.attachObject(preview)\n    yield\n   lines = []\n   marks = bryaxes.AxesGroup()\n   if preview is not None: marks.style.display = \"none\"\n   self.attachObject(marks)\n   geometries = [Pending() for series in serieslist] if workerpool is not None else []\n   for (pending, (key, pd, coordslist)) in zip(geometries, serieslist):\n    workerpool.polylineGeometry(coordslist, pending.resolve, self.decimals, pending.reject)\n   for i, (key, pd, coordslist) in enumerate(serieslist):\n    if geometries:\n     yield geometries[i]\n     lines.append(polylinemarks(geometries[i].result, classnames[i]))\n    else:\n     lines.append(SVG.PolylineObject(coordslist, classname=classnames[i]))\n    if preview is not None: lines[-1].style.display = \"none\"\n    self.attachObject(lines[-1])\n    yield\n    for batch in batches(pd):\n     datapoints = [DataPoint(self, key, coords, classnames[i]) for coords in batch]\n     marks.attach(datapoints)\n     self.indexPoints(datapoints)\n     yield\n    keydata.append((coordslist[-1][1], key, classnames[i]))\n   if preview is not None:\n    self.removeObject(preview)\n    for line in lines+[marks]: line.style.display = \"inline\"\n   keydata.sort(key = lambda x: -x[0])\n   for (_, key, classname) in keydata:\n    self.attachObject(SVG.GroupObject([\nSVG.LineObject([keypos, keypos+(keywidth,0)], classname=classname),\nbryaxes.AxesTextObject(self, key, keypos+(keywidth*1.25,0), anchorposition=4, fontsize=fontsize)\n]))\n    keypos += (0, -keyheight)\n   self.bestFit = self.fitContents()\n\n  tt = time.time()\n  self.endBuild()\n\nclass BoxPlotCanvas(bryaxes.AxesCanvas):\n @lazyinit\n def __init__(self, parent, data, title=\"\", colour=\"yellow\", fontsize=14, axisoptions={}, width=\"95%\", height=\"95%\", objid=None):\n  if isinstance(data, BoxPlotData): data = BoxPlotDataDict(data.valuesLabel, {\"\":data})\n  xaxis = bryaxes.Axis(data.xMin, data.xMax, data.valuesLabel, axisoptions)\n  yaxis = bryaxes.Axis(0, 50*len(data), \"\", {\"showAxis\":False})\n  super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)\n  self.fitContents()\n  self.measureLabels(data.keys(), fontsize)\n  yheight = 25\n  for label, boxplotdata in data.items():\n   self.attachObject(BoxPlot(boxplotdata, label, yheight, colour))\n   if label: self.attachObject(bryaxes.AxesWrappingTextObject(self, label, (xaxis.min-10*self.xScaleFactor, yheight), 100, 6, fontsize))\n   yheight += 50\n  self.bestFit = self.fitContents()\n  self.endBuild()\n\nclass Histogram(bryaxes.AxesCanvas):\n @lazyinit\n def __init__(self, parent, data, title=\"\", shownormalcurve=False, colour=\"yellow\", fontsize=14, xaxisoptions={}, yaxisoptions={}, width=\"95%\", height=\"95%\", objid=None):\n  xaxis = bryaxes.Axis(data.xMin, data.xMax, data.valuesLabel, xaxisoptions)\n  yaxis = bryaxes.Axis(0, data.maxFrequencyDensity, \"Frequency density\", yaxisoptions)\n  yield\n  super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)\n  yield\n  self.attachObject(HistogramBars(data, colour))\n  yield\n  if shownormalcurve:\n   self.attachObject(NormalCurve(self, data))\n  self.endBuild()\n\nclass CumulativeFrequencyGraph(bryaxes.AxesCanvas):\n @lazyinit\n def __init__(self, parent, data, title=\"\", colours=None, fontsize=14, xaxisoptions={}, axisoptions={}, width=\"95%\", height=\"95%\", objid=None):\n  if isinstance(data, CumulativeFrequencyData): data = CumulativeFrequencyDataDict(data.valuesLabel, {\"\":data})\n  xaxis = bryaxes.Axis(data.xMin, data.xMax, data.valuesLabel, xaxisoptions)\n  yaxis = bryaxes.Axis(0, data.maxTotalFrequency, \"Cumulative frequency\", yaxisoptions)\n  super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)\n  if not colours: colours = DEFAULT_COLOURS\n  classnames = seriesclasses(self, colours[:len(data)])\n  for i, (key, cfd) in enumerate(data.items()):\n   self.attachObject(CumulativeFrequencyLine(self, key, cfd, classnames[i]))\n  if len(data) > 1:\n   keywidth = 20*self.xScaleFactor\n   keyheight = fontsize*2*self.yScaleFactor\n   keypos = SVG.Point((self.xAxis.max + keywidth, self.yAxis.max))\n   for i, key in enumerate(data.keys()):\n    self.attachObject(SVG.GroupObject([\nSVG.LineObject([keypos, keypos+(keywidth,0)], classname=classnames[i]),\nbryaxes.AxesTextObject(self, key, keypos+(keywidth*1.25,0), anchorposition=4, fontsize=fontsize)\n]))\n    keypos += (0, -keyheight)\n   self.bestFit = self.fitContents()\n  self.endBuild()\n\nclass CumulativePercentageGraph(bryaxes.AxesCanvas):\n @lazyinit\n def __init__(self, parent, data, title=\"\", colours=None, fontsize=14, xaxisoptions={}, yaxisoptions={}, width=\"95%\", height=\"95%\", objid=None):\n  if isinstance(data, CumulativeFrequencyData): data = CumulativeFrequencyDataDict(data.valuesLabel, {\"\":data})\n  xaxis = bryaxes.Axis(data.xMin, data.xMax, data.valuesLabel, xaxisoptions)\n  yaxis = bryaxes.Axis(0, 100, \"Cumulative percentage\", yaxisoptions)\n  super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)\n  if not colours: colours = DEFAULT_COLOURS\n  classnames = seriesclasses(self, colours[:len(data)])\n  for i, (key, cfd) in enumerate(data.items()):\n   self.attachObject(CumulativePercentageLine(self, key, cfd, classnames[i]))\n  if len(data) > 1:\n   keywidth = 20*self.xScaleFactor\n   keyheight = fontsize*2*self.yScaleFactor\n   keypos = SVG.Point((self.xAxis.max + keywidth, self.yAxis.max))\n   for i, key in enumerate(data.keys()):\n    self.attachObject(SVG.GroupObject([\nSVG.LineObject([keypos, keypos+(keywidth,0)], classname=classnames[i]),\nbryaxes.AxesTextObject(self, key, keypos+(keywidth*1.25,0), anchorposition=4, fontsize=fontsize)\n]))\n    keypos += (0, -keyheight)\n   self.bestFit = self.fitContents()\n  self.endBuild()\n\n\n\nclass PieChartSector(SVG.SectorObject):\n def __init__(self, canvas, centre, radius, startangle, endangle, label, value, percentage, colour):\n  super().__init__(centre, radius, startangle, endangle, fillcolour=colour)\n  self.canvas = canvas\n  self.centre = (self.pointList[0] + self.pointList[1] + self.pointList[2])/3\n  self.tooltiptext = f\"{label}\\n{value} ({percentage:.2f}%)\"\n  self.bind(\"mouseenter\", self.showtooltip)\n  self.bind(\"touchstart\", self.showtooltip)\n  self.bind(\"mouseleave\", self.hidetooltip)\n\n def showtooltip(self, event):\n  self.canvas.tooltip.show(self.tooltiptext, self.centre)\n\n def hidetooltip(self, event):\n  self.canvas.tooltip.hide()\n\nclass Bars(bryaxes.MarkGroup):\n def __init__(self, canvas, data, graphtype=None, index=None, key=None, direction=\"vertical\", colour=\"yellow\"):\n  super().__init__()\n  for (pointlist, tooltiptext) in barrects(data, graphtype, index, key, direction):\n   self.addRectangle(pointlist, colour, tooltiptext)\n  self.build()\n\nclass DataPoint(bryaxes.AxesPoint):\n def __init__(self, canvas, label, coords, classname=\"series-0\", objid=None):\n  (x, y) = coords\n  super().__init__(canvas, (float(x), y), classname)\n  self.canvas = canvas\n  self.coords = (float(x), y)\n  self.tooltiptext = f\"{label}\\n{coords}\" if label else f\"{coords}\"\n  self.style.pointerEvents = \"none\"\n\n def showtooltip(self, event):\n  self.canvas.tooltip.show(self.tooltiptext, self.coords)\n\nclass RegressionLine(bryaxes.AxesPolyline):\n def __init__(self, canvas, data, colour=\"black\"):\n  points = data.values() if isinstance(data, LabelledPairedData) else data\n  pmcc, gradient, yintercept = regressioninfo(points)\n  sign = \"\" if yintercept < 0 else \"+\"\n  n1 = 2-int(log10(gradient))\n  n2 = 2-int(log10(yintercept))\n  self.tooltiptext = f\"y = {gradient:.{n1}f}x{sign}{yintercept:.{n2}f}\\n(PMCC = {pmcc:.2f})\"\n  x1, x2 = data.xMin, data.xMax\n  y1, y2 = gradient*x1 + yintercept, gradient*x2 + yintercept\n  super().__init__(canvas, [(x1,y1), (x2,y2)], linecolour=colour, linewidth=2)\n\n def showtooltip(self, event):\n  (x, y) = self.canvas.getSVGcoords(event)\n  self.canvas.tooltip.show(self.tooltiptext, (x, -y))\n\nclass BoxPlot(SVG.GroupObject):\n def __init__(self, boxplotinfo, label, yheight, colour=\"yellow\"):\n  xmin, Q1, Q2, Q3, xmax = boxplotinfo\n  super().__init__([\nSVG.LineObject([(xmin, yheight-5), (xmin, yheight+5)]),\nSVG.LineObject([(xmin, yheight), (Q1, yheight)]),\nSVG.RectangleObject([(Q1, yheight-15), (Q2, yheight+15)], fillcolour = colour),\nSVG.RectangleObject([(Q2, yheight-15), (Q3, yheight+15)], fillcolour = colour),\nSVG.LineObject([(Q3, yheight), (xmax, yheight)]),\nSVG.LineObject([(xmax, yheight-5), (xmax, yheight+5)])\n])\n  self.tooltiptext = f\"{label}\\nMin={xmin}, Q1={Q1}, Q2={Q2}, Q3={Q3}, Max={xmax}\"\n  self.centre = ((Q1+Q2)/2, yheight)\n  self.bind(\"mouseenter\", self.showtooltip)\n  self.bind(\"touchstart\", self.showtooltip)\n  self.bind(\"mouseleave\", self.hidetooltip)\n\n def showtooltip(self, event):\n  self.canvas.tooltip.show(self.tooltiptext, self.centre)\n\n def hidetooltip(self, event):\n  self.canvas.tooltip.hide()\n\nclass HistogramBars(bryaxes.MarkGroup):\n def __init__(self, gfd, colour=\"yellow\"):\n  super().__init__()\n  for (pointlist, tooltiptext) in histogramrects(gfd):\n   self.addRectangle(pointlist, colour, tooltiptext)\n  self.build()\n\nclass NormalCurve(bryaxes.AxesPolyline):\n def __init__(self, canvas, gfd):\n  (points, m, v) = normalcurve(gfd)\n  super().__init__(canvas, points, linewidth=2)\n  self.tooltiptext = f\"\u00b5 = {m:.1f}\\n\u03c3\u00b2 = {v:.1f}\"\n\n def showtooltip(self, event):\n  (x, y) = self.canvas.getSVGcoords(event)\n  self.canvas.tooltip.show(self.tooltiptext, (x, -y))\n\n\nclass CumulativeFrequencyLine(bryaxes.AxesPolyline):\n def __init__(self, canvas, key, cfd, classname):\n  super().__init__(canvas, cfd, classname=classname)\n  self.key = key\n\n def showtooltip(self, event):\n  (x, y) = self.canvas.getSVGcoords(event)\n  n = int(3-log10(x))\n  tooltiptext = f\"{self.key}\\nNumber of values < {x:.{n}f}: {-y:.0f}\"\n  self.canvas.tooltip.show(tooltiptext, (x, -y))\n\nclass CumulativePercentageLine(bryaxes.AxesPolyline):\n def __init__(self, canvas, key, cfd, classname):\n  total = cfd.totalFrequency\n  points = [(x, 100*y/total) for (x, y) in cfd]\n  super().__init__(canvas, points, classname=classname)\n  self.key = key\n\n def showtooltip(self, event):\n  (x, y) = self.canvas.getSVGcoords(event)\n  n = int(3-log10(x))\n  tooltiptext = f\"{self.key}\\n%age of values < {x:.{n}f}: {-y:.0f}%\"\n  self.canvas.tooltip.show(tooltiptext, (x, -y))\n", ["browser", "browser.svg", "brycharts", "brycharts.datastructures", "brycharts.geometry", "brycharts.scales", "brycharts.scheduler", "brycharts.statfns", "math", "time"]], "brycharts.chartcache": [".py", "\n\n\n\n\n\n\n\n\n\n\n\nimport hashlib\nfrom collections import OrderedDict\nfrom browser import window, timer\n\ndef fingerprint(chartclass, data, args, kwargs):\n\n description = repr((chartclass.__name__, type(data).__name__, data, sorted(getattr(data, \"__dict__\", {}).items()), args, sorted(kwargs.items())))\n return hashlib.sha1(description.encode(\"utf-8\")).hexdigest()\n\nclass ChartCache(object):\n\n\n\n\n\n\n def __init__(self, maxsize=5000000, persist=False, dbname=\"brycharts\", onload=None):\n  self.maxSize = maxsize\n  self.totalSize = 0\n  self.entries = OrderedDict()\n  self.stored = {}\n  self.db = None\n  if persist:\n   self._opendb(dbname, onload)\n  elif onload:\n   onload()\n\n def chart(self, chartclass, parent, data, *args, onready=None, **kwargs):\n\n\n\n\n  key = fingerprint(chartclass, data, args, kwargs)\n  def ready(chart):\n   self._add(key, chart)\n   if onready: onready(chart)\n  if key in self.entries:\n   self.entries.move_to_end(key)\n   chart = self.entries[key][0]\n   parent <= chart\n  elif key in self.stored:\n   parent.insertAdjacentHTML(\"beforeend\", self.stored[key])\n   placeholder = parent.lastChild\n   def build():\n    nextsibling = placeholder.nextSibling\n    parent.removeChild(placeholder)\n    chart = chartclass(parent, data, *args, onready=ready, **kwargs)\n    if nextsibling: parent.insertBefore(chart, nextsibling)\n   timer.set_timeout(build, 0)\n   return None\n  else:\n   return chartclass(parent, data, *args, onready=ready, **kwargs)\n  if onready: onready(chart)\n  return chart\n\n def clear(self):\n  self.entries.clear()\n  self.stored.clear()\n  self.totalSize = 0\n  if self.db: self._store(\"readwrite\").clear()\n\n def _add(self, key, chart):\n  markup = chart.outerHTML\n  self.entries[key] = (chart, len(markup))\n  self.totalSize += len(markup)\n  if self.db:\n   self.stored[key] = markup\n   self._store(\"readwrite\").put(markup, key)\n  while self.totalSize > self.maxSize and len(self.entries) > 1:\n   (oldkey, (oldchart, size)) = self.entries.popitem(last=False)\n   self.totalSize -= size\n   if self.db:\n    self.stored.pop(oldkey, None)\n    self._store(\"readwrite\").delete(oldkey)\n\n def _opendb(self, dbname, onload):\n  request = window.indexedDB.open(dbname, 1)\n  def onupgradeneeded(event):\n   event.target.result.createObjectStore(\"charts\")\n  def onsuccess(event):\n   self.db = event.target.result\n   cursorrequest = self._store(\"readonly\").openCursor()\n   def oncursor(event):\n    cursor = event.target.result\n    if cursor:\n     self.stored[cursor.key] = cursor.value\n     getattr(cursor, \"continue\")()\n    elif onload:\n     onload()\n   cursorrequest.onsuccess = oncursor\n  def onerror(event):\n   if onload: onload()\n  request.onupgradeneeded = onupgradeneeded\n  request.onsuccess = onsuccess\n  request.onerror = onerror\n\n def _store(self, mode):\n  return self.db.transaction(\"charts\", mode).objectStore(\"charts\")\n", ["browser", "collections", "hashlib"]], "brycharts.datastructures": [".py", "\n\n\n\n\n\n\n\n\n\nimport json\nfrom bisect import bisect_right\nfrom .scales import rounddown, roundup, getscaleintervals\nfrom .timeclasses import TimeCoord\nfrom .statfns import *\n\n__all__ = [\"LabelledData\", \"LabelledDataDict\", \"FrequencyData\", \"FrequencyDataDict\", \"PairedData\", \"TimeSeriesData\",\n\"PairedDataDict\", \"TimeSeriesDataDict\", \"LabelledPairedData\", \"LabelledPairedDataDict\", \"BoxPlotData\", \"BoxPlotDataDict\",\n\"GroupedFrequencyData\", \"GroupedFrequencyDataDict\", \"CumulativeFrequencyData\", \"CumulativeFrequencyDataDict\", \"DataTable\",\n\"countvalues\", \"classboundaries\", \"groupfrequencies\", \"fivenumbers\"]\n\n\n\ndef countvalues(rawdata):\n\n counter = {}\n for x in rawdata:\n  if x in counter:\n   counter[x] += 1\n  else:\n   counter[x] = 1\n return sorted(counter.items())\n\ndef classboundaries(datamin, datamax, boundaries=None, classwidth=None):\n\n if not boundaries:\n  if not classwidth: classwidth, _, _ = getscaleintervals(datamin, datamax, 5)\n  minboundary = rounddown(datamin, classwidth)\n  maxboundary = roundup(datamax, classwidth)\n  boundaries =  [minboundary]\n  while boundaries[-1] < maxboundary: boundaries.append(boundaries[-1] + classwidth)\n else:\n  if datamin < boundaries[0]:\n   classwidth = boundaries[1] - boundaries[0]\n   boundaries.insert(0, rounddown(datamin, classwidth))\n  if datamax > boundaries[-1]:\n   classwidth = boundaries[-1] - boundaries[-2]\n   boundaries.append(roundup(datamax, classwidth))\n return boundaries\n\ndef groupfrequencies(rawdata, boundaries):\n\n\n L = len(boundaries)\n frequencies = [0] * L\n for value in rawdata:\n  frequencies[min(max(bisect_right(boundaries, value)-1, 0), L-2)] += 1\n return list(zip(boundaries, frequencies))\n\ndef fivenumbers(rawdata):\n\n Q1, Q2, Q3 = quartiles(rawdata)\n return [min(rawdata), Q1, Q2, Q3, max(rawdata)]\n\n\n\nclass LabelledData(dict):\n def __init__(self, data, valueslabel):\n  super().__init__(data)\n  self.valuesLabel = valueslabel\n  self.labels = list(self.keys())\n  self.Values = list(self.values())\n  self.maxValue = max(self.Values)\n  self.total = sum(self.Values)\n  self.percentages = [100*value/self.total for value in self.Values]\n\nclass LabelledDataDict(dict):\n def __init__(self, datadict, valueslabel):\n  if not isinstance(next(iter(datadict.values())), LabelledData):\n   datadict = {key:LabelledData(ld, valueslabel) for (key, ld) in datadict.items()}\n  super().__init__(datadict)\n  self.maxValue = max(ld.maxValue for ld in self.values())\n  self.valuesLabel = valueslabel\n  labels = set()\n  for ld in self.values(): labels.update(ld.keys())\n  self.labels = list(labels)\n  self.Values = {label:[] for label in self.labels}\n  self.sums = {label:[0] for label in self.labels}\n  for label in self.labels:\n   for ld in self.values():\n    value = ld.get(label, 0)\n    self.Values[label].append(value)\n    self.sums[label].append(self.sums[label][-1] + value)\n  self.maxSum = max(sums[-1] for sums in self.sums.values())\n\nclass FrequencyData(LabelledData):\n def __init__(self, data=None, rawdata=None, valueslabel=\"Frequency\"):\n  if rawdata:\n   data = self.fromRawData(rawdata)\n  super().__init__(data, valueslabel)\n\n def fromRawData(self, rawdata):\n\n  return countvalues(rawdata)\n\nclass FrequencyDataDict(LabelledDataDict):\n def __init__(self, datadict=None, rawdatadict=None, valueslabel=\"Frequency\"):\n  if rawdatadict:\n   fdd = {key:FrequencyData(rawdata=rawdata, valueslabel=valueslabel) for (key, rawdata) in rawdatadict.items()}\n  else:\n   fdd = {key:FrequencyData(data=data, valueslabel=valueslabel) for (key, data) in datadict.items()}\n  super().__init__(fdd, valueslabel)\n\nclass PairedData(list):\n def __init__(self, xlabel, ylabel, data):\n  super().__init__(data)\n  self.xLabel = xlabel\n  self.yLabel = ylabel\n  self.xValues = [item[0] for item in data]\n  self.yValues = [item[1] for item in data]\n  self.xMin, self.xMax = min(self.xValues), max(self.xValues)\n  self.yMin, self.yMax = min(self.yValues), max(self.yValues)\n\nclass TimeSeriesData(PairedData):\n def __init__(self, xlabel, ylabel, data):\n  if TimeCoord.startfloat == 0:\n   x0 = min(x for (x, y) in data)\n   x1 = max(x for (x, y) in data)\n   TimeCoord.startfloat = 2*x0.timestamp() - x1.timestamp()\n   hours = round((x1.timestamp()-x0.timestamp())/3600)\n   TimeCoord.scalefloat = hours if hours > 0 else 1\n   TimeCoord.defaultformat = \"%H:%M:%S\" if hours < 5 else \"%H:%M\" if hours < 24 else \"%d/%m %H:%M\" if hours < 840 else \"%d/%m/%y\"\n  data = [(TimeCoord(x), y) for (x, y) in data]\n  super().__init__(xlabel, ylabel, data)\n\nclass PairedDataDict(dict):\n def __init__(self, xlabel, ylabel, datadict):\n  pdd = {key:PairedData(xlabel, ylabel, pd) for (key, pd) in datadict.items()}\n  super().__init__(pdd)\n  self.xLabel = xlabel\n  self.yLabel = ylabel\n  self.xMin = min(pd.xMin for pd in pdd.values())\n  self.xMax = max(pd.xMax for pd in pdd.values())\n  self.yMin = min(pd.yMin for pd in pdd.values())\n  self.yMax = max(pd.yMax for pd in pdd.values())\n\nclass TimeSeriesDataDict(dict):\n def __init__(self, xlabel, ylabel, datadict):\n  x0 = min(x for data in datadict.values() for (x, y) in data)\n  x1 = max(x for data in datadict.values() for (x, y) in data)\n  TimeCoord.startfloat = 2*x0.timestamp() - x1.timestamp()\n  hours = round((x1.timestamp()-x0.timestamp())/3600)\n  TimeCoord.scalefloat = hours if hours > 0 else 1\n  TimeCoord.defaultformat = \"%H:%M:%S\" if hours < 5 else \"%H:%M\" if hours < 24 else \"%d/%m %H:%M\" if hours < 840 else \"%d/%m/%y\"\n  pdd = {key:TimeSeriesData(xlabel, ylabel, pd) for (key, pd) in datadict.items()}\n  super().__init__(pdd)\n  self.xLabel = xlabel\n  self.yLabel = ylabel\n  self.xMin = min(pd.xMin for pd in pdd.values())\n  self.xMax = max(pd.xMax for pd in pdd.values())\n  self.yMin = min(pd.yMin for pd in pdd.values())\n  self.yMax = max(pd.yMax for pd in pdd.values())\n\nclass LabelledPairedData(dict):\n def __init__(self, xlabel, ylabel, data):\n  super().__init__(data)\n  self.xLabel = xlabel\n  self.yLabel = ylabel\n  self.xValues = [item[0] for item in data.values()]\n  self.yValues = [item[1] for item in data.values()]\n  self.xMin, self.xMax = min(self.xValues), max(self.xValues)\n  self.yMin, self.yMax = min(self.yValues), max(self.yValues)\n\nclass LabelledPairedDataDict(dict):\n def __init__(self, xlabel, ylabel, datadict):\n  lpdd = {key:LabelledPairedData(xlabel, ylabel, lpd) for (key, lpd) in datadict.items()}\n  super().__init__(lpdd)\n  self.xLabel = xlabel\n  self.yLabel = ylabel\n  self.xMin = min(lpd.xMin for lpd in lpdd.values())\n  self.xMax = max(lpd.xMax for lpd in lpdd.values())\n  self.yMin = min(lpd.yMin for lpd in lpdd.values())\n  self.yMax = max(lpd.yMax for lpd in lpdd.values())\n\nclass BoxPlotData(list):\n def __init__(self, valueslabel, boxplotdata=None, rawdata=None):\n  if rawdata:\n   boxplotdata = fivenumbers(rawdata)\n  super().__init__(boxplotdata)\n  self.valuesLabel = valueslabel\n  self.xMin = self[0]\n  self.xMax = self[-1]\n\nclass BoxPlotDataDict(dict):\n def __init__(self, valueslabel, boxplotdatadict=None, rawdatadict=None):\n  if rawdatadict:\n   boxplotdatadict = {}\n   for key, rawdata in rawdatadict.items():\n    boxplotdatadict[key] = BoxPlotData(valueslabel, rawdata=rawdata)\n  else:\n   boxplotdatadict = {key:BoxPlotData(valueslabel, boxplotdata) for key, boxplotdata in boxplotdatadict.items()}\n  super().__init__(boxplotdatadict)\n  self.xMin = min(bpd.xMin for bpd in self.values())\n  self.xMax = max(bpd.xMax for bpd in self.values())\n  self.valuesLabel = valueslabel\n\nclass GroupedFrequencyData(list):\n def __init__(self, valueslabel, data=None, rawdata=None, boundaries=None, classwidth=None):\n  if data:\n   (b, f) = data[-1]\n   if f != 0: data.append((2*b - data[-2][0], 0))\n  else:\n   boundaries = classboundaries(min(rawdata), max(rawdata), boundaries, classwidth)\n   data = self.fromRawData(rawdata, boundaries)\n  super().__init__(data)\n  self.boundaries = [item[0] for item in data]\n  self.frequencies = [item[1] for item in data]\n  self.xMin, self.xMax = self.boundaries[0], self.boundaries[-1]\n  self.maxFrequency = max(self.frequencies)\n  self.frequencyDensities = []\n  for i in range(len(self.boundaries)-1):\n   self.frequencyDensities.append(self.frequencies[i]/(self.boundaries[i+1]-self.boundaries[i]))\n  self.maxFrequencyDensity = max(self.frequencyDensities)\n  self.valuesLabel = valueslabel\n\n\n\n def fromRawData(self, rawdata, boundaries):\n  return groupfrequencies(rawdata, boundaries)\n\n def mean(self):\n  self.midpoints = [(self[i][0] + self[i+1][0])/2 for i in range(len(self)-1)]\n  sumfx = sum(x*f for (x, f) in zip(self.midpoints, self.frequencies[:-1]))\n  sumf = sum(self.frequencies)\n  return sumfx/sumf\n\n def variance(self):\n  m = self.mean()\n  sumfx2 = sum(x*x*f for (x, f) in zip(self.midpoints, self.frequencies[:-1]))\n  sumf = sum(self.frequencies)\n  return sumfx2/sumf - m*m\n\nclass GroupedFrequencyDataDict(dict):\n def __init__(self, valueslabel, datadict=None, rawdatadict=None, boundaries=None, classwidth=None):\n  if rawdatadict:\n   gfdd = {}\n   for key, rawdata in rawdatadict.items():\n    gfdd[key] = GroupedFrequencyData(valueslabel, rawdata=rawdata, boundaries=boundaries, classwidth=classwidth)\n  else:\n   gfdd = {key:GroupedFrequencyData(valueslabel, gfd) for key, gfd in datadict.items()}\n  super().__init__(gfdd)\n  self.xMin = min(gfd.xMin for gfd in self.values())\n  self.xMax = max(gfd.xMax for gfd in self.values())\n  self.maxFrequency = max(gfd.maxFrequency for gfd in self.values())\n  self.maxFrequencyDensity = max(gfd.maxFrequencyDensity for gfd in self.values())\n  self.valuesLabel = valueslabel\n\nclass CumulativeFrequencyData(list):\n def __init__(self, valueslabel, cumfreqdata=None, groupedfreqdata=None, rawdata=None, boundaries=None, classwidth=None):\n  if rawdata:\n   groupedfreqdata = GroupedFrequencyData(valueslabel=valueslabel, rawdata=rawdata, boundaries=boundaries, classwidth=classwidth)\n  if groupedfreqdata:\n   cumfreqdata = self.fromGFD(groupedfreqdata)\n  else:\n   (b, f) = cumfreqdata[0]\n   if f != 0: cumfreqdata.insert(0, (2*b - cft[1][0], 0))\n  super().__init__(cumfreqdata)\n  self.boundaries = [item[0] for item in cumfreqdata]\n  self.cumfrequencies = [item[1] for item in cumfreqdata]\n  self.xMin, self.xMax = self.boundaries[0], self.boundaries[-1]\n  self.totalFrequency = self.cumfrequencies[-1]\n  self.valuesLabel = valueslabel\n\n def fromGFD(self, groupedfreqdata):\n  (b, f) = groupedfreqdata[-1]\n  if f != 0: groupedfreqdata.append((2*b - groupedfreqdata[-2][0], 0))\n  L = len(groupedfreqdata)\n  boundaries, frequencies = zip(*groupedfreqdata)\n  cumfrequencies = [0] * L\n  for i in range(1, L):\n   cumfrequencies[i] = cumfrequencies[i-1] + frequencies[i-1]\n  return list(zip(boundaries, cumfrequencies))\n\nclass CumulativeFrequencyDataDict(dict):\n def __init__(self, valueslabel, cfdatadict=None, gfdatadict=None, rawdatadict=None, boundaries=None, classwidth=None):\n  if rawdatadict:\n   cfdd = {}\n   for key, rawdata in rawdatadict.items():\n    cfdd[key] = CumulativeFrequencyData(valueslabel, rawdata=rawdata, boundaries=boundaries, classwidth=classwidth)\n  elif gfdatadict:\n   cfdd = {key:CumulativeFrequencyData(valueslabel, groupedfreqdata=gfd) for key, gfd in gfdatadict.items()}\n  else:\n   cfdd = {key:CumulativeFrequencyData(valueslabel, cfd) for key, cfd in cfdatadict.items()}\n  super().__init__(cfdd)\n  self.xMin = min(cfd.xMin for cfd in self.values())\n  self.xMax = max(cfd.xMax for cfd in self.values())\n  self.maxTotalFrequency = max(cfd.totalFrequency for cfd in self.values())\n  self.valuesLabel = valueslabel\n\nclass DataTable(list):\n def __init__(self, csvfile=None, jsonfile=None, datasets=\"columns\", headers=True):\n  if csvfile:\n   with open(csvfile) as datafile:\n    lines = datafile.readlines()\n\n\n   data = [line.strip().split(\",\") for line in lines]\n   data = [[convertifnumber(item) for item in row] for row in data]\n  elif jsonfile:\n   with open(jsonfile) as datafile:\n    data = json.load(datafile)\n\n\n  fieldnames = data[0]\n  datalist = [{key:value for key, value in zip(fieldnames, data[i])} for i in range(1, len(data))]\n  super().__init__(datalist)\n", ["bisect", "brycharts.scales", "brycharts.statfns", "brycharts.timeclasses", "json"]], "brycharts.dragcanvas": [".py", "\n\n\n\n\n\n\nimport time\nfrom browser import document, alert, window\nimport browser.svg as svg\nfrom math import sin, cos, atan2, pi, hypot, floor, log10\nfrom . import textmetrics\nfrom .textmetrics import textwidth\nfrom .geometry import formatcoord, pointsattribute, coorddecimals\nsvgbase = basepoint = measurecontext = None\nlasttaptime = 0\nDEBUG_LAYOUT = False\nMOUSEEVENTS = [\"mousedown\", \"mousemove\", \"mouseup\", \"mouseenter\", \"mouseleave\", \"click\"]\nTOUCHEVENTS = [\"touchstart\", \"touchmove\", \"touchend\"]\nCANVASEVENTS = MOUSEEVENTS + TOUCHEVENTS + [\"dragstart\", \"dblclick\", \"contextmenu\", \"wheel\", \"mouseover\", \"mouseout\"]\ndecimals = None\n\ndef measuretext(strings, fontsize, fontfamily):\n\n global measurecontext\n if measurecontext is None: measurecontext = document.createElement(\"canvas\").getContext(\"2d\")\n measurecontext.font = f\"{fontsize}px {fontfamily}\"\n return [measurecontext.measureText(string).width for string in strings]\n\ntextmetrics.setmeasurer(measuretext)\n\ndef setdecimals(n):\n\n\n global decimals\n (previous, decimals) = (decimals, n)\n return previous\n\ndef svgcoord(x):\n\n return formatcoord(x, decimals)\n\ndef styleorclass(style, classname):\n\n\n return {\"Class\":classname} if classname else {\"style\":style}\n\ndef getsvgbase():\n\n global svgbase, basepoint\n if svgbase is None:\n  svgbase = svg.svg(width=0, height=0)\n  basepoint = svgbase.createSVGPoint()\n return svgbase\n\ndef fontfamily(canvas):\n\n if not getattr(canvas, \"fontFamily\", None): canvas.fontFamily = window.getComputedStyle(canvas).fontFamily or \"sans-serif\"\n return canvas.fontFamily\n\ndef unionextent(extents):\n\n extents = [extent for extent in extents if extent is not None]\n if not extents: return None\n return (min(e[0] for e in extents), min(e[1] for e in extents), max(e[2] for e in extents), max(e[3] for e in extents))\n\ndef pointsextent(points):\n\n if not points: return None\n xvalues = [float(x) for (x, y) in points]\n yvalues = [float(y) for (x, y) in points]\n return (min(xvalues), min(yvalues), max(xvalues), max(yvalues))\n\n\n\ndef flatten(points):\n\n return [c for point in points for c in point]\n\ndef flatpoints(flat):\n\n return [Point((flat[i], flat[i+1])) for i in range(0, len(flat), 2)]\n\ndef flatextent(flat):\n\n if not flat: return None\n (xvalues, yvalues) = (flat[0::2], flat[1::2])\n return (min(xvalues), min(yvalues), max(xvalues), max(yvalues))\n\ndef translateflat(flat, offset):\n\n (dx, dy) = offset\n return [c+dx if i%2 == 0 else c+dy for (i, c) in enumerate(flat)]\n\ndef flatattribute(flat):\n\n d = decimals\n if d is None: return \" \".join([f\"{flat[i]},{flat[i+1]}\" for i in range(0, len(flat), 2)])\n return \" \".join([f\"{formatcoord(flat[i], d)},{formatcoord(flat[i+1], d)}\" for i in range(0, len(flat), 2)])\n\ndef boxextent(centre, width, height, angle=0):\n\n (cx, cy) = centre\n (c, s) = (abs(cos(angle*pi/180)), abs(sin(angle*pi/180)))\n (halfwidth, halfheight) = ((width*c+height*s)/2, (width*s+height*c)/2)\n return (cx-halfwidth, cy-halfheight, cx+halfwidth, cy+halfheight)\n\nclass Enum(list):\n def __init__(self, name, string):\n  values = string.split()\n  for i, value in enumerate(values):\n   setattr(self, value, i)\n   self.append(i)\n\nMouseMode = Enum('MouseMode', 'NONE DRAG TRANSFORM DRAW EDIT PAN')\nTransformType = Enum('TransformType', 'NONE TRANSLATE ROTATE XSTRETCH YSTRETCH ENLARGE')\nPosition = Enum ('Position', 'CONTAINS INSIDE OVERLAPS EQUAL DISJOINT')\n\nclass ObjectMixin(object):\n\n\n def cloneObject(self):\n\n\n\n  if isinstance(self, GroupObject):\n   newobject = self.__class__()\n   for obj in self.objectList:\n    if isinstance(obj, ObjectMixin):\n     newobj = obj.cloneObject()\n     newobject <= newobj\n     newobj.group = newobject\n     newobject.objectList.append(newobj)\n  elif isinstance(self, ObjectMixin):\n   if getattr(self, \"imageloaded\", True) is False: raise RuntimeError(\"ImageObject cannot be cloned until fully loaded\")\n   if self.__class__ in shapetypes.values():\n    newobject = self.__class__()\n\n   else:\n    for cls in self.__bases__:\n     if cls in shapetypes.values():\n      newobject = cls()\n\n      break\n   for attrname in [\"XY\", \"pointList\", \"pointsetList\", \"angle\", \"fixed\", \"rotatestring\", \"centre\", \"_width\", \"_height\",\n\"currentAspectRatio\", \"imageWidth\", \"imageHeight\", \"imageAspectRatio\", \"imageloaded\",\n\"startangle\", \"endangle\", \"radius\"]:\n    attr = getattr(self, attrname, \"NO_SUCH_ATTRIBUTE\")\n    if attr == \"NO_SUCH_ATTRIBUTE\": continue\n    newattr = list(attr) if isinstance(attr, list) else attr\n    setattr(newobject, attrname, newattr)\n  else:\n   return None\n\n\n  for key in self.attrs:\n   value = self.attrs[key]\n   newobject.attrs[key] = value\n  newobject.id = \"\"\n  return newobject\n\n def setPointList(self, pointlist):\n\n  self.pointList = [Point(coords) for coords in pointlist]\n  if hasattr(self, \"_getpointsetlist\"): self.pointsetList = self._getpointsetlist(pointlist)\n  self._update()\n  self._updatehittarget()\n\n def setStyle(self, attribute, value):\n\n  self.style = {attribute:value}\n\n def getExtent(self, canvas=None):\n\n  return pointsextent(self.pointList)\n\n def _updatehittarget(self):\n\n  hittarget = getattr(self, \"hitTarget\", None)\n  if hittarget:\n   hittarget.pointList = self.pointList\n   if hasattr(self, \"pointsetList\"): hittarget.pointsetList = self.pointsetList\n   if hasattr(self, \"angle\"): hittarget.angle = self.angle\n   hittarget._update()\n\n def _transformedpointlist(self, matrix):\n\n  getsvgbase()\n  newpointlist = []\n  for point in self.pointList:\n   (basepoint.x, basepoint.y) = point\n   newpt =  basepoint.matrixTransform(matrix)\n   newpointlist.append(Point((newpt.x, newpt.y)))\n  return newpointlist\n\n def __repr__(self):\n  return f\"{self.__class__}{self.id}\"\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\nclass LineObject(svg.line, ObjectMixin):\n\n\n\n\n def __init__(self, pointlist=[(0,0), (0,0)], style=\"solid\", linecolour=\"black\", linewidth=1, fillcolour=\"none\", objid=None, classname=None):\n  [(x1, y1), (x2, y2)] = pointlist\n\n  if style == \"faintdash1\":\n   dasharray = \"10,5\"\n   linecolour = \"grey\"\n  elif style == \"faintdash2\":\n   dasharray = \"2,2\"\n   linecolour = \"lightgrey\"\n  else:\n   dasharray = None\n\n  svg.line.__init__(self, x1=svgcoord(x1), y1=svgcoord(y1), x2=svgcoord(x2), y2=svgcoord(y2),\n**styleorclass({\"stroke\":linecolour, \"strokeDasharray\":dasharray, \"stroke-width\":linewidth, \"fill\":\"none\"}, classname))\n  self.pointList = [Point(coords) for coords in pointlist]\n  if objid: self.id = objid\n\n def _update(self):\n  [(x1, y1), (x2, y2)] = self.pointList\n  self.attrs[\"x1\"] = svgcoord(x1)\n  self.attrs[\"y1\"] = svgcoord(y1)\n  self.attrs[\"x2\"] = svgcoord(x2)\n  self.attrs[\"y2\"] = svgcoord(y2)\n\nclass TextObject(svg.text, ObjectMixin):\n\n\n\n\n\n\n def __init__(self, string=\"\", anchorpoint=(0,0), anchorposition=1, fontsize=12, style=\"normal\", ignorescaling=False, canvas=None, objid=None):\n  if anchorposition in [3, 6, 9]:\n   horizpos = \"end\"\n  elif anchorposition in [2, 5, 8]:\n   horizpos = \"middle\"\n  else:\n   horizpos = \"start\"\n  lineheight = fontsize*1.2\n  if ignorescaling and canvas:\n   fontsize *= canvas.scaleFactor\n   lineheight *= canvas.scaleFactor\n  svg.text.__init__(self, font_size=fontsize, text_anchor=horizpos)\n  (self.anchorPosition, self.fontSize, self.lineHeight, self.textAnchor) = (anchorposition, fontsize, lineheight, horizpos)\n  self.setText(string, anchorpoint)\n  if objid: self.id = objid\n\n def setText(self, string, anchorpoint):\n\n  (x, y) = anchorpoint\n  self.lines = string.split(\"\\n\")\n  rowcount = len(self.lines)\n  if self.anchorPosition in [1, 2, 3]:\n   yoffset = self.fontSize\n  elif self.anchorPosition in [4, 5, 6]:\n   yoffset = self.fontSize - self.lineHeight*rowcount/2\n  else:\n   yoffset = self.fontSize - self.lineHeight*rowcount\n  self.textOrigin = (x, y+yoffset)\n  self.attrs[\"x\"] = svgcoord(x)\n  self.attrs[\"y\"] = svgcoord(y+yoffset)\n  self.text = self.lines[0]\n  for s in self.lines[1:]:\n   self <= svg.tspan(s, x=svgcoord(x), dy=self.lineHeight)\n\n def getExtent(self, canvas=None):\n  (x, y) = self.textOrigin\n  family = fontfamily(canvas) if canvas is not None else \"sans-serif\"\n  return textmetrics.textextent(self.lines, x, y, self.fontSize, self.lineHeight, self.textAnchor, family)\n\nclass WrappingTextObject(svg.text):\n\n\n\n def __init__(self, canvas, string, anchorpoint, width, anchorposition=1, fontsize=12, style=\"normal\", ignorescaling=False, objid=None):\n  (x, y) = anchorpoint\n  lineheight = fontsize*1.2\n  if ignorescaling:\n   fontsize *= canvas.scaleFactor\n   lineheight *= canvas.scaleFactor\n  lines = textmetrics.wraplines(string, width, fontsize, fontfamily(canvas))\n  svgx = svgcoord(x)\n  svg.text.__init__(self, \"\", x=svgx, font_size=fontsize)\n  self <= svg.tspan(lines[0], x=svgx, dy=0)\n  for line in lines[1:]:\n   self <= svg.tspan(line, x=svgx, dy=lineheight)\n  rowcount = len(lines)\n\n  if anchorposition in [3, 6, 9]:\n   horizpos = \"end\"\n  elif anchorposition in [2, 5, 8]:\n   horizpos = \"middle\"\n  else:\n   horizpos = \"start\"\n  self.attrs[\"text-anchor\"] = horizpos\n  if anchorposition in [1, 2, 3]:\n   yoffset = fontsize\n  elif anchorposition in [4, 5, 6]:\n   yoffset = fontsize*(1-rowcount/2)\n  else:\n   yoffset = fontsize*(1-rowcount)\n  self.attrs[\"y\"] = svgcoord(y+yoffset)\n  (self.lines, self.textOrigin, self.fontSize, self.lineHeight, self.textAnchor) = (lines, (x, y+yoffset), fontsize, lineheight, horizpos)\n  self.fontFamily = canvas.fontFamily\n  if objid: self.id = objid\n\n def getExtent(self, canvas=None):\n  (x, y) = self.textOrigin\n  return textmetrics.textextent(self.lines, x, y, self.fontSize, self.lineHeight, self.textAnchor, self.fontFamily)\n\nclass PolylineObject(svg.polyline, ObjectMixin):\n\n\n\n\n\n def __init__(self, pointlist=[(0,0)], linecolour=\"black\", linewidth=1, fillcolour=\"none\", objid=None, flatcoords=None, classname=None):\n  svg.polyline.__init__(self, **styleorclass({\"stroke\":linecolour, \"stroke-width\":linewidth, \"fill\":fillcolour}, classname))\n  self.flatCoords = list(flatcoords) if flatcoords is not None else flatten(pointlist)\n  self._pointList = None\n  self._update()\n  if objid: self.id = objid\n\n def _update(self):\n  if self._pointList is not None: self.flatCoords = flatten(self._pointList)\n  self.attrs[\"points\"] = flatattribute(self.flatCoords)\n\n @property\n def pointList(self):\n  if self._pointList is None: self._pointList = flatpoints(self.flatCoords)\n  return self._pointList\n\n @pointList.setter\n def pointList(self, pointlist):\n  self._pointList = None\n  self.flatCoords = flatten(pointlist)\n\n def getExtent(self, canvas=None):\n  return flatextent(self.flatCoords if self._pointList is None else flatten(self._pointList))\n\nclass PolygonObject(svg.polygon, ObjectMixin):\n\n\n def __init__(self, pointlist=[(0,0)], linecolour=\"black\", linewidth=1, fillcolour=\"yellow\", objid=None):\n  svg.polygon.__init__(self, style={\"stroke\":linecolour, \"stroke-width\":linewidth, \"fill\":fillcolour})\n  self.attrs[\"points\"] = pointsattribute(pointlist, decimals)\n  if objid: self.id = objid\n\n def _update(self):\n  self.attrs[\"points\"] = pointsattribute(self._pointList, decimals)\n\n def __repr__(self):\n  return f\"polygon {self.id}\" if self.id else f\"polygon {id(self)}\"\n\n def __str__(self):\n  return self.__repr__()\n\n @property\n def pointList(self):\n  if getattr(self, \"_pointList\", None) is None:\n\n   P = self.points\n   L = P.numberOfItems\n   self._pointList = [Point([P.getItem(i).x, P.getItem(i).y]) for i in range(L)]\n  return self._pointList\n\n @pointList.setter\n def pointList(self, pointlist):\n  self._pointList = [Point(coords) for coords in pointlist]\n  self._update()\n\n def setPointList(self, pointlist):\n  self._pointList = [Point(coords) for coords in pointlist]\n  self._update()\n\n def cloneObject(self):\n  newobject = self.__class__()\n  for key in self.attrs:\n   value = self.attrs[key]\n   newobject.attrs[key] = value\n  newobject.id = \"\"\n\n  P = self.points\n  P2 = newobject.points\n  L = P.numberOfItems\n  P2.clear()\n  for i in range(L):\n   pt = P.getItem(i)\n   P2.appendItem(pt)\n\n  return newobject\n\n def _transformpoints(self, points, matrix):\n  L = points.numberOfItems\n  for i in range(L):\n   pt = points.getItem(i)\n   newpt =  pt.matrixTransform(matrix)\n   points.replaceItem(newpt, i)\n\nclass RectangleObject(svg.rect, ObjectMixin):\n\n\n\n\n\n\n\n\n\n\n\n def __init__(self, pointlist=None, centre=(0,0), width=0, height=None, angle=0, linecolour=\"black\", linewidth=1, fillcolour=\"yellow\", objid=None, classname=None):\n  svg.rect.__init__(self, **styleorclass({\"stroke\":linecolour, \"stroke-width\":linewidth, \"fill\":fillcolour}, classname))\n  self.angle = angle\n  if pointlist:\n   self.setPointList(pointlist)\n  else:\n   self.centre = Point(centre)\n   if not height: height = width\n   if height and not width: width = height\n   self._width = width\n   self._height = height\n   self.setPosition()\n  if objid: self.id = objid\n\n def setPosition(self, centre=None, width=None, height=None, angle=None, preserveaspectratio=False):\n\n\n\n  if centre: self.centre = Point(centre)\n  if width:\n   self._width = width\n   if preserveaspectratio and not height: self._height = width*self.currentAspectRatio\n  if height:\n   self._height = height\n   if preserveaspectratio and not width: self._width = height/self.currentAspectRatio\n  if angle is not None: self.angle = angle\n\n  (cx, cy) = self.centre\n  self.pointList = [(cx-self._width/2, cy-self._height/2), (cx+self._width/2, cy+self._height/2)]\n  t = getsvgbase().createSVGTransform()\n  t.setRotate(self.angle, cx, cy)\n  self.pointList = self._transformedpointlist(t.matrix)\n  self._update()\n  self._updatehittarget()\n\n def _update(self):\n  [(x1, y1), (x2, y2)] = self.pointList\n  (cx, cy) = ((x1+x2)/2, (y1+y2)/2)\n  self.centre = Point((cx, cy))\n  self.rotatestring = self.style.transform = f\"translate({cx}px,{cy}px) rotate({self.angle}deg) translate({-cx}px,{-cy}px)\"\n\n  t = getsvgbase().createSVGTransform()\n  t.setRotate(-self.angle, cx, cy)\n  basepointlist = self._transformedpointlist(t.matrix)\n  [(x1, y1), (x2, y2)] = basepointlist\n  self._width = abs(x2-x1)\n  self._height = abs(y2-y1)\n  if self._width != 0: self.currentAspectRatio = self._height/self._width\n  self.attrs[\"x\"] = svgcoord(x2 if x2<x1 else x1)\n  self.attrs[\"y\"] = svgcoord(y2 if y2<y1 else y1)\n  self.attrs[\"width\"] = svgcoord(self._width)\n  self.attrs[\"height\"] = svgcoord(self._height)\n\n def getExtent(self, canvas=None):\n  if getattr(self, \"centre\", None) is None: return None\n  return boxextent(self.centre, self._width, self._height, self.angle)\n\nclass EllipseObject(svg.ellipse, ObjectMixin):\n\n\n\n\n\n\n\n\n\n\n\n def __init__(self, pointlist=None, centre=(0,0), width=0, height=None, angle=0, linecolour=\"black\", linewidth=1, fillcolour=\"yellow\", objid=None):\n  svg.ellipse.__init__(self, style = {\"stroke\":linecolour, \"stroke-width\":linewidth, \"fill\":fillcolour})\n  self.angle = angle\n  if pointlist:\n   self.setPointList(pointlist)\n  else:\n   self.centre = Point(centre)\n   if not height: height = width\n   if height and not width: width = height\n   self._width = width\n   self._height = height\n   self.setPosition()\n  if objid: self.id = objid\n\n def setPosition(self, centre=None, width=None, height=None, angle=None, preserveaspectratio=False):\n\n\n\n  if centre: self.centre = Point(centre)\n  if width:\n   self._width = width\n   if preserveaspectratio and not height: self._height = width*self.currentAspectRatio\n  if height:\n   self._height = height\n   if preserveaspectratio and not width: self._width = height/self.currentAspectRatio\n  if angle is not None: self.angle = angle\n\n  (cx, cy) = self.centre\n  self.pointList = [(cx-self._width/2, cy-self._height/2), (cx+self._width/2, cy+self._height/2)]\n  t = getsvgbase().createSVGTransform()\n  t.setRotate(self.angle, cx, cy)\n  self.pointList = self._transformedpointlist(t.matrix)\n  self._update()\n  self._updatehittarget()\n\n def _update(self):\n  [(x1, y1), (x2, y2)] = self.pointList\n  (cx, cy) = ((x1+x2)/2, (y1+y2)/2)\n  self.centre = Point((cx, cy))\n  self.rotatestring = self.style.transform = f\"translate({cx}px,{cy}px) rotate({self.angle}deg) translate({-cx}px,{-cy}px)\"\n\n  t = getsvgbase().createSVGTransform()\n  t.setRotate(-self.angle, cx, cy)\n  basepointlist = self._transformedpointlist(t.matrix)\n  [(x1, y1), (x2, y2)] = basepointlist\n  self._width = abs(x2-x1)\n  self._height = abs(y2-y1)\n  if self._width != 0: self.currentAspectRatio = self._height/self._width\n  self.attrs[\"cx\"] = svgcoord((x1+x2)/2)\n  self.attrs[\"cy\"] = svgcoord((y1+y2)/2)\n  self.attrs[\"rx\"] = svgcoord(self._width/2)\n  self.attrs[\"ry\"] = svgcoord(self._height/2)\n\n def getExtent(self, canvas=None):\n  (cx, cy) = self.centre\n  (a, b) = (self._width/2, self._height/2)\n  (c, s) = (cos(self.angle*pi/180), sin(self.angle*pi/180))\n  (halfwidth, halfheight) = (hypot(a*c, b*s), hypot(a*s, b*c))\n  return (cx-halfwidth, cy-halfheight, cx+halfwidth, cy+halfheight)\n\nclass CircleObject(svg.circle, ObjectMixin):\n\n\n\n def __init__(self, centre=(0,0), radius=0, pointlist=None, linecolour=\"black\", linewidth=1, fillcolour=\"yellow\", objid=None):\n  if pointlist:\n   self.pointList = [Point(coords) for coords in pointlist]\n  else:\n   (x, y) = centre\n   self.pointList = [Point((x, y)), Point((x+radius, y))]\n  svg.circle.__init__(self, style={\"stroke\":linecolour, \"stroke-width\":linewidth, \"fill\":fillcolour})\n  self._update()\n  if objid: self.id = objid\n\n def _update(self):\n  [(x1, y1), (x2, y2)] = self.pointList\n  self.attrs[\"cx\"]=svgcoord(x1)\n  self.attrs[\"cy\"]=svgcoord(y1)\n  self.attrs[\"r\"]=svgcoord(hypot(x2-x1, y2-y1))\n\n def getExtent(self, canvas=None):\n  [(x1, y1), (x2, y2)] = self.pointList\n  r = hypot(x2-x1, y2-y1)\n  return (x1-r, y1-r, x1+r, y1+r)\n\nclass SectorObject(svg.path, ObjectMixin):\n\n\n\n\n\n def __init__(self, centre=(0,0), radius=0, startangle=0, endangle=0, pointlist=None, linecolour=\"black\", linewidth=1, fillcolour=\"yellow\", objid=None):\n  self.centre = Point(centre)\n  self.radius = radius\n  self.startangle = startangle\n  self.endangle = endangle\n  if pointlist:\n   self.pointList = pointlist\n  else:\n   (cx, cy) = centre\n   point1 = Point((cx+radius*sin(startangle*pi/180), cy-radius*cos(startangle*pi/180)))\n   point2 = Point((cx+radius*sin(endangle*pi/180), cy-radius*cos(endangle*pi/180)))\n   self.pointList = [self.centre, point1, point2]\n  svg.path.__init__(self, style={\"stroke\":linecolour, \"stroke-width\":linewidth, \"fill\":fillcolour})\n  self._update()\n  if objid: self.id = objid\n\n def _update(self):\n  [(x0, y0), (x1, y1)] = self.pointList[:2]\n  (x2, y2) = self.pointList[-1]\n  r = hypot(x1-x0, y1-y0)\n  largeArcFlag = 1 if (self.endangle - self.startangle) % 360 > 180 else 0\n  [x0, y0, x1, y1, x2, y2, r] = [svgcoord(c) for c in (x0, y0, x1, y1, x2, y2, r)]\n  self.attrs[\"d\"] = f\"M {x0} {y0} L {x1} {y1} A {r} {r} 0 {largeArcFlag} 1 {x2} {y2} Z\"\n\n def getExtent(self, canvas=None):\n\n\n  [(cx, cy), (x1, y1)] = self.pointList[:2]\n  r = hypot(x1-cx, y1-cy)\n  sweep = self.endangle-self.startangle\n  if not 0 <= sweep <= 360: sweep %= 360\n  points = list(self.pointList)\n  for (angle, point) in [(0, (cx, cy-r)), (90, (cx+r, cy)), (180, (cx, cy+r)), (270, (cx-r, cy))]:\n   if (angle-self.startangle)%360 <= sweep or sweep == 360: points.append(point)\n  return pointsextent(points)\n\nclass PointObject(svg.circle, ObjectMixin):\n\n\n\n def __init__(self, XY=(0,0), colour=\"black\", pointsize=2, canvas=None, objid=None):\n  (x, y) = XY\n  sf = canvas.scaleFactor if canvas else 1\n  svg.circle.__init__(self, cx=svgcoord(x), cy=svgcoord(y), r=pointsize*sf, style={\"stroke\":colour, \"stroke-width\":1, \"fill\":colour, \"vector-effect\":\"non-scaling-stroke\"})\n  self._XY = None\n  self.XY = Point(XY)\n  if objid: self.id = objid\n\n def _update(self):\n  pass\n\n @property\n def XY(self):\n  return self._XY\n\n @XY.setter\n def XY(self, XY):\n  self._XY = Point(XY)\n  self.attrs[\"cx\"] = svgcoord(self._XY[0])\n  self.attrs[\"cy\"] = svgcoord(self._XY[1])\n\n def getExtent(self, canvas=None):\n  (x, y) = self.XY\n  r = float(self.attrs[\"r\"])\n  return (x-r, y-r, x+r, y+r)\n\nclass GroupObject(svg.g, ObjectMixin):\n\n\n\n\n\n\n\n\n\n def __init__(self, objlist=[], objid=None):\n  svg.g.__init__(self)\n  if not isinstance(objlist, list): objlist = [objlist]\n  self.objectList = []\n  self._canvas = None\n  for obj in objlist:\n   self.addObject(obj)\n  if objid: self.id = objid\n\n def addObject(self, svgobject, fixed=False):\n  canvas = self.canvas\n  if canvas is not None:\n   if canvas.static: svgobject.canvas = canvas\n   else: canvas.addObject(svgobject, fixed)\n  self <= svgobject\n  svgobject.group = self\n  self.objectList.append(svgobject)\n\n def addObjects(self, objectlist, fixed=False):\n  canvas = self.canvas\n  for obj in objectlist:\n   if canvas is not None:\n    if canvas.static: obj.canvas = canvas\n    else: canvas.addObject(obj, fixed)\n   self <= obj\n   obj.group = self\n   self.objectList.append(obj)\n\n def _update(self):\n  pass\n\n def removeObject(self, svgobject):\n  if not self.contains(svgobject): return\n  self.removeChild(svgobject)\n  self.objectList.remove(svgobject)\n  svgobject.group = None\n  try:\n   del self.canvas.objectDict[svgobject.id]\n  except (AttributeError, KeyError):\n   pass\n\n def deleteAll(self):\n  if self.canvas:\n   for obj in self.objectList: self.canvas.objectDict.pop(obj.id, None)\n  while self.firstChild: self.removeChild(self.firstChild)\n  self.objectList = []\n\n def setStyle(self, attribute, value):\n  for obj in self.objectList:\n   obj.setStyle(attribute, value)\n\n @property\n def canvas(self):\n  return self._canvas\n\n @canvas.setter\n def canvas(self, canvas):\n  self._canvas = canvas\n  for obj in self.objectList: obj.canvas = canvas\n\n @property\n def fixed(self):\n  return self._fixed\n\n @fixed.setter\n def fixed(self, fixedvalue):\n  self._fixed = fixedvalue\n  for obj in self.objectList: obj.fixed = fixedvalue\n\n def getExtent(self, canvas=None):\n  return unionextent([obj.getExtent(canvas) for obj in self.objectList if hasattr(obj, \"getExtent\")])\n\nclass MarkupBuilder(object):\n\n\n\n def __init__(self):\n  self.markup = []\n\n def add(self, tag, attrs, style=None):\n  attrstring = \" \".join(f'{key}=\"{svgcoord(value) if isinstance(value, float) else value}\"' for (key, value) in attrs.items())\n  if style: attrstring += ' style=\"' + \";\".join(f\"{key}:{value}\" for (key, value) in style.items()) + '\"'\n  self.markup.append(f\"<{tag} {attrstring}/>\")\n\n def insertInto(self, parent):\n  parent.insertAdjacentHTML(\"beforeend\", \"\".join(self.markup))\n  self.markup = []\n\nclass Tooltip(svg.g):\n\n\n\n def __init__(self, canvas, fontsize=12, parent=None):\n  svg.g.__init__(self)\n  self.canvas = canvas\n  self.layer = parent if parent is not None else canvas\n  self.fontSize = fontsize\n  self.background = svg.rect(style={\"stroke\":\"#d3d3d3d0\", \"fill\":\"#d3d3d3d0\"})\n  self.textElement = svg.text(\"\", font_size=fontsize, text_anchor=\"middle\")\n  self.lines = []\n  self <= [self.background, self.textElement]\n  self.style.pointerEvents = \"none\"\n  self.style.display = \"none\"\n\n def show(self, text, coords):\n  strings = text.split(\"\\n\")\n  while len(self.lines) < len(strings):\n   tspan = svg.tspan(\"\")\n   self.textElement <= tspan\n   self.lines.append(tspan)\n  lineheight = self.fontSize*1.2\n  width = max(textwidth(string, self.fontSize) for string in strings)\n  height = lineheight*len(strings)\n  (left, top) = self._place(coords, width, height)\n  decimals = self._decimals()\n  c = lambda v: formatcoord(v, decimals)\n  for i, tspan in enumerate(self.lines):\n   tspan.text = strings[i] if i < len(strings) else \"\"\n   tspan.attrs[\"x\"] = c(left+width/2)\n   tspan.attrs[\"y\"] = c(top+self.fontSize+i*lineheight)\n  (self.background.attrs[\"x\"], self.background.attrs[\"y\"]) = (c(left), c(top))\n  (self.background.attrs[\"width\"], self.background.attrs[\"height\"]) = (c(width), c(height))\n  if self.layer.lastChild != self: self.layer <= self\n  self.style.display = \"inline\"\n\n def hide(self):\n  self.style.display = \"none\"\n\n def _decimals(self):\n\n\n  return self.canvas.decimals\n\n def _place(self, coords, width, height):\n\n  (x, y) = coords\n  return (x-width/2, y-height/2)\n\nclass CanvasObject(svg.svg):\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n static = False\n precision = None\n destroyed = False\n lazyObserver = None\n\n def __init__(self, width=None, height=None, colour=\"white\", objid=None):\n  svg.svg.__init__(self, style={\"backgroundColor\":colour})\n  if width: self.style.width = width\n  if height: self.style.height = height\n  self.id = objid if objid else f\"canvas{id(self)}\"\n  self.objectDict = {}\n  self.styleSheet = None\n  self.classStyles = {}\n\n\n  self.mouseMode = MouseMode.NONE\n  self.vertexSnap = False\n  self.snapDistance = 10\n  self.lineWidthScaling = True\n\n  self.edgeSnap = False\n  self.snapAngle = 10\n  self.transformTypes = TransformType\n  self.penColour = \"black\"\n  self.fillColour  = \"yellow\"\n  self.penWidth = 3\n\n\n  self.scaleFactor = 1\n  self.mouseDetected = False\n  self.mouseOwner = None\n  self.selectedObject = None\n  self.dragStartCoords = None\n  self.viewWindow = None\n  self.layoutReads = 0\n  self.tool = \"select\"\n  self.destroyed = False\n  self.decimals = None\n\n\n  self.pixelSize = None\n  self.outerDecimals = None\n  self.panning = False\n  self.centre = None\n  self.nextid = 0\n  self.objectDict = {}\n  self.hittargets = []\n  self.handles = None\n  self.controlhandles  = None\n  self.transformHandles = []\n  self.selectedhandle = None\n  self.transformorigin = None\n  self.transformBBox = RectangleObject(linecolour=\"blue\", fillcolour=\"none\")\n  self.transformBBox.style.vectorEffect = \"non-scaling-stroke\"\n  self.rotateLine = LineObject(linecolour=\"blue\")\n  self.rotateLine.style.vectorEffect = \"non-scaling-stroke\"\n  self.attrs[\"preserveAspectRatio\"] = \"xMidYMid meet\"\n\n  self.bind(\"mousedown\", self._onMouseDown)\n  self.bind(\"mousemove\", self._onMouseMove)\n  self.bind(\"mouseup\", self._onLeftUp)\n  self.bind(\"touchstart\", self._onTouchStart)\n  self.bind(\"touchmove\", self._onMouseMove)\n  self.bind(\"touchend\", self._onLeftUp)\n  self.bind(\"dragstart\", self._onDragStart)\n  self.bind(\"dblclick\", self._onDoubleClick)\n  self.bind(\"contextmenu\", self._onRightClick)\n  self.bind(\"wheel\", self._onWheel)\n  self.keyHandler = self._onKeyDown\n  document.bind(\"keydown\", self.keyHandler)\n\n\n def setViewBox(self, pointlist):\n\n\n\n\n  ((x1, y1), (x2, y2)) = pointlist\n  self.attrs[\"viewBox\"] = f\"{x1} {y1} {x2-x1} {y2-y1}\"\n  self.viewBoxRect = [Point((x1, y1)), Point((x2, y2))]\n  self.centre = Point(((x1+x2)/2, (y1+y2)/2))\n  width, height = self._getDimensions()\n  self.xScaleFactor = (x2-x1)/width if width != 0 else 1\n  self.yScaleFactor = (y2-y1)/height if height != 0 else 1\n  self.scaleFactor  = max(self.xScaleFactor, self.yScaleFactor)\n  self.decimals = coorddecimals(self.xScaleFactor, self.yScaleFactor, self.precision)\n  if self.pixelSize is not None: setdecimals(self.decimals)\n  preserveaspectratio = self.attrs[\"preserveAspectRatio\"]\n  if preserveaspectratio == \"none\" or width == 0 or height == 0:\n   self.viewWindow = [Point((x1, y1)), Point((x2, y2))]\n  elif preserveaspectratio == \"xMidYMid meet\":\n   (cx, cy) = self.centre\n   (halfwidth, halfheight) = (width*self.scaleFactor/2, height*self.scaleFactor/2)\n   self.viewWindow = [Point((cx-halfwidth, cy-halfheight)), Point((cx+halfwidth, cy+halfheight))]\n  else:\n   self.layoutReads += 1\n   bcr = self.getBoundingClientRect()\n   matrix = self.getScreenCTM().inverse()\n   pt = self.createSVGPoint()\n   (pt.x, pt.y) = (bcr.left, bcr.top)\n   SVGpt =  pt.matrixTransform(matrix)\n   (x1, y1) = (SVGpt.x, SVGpt.y)\n   (pt.x, pt.y) = (bcr.left+bcr.width, bcr.top+bcr.height)\n   SVGpt =  pt.matrixTransform(matrix)\n   (x2, y2) = (SVGpt.x, SVGpt.y)\n   self.viewWindow = [Point((x1, y1)), Point((x2, y2))]\n  return self.viewWindow\n\n def _getDimensions(self):\n\n\n\n  if self.pixelSize: return self.pixelSize\n  self.layoutReads += 1\n  bcr = self.getBoundingClientRect()\n  self.attrs[\"width\"] = bcr.width\n  self.attrs[\"height\"] = bcr.height\n  return bcr.width, bcr.height\n\n def beginBuild(self):\n\n\n\n\n\n  self.outerDecimals = setdecimals(self.decimals)\n  self.layoutReads = 0\n  self.pixelSize = None\n  self.pixelSize = self._getDimensions()\n\n def endBuild(self):\n\n\n  self.pixelSize = None\n  setdecimals(self.outerDecimals)\n  if DEBUG_LAYOUT: print(f\"{self.__class__.__name__} {self.id}: {self.layoutReads} forced layout(s) while building\")\n\n def getExtent(self):\n\n\n\n  if self.static: return None\n  return unionextent([obj.getExtent(self) for obj in self.objectDict.values() if hasattr(obj, \"getExtent\")])\n\n def fitContents(self):\n\n\n\n  extent = self.getExtent()\n  if extent is None:\n   self.layoutReads += 1\n   bbox = self.getBBox()\n   extent = (bbox.x, bbox.y, bbox.x+bbox.width, bbox.y+bbox.height)\n  (x1, y1, x2, y2) = extent\n  if x2 == x1 or y2 == y1: return\n  wmargin, hmargin = (x2-x1)/50, (y2-y1)/50\n  self.viewWindow = self.setViewBox(((x1-wmargin, y1-hmargin), (x2+wmargin, y2+hmargin)))\n  return self.viewWindow\n\n def getSVGcoords(self, event):\n\n  x = event.changedTouches[0].clientX if \"touch\" in event.type else event.clientX\n  y = event.changedTouches[0].clientY if \"touch\" in event.type else event.clientY\n  pt = self.createSVGPoint()\n  (pt.x, pt.y) = (x, y)\n  SVGpt =  pt.matrixTransform(self.getScreenCTM().inverse())\n  return Point((SVGpt.x, SVGpt.y))\n\n def addObject(self, svgobject, fixed=False):\n\n\n\n\n\n\n\n\n  if self.static:\n   self <= svgobject\n   svgobject.canvas = self\n   return svgobject\n\n  def AddToDict(svgobj):\n   if not svgobj.id:\n    svgobj.id = f\"{self.id}_id{self.nextid}\"\n    self.nextid += 1\n   self.objectDict[svgobj.id] = svgobj\n   if isinstance(svgobj, GroupObject):\n    for obj in svgobj.objectList:\n     AddToDict(obj)\n  if not hasattr(svgobject, \"fixed\"): svgobject.fixed = fixed\n  self <= svgobject\n  AddToDict(svgobject)\n  svgobject.canvas = self\n  return svgobject\n\n def addObjects(self, objectlist, fixed=False):\n\n  for obj in objectlist:\n   if isinstance(obj, (list, tuple)):\n    self.addObjects(obj, fixed=fixed)\n   else:\n    self.addObject(obj, fixed=fixed)\n\n def deleteObject(self, svgobject):\n\n  def deletefromdict(svgobj):\n   if isinstance(svgobj, GroupObject):\n    for obj in svgobj.objectList:\n     deletefromdict(obj)\n   hittarget = getattr(svgobj, \"hitTarget\", None)\n   if hittarget: self.deleteObject(hittarget)\n   if svgobj.id in self.objectDict: del self.objectDict[svgobj.id]\n\n  if not self.contains(svgobject): return\n  self.removeChild(svgobject)\n  deletefromdict(svgobject)\n\n def deleteAll(self, event=None):\n\n  while self.firstChild:\n   self.removeChild(self.firstChild)\n  self.objectDict = {}\n  if self.styleSheet is not None: self <= self.styleSheet\n\n def deleteSelection(self):\n\n  if self.selectedObject:\n   if self.handles: self.deleteObject(self.handles)\n   if self.controlhandles: self.deleteObject(self.controlhandles)\n   hittarget = getattr(self.selectedObject, \"hitTarget\", None)\n   if hittarget: self.deleteObject(hittarget)\n   self.deleteObject(self.selectedObject)\n   self.selectedObject = self.handles = self.controlhandles = None\n\n def translateObject(self, svgobject, offset):\n\n\n  offset = Point(offset)\n  if isinstance(svgobject, GroupObject):\n   for obj in svgobject.objectList:\n    self.translateObject(obj, offset)\n   boundary = getattr(svgobject, \"boundary\", None)\n   if boundary: self.translateObject(boundary, offset)\n  elif isinstance(svgobject, PointObject):\n   svgobject.XY += offset\n  else:\n   svgobject.pointList = [point+offset for point in svgobject.pointList]\n   if hasattr(svgobject, \"pointsetList\"):\n    svgobject.pointsetList = [(p1+offset,p2+offset,p3+offset) for (p1,p2,p3) in svgobject.pointsetList]\n   svgobject._update()\n   svgobject._updatehittarget()\n   if isinstance(svgobject, PolygonObject): svgobject._segments = None\n\n def destroy(self):\n\n\n\n\n\n  if self.destroyed: return\n  self.destroyed = True\n  if self.lazyObserver is not None: self.lazyObserver.disconnect()\n  self.lazyObserver = None\n  if hasattr(self, \"objectDict\"):\n   document.unbind(\"keydown\", self.keyHandler)\n   for event in CANVASEVENTS: self.unbind(event)\n   for hittarget in self.hittargets:\n    for event in MOUSEEVENTS+TOUCHEVENTS: hittarget.unbind(event)\n   tooltip = getattr(self, \"tooltip\", None)\n   if tooltip is not None: tooltip.canvas = tooltip.layer = None\n   self.tooltip = None\n   self.deleteAll()\n   self.hittargets = []\n   self.mouseOwner = self.selectedObject = self.handles = self.controlhandles = None\n  if self.parentNode is not None: self.parentNode.removeChild(self)\n\n def __enter__(self):\n  return self\n\n def __exit__(self, exctype, excvalue, traceback):\n  self.destroy()\n\n\n def rotateElement(self, element, angle, centre=None):\n\n\n  if not centre:\n   bbox = element.getBBox()\n   centre = (bbox.x+bbox.width/2, bbox.y+bbox.height/2)\n  (cx, cy) = centre\n  transformstring = f\"translate({cx}px,{cy}px) rotate({angle}deg) translate({-cx}px,{-cy}px)\"\n  element.style.transform = transformstring + element.style.transform\n  t = getsvgbase().createSVGTransform()\n  t.setRotate(angle, *centre)\n\n  return t.matrix\n\n def scaleElement(self, element, xscale, yscale=None):\n\n\n  if not yscale: yscale = xscale\n  transformstring = f\"scale({xscale},{yscale})\"\n  element.style.transform = transformstring + element.style.transform\n  t = getsvgbase().createSVGTransform()\n  t.setScale(xscale, yscale)\n\n  return t.matrix\n\n def translateElement(self, element, vector):\n\n  (dx, dy) = vector\n  transformstring = f\"translate({dx}px,{dy}px)\"\n  element.style.transform = transformstring + element.style.transform\n  t = getsvgbase().createSVGTransform()\n  t.setTranslate(*vector)\n\n  return t.matrix\n\n\n @property\n def mouseMode(self):\n  return self._mouseMode\n\n @mouseMode.setter\n def mouseMode(self, mm):\n  if mm in [MouseMode.DRAG, MouseMode.EDIT, MouseMode.TRANSFORM]:\n   from . import dragtools\n   self.createHitTargets()\n  currentmm = getattr(self, \"_mouseMode\", None)\n  if currentmm == mm: return\n  if currentmm == MouseMode.TRANSFORM: self.hideTransformHandles()\n  elif currentmm == MouseMode.EDIT: self.deselectObject()\n  self._mouseMode = mm\n  if mm in [MouseMode.DRAG, MouseMode.PAN, MouseMode.TRANSFORM]:\n   self.tool = \"select\"\n\n @property\n def lineWidthScaling(self):\n  return self._lineWidthScaling\n\n @lineWidthScaling.setter\n def lineWidthScaling(self, lws):\n  currentlws = getattr(self, \"_lineWidthScaling\", None)\n  if currentlws == lws: return\n  self._lineWidthScaling = lws\n  if self.styleSheet is not None or not lws: self._writeStyleSheet()\n\n def setClassStyles(self, styles):\n\n\n\n  self.classStyles.update(styles)\n  self._writeStyleSheet()\n\n def _writeStyleSheet(self):\n\n  if self.styleSheet is None:\n   self.styleSheet = svg.style()\n   self.insertBefore(self.styleSheet, self.firstChild)\n  scope = \"#\" + window.CSS.escape(self.id)\n  rules = [] if self.lineWidthScaling else [f\"{scope} * {{vector-effect:non-scaling-stroke}}\"]\n  for (classname, style) in self.classStyles.items():\n   properties = \";\".join(f\"{key}:{value}\" for (key, value) in style.items())\n   rules.append(f\"{scope} .{classname} {{{properties}}}\")\n  self.styleSheet.text = \"\\n\".join(rules)\n\n def createHitTargets(self):\n  try:\n   self._createEditHitTargets()\n  except AttributeError:\n   self._createHitTargets()\n\n def _onWheel(self, event):\n  if self.mouseMode == MouseMode.PAN:\n   event.preventDefault()\n   zoomfactor = 0.9 if event.deltaY < 0 else 1.1\n   newviewbox = [self.centre + zoomfactor*(point - self.centre) for point in self.viewBoxRect]\n   self.setViewBox(newviewbox)\n\n def _onRightClick(self, event):\n\n  pass\n\n def _onDragStart(self, event):\n  event.preventDefault()\n\n def _onTouchStart(self, event):\n  event.preventDefault()\n  global lasttaptime\n  latesttaptime = time.time()\n  if event.touches.length == 1 and latesttaptime - lasttaptime < 0.3:\n   for function in self.events(\"dblclick\"):\n    function(event)\n  else:\n   self._onLeftDown(event)\n  lasttaptime = latesttaptime\n\n def _onMouseDown(self, event):\n  event.preventDefault()\n  if not self.mouseDetected:\n   self.mouseDetected = True\n   for obj in self.objectDict.values():\n    if hasattr(obj, \"reference\"):\n     if obj.reference.nodeName == \"use\": continue\n     obj.style.strokeWidth = 10*self.scaleFactor\n  if event.button > 0: return\n  self._onLeftDown(event)\n\n def _onLeftDown(self, event):\n  if self.mouseMode == MouseMode.DRAG:\n   self._prepareDrag(event)\n  elif self.mouseMode == MouseMode.TRANSFORM:\n   self._prepareTransform(event)\n  elif self.mouseMode == MouseMode.DRAW:\n   self._drawPoint(event)\n  elif self.mouseMode == MouseMode.EDIT:\n   self._prepareEdit(event)\n  elif self.mouseMode == MouseMode.PAN:\n   self._preparePan(event)\n\n def _onMouseMove(self, event):\n  event.preventDefault()\n  if self.mouseMode == MouseMode.PAN:\n   if self.panning: self._doPan(event)\n   return\n  if not self.mouseOwner: return\n  if self.mouseMode == MouseMode.DRAG:\n   self._doDrag(event)\n  else:\n   self._movePoint(event)\n\n def _onLeftUp(self, event):\n  if event.type == \"mouseup\" and event.button > 0: return\n  if self.mouseMode == MouseMode.PAN:\n   self._endPan(event)\n   return\n  if not self.mouseOwner: return\n  if self.mouseMode == MouseMode.DRAG:\n   self._endDrag(event)\n  elif self.mouseMode == MouseMode.TRANSFORM:\n   self._endTransform(event)\n   self.mouseOwner = None\n  elif self.mouseMode == MouseMode.EDIT:\n   self._endEdit(event)\n\n def _onDoubleClick(self, event):\n  if self.mouseMode == MouseMode.DRAW:\n   self.setTool(\"select\")\n  elif self.mouseMode == MouseMode.PAN:\n   self.fitContents()\n\n def _onKeyDown(self, event):\n  if event.keyCode == 46: self.deleteSelection()\n\n def _preparePan(self, event):\n  if not self.centre:\n   (width, height) = self._getDimensions()\n   self.setViewBox([(0,0), (width,height)])\n  if \"touch\" in event.type and event.touches.length == 2:\n   point0 = Point((event.touches[0].clientX, event.touches[0].clientY))\n   point1 = Point((event.touches[1].clientX, event.touches[1].clientY))\n   self.startZoomLength = (point1-point0).length()\n\n  x = event.targetTouches[0].clientX if \"touch\" in event.type else event.clientX\n  y = event.targetTouches[0].clientY if \"touch\" in event.type else event.clientY\n  self.startPoint = Point((x, y))\n  self.startCentre = self.centre\n  self.panStart = self.viewBoxRect\n  self.panning = True\n\n def _doPan(self, event):\n  if \"touch\" in event.type and event.touches.length == 2:\n   point0 = Point((event.touches[0].clientX, event.touches[0].clientY))\n   point1 = Point((event.touches[1].clientX, event.touches[1].clientY))\n   newzoomlength = (point1-point0).length()\n   zoomfactor = self.startZoomLength/newzoomlength\n\n   newviewbox = [self.centre + zoomfactor*(point - self.centre) for point in self.viewBoxRect]\n   self.setViewBox(newviewbox)\n   self.startZoomLength = newzoomlength\n  else:\n   x = event.targetTouches[0].clientX if \"touch\" in event.type else event.clientX\n   y = event.targetTouches[0].clientY if \"touch\" in event.type else event.clientY\n   sf = (self.xScaleFactor, self.yScaleFactor) if self.attrs[\"preserveAspectRatio\"] == \"none\" else self.scaleFactor\n   delta = (Point((x, y)) - self.startPoint)*sf\n\n   newviewbox = [point-delta for point in self.panStart]\n   self.setViewBox(newviewbox)\n\n def _endPan(self, event):\n  self.panning = False\n\n def getSelectedObject(self, objectid, getGroup = True):\n\n\n\n\n  try:\n   svgobj = self.objectDict[objectid]\n  except KeyError:\n   return\n  try:\n   svgobj = svgobj.reference\n  except AttributeError:\n   pass\n  if getGroup:\n   while getattr(svgobj, \"group\", None):\n    svgobj = svgobj.group\n  return svgobj\n\nclass Point(tuple):\n\n\n __slots__ = ()\n\n def __new__(cls, coords):\n  return tuple.__new__(cls, coords)\n\n @property\n def coords(self):\n  return self\n\n def __repr__(self):\n  return str(tuple(self))\n\n def __eq__(self, other):\n  if isinstance(other, tuple): return tuple.__eq__(self, other)\n  if isinstance(other, list): return tuple.__eq__(self, tuple(other))\n  return False\n\n def __ne__(self, other):\n  return not self == other\n\n __hash__ = tuple.__hash__\n\n def __add__(self, other):\n  if isinstance(other, (list, tuple)):\n   return Point([xi+yi for (xi, yi) in zip(self, other)])\n  elif other is None:\n   return None\n  else:\n   return NotImplemented\n\n def __radd__(self, other):\n  return self + other\n\n def __sub__(self, other):\n  return Point([xi-yi for (xi, yi) in zip(self, other)])\n\n def __rsub__(self, other):\n  return Point([xi-yi for (xi, yi) in zip(other, self)])\n\n def __neg__(self):\n  return Point([-xi for xi in self])\n\n def __mul__(self, other):\n  if isinstance(other, Point):\n   return sum([xi*yi for (xi, yi) in zip(self, other)])\n  elif isinstance(other, (int, float)):\n   return Point([other*xi for xi in self])\n  elif isinstance(other, (list, tuple)):\n   return Point([xi*yi for (xi, yi) in zip(self, other)])\n  elif isinstance(other, Matrix):\n   return Point([self*col for col in other.cols])\n  else:\n   return NotImplemented\n\n def __rmul__(self, other):\n  if isinstance(other, (int, float)):\n   return Point([other*xi for xi in self])\n  elif isinstance(other, (list, tuple)):\n   return Point([xi*yi for (xi, yi) in zip(self, other)])\n  else:\n   return NotImplemented\n\n def __truediv__(self, other):\n  return Point([xi/other for xi in self])\n\n def __round__(self, n):\n  (x, y) = self\n  return Point((round(float(x), n), round(float(y), n)))\n\n def length(self):\n  (x, y) = self\n  return hypot(x, y)\n\n def angle(self):\n  return atan2(self[1], self[0])\n\n def anglefrom(self, other):\n  dot = other*self\n  cross = other.cross(self)\n  if cross == 0: cross = -0.0\n  angle = atan2(cross, dot)\n  return angle\n\n def cross(self, other):\n  x1, y1 = self\n  x2, y2 = other\n  return x1*y2 - y1*x2\n\n def roundsf(self, sf):\n  x, y = self\n  return Point((roundsf(x, sf), roundsf(y, sf)))\n\nclass Matrix(object):\n def __init__(self, rows):\n  self.rows = rows\n  self.cols = [Point([self.rows[i][j] for i in range(len(self.rows))]) for j in range(len(self.rows[0]))]\n\n def __str__(self):\n  return str(\"\\n\".join(str(row) for row in self.rows))\n\n def __rmul__(self, other):\n  if isinstance(other, (list, tuple)):\n   return [Point([p*col for col in self.cols]) for p in other]\n  else:\n   return Point([other*col for col in self.cols])\n\ndef roundsf(x, sf=3):\n if x == 0: return 0\n return round(x, sf-int(floor(log10(abs(x))))-1)\n\nshapetypes = {\"line\":LineObject, \"polygon\":PolygonObject, \"polyline\":PolylineObject,\n\"rectangle\":RectangleObject, \"ellipse\":EllipseObject, \"circle\":CircleObject, \"sector\":SectorObject}\n\n\n\nDRAGTOOLS = {\"UseObject\", \"ImageObject\", \"BezierObject\", \"ClosedBezierObject\", \"SmoothBezierObject\", \"SmoothClosedBezierObject\",\n\"SmoothBezierMixin\", \"RegularPolygon\", \"Button\", \"ImageButton\", \"Definitions\"}\n\ndef __getattr__(name):\n if name in DRAGTOOLS:\n  from . import dragtools\n  return getattr(dragtools, name)\n raise AttributeError(f\"module {__name__!r} has no attribute {name!r}\")\n", ["browser", "browser.svg", "brycharts", "brycharts.geometry", "brycharts.textmetrics", "math", "time"]], "brycharts.dragtools": [".py", "\n\n\n\n\n\n\n\n\n\n\nimport time\nfrom browser import document, window\nimport browser.svg as svg\nimport browser.html as html\nfrom math import sin, cos, pi, hypot\nfrom . import dragcanvas\nfrom .dragcanvas import (getsvgbase, pointsextent, boxextent, ObjectMixin, PolygonObject, RectangleObject, EllipseObject, TextObject,\nGroupObject, CanvasObject, Point, MOUSEEVENTS, TOUCHEVENTS, shapetypes)\n\nclass SmoothBezierMixin(object):\n\n def _calculatecontrolpoints(self, points):\n\n  [(x1, y1), (x2, y2), (x3, y3)] = points\n  (dx1, dy1) = ((x2-x1), (y2-y1))\n  (dx3, dy3) = ((x2-x3), (y2-y3))\n  d1 = hypot(dx1, dy1)\n  d2 = hypot(dx3, dy3)\n  if d1 == 0 or d2 == 0: return ((x2, y2), (x2, y2))\n  cos1, sin1 = dx1/d1, dy1/d1\n  cos2, sin2 = dx3/d2, dy3/d2\n\n  (c1x, c1y) = (x2 - d1*(cos1-cos2)/2, y2 - d1*(sin1-sin2)/2)\n  (c2x, c2y) = (x2 + d2*(cos1-cos2)/2, y2 + d2*(sin1-sin2)/2)\n  c1 = ((c1x+x2)/2, (c1y+y2)/2)\n  c2 = ((c2x+x2)/2, (c2y+y2)/2)\n  return (Point(c1), Point(c2))\n\nclass UseObject(svg.use, ObjectMixin):\n\n\n\n\n\n\n\n\n\n\n def __init__(self, href=None, origin=None, centre=(0,0), width=None, height=None, angle=0, scale=None, objid=None):\n  svg.use.__init__(self, href=href)\n  svgbase = getsvgbase()\n  document <= svgbase\n  tempgroup = svg.g()\n  tempgroup <= self\n  svgbase <= tempgroup\n  bbox = tempgroup.getBBox()\n  svgbase.removeChild(tempgroup)\n  document.body.removeChild(svgbase)\n  self._origwidth = bbox.width\n  self._origheight = bbox.height\n  self._origaspectratio = self._origheight/self._origwidth\n  (cx, cy) = (bbox.x+bbox.width/2, bbox.y+bbox.height/2)\n  self.originoffset = Point((-cx, -cy))\n\n  if width and height:\n   (self._width, self._height) = (width, height)\n  elif width:\n   (self._width, self._height) = (width, width*self._origaspectratio)\n  elif height:\n   (self._width, self._height) = (height/self._origaspectratio, height)\n  else:\n   (self._width, self._height) = (self._origwidth, self._origheight)\n\n\n  if origin:\n   scalefactors = (self._width/self._origwidth, self._height/self._origheight)\n   self.centre = Point(origin) - self.originoffset*scalefactors\n  else:\n   self.centre = Point(centre)\n  self.angle = angle\n  self.setPosition()\n  if objid: self.id = objid\n\n def setPosition(self, origin=None, centre=None, width=None, height=None, angle=None, preserveaspectratio=False):\n\n\n\n\n  if width:\n   self._width = width\n   if preserveaspectratio and not height: self._height = width*self.currentAspectRatio\n  if height:\n   self._height = height\n   if preserveaspectratio and not width: self._width = height/self.currentAspectRatio\n  if self._width != 0: self.currentAspectRatio = self._height/self._width\n\n  if origin:\n   scalefactors = (self._width/self._origwidth, self._height/self._origheight)\n   self.centre = Point(origin) - self.originoffset*scalefactors\n  elif centre:\n   self.centre = Point(centre)\n  if angle is not None: self.angle = angle\n\n  (cx, cy) = self.centre\n  self.pointList = [(cx-self._width/2, cy-self._height/2), (cx+self._width/2, cy+self._height/2)]\n  t = getsvgbase().createSVGTransform()\n  t.setRotate(self.angle, cx, cy)\n  self.pointList = self._transformedpointlist(t.matrix)\n  self._update()\n  self._updatehittarget()\n\n def _update(self):\n  [(x1, y1), (x2, y2)] = self.pointList\n  (cx, cy) = ((x1+x2)/2, (y1+y2)/2)\n  self.centre = Point((cx, cy))\n  self.rotatestring = f\"translate({cx}px,{cy}px) rotate({self.angle}deg) translate({-cx}px,{-cy}px)\"\n  (xscale, yscale) = (self._width/self._origwidth, self._height/self._origheight)\n  self.scalestring = f\"translate({cx}px,{cy}px) scale({xscale},{yscale}) translate({-cx}px,{-cy}px)\"\n  self.style.transform = self.rotatestring + self.scalestring\n  self.origin = self.centre + self.originoffset\n  (self.attrs[\"x\"], self.attrs[\"y\"]) = self.origin\n\n def getExtent(self, canvas=None):\n  if getattr(self, \"centre\", None) is None: return None\n  return boxextent(self.centre, self._width, self._height, self.angle)\n\nclass ImageObject(svg.image, ObjectMixin):\n\n\n\n\n\n\n\n\n\n\n\n def __init__(self, href=None, pointlist=None, centre=(0,0), width=0, height=None, angle=0, objid=None):\n  def initialise(event):\n   nonlocal width, height\n   self.imageWidth = img.naturalWidth\n   self.imageHeight = img.naturalHeight\n\n   self.imageAspectRatio = self.imageHeight/self.imageWidth\n\n   self.attrs[\"preserveAspectRatio\"] = \"none\"\n   self.angle = angle\n   if pointlist:\n    self.setPointList(pointlist)\n   else:\n    self.centre = Point(centre)\n    if not width and not height:\n     width = self.imageWidth\n     height = self.imageHeight\n    elif not height:\n     height = width*self.imageAspectRatio\n    elif not width:\n     width = height/self.imageAspectRatio\n    self._width = width\n    self._height = height\n    self._setuppointlist()\n   self.style.visibility = \"visible\"\n   self.imageloaded = True\n   loadcomplete = window.Event.new(\"loadcomplete\")\n   self.dispatchEvent(loadcomplete)\n\n  super().__init__()\n  if objid: self.id = objid\n  self.imageloaded = False\n  self.style.visibility = \"hidden\"\n  if not href: return\n  self.attrs[\"href\"] = href\n  img = html.IMG()\n  img.bind(\"load\", initialise)\n  img.attrs[\"src\"] = href\n\n def setPosition(self, centre=None, width=None, height=None, angle=None, preserveaspectratio=False):\n\n\n\n  def set_position(event=None):\n\n   if centre: self.centre = Point(centre)\n   if width:\n    self._width = width\n    if preserveaspectratio and not height: self._height = width*self.currentAspectRatio\n   if height:\n    self._height = height\n    if preserveaspectratio and not width: self._width = height/self.currentAspectRatio\n   if angle is not None: self.angle = angle\n   self._setuppointlist()\n\n  if self.imageloaded:\n   set_position()\n  else:\n   self.bind(\"loadcomplete\", set_position)\n\n def _setuppointlist(self):\n  (cx, cy) = self.centre\n  self.pointList = [(cx-self._width/2, cy-self._height/2), (cx+self._width/2, cy+self._height/2)]\n  t = getsvgbase().createSVGTransform()\n  t.setRotate(self.angle, cx, cy)\n  self.pointList = self._transformedpointlist(t.matrix)\n  self._update()\n  self._updatehittarget()\n\n def _update(self):\n  [(x1, y1), (x2, y2)] = self.pointList\n  (cx, cy) = ((x1+x2)/2, (y1+y2)/2)\n  self.centre = Point((cx, cy))\n  self.rotatestring = self.style.transform = f\"translate({cx}px,{cy}px) rotate({self.angle}deg) translate({-cx}px,{-cy}px)\"\n\n  t = getsvgbase().createSVGTransform()\n  t.setRotate(-self.angle, cx, cy)\n  basepointlist = self._transformedpointlist(t.matrix)\n  [(x1, y1), (x2, y2)] = basepointlist\n  self._width = abs(x2-x1)\n  self._height = abs(y2-y1)\n  if self._width != 0: self.currentAspectRatio = self._height/self._width\n  self.attrs[\"x\"] = x2 if x2<x1 else x1\n  self.attrs[\"y\"] = y2 if y2<y1 else y1\n  self.attrs[\"width\"] = self._width\n  self.attrs[\"height\"] = self._height\n\n def getExtent(self, canvas=None):\n  if getattr(self, \"centre\", None) is None: return None\n  return boxextent(self.centre, self._width, self._height, self.angle)\n\nclass BezierObject(svg.path, ObjectMixin):\n\n\n\n\n\n\n def __init__(self, pointsetlist=None, pointlist=[(0,0), (0,0)], linecolour=\"black\", linewidth=1, fillcolour=\"none\", objid=None):\n  def toPoint(coords):\n   return None if coords is None else Point(coords)\n  svg.path.__init__(self, style={\"stroke\":linecolour, \"stroke-width\":linewidth, \"fill\":fillcolour})\n  if pointsetlist:\n   self.pointList = [Point(pointset[1]) for pointset in pointsetlist]\n  else:\n   self.pointList = [Point(coords) for coords in pointlist]\n   pointsetlist = self._getpointsetlist(self.pointList)\n  self.pointsetList = [[toPoint(coords) for coords in pointset] for pointset in pointsetlist]\n  self._update()\n  if objid: self.id = objid\n\n def _getpointsetlist(self, pointlist):\n  pointsetlist = [[None, pointlist[0], (pointlist[0]+pointlist[1])/2]]\n  for i in range(1, len(pointlist)-1):\n   pointsetlist.append([(pointlist[i-1]+pointlist[i])/2, pointlist[i], (pointlist[i]+pointlist[i+1])/2])\n  pointsetlist.append([(pointlist[-2]+pointlist[-1])/2, pointlist[-1], None])\n  return pointsetlist\n\n def _updatepointsetlist(self):\n  if len(self.pointList) == 2:\n   self.pointsetList = [[None]+self.pointList, self.pointList+[None]]\n  else:\n   cpoint = (self.pointList[-1]+self.pointList[-2])/2\n   self.pointsetList[-1] = [cpoint, self.pointList[-1], None]\n   self.pointsetList[-2][2] = cpoint\n\n def _update(self):\n  (dummy, (x1, y1), (c1x, c1y)) = self.pointsetList[0]\n  ((c2x, c2y), (x2, y2), dummy) = self.pointsetList[-1]\n  self.plist = [\"M\", x1, y1, \"C\", c1x, c1y]+[x for p in self.pointsetList[1:-1] for c in p for x in c]+[c2x, c2y, x2, y2]\n  self.attrs[\"d\"] = \" \".join(str(x) for x in self.plist)\n\n def getExtent(self, canvas=None):\n\n  return pointsextent([point for pointset in self.pointsetList for point in pointset if point is not None])\n\nclass ClosedBezierObject(BezierObject):\n\n\n\n\n\n def __init__(self, pointsetlist=None, pointlist=[(0,0), (0,0)], linecolour=\"black\", linewidth=1, fillcolour=\"yellow\", objid=None):\n  svg.path.__init__(self, style={\"stroke\":linecolour, \"stroke-width\":linewidth, \"fill\":fillcolour})\n  if pointsetlist:\n   self.pointList = [Point(pointset[1]) for pointset in pointsetlist]\n  else:\n   self.pointList = [Point(coords) for coords in pointlist]\n   pointsetlist = self._getpointsetlist(self.pointList)\n  self.pointsetList = [[Point(coords) for coords in pointset] for pointset in pointsetlist]\n  self._update()\n  if objid: self.id = objid\n\n def _getpointsetlist(self, pointlist):\n  pointsetlist = [[(pointlist[0]+pointlist[-1])/2, pointlist[0], (pointlist[0]+pointlist[1])/2]]\n  for i in range(1, len(pointlist)-1):\n   pointsetlist.append([(pointlist[i-1]+pointlist[i])/2, pointlist[i], (pointlist[i]+pointlist[i+1])/2])\n  pointsetlist.append([(pointlist[-2]+pointlist[-1])/2, pointlist[-1], (pointlist[0]+pointlist[-1])/2])\n  return pointsetlist\n\n def _updatepointsetlist(self):\n  if len(self.pointList) == 2:\n   self.pointsetList = self._getpointsetlist(self.pointList)\n  else:\n   cpoint1, cpoint2 = (self.pointList[-1]+self.pointList[-2])/2, (self.pointList[-1]+self.pointList[0])/2\n   self.pointsetList[-1] = (cpoint1, self.pointList[-1], cpoint2)\n   self.pointsetList[-2][2] = cpoint1\n   self.pointsetList[0][0] = cpoint2\n\n def _update(self):\n  ((c1x, c1y), (x, y), (c2x, c2y)) = self.pointsetList[0]\n  self.plist = [\"M\", x, y, \"C\", c2x, c2y] + [x for p in self.pointsetList[1:] for c in p for x in c] + [c1x, c1y, x, y]\n  self.attrs[\"d\"] = \" \".join(str(x) for x in self.plist)\n\nclass SmoothBezierObject(SmoothBezierMixin, BezierObject):\n\n\n\n def __init__(self, pointlist=[(0,0), (0,0)], linecolour=\"black\", linewidth=1, fillcolour=\"none\", objid=None):\n  self.pointList = [Point(coords) for coords in pointlist]\n  pointsetlist = self._getpointsetlist(self.pointList)\n  BezierObject.__init__(self, pointsetlist, linecolour=linecolour, linewidth=linewidth, fillcolour=fillcolour, objid=objid)\n\n def _getpointsetlist(self, pointlist):\n  if len(pointlist) == 2: return [[None]+pointlist, pointlist+[None]]\n  for i in range(1, len(pointlist)-1):\n   (c1, c2) = self._calculatecontrolpoints(pointlist[i-1:i+2])\n   if i == 1:\n    pointsetlist = [[None, pointlist[0], (pointlist[0]+c1)/2]]\n   pointsetlist.append([c1, pointlist[i], c2])\n  pointsetlist.append([(pointlist[-1]+c2)/2, pointlist[-1], None])\n  return pointsetlist\n\n def _updatepointsetlist(self):\n  if len(self.pointList) == 2:\n   self.pointsetList = [[None]+self.pointList, self.pointList+[None]]\n  else:\n   (c1, c2) = self._calculatecontrolpoints(self.pointList[-3:])\n   self.pointsetList[-1] = [(self.pointList[-1]+c2)/2, self.pointList[-1], None]\n   self.pointsetList[-2] = [c1, self.pointList[-2], c2]\n\nclass SmoothClosedBezierObject(SmoothBezierMixin, ClosedBezierObject):\n\n\n\n\n def __init__(self, pointlist=[(0,0), (0,0)], linecolour=\"black\", linewidth=1, fillcolour=\"yellow\", objid=None):\n  self.pointList = [Point(coords) for coords in pointlist]\n  pointsetlist = self._getpointsetlist(self.pointList)\n  ClosedBezierObject.__init__(self, pointsetlist, linecolour=linecolour, linewidth=linewidth, fillcolour=fillcolour, objid=objid)\n\n def _getpointsetlist(self, pointlist):\n  pointlist = [pointlist[-1]]+pointlist[:]+[pointlist[0]]\n  pointsetlist = []\n  for i in range(1, len(pointlist)-1):\n   (c1, c2) = self._calculatecontrolpoints(pointlist[i-1:i+2])\n   pointsetlist.append([c1, pointlist[i], c2])\n  return pointsetlist\n\n def _updatepointsetlist(self):\n  if len(self.pointList) == 2:\n   self.pointsetList = self._getpointsetlist(self.pointList)\n  else:\n   L = len(self.pointList)\n   pointlist = self.pointList[:]+self.pointList[:2]\n   for j in range(L-2, L+1):\n    (c1, c2) = self._calculatecontrolpoints(pointlist[j-1:j+2])\n    self.pointsetList[j%L] = [c1, pointlist[j], c2]\n\nclass RegularPolygon(PolygonObject):\n\n\n\n\n\n def __init__(self, sidecount=0, centre=None, radius=None, startpoint=None, sidelength=None, offsetangle=0, linecolour=\"black\", linewidth=1, fillcolour=\"yellow\", objid=None):\n  pointlist = []\n  if sidecount>0:\n   angle = 2*pi/sidecount\n   radoffset = offsetangle*pi/180\n   if not radius: radius = sidelength/(2*sin(pi/sidecount))\n   if not centre:\n    (x, y) = startpoint\n    centre = (x-radius*sin(radoffset), y+radius*cos(radoffset))\n   (cx, cy) = centre\n   for i in range(sidecount):\n    t = radoffset+i*angle\n    pointlist.append(Point((cx+radius*sin(t), cy-radius*cos(t))))\n  PolygonObject.__init__(self, pointlist, linecolour, linewidth, fillcolour, objid)\n  if objid: self.id = objid\n\nclass Button(GroupObject):\n\n\n\n\n\n\n\n\n\n def __init__(self, position, size, text, onclick, fontsize=None, fillcolour=\"lightgrey\", canvas=None, objid=None):\n  GroupObject.__init__(self)\n  if objid: self.id = objid\n  (x, y), (width, height) = position, size\n  self.button = RectangleObject([(x,y),(x+width, y+height)], fillcolour=fillcolour)\n  self.button.attrs[\"rx\"] = height/3\n  rowcount = text.count(\"\\n\") + 1\n  if not fontsize: fontsize = height*0.75/rowcount\n  self.label = TextObject(text,(x+width/2,y+height/2-fontsize/8),anchorposition=5, fontsize=fontsize)\n  self.addObjects([self.button, self.label])\n  self.fixed = True\n  self.bind(\"mousedown\", self._onMouseDown)\n  self.bind(\"mouseup\", self._onMouseUp)\n  self.bind(\"click\", onclick)\n  self.bind(\"touchstart\", onclick)\n  self.attrs[\"cursor\"] = \"pointer\"\n\n def _onMouseDown(self, event):\n  event.stopPropagation()\n\n def _onMouseUp(self, event):\n  event.stopPropagation()\n\n def setFillColour(self, colour):\n  self.button.style.fill = colour\n\nclass ImageButton(GroupObject):\n\n\n\n\n def __init__(self, position, size, image, onclick, fontsize=None, fillcolour=\"lightgrey\", canvas=None, objid=None):\n  GroupObject.__init__(self)\n  if objid: self.id = objid\n  (x, y), (width, height) = position, size\n  self.button = RectangleObject([(x,y),(x+width, y+height)], fillcolour=fillcolour)\n  self.button.attrs[\"rx\"] = height/3\n  image.style.transform = f\"translate({x+width/2}px,{y+height/2}px)\"\n  if canvas:\n   canvas <= image\n   bbox = image.getBBox()\n   canvas.removeChild(image)\n   scalefactor = min(width/bbox.width, height/bbox.height)*0.7\n   image.style.transform += f\" scale({scalefactor})\"\n  self.addObjects([self.button, image])\n  self.fixed = True\n  self.bind(\"mousedown\", self._onMouseDown)\n  self.bind(\"mouseup\", self._onMouseUp)\n  self.bind(\"click\", onclick)\n  self.bind(\"touchstart\", onclick)\n  self.attrs[\"cursor\"] = \"pointer\"\n\n def _onMouseDown(self, event):\n  event.stopPropagation()\n\n def _onMouseUp(self, event):\n  event.stopPropagation()\n\n def setFillColour(self, colour):\n  self.button.style.fill = colour\n\nclass Definitions(svg.defs):\n\n\n\n def __init__(self, objlist=[], filename=None):\n  svg.defs.__init__(self)\n  if filename:\n   self.innerHTML = open(filename).read()\n  for obj in objlist: self <= obj\n\ndef _createHitTargets(self):\n objlist = list(self.objectDict.values())\n for obj in objlist:\n  if isinstance(obj, GroupObject): continue\n  if hasattr(obj, \"hitTarget\"): continue\n  if hasattr(obj, \"reference\"): continue\n  if isinstance(obj, UseObject):\n   newobj = RectangleObject(pointlist=obj.pointList, angle=obj.angle)\n  elif obj.style.fill != \"none\" or obj.fixed:\n   continue\n  else:\n   newobj = obj.cloneObject()\n   newobj.style.strokeWidth = 10*self.scaleFactor if self.mouseDetected else 25*self.scaleFactor\n  newobj.style.opacity = 0\n  for event in MOUSEEVENTS: newobj.bind(event, self._onHitTargetMouseEvent)\n  for event in TOUCHEVENTS: newobj.bind(event, self._onHitTargetTouchEvent)\n  newobj.reference = obj\n  obj.hitTarget = newobj\n  self.hittargets.append(newobj)\n\n\n\n  self.addObject(newobj)\n\ndef _onHitTargetMouseEvent(self, event):\n\n obj = self.objectDict[event.target.id]\n for function in obj.reference.events(event.type):\n  function(event)\n\ndef _onHitTargetTouchEvent(self, event):\n obj = self.objectDict[event.target.id]\n for function in obj.reference.events(event.type):\n  function(event)\n latesttime = time.time()\n if event.type == \"touchend\" and latesttime - dragcanvas.lasttaptime < 0.6:\n  touch = event.changedTouches[0]\n  eventdict = {\"bubbles\":False, \"clientX\":touch.clientX, \"clientY\":touch.clientY, \"screenX\":touch.screenX, \"screenY\":touch.screenY}\n  newevent = window.MouseEvent.new(\"click\", eventdict)\n  obj.reference.dispatchEvent(newevent)\n\ndef _prepareDrag(self, event):\n self.dragStartCoords = self.getSVGcoords(event)\n self.selectedObject = self.getSelectedObject(event.target.id)\n if self.selectedObject and not self.selectedObject.fixed:\n  self.mouseOwner = self.selectedObject\n  self <= self.mouseOwner\n  if (hittarget := getattr(self.mouseOwner, \"hitTarget\", None)): self <= hittarget\n  self.startx = event.targetTouches[0].clientX if \"touch\" in event.type else event.clientX\n  self.starty = event.targetTouches[0].clientY if \"touch\" in event.type else event.clientY\n\ndef _doDrag(self, event):\n x = event.targetTouches[0].clientX if \"touch\" in event.type else event.clientX\n y = event.targetTouches[0].clientY if \"touch\" in event.type else event.clientY\n dx, dy = (x-self.startx)*self.scaleFactor, (y-self.starty)*self.scaleFactor\n self.mouseOwner.style.transform = f\"translate({dx}px,{dy}px)\"\n if isinstance(self.mouseOwner, [EllipseObject, RectangleObject, UseObject, ImageObject]):\n  self.mouseOwner.style.transform += self.mouseOwner.rotatestring\n  if isinstance(self.mouseOwner, UseObject): self.mouseOwner.style.transform += self.mouseOwner.scalestring\n\ndef _endDrag(self, event):\n self.mouseOwner.style.transform = \"translate(0px,0px)\"\n currentcoords = self.getSVGcoords(event)\n offset = currentcoords - self.dragStartCoords\n self.translateObject(self.mouseOwner, offset)\n if self.edgeSnap: self._doEdgeSnap(self.mouseOwner)\n elif self.vertexSnap: self._doVertexSnap(self.mouseOwner)\n self.mouseOwner = None\n\ndef _doVertexSnap(self, svgobject, checkpoints=None):\n if not hasattr(svgobject, \"pointList\"): return\n snapd = self.snapDistance\n bestdx = bestdy = bestd = None\n bbox = svgobject.getBBox()\n L, R, T, B = bbox.x, bbox.x+bbox.width, bbox.y, bbox.y+bbox.height\n\n if checkpoints is None:\n  checkpoints = []\n  for objid in self.objectDict:\n   if objid == svgobject.id: continue\n   obj = self.objectDict[objid]\n   if not hasattr(obj, \"pointList\"): continue\n   if hasattr(obj, \"reference\"): continue\n   if obj.style.visibility == \"hidden\": continue\n   if objgroup := getattr(obj, \"group\", None) and hasattr(objgroup, \"pointList\") : continue\n   bbox = obj.getBBox()\n   L1, R1, T1, B1 = bbox.x, bbox.x+bbox.width, bbox.y, bbox.y+bbox.height\n   if L1-R > snapd or R1-L < -snapd or T1-B > snapd or B1-T < -snapd: continue\n   checkpoints.extend(obj.pointList)\n if not checkpoints: return\n checkpoints.sort(key=lambda p:p.coords)\n objpoints = sorted(svgobject.pointList, key=lambda p:p.coords)\n\n checkstart = 0\n for i, point1 in enumerate(objpoints):\n  checkpoints = checkpoints[checkstart:]\n  if not checkpoints: break\n  try:\n   (tonextx, y) = objpoints[i+1] - point1\n  except IndexError:\n   tonextx = 0\n  checkstart = 0\n  for point2 in checkpoints:\n   (dx, dy) = point2 - point1\n   if abs(dx) < snapd and abs(dy) < snapd:\n    d = hypot(dx, dy)\n    if bestd is None or d < bestd: (bestd, bestdx, bestdy) = (d, dx, dy)\n   if tonextx - dx > snapd: checkstart += 1\n   if dx > snapd: break\n if bestd: self.translateObject(svgobject, (bestdx, bestdy))\n\nshapetypes.update({\"bezier\":BezierObject, \"closedbezier\":ClosedBezierObject, \"smoothbezier\":SmoothBezierObject, \"smoothclosedbezier\":SmoothClosedBezierObject})\n\nfor function in [_createHitTargets, _onHitTargetMouseEvent, _onHitTargetTouchEvent, _prepareDrag, _doDrag, _endDrag, _doVertexSnap]:\n setattr(CanvasObject, function.__name__, function)\n", ["browser", "browser.html", "browser.svg", "brycharts", "brycharts.dragcanvas", "math", "time"]], "brycharts.geometry": [".py", "\n\n\n\n\n\n\n\n\n\nfrom math import pi, exp, isfinite, ceil, log10\nfrom .scales import BARUNIT\n\nPIXELPRECISION = 0.01\n\ndef coorddecimals(xscalefactor, yscalefactor, precision=None):\n\n\n\n\n if precision is not None: return precision\n unit = min(abs(xscalefactor), abs(yscalefactor))*PIXELPRECISION\n return ceil(-log10(unit)) if unit > 0 else None\n\ndef formatcoord(x, decimals=None):\n\n\n\n if decimals is None or not isfinite(x): return str(x)\n x = round(x, decimals)\n return str(int(x)) if x == int(x) else str(x)\n\ndef pointsattribute(coordslist, decimals=None):\n\n if decimals is None: return \" \".join(f\"{x},{y}\" for (x, y) in coordslist)\n return \" \".join(f\"{formatcoord(x, decimals)},{formatcoord(y, decimals)}\" for (x, y) in coordslist)\n\ndef segmentspath(segments, decimals=None):\n\n c = lambda v: formatcoord(v, decimals)\n return \" \".join(f\"M{c(x1)} {c(y1)}L{c(x2)} {c(y2)}\" for ((x1, y1), (x2, y2)) in segments)\n\ndef scaleddecimals(decimals):\n\n\n return None if decimals is None else max(decimals, ceil(-log10(PIXELPRECISION)))\n\ndef scaletransform(anchorpoint, xscalefactor, yscalefactor, decimals=None):\n\n\n (x, y) = anchorpoint\n c = lambda v: formatcoord(v, decimals)\n return f\"translate({c(x)},{c(y)}) scale({xscalefactor},{-yscalefactor}) translate({c(-x)},{c(-y)})\"\n\ndef polylinegeometry(coordslist, decimals=None):\n\n xvalues = [x for (x, y) in coordslist]\n yvalues = [y for (x, y) in coordslist]\n return {\"points\":pointsattribute(coordslist, decimals), \"extent\":[min(xvalues), min(yvalues), max(xvalues), max(yvalues)]}\n\ndef barrects(data, graphtype=None, index=None, key=None, direction=\"vertical\"):\n\n if graphtype == \"stacked\":\n  barminvalues = [sums[index] for sums in data.sums.values()]\n  barmaxvalues = [sums[index+1] for sums in data.sums.values()]\n  barwidth = 0.8*BARUNIT\n  offset = 0.2*BARUNIT\n elif graphtype == \"grouped\":\n  barminvalues = [0]*len(data.labels)\n  barmaxvalues = [values[index] for values in data.Values.values()]\n  barwidth = 0.8*BARUNIT/len(data)\n  offset = 0.2*BARUNIT+barwidth*index\n else:\n  barminvalues = [0]*len(data)\n  barmaxvalues = data.Values\n  barwidth = 0.8*BARUNIT\n  offset = 0.2*BARUNIT\n\n rects = []\n for i, label in enumerate(data.labels):\n  [barstart, barend] = [i*BARUNIT+offset, i*BARUNIT+offset+barwidth]\n  value = data.Values[label][index] if key else data.Values[i]\n  if value > 0:\n   pointlist = [(barstart, barmaxvalues[i]), (barend,barminvalues[i])]\n   if direction == \"horizontal\": pointlist = [(y, x) for (x, y) in pointlist]\n   rects.append((pointlist, f\"{key}\\n{value}\" if key else f\"{value}\"))\n return rects\n\ndef histogramrects(gfd):\n\n rects = []\n for i in range(len(gfd)-1):\n  [barleft, barright] = gfd.boundaries[i:i+2]\n  tooltiptext = f\"{barleft}\u2264x<{barright}\\nFrequency: {gfd.frequencies[i]}\\nFrequency Density: {gfd.frequencyDensities[i]}\"\n  rects.append(([(barleft, gfd.frequencyDensities[i]), (barright, 0)], tooltiptext))\n return rects\n\ndef normalcurve(gfd, steps=200):\n\n m = gfd.mean()\n v = gfd.variance()\n s = v**0.5\n k = sum(gfd.frequencies)/(s*(2*pi)**0.5)\n x0 = gfd.xMin\n dx = (gfd.xMax - x0)/steps\n points = [(x0+i*dx, k*exp(-0.5*(((x0+i*dx)-m)/s)**2)) for i in range(steps+1)]\n return (points, m, v)\n", ["brycharts.scales", "math"]], "brycharts.scales": [".py", "\n\n\n\n\n\n\n\n\n\nfrom math import log10, floor, ceil\nfrom .timeclasses import *\n\nDEFAULT_COLOURS = [f\"hsl({a%360+22.5*(a//1080)},{(3-a//810)*100//3}%, 50%)\" for a in range(0,2160,135)]\nBARUNIT = 10\nAXESSTYLES = {\n\"axis-line\": {\"stroke\":\"black\", \"stroke-width\":1, \"fill\":\"none\", \"vector-effect\":\"non-scaling-stroke\"},\n\"ticks\": {\"stroke\":\"black\", \"stroke-width\":1, \"fill\":\"none\", \"vector-effect\":\"non-scaling-stroke\"},\n\"major-grid\": {\"stroke\":\"grey\", \"stroke-dasharray\":\"10,5\", \"stroke-width\":1, \"fill\":\"none\", \"vector-effect\":\"non-scaling-stroke\"},\n\"minor-grid\": {\"stroke\":\"lightgrey\", \"stroke-dasharray\":\"2,2\", \"stroke-width\":1, \"fill\":\"none\", \"vector-effect\":\"non-scaling-stroke\"},\n\"bar\": {\"stroke\":\"black\", \"stroke-width\":1, \"vector-effect\":\"non-scaling-stroke\"},\n\"data-point\": {\"stroke\":\"#00000000\", \"stroke-width\":5, \"vector-effect\":\"non-scaling-stroke\"},\n}\n\ndef seriesstyles(colours, linewidth=2):\n\n styles = {}\n for (i, colour) in enumerate(colours):\n  styles[f\"series-{i}\"] = {\"stroke\":colour, \"stroke-width\":linewidth, \"fill\":\"none\"}\n  styles[f\"data-point.series-{i}\"] = dict(AXESSTYLES[\"data-point\"], fill=colour)\n return styles\n\n\ndef rounddown (x, n):\n return floor(x/n) * n\n\ndef roundup (x, n):\n return ceil(x/n) * n\n\ndef getscaleintervals (xmin, xmax, mindivs):\n interval = xmax - xmin\n if interval == 0: return 1, 1, 1\n if mindivs < 2: return interval, interval, interval\n X = interval/(mindivs - 1)\n L = 10**floor(log10(X))\n xx = X / L\n Y = 1 if xx<=2 else 2 if xx<=5 else 5 if xx<=10 else 10\n scaleinterval = Y * L\n if Y  in {1, 2, 10}:\n  majordivisor, minordivisor = 2, 5\n elif Y == 5:\n  majordivisor, minordivisor = 1, 5\n return scaleinterval, majordivisor, minordivisor\n\nclass Axis(object):\n def __init__(self, minvalue, maxvalue, label=\"\", axisoptions={}):\n  defaults = {\"showAxis\":True, \"axisType\":\"float\", \"showArrow\":False, \"fontSize\":12,\n\"showScale\":True, \"scaleInterval\":None, \"majorDivisor\":None, \"minorDivisor\":None,\n\"showMajorTicks\":True, \"showMinorTicks\":True, \"showMajorGrid\":True, \"showMinorGrid\":False}\n  self.label = label\n  defaults.update(axisoptions)\n  for argname, value in defaults.items():\n   setattr(self, argname, value)\n  self.setRange(minvalue, maxvalue)\n\n def setRange(self, minvalue, maxvalue):\n\n  self.calculateDefaultTicks(minvalue, maxvalue, 5)\n  self.min = roundtimedown(minvalue, self.scaleInterval) if self.axisType == \"time\" else rounddown(minvalue, self.scaleInterval)\n  self.max = roundtimeup(maxvalue, self.scaleInterval) if self.axisType == \"time\" else roundup(maxvalue, self.scaleInterval)\n\n def calculateDefaultTicks(self, minvalue, maxvalue, mindivs):\n  if self.axisType == \"time\":\n   self.scaleInterval, self.majorDivisor, self.minorDivisor = gettimescaleintervals(minvalue, maxvalue, mindivs)\n  else:\n   self.scaleInterval, self.majorDivisor, self.minorDivisor = getscaleintervals(minvalue, maxvalue, mindivs)\n\n\ndef tickvalues(axis, origin, vmin, vmax, intervals=None):\n\n\n\n (scaleinterval, majordivisor, minordivisor) = intervals or (axis.scaleInterval, axis.majorDivisor, axis.minorDivisor)\n majorinterval = float(scaleinterval)/majordivisor\n minorinterval = majorinterval/minordivisor\n first = ceil(round((vmin-origin)/minorinterval, 6))\n last = floor(round((vmax-origin)/minorinterval, 6))\n ticks = [(i, origin+i*minorinterval) for i in range(first, last+1)]\n axismax = float(axis.max)\n axis.majorTickValues = [v for (i, v) in ticks if i%minordivisor == 0 and not (axis.showArrow and v > axismax-minorinterval/2)]\n axis.minorTickValues = [v for (i, v) in ticks if i%minordivisor != 0] if minorinterval > 0.5*axis.arrowLength else []\n\ndef scalevalues(axis, start, end, scaleinterval=None):\n\n\n if scaleinterval is None: scaleinterval = axis.scaleInterval\n values = []\n v = start\n while v <= end:\n  v1 = float(v)\n  if v1 != axis.omitScale:\n   n = int(1-log10(scaleinterval))\n   scalestring=str(v) if axis.axisType==\"time\" else str(int(v)) if int(v) == v else f\"{v:.{n}f}\"\n   values.append((v1, scalestring))\n  v += scaleinterval\n return values\n", ["brycharts.timeclasses", "math"]], "brycharts.scheduler": [".py", "\n\n\n\n\n\n\n\n\n\n\n\n\n\nfrom browser import window\n\nclass Pending(object):\n\n\n def __init__(self):\n  self.done = False\n  self.result = None\n  self.error = None\n\n def resolve(self, result):\n  (self.done, self.result) = (True, result)\n  chartscheduler._schedule()\n\n def reject(self, error):\n  (self.done, self.error) = (True, error)\n  chartscheduler._schedule()\n\nclass ChartTask(object):\n def __init__(self, chart, steps, onready):\n  (self.chart, self.steps, self.onready) = (chart, steps, onready)\n  self.visible = True\n  self.observer = None\n  self.waiting = None\n\nclass Scheduler(object):\n\n def __init__(self, budget=8):\n  self.budget = budget\n  self.tasks = []\n  self.pending = False\n\n def add(self, chart, steps, onready=None):\n\n  task = ChartTask(chart, steps, onready)\n  if hasattr(window, \"IntersectionObserver\"):\n   def onintersect(entries, observer):\n    for entry in entries: task.visible = entry.isIntersecting\n   task.observer = window.IntersectionObserver.new(onintersect)\n   task.observer.observe(chart)\n  self.tasks.append(task)\n  self._schedule()\n\n def _runnable(self):\n  for task in [task for task in self.tasks if getattr(task.chart, \"destroyed\", False)]: self._finish(task)\n  return [task for task in self.tasks if task.waiting is None or task.waiting.done]\n\n def _schedule(self):\n  runnable = self._runnable()\n  if self.pending or not runnable: return\n  self.pending = True\n  if any(task.visible for task in runnable) or not hasattr(window, \"requestIdleCallback\"):\n   window.requestAnimationFrame(self._runFrame)\n  else:\n   window.requestIdleCallback(self._runIdle)\n\n def _runFrame(self, timestamp):\n  self._run(self.budget)\n\n def _runIdle(self, deadline):\n  self._run(deadline.timeRemaining())\n\n def _run(self, budget):\n  self.pending = False\n  endtime = window.performance.now() + budget\n  try:\n   while window.performance.now() < endtime:\n    runnable = self._runnable()\n    if not runnable: break\n    task = next((task for task in runnable if task.visible), runnable[0])\n    if task.waiting is not None and task.waiting.error is not None:\n     self._finish(task)\n     raise RuntimeError(f\"building {task.chart.id} failed: {task.waiting.error}\")\n    try:\n     step = next(task.steps)\n     task.waiting = step if isinstance(step, Pending) else None\n    except StopIteration:\n     self._finish(task)\n     if task.onready: task.onready(task.chart)\n    except Exception:\n     self._finish(task)\n     raise\n  finally:\n   self._schedule()\n\n def _finish(self, task):\n  self.tasks.remove(task)\n  if task.observer: task.observer.disconnect()\n\nchartscheduler = Scheduler()\n", ["browser"]], "brycharts.statfns": [".py", "\n\n\n\n\n\n\ndef mean(values):\n return sum(values)/len(values)\n\ndef sum2(values):\n return sum(x*x for x in values)\n\ndef variance(values):\n return(sum2(values)/len(values) - mean(values)**2)\n\ndef stdev(values):\n return variance(values)**0.5\n\ndef percentileindex(p, n):\n x = n*p/100\n return (int(x), True) if x == int(x) else (int(x)+1, False)\n\ndef quartiles(values):\n values.sort()\n n = len(values)\n i, exact = percentileindex(25, n)\n Q1 = (values[i]+values[i+1])/2 if exact else values[i]\n i, exact = percentileindex(50, n)\n Q2 = (values[i]+values[i+1])/2 if exact else values[i]\n i, exact = percentileindex(75, n)\n Q3 = (values[i]+values[i+1])/2 if exact else values[i]\n return (Q1, Q2, Q3)\n\ndef regressioninfo(points):\n n = len(points)\n xvalues = [x[0] for x in points]\n yvalues = [x[1] for x in points]\n sx = sum(xvalues)\n sx2 = sum2(xvalues)\n Sxx = sx2 - sx*sx/n\n sy = sum(yvalues)\n sy2 = sum2(yvalues)\n Syy = sy2 - sy*sy/n\n sxy = sum(x*y for (x, y) in points)\n Sxy = sxy - sx*sy/n\n pmcc = Sxy/(Sxx*Syy)**0.5\n gradient = Sxy/Sxx\n yintercept = (sy - gradient*sx)/n\n return pmcc, gradient, yintercept\n\ndef convertifnumber(string):\n try:\n  x = float(string)\n except ValueError:\n  return string\n else:\n  n = int(x)\n  return n if n == x else x\n\nif __name__==\"__main__\":\n points = [(164,6.5), (153,3), (163,4), (157,8), (161,5), (155,4), (168,4), (174,7), (167,6), (164,7), (159,3), (167,6)]\n pmcc, gradient, yintercept = regressioninfo(points)\n print(pmcc, gradient, yintercept)\n", []], "brycharts.textmetrics": [".py", "\n\n\n\n\n\n\n\n\n\n\n\nCHARWIDTHS = {c:width for (chars, width) in [(\" .,:;'!|ijl\", 0.28), (\"()[]{}/\\\\-frtI\", 0.33),\n(\"0123456789$#?_abcdeghknopqsuvxyz\", 0.56), (\"ABCDEFGHJKLNOPQRSTUVXYZ&\", 0.67), (\"mwMW%@\", 0.86)] for c in chars}\nwidthcache = {}\nmeasurer = None\n\ndef setmeasurer(function):\n\n global measurer\n measurer = function\n widthcache.clear()\n\ndef estimatewidths(strings, fontsize=12, fontfamily=\"sans-serif\"):\n\n return [sum(CHARWIDTHS.get(c, 0.56) for c in string)*fontsize for string in strings]\n\ndef textwidths(strings, fontsize=12, fontfamily=\"sans-serif\"):\n\n cache = widthcache.setdefault((fontfamily, fontsize), {})\n missing = list({string for string in strings if string not in cache})\n if missing: cache.update(zip(missing, (measurer or estimatewidths)(missing, fontsize, fontfamily)))\n return [cache[string] for string in strings]\n\ndef textwidth(string, fontsize=12, fontfamily=\"sans-serif\"):\n\n try:\n  return widthcache[(fontfamily, fontsize)][string]\n except KeyError:\n  return textwidths([string], fontsize, fontfamily)[0]\n\ndef measurewords(strings, fontsize=12, fontfamily=\"sans-serif\"):\n\n textwidths([word for string in strings for word in string.split()]+[\" \"], fontsize, fontfamily)\n\ndef wraplines(string, width, fontsize=12, fontfamily=\"sans-serif\"):\n\n words = string.split()\n if not words: return [\"\"]\n widths = textwidths(words+[\" \"], fontsize, fontfamily)\n spacewidth = widths.pop()\n lines = [words[0]]\n linewidth = widths[0]\n for (word, wordwidth) in zip(words[1:], widths[1:]):\n  if linewidth+spacewidth+wordwidth > width:\n   lines.append(word)\n   linewidth = wordwidth\n  else:\n   lines[-1] += \" \"+word\n   linewidth += spacewidth+wordwidth\n return lines\n\ndef textextent(lines, x, y, fontsize=12, lineheight=None, textanchor=\"start\", fontfamily=\"sans-serif\"):\n\n if lineheight is None: lineheight = fontsize*1.2\n width = max(textwidths(lines, fontsize, fontfamily))\n left = x-width if textanchor == \"end\" else x-width/2 if textanchor == \"middle\" else x\n return (left, y-0.9*fontsize, left+width, y+(len(lines)-1)*lineheight+0.25*fontsize)\n", []], "brycharts.timeclasses": [".py", "import datetime, math\n\ntimeunits = [\"year\", \"month\", \"day\", \"hour\", \"minute\", \"second\"]\ntimeformats = [\"%d/%m/%y\", \"%d/%m/%y\", \"%H:%M\\n%d/%m\", \"%H:%M\", \"%H:%M\", \"%H:%M:%S\"]\ntimefactors = [1,12,30,24,60,60]\n\n\nclass TimeCoord():\n startfloat = 0\n scalefloat = 1\n defaultformat = \"%d/%m/%y %H:%M\"\n def __init__(self, date_time, timeformat=None):\n  self.asDatetime = date_time\n  self.unitlist = [getattr(date_time, unit) for unit in timeunits]\n  if not timeformat: timeformat = self.defaultformat\n  self.asString = f\"{self.asDatetime:{timeformat} }\"\n  self.asFloat = (self.asDatetime.timestamp()-self.startfloat)/self.scalefloat\n\n def __repr__(self):\n  return self.asString\n\n def __str__(self):\n  return self.asString\n\n def __float__(self):\n  return self.asFloat\n\n\n def __add__(self, other):\n  if isinstance(other, TimeInterval):\n   return TimeCoord(self.asDatetime + other.timedelta, other.timeformat)\n  else:\n   return NotImplemented\n\n def __sub__(self, other):\n  return self.asDatetime - other.asDatetime\n\n def __lt__(self, other):\n  return float(self) < float(other)\n\n def __le__(self, other):\n  return float(self) <= float(other)\n\n def __gt__(self, other):\n  return float(self) > float(other)\n\n def __ge__(self, other):\n  return float(self) >= float(other)\n\n def __eq__(self, other):\n  return self.asDatetime == other.asDatetime\n\nclass TimeInterval():\n def __init__(self, interval, unitindex=5, timeformat=None):\n\n  unit = timeunits[unitindex]\n  args = {unit+\"s\": interval}\n  self.timedelta = datetime.timedelta(**args)\n  self.unitIndex = unitindex\n  self.interval = interval\n  if timeformat:\n   self.timeformat = timeformat\n  else:\n   self.timeformat = timeformats[unitindex]\n   if unitindex == 3 and interval >= 6: self.timeformat = timeformats[2]\n   if unitindex == 2 and interval >= 28: self.timeformat = timeformats[1]\n\n def __mul__(self, other):\n  return TimeInterval(other*self.interval, self.unitIndex, self.timeformat)\n\n def __rmul__(self, other):\n  return TimeInterval(other*self.interval, self.unitIndex, self.timeformat)\n\n def __str__(self):\n  return str(self.timedelta)\n\n def __repr__(self):\n  return str(self.timedelta)\n\n def __float__(self):\n  return self.timedelta.total_seconds()/TimeCoord.scalefloat\n\ndef gettimescaleintervals(tc1, tc2, mindivs=5):\n def roundladder(x, ladder):\n  for i in range(len(ladder) - 1):\n   if x < ladder[i+1]: return ladder[i]\n  return ladder[-1]\n\n interval = (tc2.asDatetime.timestamp() - tc1.asDatetime.timestamp()) / (mindivs-1)\n unitindex = 5\n while unitindex > 2:\n  newinterval = interval/timefactors[unitindex]\n  if newinterval < 1: break\n  interval = newinterval\n  unitindex -= 1\n\n ladderlist = [None, None, [1,2,7,14,28,91,364], [1,2,3,4,6,12], [1,2,5,10,15,30], [1,2,5,10,15,30]]\n subdivisors = [None, None, {1:(2,3), 2:(2,3), 7:(1,7), 14:(2,7), 28:(2,2), 91:(1,13), 364:(1,13)},\n{1:(2,3), 2:(2,3), 3:(3,2), 4:(4,2), 6:(1,6), 12:(3,4)},\n{1:(2,3), 2:(2,3), 5:(1,5), 10:(2,5), 15:(3,5), 30:(3,2)},\n{1:(2,3), 2:(2,3), 5:(1,5), 10:(2,5), 15:(3,5), 30:(3,2)}]\n scaleinterval = roundladder(interval, ladderlist[unitindex])\n (majordivisor, minordivisor) = subdivisors[unitindex][scaleinterval]\n\n return TimeInterval(scaleinterval, unitindex), majordivisor, minordivisor\n\ndef floattotime(x, timeformat=None):\n\n return TimeCoord(datetime.datetime.fromtimestamp(x*TimeCoord.scalefloat+TimeCoord.startfloat), timeformat)\n\ndef roundtimedown(tc, scaleinterval):\n i = scaleinterval.unitIndex\n x = tc.unitlist[i]\n roundx = math.floor(x/scaleinterval.interval) * scaleinterval.interval\n if i ==2 and roundx == 0: roundx = 1\n roundedlist = tc.unitlist[:i] + [roundx] + [0]*(6-i)\n return TimeCoord(datetime.datetime(*roundedlist), scaleinterval.timeformat)\n\ndef roundtimeup(tc, scaleinterval):\n tc0 = roundtimedown(tc, scaleinterval)\n return tc0 if tc0.unitlist == tc.unitlist else tc0 + scaleinterval\n\n", ["datetime", "math"]], "brycharts.workers": [".py", "\n\n\n\n\n\n\n\n\n\n\n\n\nimport json\nfrom browser import window, worker\nfrom .datastructures import *\n\nclass WorkerPool(object):\n\n\n\n\n\n\n def __init__(self, size=None, workerid=\"brycharts-dataworker\", onerror=None):\n  self.size = size or window.navigator.hardwareConcurrency or 2\n  self.onError = onerror\n  self.workers = []\n  self.queue = []\n  self.callbacks = {}\n  self.nextid = 0\n  for i in range(self.size):\n   worker.create_worker(workerid, self._onready, self._onmessage, self._onerror)\n\n def frequencyData(self, rawdata, valueslabel=\"Frequency\", callback=None, onerror=None):\n  self._submit(\"frequencies\", rawdata, [], lambda result: callback(FrequencyData(data=[tuple(item) for item in result], valueslabel=valueslabel)), onerror)\n\n def frequencyDataDict(self, rawdatadict, valueslabel=\"Frequency\", callback=None, onerror=None):\n  self._gather(\"frequencies\", rawdatadict, [],\nlambda results: callback(FrequencyDataDict(datadict={key:[tuple(item) for item in result] for (key, result) in results.items()}, valueslabel=valueslabel)), onerror)\n\n def groupedFrequencyData(self, valueslabel, rawdata, boundaries=None, classwidth=None, callback=None, onerror=None):\n  self._submit(\"groupedfrequencies\", rawdata, [boundaries, classwidth], lambda result: callback(GroupedFrequencyData(valueslabel, data=[tuple(item) for item in result])), onerror)\n\n def groupedFrequencyDataDict(self, valueslabel, rawdatadict, boundaries=None, classwidth=None, callback=None, onerror=None):\n  self._gather(\"groupedfrequencies\", rawdatadict, [boundaries, classwidth],\nlambda results: callback(GroupedFrequencyDataDict(valueslabel, datadict={key:[tuple(item) for item in result] for (key, result) in results.items()})), onerror)\n\n def boxPlotData(self, valueslabel, rawdata, callback=None, onerror=None):\n  self._submit(\"boxplot\", rawdata, [], lambda result: callback(BoxPlotData(valueslabel, boxplotdata=result)), onerror)\n\n def boxPlotDataDict(self, valueslabel, rawdatadict, callback=None, onerror=None):\n  self._gather(\"boxplot\", rawdatadict, [], lambda results: callback(BoxPlotDataDict(valueslabel, boxplotdatadict=results)), onerror)\n\n def regressionInfo(self, points, callback=None, onerror=None):\n\n  self._submit(\"regression\", [v for point in points for v in point], [], lambda result: callback(*result), onerror)\n\n def polylineGeometry(self, coordslist, callback=None, decimals=None, onerror=None):\n\n\n  self._submit(\"polyline\", [v for coords in coordslist for v in coords], [decimals], callback, onerror)\n\n def _gather(self, task, rawdatadict, args, callback, onerror=None):\n\n\n  if not rawdatadict:\n   callback({})\n   return\n  results = {}\n  failed = []\n  def collect(key):\n   def oncomplete(result):\n    results[key] = result\n    if len(results) == len(rawdatadict): callback({key:results[key] for key in rawdatadict})\n   return oncomplete\n  def onfail(error):\n   if failed: return\n   failed.append(error)\n   if onerror:\n    onerror(error)\n   else:\n    self._onerror(error)\n  for (key, rawdata) in rawdatadict.items():\n   self._submit(task, rawdata, args, collect(key), onfail)\n\n def _submit(self, task, rawdata, args, callback, onerror=None):\n  message = {\"id\":self.nextid, \"task\":task, \"args\":json.dumps(args), \"column\":None, \"values\":None}\n  if task != \"frequencies\" or all(isinstance(x, (int, float)) for x in rawdata[:100]):\n   message[\"column\"] = window.Float64Array.new(rawdata)\n  else:\n   message[\"values\"] = json.dumps(list(rawdata))\n  self.nextid += 1\n  self.queue.append((message, callback, onerror))\n  self._dispatch()\n\n def _dispatch(self):\n  while self.queue and self.workers:\n   entry = min(self.workers, key=lambda entry: entry[1])\n   (message, callback, onerror) = self.queue.pop(0)\n   entry[0].send(message, [message[\"column\"].buffer] if message[\"column\"] is not None else [])\n   entry[1] += 1\n   self.callbacks[message[\"id\"]] = (entry, callback, onerror)\n\n def _onready(self, newworker):\n  self.workers.append([newworker, 0])\n  self._dispatch()\n\n def _onmessage(self, event):\n  reply = json.loads(event.data)\n  (entry, callback, onerror) = self.callbacks.pop(reply[\"id\"])\n  entry[1] -= 1\n  if \"error\" in reply and onerror:\n   onerror(reply[\"error\"])\n  elif \"error\" in reply:\n   self._onerror(reply[\"error\"])\n  else:\n   callback(reply[\"result\"])\n\n def _onerror(self, error):\n  if self.onError:\n   self.onError(error)\n  else:\n   print(\"brycharts worker error:\", error)\n", ["browser", "brycharts.datastructures", "json"]]}
 __BRYTHON__.update_VFS(scripts)
@@ -1 +1,8 @@
-from .brycharts import *
+try:
+    from browser import document
+except ImportError: #Not running in Brython (or running in a web worker): only the data structures and the headless renderer (svgrender) are available
+    from .datastructures import *
+else:
+    from .brycharts import *
+    from .chartcache import ChartCache
+    from .workers import WorkerPool
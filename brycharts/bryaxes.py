@@ -8,57 +8,112 @@
 #Routines connected with actually drawing the axes.
 
 import time
-from math import log10, floor, ceil
+from bisect import bisect_left, bisect_right
+from math import floor, hypot
 import browser.svg as svg
+from browser import timer
 from . import dragcanvas as SVG
+from . import textmetrics
 from .timeclasses import *
-
-def rounddown (x, n):
-    return floor(x/n) * n
-
-def roundup (x, n):
-    return ceil(x/n) * n
-
-def getscaleintervals (xmin, xmax, mindivs):
-    interval = xmax - xmin
-    if interval == 0: return 1, 1, 1
-    if mindivs < 2: return interval, interval, interval
-    X = interval/(mindivs - 1)
-    L = 10**floor(log10(X))
-    xx = X / L
-    Y = 1 if xx<=2 else 2 if xx<=5 else 5 if xx<=10 else 10
-    scaleinterval = Y * L
-    if Y  in {1, 2, 10}:
-        majordivisor, minordivisor = 2, 5
-    elif Y == 5:
-        majordivisor, minordivisor = 1, 5
-    return scaleinterval, majordivisor, minordivisor
+from .scales import *
+from .geometry import formatcoord, segmentspath, scaletransform, scaleddecimals
+
+def segmentdistance(point, start, end):
+    (x, y), (x1, y1), (x2, y2) = point, start, end
+    (dx, dy) = (x2-x1, y2-y1)
+    d2 = dx*dx + dy*dy
+    t = 0 if d2 == 0 else max(0, min(1, ((x-x1)*dx + (y-y1)*dy)/d2))
+    return hypot(x-x1-t*dx, y-y1-t*dy)
+
+class PointIndex(object):
+    '''Uniform grid of data points, so that the point nearest to the cursor can be found
+    without the browser having to hit-test every mark. Points can be added at any time.'''
+    def __init__(self, xmin, xmax, ymin, ymax, divisions=32):
+        self.cellWidth = (xmax-xmin)/divisions or 1
+        self.cellHeight = (ymax-ymin)/divisions or 1
+        self.cells = {}
+
+    def _cell(self, x, y):
+        return (floor(x/self.cellWidth), floor(y/self.cellHeight))
+
+    def add(self, coords, item):
+        (x, y) = coords
+        self.cells.setdefault(self._cell(x, y), []).append((x, y, item))
+
+    def nearest(self, coords, radius, xscalefactor, yscalefactor):
+        '''Returns the item nearest to `coords` (in data units) which is within `radius` pixels, or None.'''
+        (x, y) = coords
+        rx, ry = radius*xscalefactor, radius*yscalefactor
+        (i0, j0) = self._cell(x-rx, y-ry)
+        (i1, j1) = self._cell(x+rx, y+ry)
+        if (i1-i0+1)*(j1-j0+1) > len(self.cells):
+            cells = [cell for ((i, j), cell) in self.cells.items() if i0 <= i <= i1 and j0 <= j <= j1]
+        else:
+            cells = [self.cells[(i, j)] for i in range(i0, i1+1) for j in range(j0, j1+1) if (i, j) in self.cells]
+        best, bestd = None, radius
+        for cell in cells:
+            for (px, py, item) in cell:
+                d = hypot((px-x)/xscalefactor, (py-y)/yscalefactor)
+                if d <= bestd: best, bestd = item, d
+        return best
+
+def fixedextent(obj, canvas):
+    '''The extent of `obj`, leaving out any scaled objects within it (whose extent depends on the current scale of the canvas).'''
+    if isinstance(obj, ScaledObjectMixin): return None
+    if hasattr(obj, "objectList"):
+        return SVG.unionextent([fixedextent(child, canvas) for child in obj.objectList]+[getattr(obj, "markExtent", None)])
+    return obj.getExtent(canvas) if hasattr(obj, "getExtent") else None
 
 class ScaledObjectMixin():
+    pixelOffsets = True #If True, the coordinates within the object are offsets in pixels from its anchor point (see geometry.scaleddecimals)
+
     def rescale(self, canvas):
         (x, y) = self.anchorPoint
         #self.style.transform = f"translate({x}px,{y}px) scale({canvas.xScaleFactor},{-canvas.yScaleFactor}) translate({-x}px,{-y}px)"
-        self.attrs["transform"] = f"translate({x},{y}) scale({canvas.xScaleFactor},{-canvas.yScaleFactor}) translate({-x},{-y})"
+        decimals = scaleddecimals(SVG.decimals) if self.pixelOffsets else SVG.decimals
+        self.attrs["transform"] = scaletransform((x, y), canvas.xScaleFactor, canvas.yScaleFactor, decimals)
+
+    def scaledExtent(self, extent, canvas):
+        '''Converts the unscaled `extent` of the object to data units, using the current scale factors of the canvas.'''
+        (x, y) = self.anchorPoint
+        (x1, y1, x2, y2) = extent
+        (sx, sy) = (canvas.xScaleFactor, canvas.yScaleFactor)
+        return (x+(x1-x)*sx, y-(y2-y)*sy, x+(x2-x)*sx, y-(y1-y)*sy)
 
 class AxesTextObject(SVG.TextObject, ScaledObjectMixin):
-    def __init__(self, canvas, string="", anchorpoint=(0,0), anchorposition=1, fontsize=12):
+    def __init__(self, canvas, string="", anchorpoint=(0,0), anchorposition=1, fontsize=12, register=True):
         super().__init__(string, anchorpoint, anchorposition, fontsize)
-        self.anchorPoint = anchorpoint
         self.rescale(canvas)
-        canvas.scaledObjects.append(self)
+        if register: canvas.scaledObjects.append(self)
+
+    def setText(self, string, anchorpoint):
+        previous = SVG.setdecimals(scaleddecimals(SVG.decimals))
+        super().setText(string, anchorpoint)
+        SVG.setdecimals(previous)
+        self.anchorPoint = anchorpoint
+
+    def getExtent(self, canvas=None):
+        return self.scaledExtent(super().getExtent(canvas), canvas)
 
 class AxesWrappingTextObject(SVG.WrappingTextObject, ScaledObjectMixin):
     def __init__(self, canvas, string="", anchorpoint=(0,0), width=80, anchorposition=2, fontsize=12):
+        previous = SVG.setdecimals(scaleddecimals(SVG.decimals))
         super().__init__(canvas, string, anchorpoint, width/canvas.xScaleFactor, anchorposition, fontsize)
+        SVG.setdecimals(previous)
         self.anchorPoint = anchorpoint
         self.rescale(canvas)
         canvas.scaledObjects.append(self)
 
+    def getExtent(self, canvas=None):
+        return self.scaledExtent(super().getExtent(canvas), canvas)
+
 class AxesPoint(svg.circle, ScaledObjectMixin):
-    def __init__(self, canvas, XY=(0,0), colour="black", objid=None):
+    '''A data point, coloured by the CSS class `classname` of its series (see `brycharts.seriesclasses`).'''
+    pixelOffsets = False #cx and cy are the anchor point itself, so they are written to the same decimals as the transform
+
+    def __init__(self, canvas, XY=(0,0), classname="series-0", objid=None):
         (x, y) = XY
-        sf = canvas.scaleFactor
-        svg.circle.__init__(self, cx=float(x), cy=y, r=3, style={"stroke":"#00000000", "stroke-width":5, "fill":colour, "vector-effect":"non-scaling-stroke"})
+        svg.circle.__init__(self, cx=SVG.svgcoord(float(x)), cy=SVG.svgcoord(y), r=3, Class=f"data-point {classname}")
         self.anchorPoint = self.XY = SVG.Point(XY)
         self.rescale(canvas)
         if objid: self.id = objid
@@ -67,128 +122,266 @@ class AxesPoint(svg.circle, ScaledObjectMixin):
     def _update(self):
         pass
 
+    def getExtent(self, canvas=None):
+        (x, y) = self.anchorPoint
+        return self.scaledExtent((x-3, y-3, x+3, y+3), canvas)
+
+class AxesTooltip(SVG.Tooltip):
+    '''The reusable tooltip of an `AxesCanvas`. It is drawn unscaled, with the middle of its bottom edge at `coords`.'''
+    def __init__(self, canvas, fontsize=12):
+        super().__init__(canvas, fontsize, canvas.container)
+
+    def _decimals(self):
+        return scaleddecimals(self.canvas.decimals) #Within the tooltip, the units are pixels
+
+    def _place(self, coords, width, height):
+        (x, y) = coords
+        c = lambda v: formatcoord(v, self.canvas.decimals)
+        self.attrs["transform"] = f"translate({c(x)},{c(y)}) scale({self.canvas.xScaleFactor},{-self.canvas.yScaleFactor})"
+        return (-width/2, -height)
+
 class AxesPolyline(SVG.PolylineObject):
-    def __init__(self, canvas, pointlist=[(0,0)], linecolour="black", linewidth=1, fillcolour="none", objid=None):
-        super().__init__(pointlist, linecolour, linewidth, fillcolour, objid)
+    '''A polyline which is hit-tested by the canvas from its coordinates, rather than by an invisible copy of itself.
+    Subclasses provide a `showtooltip(event)` method.'''
+    def __init__(self, canvas, pointlist=[(0,0)], linecolour="black", linewidth=1, fillcolour="none", objid=None, flatcoords=None, classname=None):
+        super().__init__(pointlist, linecolour, linewidth, fillcolour, objid, flatcoords, classname)
         #self.style.vectorEffect = "non-scaling-stroke"
-        newobj = SVG.PolylineObject(pointlist, linecolour, linewidth, fillcolour, objid)
-        newobj.style.strokeWidth = 6 if canvas.mouseDetected else 10
-        newobj.style.opacity = 0
-        for event in SVG.MOUSEEVENTS: newobj.bind(event, canvas._onHitTargetMouseEvent)
-        for event in SVG.TOUCHEVENTS: newobj.bind(event, canvas._onHitTargetTouchEvent)
-        newobj.reference = self
-        self.hitTarget = newobj
-        canvas.hittargets.append(newobj)
-        canvas.attachObject(newobj)
+        self.xValues = self.flatCoords[0::2]
+        self.xSorted = all(self.xValues[i] <= self.xValues[i+1] for i in range(len(self.xValues)-1))
+        canvas.hitLines.append(self)
+
+    def distanceTo(self, coords, xscalefactor, yscalefactor, tolerance):
+        '''Returns the distance in pixels from `coords` (in data units) to the line.
+        For a line whose x-coordinates are in order, only segments within `tolerance` pixels horizontally are checked.'''
+        (x, y) = coords
+        start, end = 0, len(self.xValues)
+        if self.xSorted:
+            rx = tolerance*xscalefactor
+            start = max(bisect_left(self.xValues, x-rx)-1, 0)
+            end = min(bisect_right(self.xValues, x+rx)+1, end)
+        flat = self.flatCoords[2*start:2*end]
+        pixelpoints = [(flat[i]/xscalefactor, flat[i+1]/yscalefactor) for i in range(0, len(flat), 2)]
+        if not pixelpoints: return None
+        cursor = (x/xscalefactor, y/yscalefactor)
+        if len(pixelpoints) == 1: return hypot(cursor[0]-pixelpoints[0][0], cursor[1]-pixelpoints[0][1])
+        return min(segmentdistance(cursor, pixelpoints[i], pixelpoints[i+1]) for i in range(len(pixelpoints)-1))
 
 class AxesLine(SVG.LineObject):
-    def __init__(self, pointlist=[(0,0), (0,0)], style="solid", linecolour="black", linewidth=1, fillcolour="none", objid=None):
-        super().__init__(pointlist, style, linecolour, linewidth, fillcolour, objid)
-        self.style.vectorEffect = "non-scaling-stroke"
+    def __init__(self, pointlist=[(0,0), (0,0)], style="solid", linecolour="black", linewidth=1, fillcolour="none", objid=None, classname=None):
+        super().__init__(pointlist, style, linecolour, linewidth, fillcolour, objid, classname)
+        if not classname: self.style.vectorEffect = "non-scaling-stroke"
 
 class AxesGroup(svg.g):
+    '''A group which keeps a list of its objects (so that its extent can be calculated), and the extent of any markup
+    inserted into it in `markExtent`.'''
     def __init__(self, objlist=[], objid=None):
         svg.g.__init__(self)
-        for obj in objlist: self.attach(obj)
+        self.objectList = []
+        self.markExtent = None
+        for obj in getattr(objlist, "objectList", objlist): self.attach(obj)
         if objid: self.id = objid
 
-class Axis(object):
-    def __init__(self, minvalue, maxvalue, label="", axisoptions={}):
-        defaults = {"showAxis":True, "axisType":"float", "showArrow":False, "fontSize":12,
-                    "showScale":True, "scaleInterval":None, "majorDivisor":None, "minorDivisor":None,
-                    "showMajorTicks":True, "showMinorTicks":True, "showMajorGrid":True, "showMinorGrid":False}
-        self.label = label
-        defaults.update(axisoptions)
-        for argname, value in defaults.items():
-            setattr(self, argname, value)
-        self.calculateDefaultTicks(minvalue, maxvalue, 5)
-        self.min = roundtimedown(minvalue, self.scaleInterval) if self.axisType == "time" else rounddown(minvalue, self.scaleInterval)
-        self.max = roundtimeup(maxvalue, self.scaleInterval) if self.axisType == "time" else roundup(maxvalue, self.scaleInterval)
-
-    def calculateDefaultTicks(self, minvalue, maxvalue, mindivs):
-        if self.axisType == "time":
-            self.scaleInterval, self.majorDivisor, self.minorDivisor = gettimescaleintervals(minvalue, maxvalue, mindivs)
-        else:
-            self.scaleInterval, self.majorDivisor, self.minorDivisor = getscaleintervals(minvalue, maxvalue, mindivs)
-        #print(self.scaleInterval, self.majorTickInterval, self.minorTickInterval)
+    def attach(self, objects):
+        super().attach(objects)
+        self.objectList.extend(objects if isinstance(objects, (list, tuple)) else [objects])
+
+    def getExtent(self, canvas=None):
+        return SVG.unionextent([obj.getExtent(canvas) for obj in self.objectList if hasattr(obj, "getExtent")]+[self.markExtent])
 
 class BasicAxis(AxesGroup):
+    '''The line, label and (optional) arrow of an axis, which are moved in place by `update()`.'''
     def __init__(self, canvas, axis):
         super().__init__()
+        self.axisLine = AxesLine(classname="axis-line")
+        self.axisLabel = AxesTextObject(canvas, axis.label, (0, 0), 3 if axis.direction == "x" else 7, fontsize=axis.fontSize)
+        self.arrowLines = [AxesLine(classname="axis-line"), AxesLine(classname="axis-line")] if axis.showArrow else []
+        self.attach([self.axisLine, self.axisLabel]+self.arrowLines)
+        self.update(axis)
+
+    def update(self, axis):
         axismin, axismax = float(axis.min), float(axis.max)
         if axis.direction == "x":
-            self.attach([AxesLine([(axismin, axis.position), (axismax, axis.position)]),
-                         AxesTextObject(canvas, axis.label, (axismax, axis.position-3*axis.tickLength), 3, fontsize=axis.fontSize)])
-            if axis.showArrow:
-                self.attach([AxesLine([(axismax, axis.position), (axismax-axis.arrowLength, axis.position-axis.tickLength)]),
-                             AxesLine([(axismax, axis.position), (axismax-axis.arrowLength, axis.position+axis.tickLength)])])
+            self.axisLine.setPointList([(axismin, axis.position), (axismax, axis.position)])
+            self.axisLabel.setText(axis.label, (axismax, axis.position-3*axis.tickLength))
+            arrowpoints = [(axismax-axis.arrowLength, axis.position-axis.tickLength), (axismax-axis.arrowLength, axis.position+axis.tickLength)]
+            arrowhead = (axismax, axis.position)
         else:
-            self.attach([AxesLine([(axis.position, axismin), (axis.position, axismax)]),
-                         AxesTextObject(canvas, axis.label, (axis.position, axismax), 7, fontsize=axis.fontSize)])
-            if axis.showArrow:
-                self.attach([AxesLine([(axis.position, axismax), (axis.position-axis.tickLength, axismax-axis.arrowLength)]),
-                             AxesLine([(axis.position, axismax), (axis.position+axis.tickLength, axismax-axis.arrowLength)])])
+            self.axisLine.setPointList([(axis.position, axismin), (axis.position, axismax)])
+            self.axisLabel.setText(axis.label, (axis.position, axismax))
+            arrowpoints = [(axis.position-axis.tickLength, axismax-axis.arrowLength), (axis.position+axis.tickLength, axismax-axis.arrowLength)]
+            arrowhead = (axis.position, axismax)
+        for (arrowline, arrowpoint) in zip(self.arrowLines, arrowpoints):
+            arrowline.setPointList([arrowhead, arrowpoint])
 
 class Ticks(AxesGroup):
+    '''All the major or minor ticks of an axis, as a single path, which is updated in place by `update()`.'''
     def __init__(self, axis, ticktype):
-        values = axis.majorTickValues if ticktype == "major" else axis.minorTickValues
-        ticklength = axis.tickLength if ticktype == "major" else axis.tickLength/2
-        tickend = axis.position-ticklength
         super().__init__()
-        for v in values:
-            if axis.direction == "x":
-                self.attach(AxesLine([(v, axis.position), (v, tickend)]))
-            else:
-                self.attach(AxesLine([(axis.position, v), (tickend, v)]))
+        self.tickType = ticktype
+        self.path = svg.path(Class="ticks")
+        self <= self.path
+        self.update(axis)
         axis.axisObjects.attach(self)
 
+    def update(self, axis):
+        values = axis.majorTickValues if self.tickType == "major" else axis.minorTickValues
+        ticklength = axis.tickLength if self.tickType == "major" else axis.tickLength/2
+        tickend = axis.position-ticklength
+        if axis.direction == "x":
+            segments = [((v, axis.position), (v, tickend)) for v in values]
+        else:
+            segments = [((axis.position, v), (tickend, v)) for v in values]
+        self.path.attrs["d"] = segmentspath(segments, SVG.decimals)
+        self.markExtent = None
+        if values:
+            (vmin, vmax), (pmin, pmax) = (min(values), max(values)), sorted([axis.position, tickend])
+            self.markExtent = (vmin, pmin, vmax, pmax) if axis.direction == "x" else (pmin, vmin, pmax, vmax)
+
 class GridLines(AxesGroup):
+    '''All the major or minor grid lines of an axis, as a single path, which is updated in place by `update()`.'''
     def __init__(self, axis, gridtype):
-        values = axis.majorTickValues if gridtype == "major" else axis.minorTickValues
-        linemin, linemax = axis.gridMin, axis.gridMax
-        linestyle = "faintdash1" if gridtype == "major" else "faintdash2"
         super().__init__()
-        for v in values:
-            if axis.direction == "x":
-                self.attach(AxesLine([(v, linemin), (v, linemax)], linestyle))
-            else:
-                self.attach(AxesLine([(linemin, v), (linemax, v)], linestyle))
+        self.gridType = gridtype
+        self.path = svg.path(Class=f"{gridtype}-grid")
+        self <= self.path
+        self.update(axis)
         axis.axisObjects.attach(self)
 
-class ScaleValues(AxesGroup):
+    def update(self, axis):
+        values = axis.majorTickValues if self.gridType == "major" else axis.minorTickValues
+        linemin, linemax = axis.gridMin, axis.gridMax
+        if axis.direction == "x":
+            segments = [((v, linemin), (v, linemax)) for v in values]
+        else:
+            segments = [((linemin, v), (linemax, v)) for v in values]
+        self.path.attrs["d"] = segmentspath(segments, SVG.decimals)
+        self.markExtent = None
+        if values:
+            (vmin, vmax) = (min(values), max(values))
+            self.markExtent = (vmin, linemin, vmax, linemax) if axis.direction == "x" else (linemin, vmin, linemax, vmax)
+
+class MarkGroup(SVG.GroupObject):
+    '''A group of static marks (eg bars) which are built as markup and inserted into the DOM in one operation by `build()`.
+    No Python object is created for each mark: the group shows the tooltip of the mark under the cursor, using its `data-index`.'''
+    def __init__(self):
+        super().__init__()
+        self.builder = SVG.MarkupBuilder()
+        self.tooltips = []
+        self.markExtent = None
+        self.bind("mouseover", self.showtooltip)
+        self.bind("touchstart", self.showtooltip)
+        self.bind("mouseout", self.hidetooltip)
+
+    def addRectangle(self, pointlist, colour, tooltiptext):
+        [(x1, y1), (x2, y2)] = pointlist
+        attrs = {"x":min(x1, x2), "y":min(y1, y2), "width":abs(x2-x1), "height":abs(y2-y1), "class":"bar", "data-index":len(self.tooltips)}
+        self.builder.add("rect", attrs, {"fill":colour})
+        self.tooltips.append((tooltiptext, ((x1+x2)/2, (y1+y2)/2)))
+        self.markExtent = SVG.unionextent([self.markExtent, (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))])
+
+    def getExtent(self, canvas=None):
+        return SVG.unionextent([super().getExtent(canvas), self.markExtent])
+
+    def build(self):
+        self.builder.insertInto(self)
+
+    def showtooltip(self, event):
+        index = event.target.getAttribute("data-index")
+        if index is None: return
+        (tooltiptext, centre) = self.tooltips[int(index)]
+        self.canvas.tooltip.show(tooltiptext, centre)
+
+    def hidetooltip(self, event):
+        self.canvas.tooltip.hide()
+
+class ScaleValues(AxesGroup, ScaledObjectMixin):
+    '''The scale values of an axis. When the axis is re-ticked or its range changes, `update()` keeps the labels of values which
+    are still shown, and moves and relabels the others to show the new values. A pool of spare labels is kept hidden for this.'''
+    poolSize = 24
+
     def __init__(self, canvas, axis):
         super().__init__()
-        v = axis.min
-        while v <= axis.max:
-            v1 = float(v)
-            if v1 != axis.omitScale:
-                n = int(1-log10(axis.scaleInterval))
-                scalestring=str(v) if axis.axisType=="time" else str(int(v)) if int(v) == v else f"{v:.{n}f}"
-                if axis.direction == "x":
-                    self.attach(AxesTextObject(canvas, scalestring, (v1, axis.position-axis.tickLength), 2, fontsize=axis.fontSize))
-                else:
-                    self.attach(AxesTextObject(canvas, scalestring, (axis.position-axis.tickLength, v1), 6, fontsize=axis.fontSize))
-            v += axis.scaleInterval
+        self.anchorPosition = 2 if axis.direction == "x" else 6
+        self.labels = []
+        self.shown = []
+        self._addLabels(canvas, axis, self.poolSize)
+        self.update(canvas, axis, scalevalues(axis, axis.min, axis.max))
+        self.rescale(canvas)
         axis.axisObjects.attach(self)
+        canvas.scaledObjects.append(self)
+
+    def _addLabels(self, canvas, axis, count):
+        newlabels = [AxesTextObject(canvas, "", (0, 0), self.anchorPosition, axis.fontSize, register=False) for i in range(count)]
+        for label in newlabels:
+            label.scaleString = None
+            label.style.display = "none"
+        self.labels.extend(newlabels)
+        self.attach(newlabels)
+
+    def update(self, canvas, axis, values):
+        '''Shows the scale values in `values`, a list of (value, string).'''
+        current = {label.scaleString: label for label in self.shown}
+        kept = {scalestring: current[scalestring] for (v, scalestring) in values if scalestring in current}
+        spare = [label for label in self.labels if label.scaleString not in kept]
+        if len(spare) < len(values)-len(kept):
+            self._addLabels(canvas, axis, len(values)-len(kept)-len(spare))
+            spare = [label for label in self.labels if label.scaleString not in kept]
+        spare.reverse()
+        self.shown = []
+        for (v, scalestring) in values:
+            anchorpoint = (v, axis.position-axis.tickLength) if axis.direction == "x" else (axis.position-axis.tickLength, v)
+            label = kept.get(scalestring)
+            if label is None:
+                label = spare.pop()
+                if label.scaleString is None: label.style.display = "inline"
+                label.scaleString = scalestring
+                label.setText(scalestring, anchorpoint)
+            elif label.anchorPoint != anchorpoint:
+                label.setText(scalestring, anchorpoint)
+            self.shown.append(label)
+        for label in spare:
+            if label.scaleString is not None:
+                label.scaleString = None
+                label.style.display = "none"
+
+    def rescale(self, canvas):
+        for label in self.shown:
+            label.rescale(canvas)
+
+    def getExtent(self, canvas=None):
+        return SVG.unionextent([label.getExtent(canvas) for label in self.shown])
 
 class AxesCanvas(SVG.CanvasObject):
     def __init__(self, parent, width, height, xAxis=None, yAxis=None, title=None, objid=None):
         tt = time.time()
         super().__init__(width, height, objid=objid)
-        parent <= self
+        if self.parentNode is None: parent <= self
         self.attrs["preserveAspectRatio"] = "none"
+        self.beginBuild()
         self.container = SVG.GroupObject(objid="panel")
         #self.container.style.transform = "scaleY(-1)"
         self.container.attrs["transform"] = "scale(1,-1)"
         self.addObject(self.container)
         self.mouseMode = SVG.MouseMode.PAN
         self.lineWidthScaling = False
+        self.setClassStyles(AXESSTYLES)
         self.title = title
-        self.tooltip = None
+        self.tooltip = AxesTooltip(self)
         self.bestFit = None
         self.scaledObjects = []
+        self.fitObjects = []
+        self.fixedExtent = None
+        self.pointIndex = None
+        self.hitLines = []
+        self.hoverTarget = None
+        self.hoverRadius = 8
+        self.dynamicTicks = True
+        self.retickDelay = 150
+        self.retickTimer = None
+        self.marksScale = None #The scale factors at which the scaled objects were last rescaled (see retick)
         self.bind("touchstart", self.clearTooltip)
         self.bind("mousemove", self.onMouseMove)
+        self.bind("mouseleave", self.onMouseLeave)
         #print("set up axes", time.time()-tt)
         tt = time.time()
 
@@ -201,6 +394,8 @@ class AxesCanvas(SVG.CanvasObject):
             self.container.attach(svgobject)
         else:
             self.container.addObject(svgobject, fixed)
+        self.fitObjects.append(svgobject)
+        self.fixedExtent = SVG.unionextent([self.fixedExtent, fixedextent(svgobject, self)])
 
     def attachObjects(self, objectlist):
         for obj in objectlist:
@@ -211,13 +406,166 @@ class AxesCanvas(SVG.CanvasObject):
 
     def removeObject(self, svgobject):
         self.container.removeChild(svgobject)
+        if svgobject in self.fitObjects:
+            self.fitObjects.remove(svgobject)
+            self.fixedExtent = SVG.unionextent([fixedextent(obj, self) for obj in self.fitObjects])
         if isinstance(svgobject, ScaledObjectMixin):
             self.scaledObjects.remove(svgobject)
+        if isinstance(svgobject, AxesPolyline) and svgobject in self.hitLines:
+            self.hitLines.remove(svgobject)
+
+    def destroy(self):
+        '''As `CanvasObject.destroy`, but also cancels any pending re-tick, and clears the lists of objects which are scaled,
+        fitted and hit-tested by the canvas.'''
+        if getattr(self, "retickTimer", None) is not None: timer.clear_timeout(self.retickTimer) #Not set if the chart has not been built
+        self.retickTimer = None
+        self.scaledObjects = []
+        self.fitObjects = []
+        self.hitLines = []
+        self.pointIndex = self.hoverTarget = None
+        super().destroy()
+
+    def setViewBox(self, pointlist):
+        viewwindow = super().setViewBox(pointlist)
+        if hasattr(self, "xAxis") and self.dynamicTicks and self.pixelSize is None:
+            if self.retickTimer is not None: timer.clear_timeout(self.retickTimer)
+            self.retickTimer = timer.set_timeout(self.retick, self.retickDelay)
+        return viewwindow
+
+    def retick(self):
+        '''Recalculates the scales of the axes for the part of the chart in view (eg after zooming or panning), and updates
+        the ticks, grid lines and scale values in place. Called `retickDelay` ms after the view stops changing.
+        While the whole of an axis is in view, it keeps the scale intervals it was built with. Only the axis objects are rescaled,
+        unless the scale has changed (ie after zooming), when the data points also have to be rescaled to keep their size.
+        The coordinates are written to the `decimals` for the new scale.'''
+        self.retickTimer = None
+        previous = SVG.setdecimals(self.decimals)
+        try:
+            self._retick()
+        finally:
+            SVG.setdecimals(previous)
+
+    def _retick(self):
+        [(x1, y1), (x2, y2)] = self.viewWindow
+        self.setTickLengths()
+        for (axis, vmin, vmax) in [(self.xAxis, x1, x2), (self.yAxis, -y2, -y1)]:
+            if not axis.showAxis: continue
+            (axismin, axismax) = (float(axis.min), float(axis.max))
+            (vmin, vmax) = (max(vmin, axismin), min(vmax, axismax))
+            values = []
+            axis.majorTickValues = axis.minorTickValues = []
+            if vmin == axismin and vmax == axismax:
+                #The whole axis is in view, so it keeps the scale it was built with
+                tickvalues(axis, axismin, axismin, axismax)
+                values = scalevalues(axis, axis.min, axis.max)
+            elif vmax > vmin:
+                #The intervals for the part in view are only used here, so the scale of the axis itself is unchanged
+                if axis.axisType == "time":
+                    intervals = gettimescaleintervals(floattotime(vmin), floattotime(vmax), 5)
+                    start = roundtimeup(floattotime(vmin), intervals[0])
+                else:
+                    intervals = getscaleintervals(vmin, vmax, 5)
+                    start = roundup(vmin, intervals[0])
+                tickvalues(axis, float(start), vmin, vmax, intervals)
+                values = scalevalues(axis, start, vmax, intervals[0])
+            axis.basicAxis.update(axis)
+            for ticks in [axis.majorTicks, axis.minorTicks, axis.majorGrid, axis.minorGrid]:
+                if ticks is not None: ticks.update(axis)
+            if axis.scaleValues is not None: axis.scaleValues.update(self, axis, values)
+        self.rescaleAxes()
+        if (self.xScaleFactor, self.yScaleFactor) != self.marksScale: self.rescaleObjects()
+
+    def updateAxes(self, xmin, xmax, ymin, ymax):
+        '''Changes the ranges of the axes, eg when new data has been added. The existing axis objects are updated in place
+        (see `retick`) instead of being redrawn, and the data marks are left untouched.'''
+        self.xAxis.setRange(xmin, xmax)
+        self.yAxis.setRange(ymin, ymax)
+        xmin, xmax, ymin, ymax = float(self.xAxis.min), float(self.xAxis.max), float(self.yAxis.min), float(self.yAxis.max)
+        if xmax <= xmin or ymax <= ymin: return
+        self.placeAxes()
+        self.setViewBox([(xmin, -ymax), (xmax, -ymin)])
+        self.retick()
+        if self.titleObject is not None:
+            previous = SVG.setdecimals(self.decimals)
+            self.titleObject.setText(self.title, self._titleAnchor())
+            SVG.setdecimals(previous)
+        self.fixedExtent = SVG.unionextent([fixedextent(obj, self) for obj in self.fitObjects])
+        self.fitContents()
+        if self.retickTimer is not None: timer.clear_timeout(self.retickTimer)
+        self.retickTimer = None
+
+    def placeAxes(self):
+        '''Sets where the axes cross, and the extent of the grid lines, from the ranges of the axes.'''
+        (xAxis, yAxis) = (self.xAxis, self.yAxis)
+        xmin, xmax, ymin, ymax = float(xAxis.min), float(xAxis.max), float(yAxis.min), float(yAxis.max)
+        xAxis.position = ymin if ymin > 0 else ymax if ymax < 0 else 0
+        yAxis.position = xmin if xmin > 0 else xmax if xmax < 0 else 0
+        xAxis.omitScale = yAxis.position if yAxis.showAxis and ymin < xAxis.position else None
+        yAxis.omitScale = xAxis.position if xAxis.showAxis and xmin < yAxis.position else None
+        xAxis.gridMin, xAxis.gridMax = ymin, ymax
+        yAxis.gridMin, yAxis.gridMax = xmin, xmax
+
+    def _titleAnchor(self):
+        return ((float(self.xAxis.min)+float(self.xAxis.max))/2, float(self.yAxis.max)+1.5*self.yAxis.fontSize*self.yScaleFactor)
+
+    def setTickLengths(self):
+        '''Sets the lengths (in data units) of the ticks and arrows of the axes, from the current scale.'''
+        self.xAxis.tickLength = self.yAxis.arrowLength = 0.75*self.xAxis.fontSize*self.yScaleFactor
+        self.yAxis.tickLength = self.xAxis.arrowLength = 0.75*self.yAxis.fontSize*self.xScaleFactor
 
     def rescaleObjects(self):
-        #print(self.scaledObjects)
+        '''Rescales all the scaled objects (eg data points and text), so that they keep their size at the current scale.'''
         for obj in self.scaledObjects:
             obj.rescale(self)
+        self.marksScale = (self.xScaleFactor, self.yScaleFactor)
+
+    def rescaleAxes(self):
+        '''Rescales only the axis labels, scale values and title, whose number does not depend on the number of data points.'''
+        for axis in [self.xAxis, self.yAxis]:
+            if not axis.showAxis: continue
+            axis.basicAxis.axisLabel.rescale(self)
+            if axis.scaleValues is not None: axis.scaleValues.rescale(self)
+        if self.titleObject is not None: self.titleObject.rescale(self)
+
+    def measureLabels(self, labels, fontsize):
+        '''Measures all the words in `labels` in one batch, before they are laid out as `AxesWrappingTextObjects`.'''
+        textmetrics.measurewords([str(label) for label in labels], fontsize, SVG.fontfamily(self))
+
+    def indexPoints(self, datapoints):
+        '''Adds `datapoints` to the canvas's `pointIndex`, which is used to show the tooltip of the point nearest to the cursor.'''
+        if self.pointIndex is None:
+            self.pointIndex = PointIndex(float(self.xAxis.min), float(self.xAxis.max), float(self.yAxis.min), float(self.yAxis.max))
+        for point in datapoints:
+            self.pointIndex.add(point.coords, point)
+
+    def nearestLine(self, coords):
+        tolerance = 3 if self.mouseDetected else 5
+        best, bestd = None, tolerance
+        for line in self.hitLines:
+            d = line.distanceTo(coords, self.xScaleFactor, self.yScaleFactor, tolerance)
+            if d is not None and d <= bestd: best, bestd = line, d
+        return best
+
+    def showHoverTarget(self, event):
+        '''Shows the tooltip of the data point or line nearest to the cursor (if any), and returns that object.'''
+        (x, y) = self.getSVGcoords(event)
+        target = None
+        if self.pointIndex: target = self.pointIndex.nearest((x, -y), self.hoverRadius, self.xScaleFactor, self.yScaleFactor)
+        if target is None and self.hitLines: target = self.nearestLine((x, -y))
+        if target is not self.hoverTarget:
+            self.tooltip.hide()
+            self.hoverTarget = target
+            if target is not None: target.showtooltip(event)
+        return target
+
+    def getExtent(self):
+        '''Returns the extent of the chart in SVG coordinates (ie with y reversed), without reading the DOM.
+        The extent of the objects attached using `attachObject` is kept up to date as they are attached, in `fixedExtent`;
+        that of the scaled objects (eg text), which depends on the current scale, is added to it.'''
+        extent = SVG.unionextent([self.fixedExtent]+[obj.getExtent(self) for obj in self.scaledObjects])
+        if extent is None: return None
+        (x1, y1, x2, y2) = extent
+        return (x1, -y2, x2, -y1)
 
     def fitContents(self):
         if self.bestFit:
@@ -225,8 +573,8 @@ class AxesCanvas(SVG.CanvasObject):
             return self.bestFit
         else:
             super().fitContents()
-            self.rescaleObjects()
             viewwindow = super().fitContents()
+            self.rescaleObjects()
             return viewwindow
 
     def onMouseMove(self, event):
@@ -235,10 +583,17 @@ class AxesCanvas(SVG.CanvasObject):
             for obj in self.objectDict.values():
                 if hasattr(obj, "reference"):
                     obj.style.strokeWidth = 6
+        if self.pointIndex or self.hitLines: self.showHoverTarget(event)
+
+    def onMouseLeave(self, event):
+        '''Hides the tooltip when the cursor leaves the chart, since points and lines are not hit-tested themselves.'''
+        self.tooltip.hide()
+        self.hoverTarget = None
 
     def clearTooltip(self, event):
+        if (self.pointIndex or self.hitLines) and self.showHoverTarget(event) is not None: return
         if event.target != self: return
-        if self.tooltip: self.tooltip.hide()
+        self.tooltip.hide()
 
     """
     def makeXScaleValue(self, x, y):
@@ -265,32 +620,22 @@ class AxesCanvas(SVG.CanvasObject):
         if xmax <= xmin or ymax <= ymin: return
         self.setViewBox([(xmin, -ymax), (xmax, -ymin)])
         (xAxis.direction, yAxis.direction) = ("x", "y")
-        xAxis.tickLength = yAxis.arrowLength = 0.75*xAxis.fontSize*self.yScaleFactor
-        yAxis.tickLength = xAxis.arrowLength = 0.75*yAxis.fontSize*self.xScaleFactor
-        xAxis.position = ymin if ymin > 0 else ymax if ymax < 0 else 0
-        yAxis.position = xmin if xmin > 0 else xmax if xmax < 0 else 0
-        xAxis.omitScale = yAxis.position if yAxis.showAxis and ymin < xAxis.position else None
-        yAxis.omitScale = xAxis.position if xAxis.showAxis and xmin < yAxis.position else None
-        xAxis.gridMin, xAxis.gridMax = ymin, ymax
-        yAxis.gridMin, yAxis.gridMax = xmin, xmax
+        (self.xAxis, self.yAxis) = (xAxis, yAxis)
+        self.setTickLengths()
+        self.placeAxes()
         self.container.clear()
+        self.scaledObjects = []
+        self.fitObjects = []
+        self.fixedExtent = None
 
         for axis in [xAxis, yAxis]:
             if not axis.showAxis: continue
             axis.basicAxis = BasicAxis(self, axis)
             axis.axisObjects = AxesGroup(axis.basicAxis)
+            axis.majorTicks = axis.minorTicks = axis.majorGrid = axis.minorGrid = axis.scaleValues = None
+            tickvalues(axis, float(axis.min), float(axis.min), float(axis.max))
 
-            axismin, axismax = float(axis.min), float(axis.max)
-            majortickinterval = float(axis.scaleInterval)/axis.majorDivisor
-            count = int(round((axismax - axismin)/majortickinterval))
-            majorcount = count if axis.showArrow else count + 1
-            axis.majorTickValues = [axismin + i*majortickinterval for i in range(majorcount)]
-            if axis.showMinorTicks or axis.showMinorGrid:
-                minortickinterval = majortickinterval/axis.minorDivisor
-                count = count*axis.minorDivisor
-                axis.minorTickValues = [axismin + i*minortickinterval for i in range(count) if i%axis.minorDivisor != 0]
-
-            if axis.showMinorTicks and minortickinterval > 0.5*axis.arrowLength:
+            if axis.showMinorTicks:
                 axis.minorTicks = Ticks(axis, "minor")
             if axis.showMajorTicks:
                 axis.majorTicks = Ticks(axis, "major")
@@ -301,7 +646,7 @@ class AxesCanvas(SVG.CanvasObject):
             #print("x-axis scale", time.time()-tt)
             #tt = time.time()
 
-            if axis.showMinorGrid and minortickinterval > 0.5*axis.arrowLength:
+            if axis.showMinorGrid:
                 axis.minorGrid = GridLines(axis, "minor")
             if axis.showMajorGrid:
                 axis.majorGrid = GridLines(axis, "major")
@@ -309,8 +654,8 @@ class AxesCanvas(SVG.CanvasObject):
             self.attachObject(axis.axisObjects)
             #print("x-axis grid", time.time()-tt)
 
-        self.xAxis = xAxis
-        self.yAxis = yAxis
+        self.titleObject = None
         if self.title:
-            self.attachObject(AxesTextObject(self, self.title, ((xmin+xmax)/2, ymax+1.5*yAxis.fontSize*self.yScaleFactor), 8, yAxis.fontSize*1.25))
+            self.titleObject = AxesTextObject(self, self.title, self._titleAnchor(), 8, yAxis.fontSize*1.25)
+            self.attachObject(self.titleObject)
         self.fitContents()
@@ -6,306 +6,115 @@
 # For details, see the LICENSE file in this repository                        #
 
 import time
-import json
-from math import sin, cos, pi, log10, exp, floor, ceil
+from math import sin, cos, pi, log10
 from . import dragcanvas as SVG
 from . import bryaxes
-from .statfns import *
+from .scales import DEFAULT_COLOURS, BARUNIT, seriesstyles
+from .datastructures import *
+from .statfns import regressioninfo
 import browser.svg as svg
-
-DEFAULT_COLOURS = [f"hsl({a%360+22.5*(a//1080)},{(3-a//810)*100//3}%, 50%)" for a in range(0,2160,135)]
-BARUNIT = 10
-
-def rounddown (x, n):
-    return floor(x/n) * n
-
-def roundup (x, n):
-    return ceil(x/n) * n
-
-def getscaleintervals (xmin, xmax, mindivs):
-    interval = xmax - xmin
-    if interval == 0: return 1, 1, 1
-    if mindivs < 2: return interval, interval, interval
-    X = interval/(mindivs - 1)
-    L = 10**floor(log10(X))
-    xx = X / L
-    Y = 1 if xx<=2 else 2 if xx<=5 else 5 if xx<=10 else 10
-    scaleinterval = Y * L
-    if Y  in {1, 2, 10}:
-        majordivisor, minordivisor = 2, 5
-    elif Y == 5:
-        majordivisor, minordivisor = 1, 5
-    return scaleinterval, majordivisor, minordivisor
-
-# Classes which provide the data structures needed as inputs for the graphs
-
-class LabelledData(dict):
-    def __init__(self, data, valueslabel):
-       super().__init__(data)
-       self.valuesLabel = valueslabel
-       self.labels = list(self.keys())
-       self.Values = list(self.values())
-       self.maxValue = max(self.Values)
-       self.total = sum(self.Values)
-       self.percentages = [100*value/self.total for value in self.Values]
-
-class LabelledDataDict(dict):
-    def __init__(self, datadict, valueslabel):
-        if not isinstance(next(iter(datadict.values())), LabelledData):
-            datadict = {key:LabelledData(ld, valueslabel) for (key, ld) in datadict.items()}
-        super().__init__(datadict)
-        self.maxValue = max(ld.maxValue for ld in self.values())
-        self.valuesLabel = valueslabel
-        labels = set()
-        for ld in self.values(): labels.update(ld.keys())
-        self.labels = list(labels)
-        self.Values = {label:[] for label in self.labels}
-        self.sums = {label:[0] for label in self.labels}
-        for label in self.labels:
-            for ld in self.values():
-                value = ld.get(label, 0)
-                self.Values[label].append(value)
-                self.sums[label].append(self.sums[label][-1] + value)
-        self.maxSum = max(sums[-1] for sums in self.sums.values())
-
-class FrequencyData(LabelledData):
-    def __init__(self, data=None, rawdata=None, valueslabel="Frequency"):
-        if rawdata:
-            data = self.fromRawData(rawdata)
-        super().__init__(data, valueslabel)
-
-    def fromRawData(self, rawdata):
-        #return sorted(Counter(rawdata).items())
-        counter = {}
-        for x in rawdata:
-            if x in counter:
-                counter[x] += 1
+from browser import window
+from .scheduler import chartscheduler, Pending
+from .geometry import barrects, histogramrects, normalcurve, scaletransform
+
+BATCHSIZE = 500
+PREVIEWSIZE = 1000
+
+def batches(items, size=BATCHSIZE):
+    for i in range(0, len(items), size):
+        yield items[i:i+size]
+
+def sample(items, size=PREVIEWSIZE):
+    '''Returns every nth item of `items` (and the last one), so that there are about `size` items.'''
+    step = -(-len(items)//size)
+    return items[::step] + ([items[-1]] if (len(items)-1)%step else [])
+
+def pointmarks(canvas, coordslist, classname):
+    '''Returns a group of static circles at `coordslist`, drawn as markup (ie without a Python object for each point),
+    coloured by the CSS class `classname` (see `seriesclasses`).'''
+    builder = SVG.MarkupBuilder()
+    (sx, sy) = (canvas.xScaleFactor, canvas.yScaleFactor)
+    for (x, y) in coordslist:
+        transform = scaletransform((x, y), sx, sy, SVG.decimals)
+        builder.add("circle", {"cx":x, "cy":y, "r":3, "class":f"data-point {classname}", "transform":transform})
+    group = bryaxes.AxesGroup()
+    builder.insertInto(group)
+    group.markExtent = SVG.pointsextent(coordslist)
+    return group
+
+def seriesclasses(canvas, colours, linewidth=2):
+    '''Sets the CSS classes "series-0", "series-1", ... of `canvas` for the lines and data points drawn in each of `colours`,
+    and returns their names.'''
+    canvas.setClassStyles(seriesstyles(colours, linewidth))
+    return [f"series-{i}" for i in range(len(colours))]
+
+def polylinemarks(geometry, classname):
+    '''Returns a group containing a static polyline of the CSS class `classname` (see `seriesclasses`), from the `geometry`
+    calculated by `geometry.polylinegeometry` (eg in a web worker).'''
+    builder = SVG.MarkupBuilder()
+    builder.add("polyline", {"points":geometry["points"], "class":classname})
+    group = bryaxes.AxesGroup()
+    builder.insertInto(group)
+    group.markExtent = tuple(geometry["extent"])
+    return group
+
+def precisionsteps(chart, steps):
+    '''Runs each of `steps` with the coordinates written to the `decimals` of `chart`, since steps of other charts may run in between.'''
+    while True:
+        previous = SVG.setdecimals(chart.decimals)
+        try:
+            step = next(steps)
+        except StopIteration:
+            return
+        finally:
+            SVG.setdecimals(previous)
+        yield step
+
+def lazyinit(init):
+    '''Adds the `lazy`, `sliced`, `onready`, `static` and `precision` parameters to the constructor of a chart.
+    If `lazy` is True, an empty canvas of the size of the chart is placed in `parent`, and the chart is only built when this comes into view.
+    If `sliced` is True, the chart is built a step at a time by the `chartscheduler`, so that the page stays responsive.
+    In either case `width` and `height` must be given as keyword arguments, and `onready(chart)` is called when the chart has been built.
+    Charts which take `progressive` or `workerpool` parameters are always sliced if these are used.
+    If `static` is True, the objects of the chart are attached without being registered (see `CanvasObject.static`).
+    `precision` is the number of decimal places for coordinates (see `CanvasObject.precision`).'''
+    def __init__(self, parent, *args, lazy=False, sliced=False, onready=None, static=False, precision=None, **kwargs):
+        self.static = static
+        self.precision = precision
+        sliced = sliced or kwargs.get("progressive", False) or kwargs.get("workerpool") is not None
+        if lazy or sliced:
+            svg.svg.__init__(self, style={"width":kwargs.get("width", "95%"), "height":kwargs.get("height", "95%")})
+            parent <= self
+        def build():
+            steps = init(self, parent, *args, **kwargs)
+            if steps is None:
+                if onready: onready(self)
+            elif sliced:
+                chartscheduler.add(self, precisionsteps(self, steps), onready)
             else:
-                counter[x] = 1
-        return sorted(counter.items())
-
-class FrequencyDataDict(LabelledDataDict):
-    def __init__(self, datadict=None, rawdatadict=None, valueslabel="Frequency"):
-        if rawdatadict:
-            fdd = {key:FrequencyData(rawdata=rawdata, valueslabel=valueslabel) for (key, rawdata) in rawdatadict.items()}
-        else:
-            fdd = {key:FrequencyData(data=data, valueslabel=valueslabel) for (key, data) in datadict.items()}
-        super().__init__(fdd, valueslabel)
-
-class PairedData(list):
-    def __init__(self, xlabel, ylabel, data):
-        super().__init__(data)
-        self.xLabel = xlabel
-        self.yLabel = ylabel
-        self.xValues = [item[0] for item in data]
-        self.yValues = [item[1] for item in data]
-        self.xMin, self.xMax = min(self.xValues), max(self.xValues)
-        self.yMin, self.yMax = min(self.yValues), max(self.yValues)
-
-class TimeSeriesData(PairedData):
-    def __init__(self, xlabel, ylabel, data):
-        if bryaxes.TimeCoord.startfloat == 0:
-            x0 = min(x for (x, y) in data)
-            x1 = max(x for (x, y) in data)
-            bryaxes.TimeCoord.startfloat = 2*x0.timestamp() - x1.timestamp()
-            hours = round((x1.timestamp()-x0.timestamp())/3600)
-            bryaxes.TimeCoord.scalefloat = hours if hours > 0 else 1
-            bryaxes.TimeCoord.defaultformat = "%H:%M:%S" if hours < 5 else "%H:%M" if hours < 24 else "%d/%m %H:%M" if hours < 840 else "%d/%m/%y"
-        data = [(bryaxes.TimeCoord(x), y) for (x, y) in data]
-        super().__init__(xlabel, ylabel, data)
-
-class PairedDataDict(dict):
-    def __init__(self, xlabel, ylabel, datadict):
-        pdd = {key:PairedData(xlabel, ylabel, pd) for (key, pd) in datadict.items()}
-        super().__init__(pdd)
-        self.xLabel = xlabel
-        self.yLabel = ylabel
-        self.xMin = min(pd.xMin for pd in pdd.values())
-        self.xMax = max(pd.xMax for pd in pdd.values())
-        self.yMin = min(pd.yMin for pd in pdd.values())
-        self.yMax = max(pd.yMax for pd in pdd.values())
-
-class TimeSeriesDataDict(dict):
-    def __init__(self, xlabel, ylabel, datadict):
-        x0 = min(x for data in datadict.values() for (x, y) in data)
-        x1 = max(x for data in datadict.values() for (x, y) in data)
-        bryaxes.TimeCoord.startfloat = 2*x0.timestamp() - x1.timestamp()
-        hours = round((x1.timestamp()-x0.timestamp())/3600)
-        bryaxes.TimeCoord.scalefloat = hours if hours > 0 else 1
-        bryaxes.TimeCoord.defaultformat = "%H:%M:%S" if hours < 5 else "%H:%M" if hours < 24 else "%d/%m %H:%M" if hours < 840 else "%d/%m/%y"
-        pdd = {key:TimeSeriesData(xlabel, ylabel, pd) for (key, pd) in datadict.items()}
-        super().__init__(pdd)
-        self.xLabel = xlabel
-        self.yLabel = ylabel
-        self.xMin = min(pd.xMin for pd in pdd.values())
-        self.xMax = max(pd.xMax for pd in pdd.values())
-        self.yMin = min(pd.yMin for pd in pdd.values())
-        self.yMax = max(pd.yMax for pd in pdd.values())
-
-class LabelledPairedData(dict):
-    def __init__(self, xlabel, ylabel, data):
-        super().__init__(data)
-        self.xLabel = xlabel
-        self.yLabel = ylabel
-        self.xValues = [item[0] for item in data.values()]
-        self.yValues = [item[1] for item in data.values()]
-        self.xMin, self.xMax = min(self.xValues), max(self.xValues)
-        self.yMin, self.yMax = min(self.yValues), max(self.yValues)
-
-class LabelledPairedDataDict(dict):
-    def __init__(self, xlabel, ylabel, datadict):
-        lpdd = {key:LabelledPairedData(xlabel, ylabel, lpd) for (key, lpd) in datadict.items()}
-        super().__init__(lpdd)
-        self.xLabel = xlabel
-        self.yLabel = ylabel
-        self.xMin = min(lpd.xMin for lpd in lpdd.values())
-        self.xMax = max(lpd.xMax for lpd in lpdd.values())
-        self.yMin = min(lpd.yMin for lpd in lpdd.values())
-        self.yMax = max(lpd.yMax for lpd in lpdd.values())
-
-class BoxPlotData(list):
-    def __init__(self, valueslabel, boxplotdata=None, rawdata=None):
-        if rawdata:
-            Q1, Q2, Q3 = quartiles(rawdata)
-            boxplotdata = [min(rawdata), Q1, Q2, Q3, max(rawdata)]
-        super().__init__(boxplotdata)
-        self.valuesLabel = valueslabel
-        self.xMin = self[0]
-        self.xMax = self[-1]
-
-class BoxPlotDataDict(dict):
-    def __init__(self, valueslabel, boxplotdatadict=None, rawdatadict=None):
-        if rawdatadict:
-            boxplotdatadict = {}
-            for key, rawdata in rawdatadict.items():
-                boxplotdatadict[key] = BoxPlotData(valueslabel, rawdata=rawdata)
+                for step in steps: pass
+                if onready: onready(self)
+        if lazy and hasattr(window, "IntersectionObserver"):
+            def onintersect(entries, observer):
+                if not any(entry.isIntersecting for entry in entries): return
+                observer.disconnect()
+                self.lazyObserver = None
+                build()
+            self.lazyObserver = window.IntersectionObserver.new(onintersect, {"rootMargin":"100px"})
+            self.lazyObserver.observe(self)
         else:
-            boxplotdatadict = {key:BoxPlotData(valueslabel, boxplotdata) for key, boxplotdata in boxplotdatadict.items()}
-        super().__init__(boxplotdatadict)
-        self.xMin = min(bpd.xMin for bpd in self.values())
-        self.xMax = max(bpd.xMax for bpd in self.values())
-        self.valuesLabel = valueslabel
-
-class GroupedFrequencyData(list):
-    def __init__(self, valueslabel, data=None, rawdata=None, boundaries=None, classwidth=None):
-        if data:
-            (b, f) = data[-1]
-            if f != 0: data.append((2*b - data[-2][0], 0))
-        else:
-            datamin, datamax = min(rawdata), max(rawdata)
-            if not boundaries:
-                if not classwidth: classwidth, _, _ = getscaleintervals(datamin, datamax, 5)
-                minboundary = rounddown(datamin, classwidth)
-                maxboundary = roundup(datamax, classwidth)
-                boundaries =  [minboundary]
-                while boundaries[-1] < maxboundary: boundaries.append(boundaries[-1] + classwidth)
-            else:
-                if datamin < boundaries[0]:
-                    classwidth = boundaries[1] - boundaries[0]
-                    boundaries.insert(0, rounddown(datamin, classwidth))
-                if datamax > boundaries[-1]:
-                    classwidth = boundaries[-1] - boundaries[-2]
-                    boundaries.append(roundup(datamax, classwidth))
-            data = self.fromRawData(rawdata, boundaries)
-        super().__init__(data)
-        self.boundaries = [item[0] for item in data]
-        self.frequencies = [item[1] for item in data]
-        self.xMin, self.xMax = self.boundaries[0], self.boundaries[-1]
-        self.maxFrequency = max(self.frequencies)
-        self.frequencyDensities = []
-        for i in range(len(self.boundaries)-1):
-            self.frequencyDensities.append(self.frequencies[i]/(self.boundaries[i+1]-self.boundaries[i]))
-        self.maxFrequencyDensity = max(self.frequencyDensities)
-        self.valuesLabel = valueslabel
-        #print("Means", mean(rawdata), self.mean())
-        #print("Variances", variance(rawdata), self.variance())
-
-    def fromRawData(self, rawdata, boundaries):
-        L = len(boundaries)
-        frequencies = [0] * L
-        for value in rawdata:
-            for i in range(L):
-                if value < boundaries[i+1]:
-                    frequencies[i] += 1
-                    break
-        return list(zip(boundaries, frequencies))
-
-    def mean(self):
-        self.midpoints = [(self[i][0] + self[i+1][0])/2 for i in range(len(self)-1)]
-        sumfx = sum(x*f for (x, f) in zip(self.midpoints, self.frequencies[:-1]))
-        sumf = sum(self.frequencies)
-        return sumfx/sumf
-
-    def variance(self):
-        m = self.mean()
-        sumfx2 = sum(x*x*f for (x, f) in zip(self.midpoints, self.frequencies[:-1]))
-        sumf = sum(self.frequencies)
-        return sumfx2/sumf - m*m
-
-class GroupedFrequencyDataDict(dict):
-    def __init__(self, valueslabel, datadict=None, rawdatadict=None, boundaries=None, classwidth=None):
-        if rawdatadict:
-            gfdd = {}
-            for key, rawdata in rawdatadict.items():
-                gfdd[key] = GroupedFrequencyData(valueslabel, rawdata=rawdata, boundaries=boundaries, classwidth=classwidth)
-        else:
-            gfdd = {key:GroupedFrequencyData(valueslabel, gfd) for key, gfd in datadict.items()}
-        super().__init__(gfdd)
-        self.xMin = min(gfd.xMin for gfd in self.values())
-        self.xMax = max(gfd.xMax for gfd in self.values())
-        self.maxFrequency = max(gfd.maxFrequency for gfd in self.values())
-        self.maxFrequencyDensity = max(gfd.maxFrequencyDensity for gfd in self.values())
-        self.valuesLabel = valueslabel
-
-class CumulativeFrequencyData(list):
-    def __init__(self, valueslabel, cumfreqdata=None, groupedfreqdata=None, rawdata=None, boundaries=None, classwidth=None):
-        if rawdata:
-            groupedfreqdata = GroupedFrequencyData(valueslabel=valueslabel, rawdata=rawdata, boundaries=boundaries, classwidth=classwidth)
-        if groupedfreqdata:
-            cumfreqdata = self.fromGFD(groupedfreqdata)
-        else:
-            (b, f) = cumfreqdata[0]
-            if f != 0: cumfreqdata.insert(0, (2*b - cft[1][0], 0))
-        super().__init__(cumfreqdata)
-        self.boundaries = [item[0] for item in cumfreqdata]
-        self.cumfrequencies = [item[1] for item in cumfreqdata]
-        self.xMin, self.xMax = self.boundaries[0], self.boundaries[-1]
-        self.totalFrequency = self.cumfrequencies[-1]
-        self.valuesLabel = valueslabel
-
-    def fromGFD(self, groupedfreqdata):
-        (b, f) = groupedfreqdata[-1]
-        if f != 0: groupedfreqdata.append((2*b - groupedfreqdata[-2][0], 0))
-        L = len(groupedfreqdata)
-        boundaries, frequencies = zip(*groupedfreqdata)
-        cumfrequencies = [0] * L
-        for i in range(1, L):
-            cumfrequencies[i] = cumfrequencies[i-1] + frequencies[i-1]
-        return list(zip(boundaries, cumfrequencies))
-
-class CumulativeFrequencyDataDict(dict):
-    def __init__(self, valueslabel, cfdatadict=None, gfdatadict=None, rawdatadict=None, boundaries=None, classwidth=None):
-        if rawdatadict:
-            cfdd = {}
-            for key, rawdata in rawdatadict.items():
-                cfdd[key] = CumulativeFrequencyData(valueslabel, rawdata=rawdata, boundaries=boundaries, classwidth=classwidth)
-        elif gfdatadict:
-            cfdd = {key:CumulativeFrequencyData(valueslabel, groupedfreqdata=gfd) for key, gfd in gfdatadict.items()}
-        else:
-            cfdd = {key:CumulativeFrequencyData(valueslabel, cfd) for key, cfd in cfdatadict.items()}
-        super().__init__(cfdd)
-        self.xMin = min(cfd.xMin for cfd in self.values())
-        self.xMax = max(cfd.xMax for cfd in self.values())
-        self.maxTotalFrequency = max(cfd.totalFrequency for cfd in self.values())
-        self.valuesLabel = valueslabel
+            build()
+    return __init__
 
 # Classes which provide the charts
 
 class PieChart(SVG.CanvasObject):
+    @lazyinit
     def __init__(self, parent, data, title="", colours=None, usekey=True, fontsize=14, width="95%", height="95%", objid=None):
         super().__init__(width, height, objid=objid)
-        parent <= self
-        self.tooltip = None
+        if self.parentNode is None: parent <= self
+        self.beginBuild()
+        self.tooltip = SVG.Tooltip(self)
         if not colours: colours = DEFAULT_COLOURS
         if not usekey:
             D = data.items()
@@ -344,12 +153,14 @@ class PieChart(SVG.CanvasObject):
             titlepos = (0, -130)
         if title: self.addObject(SVG.TextObject(title, titlepos, anchorposition=8, fontsize=fontsize*1.25))
         self.fitContents()
+        self.endBuild()
 
     def clearTooltip(self, event):
         if event.target != self: return
-        if self.tooltip: self.tooltip.hide()
+        self.tooltip.hide()
 
 class BarChart(bryaxes.AxesCanvas):
+    @lazyinit
     def __init__(self, parent, data, title="", direction="vertical", colour="yellow", fontsize=14, axisoptions={}, width="95%", height="95%", objid=None):
         xaxisoptions = {"showScale":False, "showMajorTicks":False, "showMinorTicks":False, "showMajorGrid":False}
         xaxis = bryaxes.Axis(0, BARUNIT*len(data), "", xaxisoptions)
@@ -357,6 +168,7 @@ class BarChart(bryaxes.AxesCanvas):
         if direction == "horizontal": xaxis, yaxis = yaxis, xaxis
         super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)
         self.attachObject(Bars(self, data, direction=direction, colour=colour))
+        self.measureLabels(data.labels, fontsize)
         for i in range(len(data)):
             if direction == "horizontal":
                 label = bryaxes.AxesWrappingTextObject(self, data.labels[i], (-10*self.xScaleFactor, (i+0.6)*BARUNIT), 80, anchorposition=6, fontsize=fontsize)
@@ -364,8 +176,10 @@ class BarChart(bryaxes.AxesCanvas):
                 label = bryaxes.AxesWrappingTextObject(self, data.labels[i], ((i+0.6)*BARUNIT, 0), 0.8*BARUNIT, fontsize=fontsize)
             self.attachObject(label)
         self.fitContents()
+        self.endBuild()
 
 class StackedBarChart(bryaxes.AxesCanvas):
+    @lazyinit
     def __init__(self, parent, data, title="", direction="vertical", colours=None, fontsize=14, axisoptions={}, width="95%", height="95%", objid=None):
         if not colours: colours = DEFAULT_COLOURS
         xaxisoptions = {"showScale":False, "showMajorTicks":False, "showMinorTicks":False, "showMajorGrid":False}
@@ -375,6 +189,7 @@ class StackedBarChart(bryaxes.AxesCanvas):
         super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)
         for i, key in enumerate(data.keys()):
             self.attachObject(Bars(self, data, "stacked", i, key, direction, colours[i]))
+        self.measureLabels(data.labels, fontsize)
         for i in range(len(data.labels)):
             if direction == "horizontal":
                 label = bryaxes.AxesWrappingTextObject(self, data.labels[i], (-10*self.xScaleFactor, (i+0.6)*BARUNIT), 80, anchorposition=6, fontsize=fontsize)
@@ -391,8 +206,10 @@ class StackedBarChart(bryaxes.AxesCanvas):
                 ]))
             keypos += (0, keyheight)
         self.bestFit = self.fitContents()
+        self.endBuild()
 
 class GroupedBarChart(bryaxes.AxesCanvas):
+    @lazyinit
     def __init__(self, parent, data, title="", direction="vertical", colours=None, fontsize=14, axisoptions={}, width="95%", height="95%", objid=None):
         if not colours: colours = DEFAULT_COLOURS
         xaxisoptions = {"showScale":False, "showMajorTicks":False, "showMinorTicks":False, "showMajorGrid":False}
@@ -402,6 +219,7 @@ class GroupedBarChart(bryaxes.AxesCanvas):
         super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)
         for i, key in enumerate(data.keys()):
             self.attachObject(Bars(self, data, "grouped", i, key, direction, colours[i]))
+        self.measureLabels(data.labels, fontsize)
         for i in range(len(data.labels)):
             if direction == "horizontal":
                 label = bryaxes.AxesWrappingTextObject(self, data.labels[i], (-10*self.xScaleFactor, (i+0.6)*BARUNIT), 80, anchorposition=6, fontsize=fontsize)
@@ -418,22 +236,43 @@ class GroupedBarChart(bryaxes.AxesCanvas):
                 ]))
             keypos += (0, keyheight)
         self.bestFit = self.fitContents()
+        self.endBuild()
 
 class ScatterGraph(bryaxes.AxesCanvas):
-    def __init__(self, parent, data, title="", colour="red", showregressionline=False, fontsize=14, xaxisoptions={}, yaxisoptions={}, width="95%", height="95%", objid=None):
+    @lazyinit
+    def __init__(self, parent, data, title="", colour="red", showregressionline=False, fontsize=14, xaxisoptions={}, yaxisoptions={}, width="95%", height="95%", objid=None, progressive=False):
         xaxis = bryaxes.Axis(data.xMin, data.xMax, data.xLabel, xaxisoptions)
         yaxis = bryaxes.Axis(data.yMin, data.yMax, data.yLabel, yaxisoptions)
+        yield
         super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)
+        yield
         if showregressionline:
             self.regressionLine = RegressionLine(self, data)
             self.attachObject(self.regressionLine)
-        if isinstance(data, LabelledPairedData):
-            self.dataPoints = [DataPoint(self, label, coords, colour) for (label, coords) in data.items()]
-        else:
-            self.dataPoints = [DataPoint(self, None, coords, colour) for coords in data]
-        self.container.attach(self.dataPoints)
+        items = list(data.items()) if isinstance(data, LabelledPairedData) else [(None, coords) for coords in data]
+        [classname] = seriesclasses(self, [colour])
+        preview = None
+        if progressive and len(items) > PREVIEWSIZE:
+            preview = pointmarks(self, [coords for (label, coords) in sample(items)], classname)
+            self.attachObject(preview)
+            yield
+        marks = bryaxes.AxesGroup()
+        if preview is not None: marks.style.display = "none"
+        self.attachObject(marks)
+        self.dataPoints = []
+        for batch in batches(items):
+            datapoints = [DataPoint(self, label, coords, classname) for (label, coords) in batch]
+            marks.attach(datapoints)
+            self.indexPoints(datapoints)
+            self.dataPoints.extend(datapoints)
+            yield
+        if preview is not None:
+            self.removeObject(preview)
+            marks.style.display = "inline"
+        self.endBuild()
 
 class BasicScatterGraph(bryaxes.AxesCanvas):
+    @lazyinit
     def __init__(self, parent, data, title="", colour="red", showregressionline=False, fontsize=14, xaxisoptions={}, yaxisoptions={}, width="95%", height="95%", objid=None):
         xaxis = bryaxes.Axis(data.xMin, data.xMax, data.xLabel, xaxisoptions)
         yaxis = bryaxes.Axis(data.yMin, data.yMax, data.yLabel, yaxisoptions)
@@ -443,32 +282,35 @@ class BasicScatterGraph(bryaxes.AxesCanvas):
             self.attachObject(self.regressionLine)
         if isinstance(data, LabelledPairedData):
             data = data.values()
-        basepoint = svg.circle(cx=0, cy=0, r=3, fill=colour, stroke="none")
-        self.dataPoints = []
-        for (x, y) in data:
-            point = basepoint.cloneNode(True)
-            (point.attrs["cx"], point.attrs["cy"]) = (x, y)
-            point.attrs["transform"] = f"translate({x},{y}) scale({self.xScaleFactor},{-self.yScaleFactor}) translate({-x},{-y})"
-            self.dataPoints.append(point)
-        self.container.attach(self.dataPoints)
+        [classname] = seriesclasses(self, [colour])
+        self.dataPoints = pointmarks(self, data, classname)
+        self.attachObject(self.dataPoints)
+        self.endBuild()
 
 class MultiScatterGraph(bryaxes.AxesCanvas):
+    @lazyinit
     def __init__(self, parent, data, title="", colours=None, showregressionlines=False, fontsize=14, xaxisoptions={}, yaxisoptions={}, width="95%", height="95%", objid=None):
         xaxis = bryaxes.Axis(data.xMin, data.xMax, data.xLabel, xaxisoptions)
         yaxis = bryaxes.Axis(data.yMin, data.yMax, data.yLabel, yaxisoptions)
+        yield
         super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)
+        yield
         if not colours: colours = DEFAULT_COLOURS
         if showregressionlines==True: showregressionlines = [True]*len(data)
         if showregressionlines==False: showregressionlines = [False]*len(data)
+        classnames = seriesclasses(self, colours[:len(data)])
         for i, (key, dataset) in enumerate(data.items()):
             if showregressionlines[i]:
                 self.regressionLine = RegressionLine(self, dataset, colours[i])
                 self.attachObject(self.regressionLine)
-            if isinstance(dataset, LabelledPairedData):
-                self.dataPoints = [DataPoint(self, label, coords, colours[i]) for (label, coords) in dataset.items()]
-            else:
-                self.dataPoints = [DataPoint(self, None, coords, colours[i]) for coords in dataset]
-            self.container.attach(self.dataPoints)
+            items = list(dataset.items()) if isinstance(dataset, LabelledPairedData) else [(None, coords) for coords in dataset]
+            self.dataPoints = []
+            for batch in batches(items):
+                datapoints = [DataPoint(self, label, coords, classnames[i]) for (label, coords) in batch]
+                self.attachObjects(datapoints)
+                self.indexPoints(datapoints)
+                self.dataPoints.extend(datapoints)
+                yield
         keywidth = 20*self.xScaleFactor
         keyheight = fontsize*2*self.yScaleFactor
         keypos = SVG.Point((self.xAxis.max + keywidth, self.yAxis.min+keyheight))
@@ -479,16 +321,20 @@ class MultiScatterGraph(bryaxes.AxesCanvas):
                 ]))
             keypos += (0, keyheight)
         self.bestFit = self.fitContents()
+        self.endBuild()
 
 class LineGraph(bryaxes.AxesCanvas):
-    def __init__(self, parent, data, title="", colours=None, fontsize=14, xaxisoptions={}, yaxisoptions={}, width="95%", height="95%", objid=None):
+    @lazyinit
+    def __init__(self, parent, data, title="", colours=None, fontsize=14, xaxisoptions={}, yaxisoptions={}, width="95%", height="95%", objid=None, progressive=False, workerpool=None):
         tt = time.time()
         xaxisoptions["axisType"] = "time" if isinstance(data, (TimeSeriesData, TimeSeriesDataDict)) else "float"
         xaxis = bryaxes.Axis(data.xMin, data.xMax, data.xLabel, xaxisoptions)
         yaxis = bryaxes.Axis(data.yMin, data.yMax, data.yLabel, yaxisoptions)
         #print("axes", time.time()-tt)
+        yield
         tt = time.time()
         super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)
+        yield
         #print("canvas", time.time()-tt)
         tt = time.time()
         if not colours: colours = DEFAULT_COLOURS
@@ -500,86 +346,129 @@ class LineGraph(bryaxes.AxesCanvas):
             keyheight = fontsize*2*self.yScaleFactor
             keypos = SVG.Point((float(self.xAxis.max) + keywidth, self.yAxis.max))
             keydata = []
-            for i, (key, pd) in enumerate(data.items()):
-                coordslist = [(float(x), y) for (x, y) in pd]
-                self.attachObject(SVG.PolylineObject(coordslist, linecolour=colours[i], linewidth=2))
-                self.attachObjects([DataPoint(self, key, coords, colours[i]) for coords in pd])
-                keydata.append((coordslist[-1][1], key, colours[i]))
+            serieslist = [(key, list(pd), [(float(x), y) for (x, y) in pd]) for (key, pd) in data.items()]
+            classnames = seriesclasses(self, colours[:len(serieslist)])
+            preview = None
+            if progressive and max(len(pd) for (key, pd, coordslist) in serieslist) > PREVIEWSIZE:
+                preview = SVG.GroupObject([SVG.PolylineObject(sample(coordslist), classname=classnames[i])
+                                           for i, (key, pd, coordslist) in enumerate(serieslist)])
+                self.attachObject(preview)
+                yield
+            lines = []
+            marks = bryaxes.AxesGroup()
+            if preview is not None: marks.style.display = "none"
+            self.attachObject(marks)
+            geometries = [Pending() for series in serieslist] if workerpool is not None else []
+            for (pending, (key, pd, coordslist)) in zip(geometries, serieslist):
+                workerpool.polylineGeometry(coordslist, pending.resolve, self.decimals, pending.reject)
+            for i, (key, pd, coordslist) in enumerate(serieslist):
+                if geometries:
+                    yield geometries[i]
+                    lines.append(polylinemarks(geometries[i].result, classnames[i]))
+                else:
+                    lines.append(SVG.PolylineObject(coordslist, classname=classnames[i]))
+                if preview is not None: lines[-1].style.display = "none"
+                self.attachObject(lines[-1])
+                yield
+                for batch in batches(pd):
+                    datapoints = [DataPoint(self, key, coords, classnames[i]) for coords in batch]
+                    marks.attach(datapoints)
+                    self.indexPoints(datapoints)
+                    yield
+                keydata.append((coordslist[-1][1], key, classnames[i]))
+            if preview is not None:
+                self.removeObject(preview)
+                for line in lines+[marks]: line.style.display = "inline"
             keydata.sort(key = lambda x: -x[0])
-            for (_, key, colour) in keydata:
+            for (_, key, classname) in keydata:
                 self.attachObject(SVG.GroupObject([
-                    SVG.LineObject([keypos, keypos+(keywidth,0)], linecolour=colour, linewidth=2),
+                    SVG.LineObject([keypos, keypos+(keywidth,0)], classname=classname),
                     bryaxes.AxesTextObject(self, key, keypos+(keywidth*1.25,0), anchorposition=4, fontsize=fontsize)
                     ]))
                 keypos += (0, -keyheight)
             self.bestFit = self.fitContents()
         #print("lines", time.time()-tt)
         tt = time.time()
+        self.endBuild()
 
 class BoxPlotCanvas(bryaxes.AxesCanvas):
+    @lazyinit
     def __init__(self, parent, data, title="", colour="yellow", fontsize=14, axisoptions={}, width="95%", height="95%", objid=None):
         if isinstance(data, BoxPlotData): data = BoxPlotDataDict(data.valuesLabel, {"":data})
         xaxis = bryaxes.Axis(data.xMin, data.xMax, data.valuesLabel, axisoptions)
         yaxis = bryaxes.Axis(0, 50*len(data), "", {"showAxis":False})
         super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)
         self.fitContents()
+        self.measureLabels(data.keys(), fontsize)
         yheight = 25
         for label, boxplotdata in data.items():
             self.attachObject(BoxPlot(boxplotdata, label, yheight, colour))
             if label: self.attachObject(bryaxes.AxesWrappingTextObject(self, label, (xaxis.min-10*self.xScaleFactor, yheight), 100, 6, fontsize))
             yheight += 50
         self.bestFit = self.fitContents()
+        self.endBuild()
 
 class Histogram(bryaxes.AxesCanvas):
+    @lazyinit
     def __init__(self, parent, data, title="", shownormalcurve=False, colour="yellow", fontsize=14, xaxisoptions={}, yaxisoptions={}, width="95%", height="95%", objid=None):
         xaxis = bryaxes.Axis(data.xMin, data.xMax, data.valuesLabel, xaxisoptions)
         yaxis = bryaxes.Axis(0, data.maxFrequencyDensity, "Frequency density", yaxisoptions)
+        yield
         super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)
+        yield
         self.attachObject(HistogramBars(data, colour))
+        yield
         if shownormalcurve:
             self.attachObject(NormalCurve(self, data))
+        self.endBuild()
 
 class CumulativeFrequencyGraph(bryaxes.AxesCanvas):
+    @lazyinit
     def __init__(self, parent, data, title="", colours=None, fontsize=14, xaxisoptions={}, axisoptions={}, width="95%", height="95%", objid=None):
         if isinstance(data, CumulativeFrequencyData): data = CumulativeFrequencyDataDict(data.valuesLabel, {"":data})
         xaxis = bryaxes.Axis(data.xMin, data.xMax, data.valuesLabel, xaxisoptions)
         yaxis = bryaxes.Axis(0, data.maxTotalFrequency, "Cumulative frequency", yaxisoptions)
         super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)
         if not colours: colours = DEFAULT_COLOURS
+        classnames = seriesclasses(self, colours[:len(data)])
         for i, (key, cfd) in enumerate(data.items()):
-            self.attachObject(CumulativeFrequencyLine(self, key, cfd, colours[i]))
+            self.attachObject(CumulativeFrequencyLine(self, key, cfd, classnames[i]))
         if len(data) > 1:
             keywidth = 20*self.xScaleFactor
             keyheight = fontsize*2*self.yScaleFactor
             keypos = SVG.Point((self.xAxis.max + keywidth, self.yAxis.max))
             for i, key in enumerate(data.keys()):
                 self.attachObject(SVG.GroupObject([
-                    SVG.LineObject([keypos, keypos+(keywidth,0)], linecolour=colours[i], linewidth=2),
+                    SVG.LineObject([keypos, keypos+(keywidth,0)], classname=classnames[i]),
                     bryaxes.AxesTextObject(self, key, keypos+(keywidth*1.25,0), anchorposition=4, fontsize=fontsize)
                     ]))
                 keypos += (0, -keyheight)
             self.bestFit = self.fitContents()
+        self.endBuild()
 
 class CumulativePercentageGraph(bryaxes.AxesCanvas):
+    @lazyinit
     def __init__(self, parent, data, title="", colours=None, fontsize=14, xaxisoptions={}, yaxisoptions={}, width="95%", height="95%", objid=None):
         if isinstance(data, CumulativeFrequencyData): data = CumulativeFrequencyDataDict(data.valuesLabel, {"":data})
         xaxis = bryaxes.Axis(data.xMin, data.xMax, data.valuesLabel, xaxisoptions)
         yaxis = bryaxes.Axis(0, 100, "Cumulative percentage", yaxisoptions)
         super().__init__(parent, width, height, xAxis=xaxis, yAxis=yaxis, title=title, objid=objid)
         if not colours: colours = DEFAULT_COLOURS
+        classnames = seriesclasses(self, colours[:len(data)])
         for i, (key, cfd) in enumerate(data.items()):
-            self.attachObject(CumulativePercentageLine(self, key, cfd, colours[i]))
+            self.attachObject(CumulativePercentageLine(self, key, cfd, classnames[i]))
         if len(data) > 1:
             keywidth = 20*self.xScaleFactor
             keyheight = fontsize*2*self.yScaleFactor
             keypos = SVG.Point((self.xAxis.max + keywidth, self.yAxis.max))
             for i, key in enumerate(data.keys()):
                 self.attachObject(SVG.GroupObject([
-                    SVG.LineObject([keypos, keypos+(keywidth,0)], linecolour=colours[i], linewidth=2),
+                    SVG.LineObject([keypos, keypos+(keywidth,0)], classname=classnames[i]),
                     bryaxes.AxesTextObject(self, key, keypos+(keywidth*1.25,0), anchorposition=4, fontsize=fontsize)
                     ]))
                 keypos += (0, -keyheight)
             self.bestFit = self.fitContents()
+        self.endBuild()
 
 # Utility classes not needed by end users
 
@@ -594,120 +483,29 @@ class PieChartSector(SVG.SectorObject):
         self.bind("mouseleave", self.hidetooltip)
 
     def showtooltip(self, event):
-        if self.canvas.tooltip: self.canvas.tooltip.hide()
-        self.canvas.tooltip = Tooltip(self.canvas, self.tooltiptext, self.centre)
+        self.canvas.tooltip.show(self.tooltiptext, self.centre)
 
     def hidetooltip(self, event):
         self.canvas.tooltip.hide()
 
-class Tooltip(SVG.TextObject):
-    def __init__(self, canvas, text, coords):
-        super().__init__(text, coords, anchorposition=5)
-        self.canvas = canvas
-        self.coords = coords
-        self._background = None
-        self.style.pointerEvents = "none"
-        self.canvas.addObject(self)
-        self.setBackground()
-        self.canvas <= self
-
-    def setBackground(self):
-        bbox = self.getBBox()
-        width, height = bbox.width, bbox.height
-        x, y = self.coords
-        self._background  = SVG.RectangleObject([(x-width/2, y-height/2), (x+width/2, y+height/2)], linecolour="#d3d3d3d0", fillcolour="#d3d3d3d0")
-        self.canvas.addObject(self._background)
-        self._background.style.pointerEvents = "none"
-
-    def hide(self):
-        self.canvas.deleteObject(self._background)
-        self.canvas.deleteObject(self)
-        self.canvas.tooltip = None
-
-class AxesTooltip(bryaxes.AxesTextObject):
-    def __init__(self, canvas, text, coords):
-        super().__init__(canvas, text, coords, anchorposition=8)
-        self.canvas = canvas
-        self.coords = coords
-        self._background = None
-        self.style.pointerEvents = "none"
-        self.canvas.attachObject(self)
-        self.setBackground()
-        self.canvas.container <= self
-
-    def setBackground(self):
-        bbox = self.getBBox()
-        width, height = bbox.width*self.canvas.xScaleFactor, bbox.height*self.canvas.yScaleFactor
-        x, y = self.coords
-        self._background  = SVG.RectangleObject([(x-width/2, y+height), (x+width/2, y)], linecolour="#d3d3d3d0", fillcolour="#d3d3d3d0")
-        self.canvas.attachObject(self._background)
-        self._background.style.pointerEvents = "none"
-
-    def hide(self):
-        self.canvas.removeObject(self._background)
-        self.canvas.removeObject(self)
-        self.canvas.tooltip = None
-
-class Bar(SVG.RectangleObject):
-    def __init__(self, canvas, pointlist, key, value, direction="vertical", colour="yellow"):
-        if direction == "horizontal": pointlist = [(y, x) for (x, y) in pointlist]
-        super().__init__(pointlist, fillcolour=colour)
-        self.canvas = canvas
-        self.tooltiptext = f"{key}\n{value}" if key else f"{value}"
-        self.centre = (self.pointList[0] + self.pointList[1])/2
-        self.bind("mouseenter", self.showtooltip)
-        self.bind("touchstart", self.showtooltip)
-        self.bind("mouseleave", self.hidetooltip)
-
-    def showtooltip(self, event):
-        if self.canvas.tooltip: self.canvas.tooltip.hide()
-        self.canvas.tooltip = AxesTooltip(self.canvas, self.tooltiptext, self.centre)
-
-    def hidetooltip(self, event):
-        self.canvas.tooltip.hide()
-
-class Bars(SVG.GroupObject):
+class Bars(bryaxes.MarkGroup):
     def __init__(self, canvas, data, graphtype=None, index=None, key=None, direction="vertical", colour="yellow"):
         super().__init__()
-        if graphtype == "stacked":
-            barminvalues = [sums[index] for sums in data.sums.values()]
-            barmaxvalues = [sums[index+1] for sums in data.sums.values()]
-            barwidth = 0.8*BARUNIT
-            offset = 0.2*BARUNIT
-        elif graphtype == "grouped":
-            barminvalues = [0]*len(data.labels)
-            barmaxvalues = [values[index] for values in data.Values.values()]
-            barwidth = 0.8*BARUNIT/len(data)
-            offset = 0.2*BARUNIT+barwidth*index
-        else:
-            barminvalues = [0]*len(data)
-            barmaxvalues = data.Values
-            barwidth = 0.8*BARUNIT
-            offset = 0.2*BARUNIT
-
-        for i, label in enumerate(data.labels):
-            [barstart, barend] = [i*BARUNIT+offset, i*BARUNIT+offset+barwidth]
-            value = data.Values[label][index] if key else data.Values[i]
-            if value > 0:
-                self.addObject(Bar(canvas, [(barstart, barmaxvalues[i]), (barend,barminvalues[i])], key, value, direction, colour))
+        for (pointlist, tooltiptext) in barrects(data, graphtype, index, key, direction):
+            self.addRectangle(pointlist, colour, tooltiptext)
+        self.build()
 
 class DataPoint(bryaxes.AxesPoint):
-    def __init__(self, canvas, label, coords, colour="red", objid=None):
+    def __init__(self, canvas, label, coords, classname="series-0", objid=None):
         (x, y) = coords
-        super().__init__(canvas, (float(x), y), colour)
+        super().__init__(canvas, (float(x), y), classname)
         self.canvas = canvas
         self.coords = (float(x), y)
         self.tooltiptext = f"{label}\n{coords}" if label else f"{coords}"
-        self.bind("mouseenter", self.showtooltip)
-        self.bind("touchstart", self.showtooltip)
-        self.bind("mouseleave", self.hidetooltip)
+        self.style.pointerEvents = "none" #Hover is handled by the canvas's pointIndex
 
     def showtooltip(self, event):
-        if self.canvas.tooltip: self.canvas.tooltip.hide()
-        self.canvas.tooltip = AxesTooltip(self.canvas, self.tooltiptext, self.coords)
-
-    def hidetooltip(self, event):
-        self.canvas.tooltip.hide()
+        self.canvas.tooltip.show(self.tooltiptext, self.coords)
 
 class RegressionLine(bryaxes.AxesPolyline):
     def __init__(self, canvas, data, colour="black"):
@@ -721,17 +519,9 @@ class RegressionLine(bryaxes.AxesPolyline):
         y1, y2 = gradient*x1 + yintercept, gradient*x2 + yintercept
         super().__init__(canvas, [(x1,y1), (x2,y2)], linecolour=colour, linewidth=2)
 
-        self.bind("mouseenter", self.showtooltip)
-        self.bind("touchstart", self.showtooltip)
-        self.bind("mouseleave", self.hidetooltip)
-
     def showtooltip(self, event):
-        if self.canvas.tooltip: self.canvas.tooltip.hide()
         (x, y) = self.canvas.getSVGcoords(event)
-        self.canvas.tooltip = AxesTooltip(self.canvas, self.tooltiptext, (x, -y))
-
-    def hidetooltip(self, event):
-        self.canvas.tooltip.hide()
+        self.canvas.tooltip.show(self.tooltiptext, (x, -y))
 
 class BoxPlot(SVG.GroupObject):
     def __init__(self, boxplotinfo, label, yheight, colour="yellow"):
@@ -751,111 +541,49 @@ class BoxPlot(SVG.GroupObject):
         self.bind("mouseleave", self.hidetooltip)
 
     def showtooltip(self, event):
-        if self.canvas.tooltip: self.canvas.tooltip.hide()
-        self.canvas.tooltip = AxesTooltip(self.canvas, self.tooltiptext, self.centre)
-
-    def hidetooltip(self, event):
-        self.canvas.tooltip.hide()
-
-class HistogramBar(SVG.RectangleObject):
-    def __init__(self, gfd, i, colour="yellow"):
-        [barleft, barright] = gfd.boundaries[i:i+2]
-        super().__init__([(barleft, gfd.frequencyDensities[i]), (barright, 0)], fillcolour=colour)
-        self.tooltiptext = f"{barleft}≤x<{barright}\nFrequency: {gfd.frequencies[i]}\nFrequency Density: {gfd.frequencyDensities[i]}"
-        self.centre = ((barleft+barright)/2, gfd.frequencyDensities[i]/2)
-        self.bind("mouseenter", self.showtooltip)
-        self.bind("touchstart", self.showtooltip)
-        self.bind("mouseleave", self.hidetooltip)
-
-    def showtooltip(self, event):
-        if self.canvas.tooltip: self.canvas.tooltip.hide()
-        self.canvas.tooltip = AxesTooltip(self.canvas, self.tooltiptext, self.centre)
+        self.canvas.tooltip.show(self.tooltiptext, self.centre)
 
     def hidetooltip(self, event):
         self.canvas.tooltip.hide()
 
-class HistogramBars(SVG.GroupObject):
+class HistogramBars(bryaxes.MarkGroup):
     def __init__(self, gfd, colour="yellow"):
         super().__init__()
-        for i in range(len(gfd)-1):
-            self.addObject(HistogramBar(gfd, i, colour))
+        for (pointlist, tooltiptext) in histogramrects(gfd):
+            self.addRectangle(pointlist, colour, tooltiptext)
+        self.build()
 
 class NormalCurve(bryaxes.AxesPolyline):
     def __init__(self, canvas, gfd):
-        m = gfd.mean()
-        v = gfd.variance()
-        s = v**0.5
-        k = sum(gfd.frequencies)/(s*(2*pi)**0.5)
-        x0 = gfd.xMin
-        dx = (gfd.xMax - x0)/200
-        points = [(x0+i*dx, k*exp(-0.5*(((x0+i*dx)-m)/s)**2)) for i in range(201)]
+        (points, m, v) = normalcurve(gfd)
         super().__init__(canvas, points, linewidth=2)
         self.tooltiptext = f"µ = {m:.1f}\nσ² = {v:.1f}"
-        self.bind("mouseenter", self.showtooltip)
-        self.bind("touchstart", self.showtooltip)
-        self.bind("mouseleave", self.hidetooltip)
 
     def showtooltip(self, event):
-        if self.canvas.tooltip: self.canvas.tooltip.hide()
         (x, y) = self.canvas.getSVGcoords(event)
-        self.canvas.tooltip = AxesTooltip(self.canvas, self.tooltiptext, (x, -y))
-
-    def hidetooltip(self, event):
-        self.canvas.tooltip.hide()
+        self.canvas.tooltip.show(self.tooltiptext, (x, -y))
 
 
 class CumulativeFrequencyLine(bryaxes.AxesPolyline):
-    def __init__(self, canvas, key, cfd, colour):
-        super().__init__(canvas, cfd, linecolour=colour, linewidth=2)
+    def __init__(self, canvas, key, cfd, classname):
+        super().__init__(canvas, cfd, classname=classname)
         self.key = key
-        self.bind("mouseenter", self.showtooltip)
-        self.bind("touchstart", self.showtooltip)
-        self.bind("mouseleave", self.hidetooltip)
 
     def showtooltip(self, event):
-        if self.canvas.tooltip: self.canvas.tooltip.hide()
         (x, y) = self.canvas.getSVGcoords(event)
         n = int(3-log10(x))
         tooltiptext = f"{self.key}\nNumber of values < {x:.{n}f}: {-y:.0f}"
-        self.canvas.tooltip = AxesTooltip(self.canvas, tooltiptext, (x, -y))
-
-    def hidetooltip(self, event):
-        self.canvas.tooltip.hide()
+        self.canvas.tooltip.show(tooltiptext, (x, -y))
 
 class CumulativePercentageLine(bryaxes.AxesPolyline):
-    def __init__(self, canvas, key, cfd, colour):
+    def __init__(self, canvas, key, cfd, classname):
         total = cfd.totalFrequency
         points = [(x, 100*y/total) for (x, y) in cfd]
-        super().__init__(canvas, points, linecolour=colour, linewidth=2)
+        super().__init__(canvas, points, classname=classname)
         self.key = key
-        self.bind("mouseenter", self.showtooltip)
-        self.bind("touchstart", self.showtooltip)
-        self.bind("mouseleave", self.hidetooltip)
 
     def showtooltip(self, event):
-        if self.canvas.tooltip: self.canvas.tooltip.hide()
         (x, y) = self.canvas.getSVGcoords(event)
         n = int(3-log10(x))
         tooltiptext = f"{self.key}\n%age of values < {x:.{n}f}: {-y:.0f}%"
-        self.canvas.tooltip = AxesTooltip(self.canvas, tooltiptext, (x, -y))
-
-    def hidetooltip(self, event):
-        self.canvas.tooltip.hide()
-
-class DataTable(list):
-    def __init__(self, csvfile=None, jsonfile=None, datasets="columns", headers=True):
-        if csvfile:
-            with open(csvfile) as datafile:
-                lines = datafile.readlines()
-            #datafile = open(csvfile)
-            #lines = datafile.readlines()
-            data = [line.strip().split(",") for line in lines]
-            data = [[convertifnumber(item) for item in row] for row in data]
-        elif jsonfile:
-            with open(jsonfile) as datafile:
-                data = json.load(datafile)
-            #datafile = open(jsonfile)
-            #data = json.load(datafile)
-        fieldnames = data[0]
-        datalist = [{key:value for key, value in zip(fieldnames, data[i])} for i in range(1, len(data))]
-        super().__init__(datalist)
+        self.canvas.tooltip.show(tooltiptext, (x, -y))
@@ -0,0 +1,110 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 1997-2021 Andy Lewis                                          #
+# --------------------------------------------------------------------------- #
+# For details, see the LICENSE file in this repository                        #
+
+#A cache of rendered charts, so that a chart which is shown again with the same data and options is not rebuilt.
+#Example:
+#   cache = brycharts.ChartCache()
+#   cache.chart(brycharts.PieChart, parent, freqdata, title, height="45%")
+
+import hashlib
+from collections import OrderedDict
+from browser import window, timer
+
+def fingerprint(chartclass, data, args, kwargs):
+    '''Returns a key identifying a chart of class `chartclass`, created from `data` with the given options.'''
+    description = repr((chartclass.__name__, type(data).__name__, data, sorted(getattr(data, "__dict__", {}).items()), args, sorted(kwargs.items())))
+    return hashlib.sha1(description.encode("utf-8")).hexdigest()
+
+class ChartCache(object):
+    '''Keeps charts (with their interactivity) after they have been removed from the page, so that they can be re-attached
+    instead of rebuilt. When the total size of the cached charts (measured as the length of their SVG markup) exceeds `maxsize`,
+    the least recently used charts are dropped.
+    If `persist` is True, the SVG markup is also stored in the browser's IndexedDB. After a reload, a stored chart is painted
+    from this markup straight away, and the interactive chart is built to replace it afterwards. Because IndexedDB is
+    asynchronous, the stored charts are not available until `onload` (if given) has been called.'''
+    def __init__(self, maxsize=5000000, persist=False, dbname="brycharts", onload=None):
+        self.maxSize = maxsize
+        self.totalSize = 0
+        self.entries = OrderedDict() #key: (chart, size)
+        self.stored = {} #key: SVG markup, from IndexedDB
+        self.db = None
+        if persist:
+            self._opendb(dbname, onload)
+        elif onload:
+            onload()
+
+    def chart(self, chartclass, parent, data, *args, onready=None, **kwargs):
+        '''Attaches to `parent` the chart which `chartclass(parent, data, *args, **kwargs)` would create, from the cache if possible.
+        Returns the chart, except when it is being painted from stored markup, in which case it returns None. `onready` (if given)
+        is called with the chart once it has been built. A new chart is only added to the cache then, since a `lazy` or `sliced`
+        chart is still empty when its constructor returns.'''
+        key = fingerprint(chartclass, data, args, kwargs)
+        def ready(chart):
+            self._add(key, chart)
+            if onready: onready(chart)
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            chart = self.entries[key][0]
+            parent <= chart
+        elif key in self.stored:
+            parent.insertAdjacentHTML("beforeend", self.stored[key])
+            placeholder = parent.lastChild
+            def build():
+                nextsibling = placeholder.nextSibling
+                parent.removeChild(placeholder)
+                chart = chartclass(parent, data, *args, onready=ready, **kwargs)
+                if nextsibling: parent.insertBefore(chart, nextsibling)
+            timer.set_timeout(build, 0)
+            return None
+        else:
+            return chartclass(parent, data, *args, onready=ready, **kwargs)
+        if onready: onready(chart)
+        return chart
+
+    def clear(self):
+        self.entries.clear()
+        self.stored.clear()
+        self.totalSize = 0
+        if self.db: self._store("readwrite").clear()
+
+    def _add(self, key, chart):
+        markup = chart.outerHTML
+        self.entries[key] = (chart, len(markup))
+        self.totalSize += len(markup)
+        if self.db:
+            self.stored[key] = markup
+            self._store("readwrite").put(markup, key)
+        while self.totalSize > self.maxSize and len(self.entries) > 1:
+            (oldkey, (oldchart, size)) = self.entries.popitem(last=False)
+            self.totalSize -= size
+            if self.db:
+                self.stored.pop(oldkey, None)
+                self._store("readwrite").delete(oldkey)
+
+    def _opendb(self, dbname, onload):
+        request = window.indexedDB.open(dbname, 1)
+        def onupgradeneeded(event):
+            event.target.result.createObjectStore("charts")
+        def onsuccess(event):
+            self.db = event.target.result
+            cursorrequest = self._store("readonly").openCursor()
+            def oncursor(event):
+                cursor = event.target.result
+                if cursor:
+                    self.stored[cursor.key] = cursor.value
+                    getattr(cursor, "continue")()
+                elif onload:
+                    onload()
+            cursorrequest.onsuccess = oncursor
+        def onerror(event):
+            if onload: onload()
+        request.onupgradeneeded = onupgradeneeded
+        request.onsuccess = onsuccess
+        request.onerror = onerror
+
+    def _store(self, mode):
+        return self.db.transaction("charts", mode).objectStore("charts")
@@ -0,0 +1,316 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 1997-2021 Andy Lewis                                          #
+# --------------------------------------------------------------------------- #
+# For details, see the LICENSE file in this repository                        #
+
+#The data structures which are used as inputs for the charts.
+#This module does not use the browser, so it can also be used with the headless renderer in svgrender.
+
+import json
+from bisect import bisect_right
+from .scales import rounddown, roundup, getscaleintervals
+from .timeclasses import TimeCoord
+from .statfns import *
+
+__all__ = ["LabelledData", "LabelledDataDict", "FrequencyData", "FrequencyDataDict", "PairedData", "TimeSeriesData",
+           "PairedDataDict", "TimeSeriesDataDict", "LabelledPairedData", "LabelledPairedDataDict", "BoxPlotData", "BoxPlotDataDict",
+           "GroupedFrequencyData", "GroupedFrequencyDataDict", "CumulativeFrequencyData", "CumulativeFrequencyDataDict", "DataTable",
+           "countvalues", "classboundaries", "groupfrequencies", "fivenumbers"]
+
+# Summaries of raw data, used by the data structures (and by the web workers in workers.py)
+
+def countvalues(rawdata):
+    '''Returns a sorted list of (value, frequency) for the values in `rawdata`.'''
+    counter = {}
+    for x in rawdata:
+        if x in counter:
+            counter[x] += 1
+        else:
+            counter[x] = 1
+    return sorted(counter.items())
+
+def classboundaries(datamin, datamax, boundaries=None, classwidth=None):
+    '''Returns the class boundaries for grouping data from `datamin` to `datamax`, extending `boundaries` (if given) to cover the data.'''
+    if not boundaries:
+        if not classwidth: classwidth, _, _ = getscaleintervals(datamin, datamax, 5)
+        minboundary = rounddown(datamin, classwidth)
+        maxboundary = roundup(datamax, classwidth)
+        boundaries =  [minboundary]
+        while boundaries[-1] < maxboundary: boundaries.append(boundaries[-1] + classwidth)
+    else:
+        if datamin < boundaries[0]:
+            classwidth = boundaries[1] - boundaries[0]
+            boundaries.insert(0, rounddown(datamin, classwidth))
+        if datamax > boundaries[-1]:
+            classwidth = boundaries[-1] - boundaries[-2]
+            boundaries.append(roundup(datamax, classwidth))
+    return boundaries
+
+def groupfrequencies(rawdata, boundaries):
+    '''Returns a list of (lower boundary, frequency) for the classes with the given `boundaries`. A value equal to the upper boundary
+    of the last class is counted in that class.'''
+    L = len(boundaries)
+    frequencies = [0] * L
+    for value in rawdata:
+        frequencies[min(max(bisect_right(boundaries, value)-1, 0), L-2)] += 1
+    return list(zip(boundaries, frequencies))
+
+def fivenumbers(rawdata):
+    '''Returns the minimum, quartiles and maximum of `rawdata`.'''
+    Q1, Q2, Q3 = quartiles(rawdata)
+    return [min(rawdata), Q1, Q2, Q3, max(rawdata)]
+
+# Classes which provide the data structures needed as inputs for the graphs
+
+class LabelledData(dict):
+    def __init__(self, data, valueslabel):
+       super().__init__(data)
+       self.valuesLabel = valueslabel
+       self.labels = list(self.keys())
+       self.Values = list(self.values())
+       self.maxValue = max(self.Values)
+       self.total = sum(self.Values)
+       self.percentages = [100*value/self.total for value in self.Values]
+
+class LabelledDataDict(dict):
+    def __init__(self, datadict, valueslabel):
+        if not isinstance(next(iter(datadict.values())), LabelledData):
+            datadict = {key:LabelledData(ld, valueslabel) for (key, ld) in datadict.items()}
+        super().__init__(datadict)
+        self.maxValue = max(ld.maxValue for ld in self.values())
+        self.valuesLabel = valueslabel
+        labels = set()
+        for ld in self.values(): labels.update(ld.keys())
+        self.labels = list(labels)
+        self.Values = {label:[] for label in self.labels}
+        self.sums = {label:[0] for label in self.labels}
+        for label in self.labels:
+            for ld in self.values():
+                value = ld.get(label, 0)
+                self.Values[label].append(value)
+                self.sums[label].append(self.sums[label][-1] + value)
+        self.maxSum = max(sums[-1] for sums in self.sums.values())
+
+class FrequencyData(LabelledData):
+    def __init__(self, data=None, rawdata=None, valueslabel="Frequency"):
+        if rawdata:
+            data = self.fromRawData(rawdata)
+        super().__init__(data, valueslabel)
+
+    def fromRawData(self, rawdata):
+        #return sorted(Counter(rawdata).items())
+        return countvalues(rawdata)
+
+class FrequencyDataDict(LabelledDataDict):
+    def __init__(self, datadict=None, rawdatadict=None, valueslabel="Frequency"):
+        if rawdatadict:
+            fdd = {key:FrequencyData(rawdata=rawdata, valueslabel=valueslabel) for (key, rawdata) in rawdatadict.items()}
+        else:
+            fdd = {key:FrequencyData(data=data, valueslabel=valueslabel) for (key, data) in datadict.items()}
+        super().__init__(fdd, valueslabel)
+
+class PairedData(list):
+    def __init__(self, xlabel, ylabel, data):
+        super().__init__(data)
+        self.xLabel = xlabel
+        self.yLabel = ylabel
+        self.xValues = [item[0] for item in data]
+        self.yValues = [item[1] for item in data]
+        self.xMin, self.xMax = min(self.xValues), max(self.xValues)
+        self.yMin, self.yMax = min(self.yValues), max(self.yValues)
+
+class TimeSeriesData(PairedData):
+    def __init__(self, xlabel, ylabel, data):
+        if TimeCoord.startfloat == 0:
+            x0 = min(x for (x, y) in data)
+            x1 = max(x for (x, y) in data)
+            TimeCoord.startfloat = 2*x0.timestamp() - x1.timestamp()
+            hours = round((x1.timestamp()-x0.timestamp())/3600)
+            TimeCoord.scalefloat = hours if hours > 0 else 1
+            TimeCoord.defaultformat = "%H:%M:%S" if hours < 5 else "%H:%M" if hours < 24 else "%d/%m %H:%M" if hours < 840 else "%d/%m/%y"
+        data = [(TimeCoord(x), y) for (x, y) in data]
+        super().__init__(xlabel, ylabel, data)
+
+class PairedDataDict(dict):
+    def __init__(self, xlabel, ylabel, datadict):
+        pdd = {key:PairedData(xlabel, ylabel, pd) for (key, pd) in datadict.items()}
+        super().__init__(pdd)
+        self.xLabel = xlabel
+        self.yLabel = ylabel
+        self.xMin = min(pd.xMin for pd in pdd.values())
+        self.xMax = max(pd.xMax for pd in pdd.values())
+        self.yMin = min(pd.yMin for pd in pdd.values())
+        self.yMax = max(pd.yMax for pd in pdd.values())
+
+class TimeSeriesDataDict(dict):
+    def __init__(self, xlabel, ylabel, datadict):
+        x0 = min(x for data in datadict.values() for (x, y) in data)
+        x1 = max(x for data in datadict.values() for (x, y) in data)
+        TimeCoord.startfloat = 2*x0.timestamp() - x1.timestamp()
+        hours = round((x1.timestamp()-x0.timestamp())/3600)
+        TimeCoord.scalefloat = hours if hours > 0 else 1
+        TimeCoord.defaultformat = "%H:%M:%S" if hours < 5 else "%H:%M" if hours < 24 else "%d/%m %H:%M" if hours < 840 else "%d/%m/%y"
+        pdd = {key:TimeSeriesData(xlabel, ylabel, pd) for (key, pd) in datadict.items()}
+        super().__init__(pdd)
+        self.xLabel = xlabel
+        self.yLabel = ylabel
+        self.xMin = min(pd.xMin for pd in pdd.values())
+        self.xMax = max(pd.xMax for pd in pdd.values())
+        self.yMin = min(pd.yMin for pd in pdd.values())
+        self.yMax = max(pd.yMax for pd in pdd.values())
+
+class LabelledPairedData(dict):
+    def __init__(self, xlabel, ylabel, data):
+        super().__init__(data)
+        self.xLabel = xlabel
+        self.yLabel = ylabel
+        self.xValues = [item[0] for item in data.values()]
+        self.yValues = [item[1] for item in data.values()]
+        self.xMin, self.xMax = min(self.xValues), max(self.xValues)
+        self.yMin, self.yMax = min(self.yValues), max(self.yValues)
+
+class LabelledPairedDataDict(dict):
+    def __init__(self, xlabel, ylabel, datadict):
+        lpdd = {key:LabelledPairedData(xlabel, ylabel, lpd) for (key, lpd) in datadict.items()}
+        super().__init__(lpdd)
+        self.xLabel = xlabel
+        self.yLabel = ylabel
+        self.xMin = min(lpd.xMin for lpd in lpdd.values())
+        self.xMax = max(lpd.xMax for lpd in lpdd.values())
+        self.yMin = min(lpd.yMin for lpd in lpdd.values())
+        self.yMax = max(lpd.yMax for lpd in lpdd.values())
+
+class BoxPlotData(list):
+    def __init__(self, valueslabel, boxplotdata=None, rawdata=None):
+        if rawdata:
+            boxplotdata = fivenumbers(rawdata)
+        super().__init__(boxplotdata)
+        self.valuesLabel = valueslabel
+        self.xMin = self[0]
+        self.xMax = self[-1]
+
+class BoxPlotDataDict(dict):
+    def __init__(self, valueslabel, boxplotdatadict=None, rawdatadict=None):
+        if rawdatadict:
+            boxplotdatadict = {}
+            for key, rawdata in rawdatadict.items():
+                boxplotdatadict[key] = BoxPlotData(valueslabel, rawdata=rawdata)
+        else:
+            boxplotdatadict = {key:BoxPlotData(valueslabel, boxplotdata) for key, boxplotdata in boxplotdatadict.items()}
+        super().__init__(boxplotdatadict)
+        self.xMin = min(bpd.xMin for bpd in self.values())
+        self.xMax = max(bpd.xMax for bpd in self.values())
+        self.valuesLabel = valueslabel
+
+class GroupedFrequencyData(list):
+    def __init__(self, valueslabel, data=None, rawdata=None, boundaries=None, classwidth=None):
+        if data:
+            (b, f) = data[-1]
+            if f != 0: data.append((2*b - data[-2][0], 0))
+        else:
+            boundaries = classboundaries(min(rawdata), max(rawdata), boundaries, classwidth)
+            data = self.fromRawData(rawdata, boundaries)
+        super().__init__(data)
+        self.boundaries = [item[0] for item in data]
+        self.frequencies = [item[1] for item in data]
+        self.xMin, self.xMax = self.boundaries[0], self.boundaries[-1]
+        self.maxFrequency = max(self.frequencies)
+        self.frequencyDensities = []
+        for i in range(len(self.boundaries)-1):
+            self.frequencyDensities.append(self.frequencies[i]/(self.boundaries[i+1]-self.boundaries[i]))
+        self.maxFrequencyDensity = max(self.frequencyDensities)
+        self.valuesLabel = valueslabel
+        #print("Means", mean(rawdata), self.mean())
+        #print("Variances", variance(rawdata), self.variance())
+
+    def fromRawData(self, rawdata, boundaries):
+        return groupfrequencies(rawdata, boundaries)
+
+    def mean(self):
+        self.midpoints = [(self[i][0] + self[i+1][0])/2 for i in range(len(self)-1)]
+        sumfx = sum(x*f for (x, f) in zip(self.midpoints, self.frequencies[:-1]))
+        sumf = sum(self.frequencies)
+        return sumfx/sumf
+
+    def variance(self):
+        m = self.mean()
+        sumfx2 = sum(x*x*f for (x, f) in zip(self.midpoints, self.frequencies[:-1]))
+        sumf = sum(self.frequencies)
+        return sumfx2/sumf - m*m
+
+class GroupedFrequencyDataDict(dict):
+    def __init__(self, valueslabel, datadict=None, rawdatadict=None, boundaries=None, classwidth=None):
+        if rawdatadict:
+            gfdd = {}
+            for key, rawdata in rawdatadict.items():
+                gfdd[key] = GroupedFrequencyData(valueslabel, rawdata=rawdata, boundaries=boundaries, classwidth=classwidth)
+        else:
+            gfdd = {key:GroupedFrequencyData(valueslabel, gfd) for key, gfd in datadict.items()}
+        super().__init__(gfdd)
+        self.xMin = min(gfd.xMin for gfd in self.values())
+        self.xMax = max(gfd.xMax for gfd in self.values())
+        self.maxFrequency = max(gfd.maxFrequency for gfd in self.values())
+        self.maxFrequencyDensity = max(gfd.maxFrequencyDensity for gfd in self.values())
+        self.valuesLabel = valueslabel
+
+class CumulativeFrequencyData(list):
+    def __init__(self, valueslabel, cumfreqdata=None, groupedfreqdata=None, rawdata=None, boundaries=None, classwidth=None):
+        if rawdata:
+            groupedfreqdata = GroupedFrequencyData(valueslabel=valueslabel, rawdata=rawdata, boundaries=boundaries, classwidth=classwidth)
+        if groupedfreqdata:
+            cumfreqdata = self.fromGFD(groupedfreqdata)
+        else:
+            (b, f) = cumfreqdata[0]
+            if f != 0: cumfreqdata.insert(0, (2*b - cft[1][0], 0))
+        super().__init__(cumfreqdata)
+        self.boundaries = [item[0] for item in cumfreqdata]
+        self.cumfrequencies = [item[1] for item in cumfreqdata]
+        self.xMin, self.xMax = self.boundaries[0], self.boundaries[-1]
+        self.totalFrequency = self.cumfrequencies[-1]
+        self.valuesLabel = valueslabel
+
+    def fromGFD(self, groupedfreqdata):
+        (b, f) = groupedfreqdata[-1]
+        if f != 0: groupedfreqdata.append((2*b - groupedfreqdata[-2][0], 0))
+        L = len(groupedfreqdata)
+        boundaries, frequencies = zip(*groupedfreqdata)
+        cumfrequencies = [0] * L
+        for i in range(1, L):
+            cumfrequencies[i] = cumfrequencies[i-1] + frequencies[i-1]
+        return list(zip(boundaries, cumfrequencies))
+
+class CumulativeFrequencyDataDict(dict):
+    def __init__(self, valueslabel, cfdatadict=None, gfdatadict=None, rawdatadict=None, boundaries=None, classwidth=None):
+        if rawdatadict:
+            cfdd = {}
+            for key, rawdata in rawdatadict.items():
+                cfdd[key] = CumulativeFrequencyData(valueslabel, rawdata=rawdata, boundaries=boundaries, classwidth=classwidth)
+        elif gfdatadict:
+            cfdd = {key:CumulativeFrequencyData(valueslabel, groupedfreqdata=gfd) for key, gfd in gfdatadict.items()}
+        else:
+            cfdd = {key:CumulativeFrequencyData(valueslabel, cfd) for key, cfd in cfdatadict.items()}
+        super().__init__(cfdd)
+        self.xMin = min(cfd.xMin for cfd in self.values())
+        self.xMax = max(cfd.xMax for cfd in self.values())
+        self.maxTotalFrequency = max(cfd.totalFrequency for cfd in self.values())
+        self.valuesLabel = valueslabel
+
+class DataTable(list):
+    def __init__(self, csvfile=None, jsonfile=None, datasets="columns", headers=True):
+        if csvfile:
+            with open(csvfile) as datafile:
+                lines = datafile.readlines()
+            #datafile = open(csvfile)
+            #lines = datafile.readlines()
+            data = [line.strip().split(",") for line in lines]
+            data = [[convertifnumber(item) for item in row] for row in data]
+        elif jsonfile:
+            with open(jsonfile) as datafile:
+                data = json.load(datafile)
+            #datafile = open(jsonfile)
+            #data = json.load(datafile)
+        fieldnames = data[0]
+        datalist = [{key:value for key, value in zip(fieldnames, data[i])} for i in range(1, len(data))]
+        super().__init__(datalist)
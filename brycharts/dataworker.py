@@ -0,0 +1,47 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 1997-2021 Andy Lewis                                          #
+# --------------------------------------------------------------------------- #
+# For details, see the LICENSE file in this repository                        #
+
+#The script run by each web worker of a brycharts.WorkerPool (see workers.py). Include it in the page with:
+#   <script type="text/python" class="webworker" id="brycharts-dataworker" src="brycharts/dataworker.py"></script>
+#Each message contains a task name, the raw data (as a Float64Array `column`, or as JSON `values`) and the other arguments as JSON.
+#The reply is a JSON string containing the summary, from which the main thread builds the data structure,
+#or the attributes of a mark (see geometry.py), which the main thread only has to insert into the SVG.
+
+import json
+from browser import bind, self
+from brycharts.datastructures import countvalues, classboundaries, groupfrequencies, fivenumbers
+from brycharts.statfns import regressioninfo
+from brycharts.geometry import polylinegeometry
+
+def frequencies(values, fromcolumn):
+    if fromcolumn: values = [int(x) if x == int(x) else x for x in values] #Whole numbers arrive as floats
+    return countvalues(values)
+
+def groupedfrequencies(values, fromcolumn, boundaries=None, classwidth=None):
+    return groupfrequencies(values, classboundaries(min(values), max(values), boundaries, classwidth))
+
+def boxplot(values, fromcolumn):
+    return fivenumbers(values)
+
+def regression(values, fromcolumn):
+    return regressioninfo(list(zip(values[0::2], values[1::2])))
+
+def polyline(values, fromcolumn, decimals=None):
+    return polylinegeometry(list(zip(values[0::2], values[1::2])), decimals)
+
+TASKS = {"frequencies":frequencies, "groupedfrequencies":groupedfrequencies, "boxplot":boxplot, "regression":regression, "polyline":polyline}
+
+@bind(self, "message")
+def onmessage(event):
+    message = event.data
+    try:
+        fromcolumn = message.column is not None
+        values = list(message.column) if fromcolumn else json.loads(message.values)
+        result = TASKS[message.task](values, fromcolumn, *json.loads(message.args))
+        self.send(json.dumps({"id":message.id, "result":result}))
+    except Exception as exc:
+        self.send(json.dumps({"id":message.id, "error":f"{type(exc).__name__}: {exc}"}))
@@ -8,13 +8,102 @@
 import time
 from browser import document, alert, window
 import browser.svg as svg
-import browser.html as html
 from math import sin, cos, atan2, pi, hypot, floor, log10
-svgbase = svg.svg(width=0, height=0)
-basepoint = svgbase.createSVGPoint()
+from . import textmetrics
+from .textmetrics import textwidth
+from .geometry import formatcoord, pointsattribute, coorddecimals
+svgbase = basepoint = measurecontext = None #Created when first needed (see getsvgbase and measuretext), so that importing is quick
 lasttaptime = 0
+DEBUG_LAYOUT = False #If True, the number of forced layouts is printed when each chart has been built (see CanvasObject.endBuild)
 MOUSEEVENTS = ["mousedown", "mousemove", "mouseup", "mouseenter", "mouseleave", "click"]
 TOUCHEVENTS = ["touchstart", "touchmove", "touchend"]
+CANVASEVENTS = MOUSEEVENTS + TOUCHEVENTS + ["dragstart", "dblclick", "contextmenu", "wheel", "mouseover", "mouseout"]
+decimals = None #The number of decimal places to which coordinates are currently written, or None for full precision (see setdecimals)
+
+def measuretext(strings, fontsize, fontfamily):
+    '''Measures `strings` with a canvas 2D context, which (unlike getComputedTextLength) does not force a layout.'''
+    global measurecontext
+    if measurecontext is None: measurecontext = document.createElement("canvas").getContext("2d")
+    measurecontext.font = f"{fontsize}px {fontfamily}"
+    return [measurecontext.measureText(string).width for string in strings]
+
+textmetrics.setmeasurer(measuretext)
+
+def setdecimals(n):
+    '''Sets the number of decimal places to which the XxxObjects write their coordinates (None for full precision), and returns
+    the previous setting. Canvases set this to their own `decimals` while they are being built (see `CanvasObject.beginBuild`).'''
+    global decimals
+    (previous, decimals) = (decimals, n)
+    return previous
+
+def svgcoord(x):
+    '''The coordinate `x` as written in an SVG attribute, to the current number of `decimals`.'''
+    return formatcoord(x, decimals)
+
+def styleorclass(style, classname):
+    '''The keyword arguments which give a new element either the CSS class `classname` (whose style is set for the canvas
+    by `CanvasObject.setClassStyles`), or if this is None, the inline `style`.'''
+    return {"Class":classname} if classname else {"style":style}
+
+def getsvgbase():
+    '''The detached svg element which is used to create SVGTransforms and SVGPoints.'''
+    global svgbase, basepoint
+    if svgbase is None:
+        svgbase = svg.svg(width=0, height=0)
+        basepoint = svgbase.createSVGPoint()
+    return svgbase
+
+def fontfamily(canvas):
+    '''The font-family of text on `canvas` (looked up once, and stored as `canvas.fontFamily`).'''
+    if not getattr(canvas, "fontFamily", None): canvas.fontFamily = window.getComputedStyle(canvas).fontFamily or "sans-serif"
+    return canvas.fontFamily
+
+def unionextent(extents):
+    '''The smallest (x1, y1, x2, y2) box containing all the given boxes, ignoring any which are None.'''
+    extents = [extent for extent in extents if extent is not None]
+    if not extents: return None
+    return (min(e[0] for e in extents), min(e[1] for e in extents), max(e[2] for e in extents), max(e[3] for e in extents))
+
+def pointsextent(points):
+    '''The (x1, y1, x2, y2) box containing all of `points`.'''
+    if not points: return None
+    xvalues = [float(x) for (x, y) in points]
+    yvalues = [float(y) for (x, y) in points]
+    return (min(xvalues), min(yvalues), max(xvalues), max(yvalues))
+
+#Helpers for flat coordinate lists [x0, y0, x1, y1, ...], which shapes with many vertices (eg PolylineObject) keep
+#instead of a Point for each vertex
+def flatten(points):
+    '''The flat coordinate list of `points`.'''
+    return [c for point in points for c in point]
+
+def flatpoints(flat):
+    '''The Points of the flat coordinate list `flat`.'''
+    return [Point((flat[i], flat[i+1])) for i in range(0, len(flat), 2)]
+
+def flatextent(flat):
+    '''The (x1, y1, x2, y2) box containing all the points of the flat coordinate list `flat`.'''
+    if not flat: return None
+    (xvalues, yvalues) = (flat[0::2], flat[1::2])
+    return (min(xvalues), min(yvalues), max(xvalues), max(yvalues))
+
+def translateflat(flat, offset):
+    '''The flat coordinate list `flat`, translated by `offset`.'''
+    (dx, dy) = offset
+    return [c+dx if i%2 == 0 else c+dy for (i, c) in enumerate(flat)]
+
+def flatattribute(flat):
+    '''The SVG `points` attribute for the flat coordinate list `flat`, to the current number of `decimals`.'''
+    d = decimals
+    if d is None: return " ".join([f"{flat[i]},{flat[i+1]}" for i in range(0, len(flat), 2)])
+    return " ".join([f"{formatcoord(flat[i], d)},{formatcoord(flat[i+1], d)}" for i in range(0, len(flat), 2)])
+
+def boxextent(centre, width, height, angle=0):
+    '''The (x1, y1, x2, y2) box containing a `width` x `height` rectangle centred on `centre` and rotated by `angle` degrees.'''
+    (cx, cy) = centre
+    (c, s) = (abs(cos(angle*pi/180)), abs(sin(angle*pi/180)))
+    (halfwidth, halfheight) = ((width*c+height*s)/2, (width*s+height*c)/2)
+    return (cx-halfwidth, cy-halfheight, cx+halfwidth, cy+halfheight)
 
 class Enum(list):
     def __init__(self, name, string):
@@ -43,7 +132,7 @@ class ObjectMixin(object):
                     newobj.group = newobject
                     newobject.objectList.append(newobj)
         elif isinstance(self, ObjectMixin):
-            if isinstance(self, ImageObject) and not self.imageloaded: raise RuntimeError("ImageObject cannot be cloned until fully loaded")
+            if getattr(self, "imageloaded", True) is False: raise RuntimeError("ImageObject cannot be cloned until fully loaded")
             if self.__class__ in shapetypes.values():
                 newobject = self.__class__()
                 #print("Cloning a", self.__class__)
@@ -73,7 +162,7 @@ class ObjectMixin(object):
     def setPointList(self, pointlist):
         '''Change the shape of an object by replacing its `pointList`. Not valid for `PointObjects`, `UseObjects`, `TextObjects` or `WrappingTextObjects`.'''
         self.pointList = [Point(coords) for coords in pointlist]
-        if isinstance(self, BezierObject): self.pointsetList = self._getpointsetlist(pointlist)
+        if hasattr(self, "_getpointsetlist"): self.pointsetList = self._getpointsetlist(pointlist)
         self._update()
         self._updatehittarget()
 
@@ -81,17 +170,22 @@ class ObjectMixin(object):
         '''Utility function to set a CSS style attribute, can be overridden for specific types of object'''
         self.style = {attribute:value}
 
+    def getExtent(self, canvas=None):
+        '''Returns the (x1, y1, x2, y2) box containing the object, calculated from its geometry rather than measured in the DOM.'''
+        return pointsextent(self.pointList)
+
     def _updatehittarget(self):
         '''Not intended to be called by end users.'''
         hittarget = getattr(self, "hitTarget", None)
         if hittarget:
             hittarget.pointList = self.pointList
-            if isinstance(self, BezierObject): hittarget.pointsetList = self.pointsetList
-            if isinstance(self, (RectangleObject, EllipseObject, ImageObject, UseObject)): hittarget.angle = self.angle
+            if hasattr(self, "pointsetList"): hittarget.pointsetList = self.pointsetList
+            if hasattr(self, "angle"): hittarget.angle = self.angle
             hittarget._update()
 
     def _transformedpointlist(self, matrix):
         '''Not intended to be called by end users.'''
+        getsvgbase()
         newpointlist = []
         for point in self.pointList:
             (basepoint.x, basepoint.y) = point
@@ -102,48 +196,31 @@ class ObjectMixin(object):
     def __repr__(self):
         return f"{self.__class__}{self.id}"
 
-class SmoothBezierMixin(object):
-    '''Extra methods for SmoothBezierObject and SmoothClosedBezierObject.'''
-    def _calculatecontrolpoints(self, points):
-        '''Not intended to be called by end users.'''
-        [(x1, y1), (x2, y2), (x3, y3)] = points
-        (dx1, dy1) = ((x2-x1), (y2-y1))
-        (dx3, dy3) = ((x2-x3), (y2-y3))
-        d1 = hypot(dx1, dy1)
-        d2 = hypot(dx3, dy3)
-        if d1 == 0 or d2 == 0: return ((x2, y2), (x2, y2))
-        cos1, sin1 = dx1/d1, dy1/d1
-        cos2, sin2 = dx3/d2, dy3/d2
-
-        (c1x, c1y) = (x2 - d1*(cos1-cos2)/2, y2 - d1*(sin1-sin2)/2)
-        (c2x, c2y) = (x2 + d2*(cos1-cos2)/2, y2 + d2*(sin1-sin2)/2)
-        c1 = ((c1x+x2)/2, (c1y+y2)/2)
-        c2 = ((c2x+x2)/2, (c2y+y2)/2)
-        return (Point(c1), Point(c2))
-
-    '''The following XxxObject classes share various common parameters and attributes.
-    ###Common Parameters
-    When created, as well as the paramters listed for each type of Object, they all share the following optional parameters:
-    `objid`: id of the object (for referencing in the document or using `canvas.getSelectedObject(id)`
-    (The following are not applicable to TextObject, WrappingTextObject, PointObject or UseObject)
-    `linecolour`: colour of the "stroke" or outline of the shape
-    `linewidth`: width of the outline of the shape (its "stroke-width")
-    `fillcolour`: colour of the interior of the shape (not applicable to LineObject). Use "none" if no fill desired.
-
-    ### Common Attributes
-    After creation and adding to the canvas using `canvas.addObject()`, they have following attributes:
-    `obj.fixed` (read/write): If set to `True`, the object cannot be dragged or transformed with the mouse (default `False`)
-    `obj.canvas` (read only): A reference to the canvas which contains the object
-    `obj.pointList` (read only): See individual object definitions for its meaning. (Not applicable to TextObject, WrappingTextObject or PointObject.)
-
-    They also share the following methods:
-    `obj.setPointList()`, `obj.setStyle()`, `obj.cloneObject`
-    '''
+'''The following XxxObject classes share various common parameters and attributes.
+###Common Parameters
+When created, as well as the paramters listed for each type of Object, they all share the following optional parameters:
+`objid`: id of the object (for referencing in the document or using `canvas.getSelectedObject(id)`
+(The following are not applicable to TextObject, WrappingTextObject, PointObject or UseObject)
+`linecolour`: colour of the "stroke" or outline of the shape
+`linewidth`: width of the outline of the shape (its "stroke-width")
+`fillcolour`: colour of the interior of the shape (not applicable to LineObject). Use "none" if no fill desired.
+
+### Common Attributes
+After creation and adding to the canvas using `canvas.addObject()`, they have following attributes:
+`obj.fixed` (read/write): If set to `True`, the object cannot be dragged or transformed with the mouse (default `False`)
+`obj.canvas` (read only): A reference to the canvas which contains the object
+`obj.pointList` (read only): See individual object definitions for its meaning. (Not applicable to TextObject, WrappingTextObject or PointObject.)
+
+They also share the following methods:
+`obj.setPointList()`, `obj.setStyle()`, `obj.cloneObject`
+'''
+
 class LineObject(svg.line, ObjectMixin):
     '''A wrapper for SVG line. Parameters:
     pointList: list containing the coordinates of the start and end points
-    style: "solid" (the default), "faintdash1" (longer dashes) or "faintdash2" (shorter dashes)'''
-    def __init__(self, pointlist=[(0,0), (0,0)], style="solid", linecolour="black", linewidth=1, fillcolour="none", objid=None):
+    style: "solid" (the default), "faintdash1" (longer dashes) or "faintdash2" (shorter dashes)
+    classname: if given, the line is styled by this CSS class (see `CanvasObject.setClassStyles`) instead of an inline style'''
+    def __init__(self, pointlist=[(0,0), (0,0)], style="solid", linecolour="black", linewidth=1, fillcolour="none", objid=None, classname=None):
         [(x1, y1), (x2, y2)] = pointlist
 
         if style == "faintdash1":
@@ -155,16 +232,17 @@ class LineObject(svg.line, ObjectMixin):
         else:
             dasharray = None
 
-        svg.line.__init__(self, x1=x1, y1=y1, x2=x2, y2=y2, style={"stroke":linecolour, "strokeDasharray":dasharray, "stroke-width":linewidth, "fill":"none"})
+        svg.line.__init__(self, x1=svgcoord(x1), y1=svgcoord(y1), x2=svgcoord(x2), y2=svgcoord(y2),
+                          **styleorclass({"stroke":linecolour, "strokeDasharray":dasharray, "stroke-width":linewidth, "fill":"none"}, classname))
         self.pointList = [Point(coords) for coords in pointlist]
         if objid: self.id = objid
 
     def _update(self):
         [(x1, y1), (x2, y2)] = self.pointList
-        self.attrs["x1"] = x1
-        self.attrs["y1"] = y1
-        self.attrs["x2"] = x2
-        self.attrs["y2"] = y2
+        self.attrs["x1"] = svgcoord(x1)
+        self.attrs["y1"] = svgcoord(y1)
+        self.attrs["x2"] = svgcoord(x2)
+        self.attrs["y2"] = svgcoord(y2)
 
 class TextObject(svg.text, ObjectMixin):
     '''A multiline textbox.  Use "\n" within string to separate lines. To make sure the font-size is not affected by the scaling of the
@@ -174,9 +252,6 @@ class TextObject(svg.text, ObjectMixin):
     4  5  6
     7  8  9'''
     def __init__(self, string="", anchorpoint=(0,0), anchorposition=1, fontsize=12, style="normal", ignorescaling=False, canvas=None, objid=None):
-        (x, y) = anchorpoint
-        stringlist = string.split("\n")
-        rowcount = len(stringlist)
         if anchorposition in [3, 6, 9]:
             horizpos = "end"
         elif anchorposition in [2, 5, 8]:
@@ -187,40 +262,51 @@ class TextObject(svg.text, ObjectMixin):
         if ignorescaling and canvas:
             fontsize *= canvas.scaleFactor
             lineheight *= canvas.scaleFactor
-        if anchorposition in [1, 2, 3]:
-            yoffset = fontsize
-        elif anchorposition in [4, 5, 6]:
-            yoffset = fontsize - lineheight*rowcount/2
-        else:
-            yoffset = fontsize - lineheight*rowcount
-
-        svg.text.__init__(self, stringlist[0], x=x, y=y+yoffset, font_size=fontsize, text_anchor=horizpos)
-        for s in stringlist[1:]:
-            self <= svg.tspan(s, x=x, dy=lineheight)
+        svg.text.__init__(self, font_size=fontsize, text_anchor=horizpos)
+        (self.anchorPosition, self.fontSize, self.lineHeight, self.textAnchor) = (anchorposition, fontsize, lineheight, horizpos)
+        self.setText(string, anchorpoint)
         if objid: self.id = objid
 
+    def setText(self, string, anchorpoint):
+        '''Replaces the text of the textbox and moves it to `anchorpoint`, keeping its other settings.'''
+        (x, y) = anchorpoint
+        self.lines = string.split("\n")
+        rowcount = len(self.lines)
+        if self.anchorPosition in [1, 2, 3]:
+            yoffset = self.fontSize
+        elif self.anchorPosition in [4, 5, 6]:
+            yoffset = self.fontSize - self.lineHeight*rowcount/2
+        else:
+            yoffset = self.fontSize - self.lineHeight*rowcount
+        self.textOrigin = (x, y+yoffset)
+        self.attrs["x"] = svgcoord(x)
+        self.attrs["y"] = svgcoord(y+yoffset)
+        self.text = self.lines[0]
+        for s in self.lines[1:]:
+            self <= svg.tspan(s, x=svgcoord(x), dy=self.lineHeight)
+
+    def getExtent(self, canvas=None):
+        (x, y) = self.textOrigin
+        family = fontfamily(canvas) if canvas is not None else "sans-serif"
+        return textmetrics.textextent(self.lines, x, y, self.fontSize, self.lineHeight, self.textAnchor, family)
+
 class WrappingTextObject(svg.text):
     '''See TextObject above for explanation of most of the parameters; however, note that canvas must be specified.
-    A width in SVG units is also specified, and text will be wrapped at word boundaries to fit that width.'''
+    A width in SVG units is also specified, and text will be wrapped at word boundaries to fit that width.
+    The words are measured with textmetrics (which caches their widths), so the object is not attached to the canvas to measure them.'''
     def __init__(self, canvas, string, anchorpoint, width, anchorposition=1, fontsize=12, style="normal", ignorescaling=False, objid=None):
         (x, y) = anchorpoint
         lineheight = fontsize*1.2
         if ignorescaling:
             fontsize *= canvas.scaleFactor
             lineheight *= canvas.scaleFactor
-        words = string.split()
-        svg.text.__init__(self, "", x=x, font_size=fontsize)
-        canvas <= self
-        tspan = svg.tspan(words.pop(0), x=x, dy=0)
-        self <= tspan
-        rowcount = 1
-        for word in words:
-            tspan.text += " "+word
-            if tspan.getComputedTextLength() > width:
-                tspan.text = tspan.text[:-len(word)-1]
-                tspan = svg.tspan(word, x=x, dy=lineheight)
-                self <= tspan
-                rowcount += 1
+        lines = textmetrics.wraplines(string, width, fontsize, fontfamily(canvas))
+        svgx = svgcoord(x)
+        svg.text.__init__(self, "", x=svgx, font_size=fontsize)
+        self <= svg.tspan(lines[0], x=svgx, dy=0)
+        for line in lines[1:]:
+            self <= svg.tspan(line, x=svgx, dy=lineheight)
+        rowcount = len(lines)
 
         if anchorposition in [3, 6, 9]:
             horizpos = "end"
@@ -235,31 +321,55 @@ class WrappingTextObject(svg.text):
             yoffset = fontsize*(1-rowcount/2)
         else:
             yoffset = fontsize*(1-rowcount)
-        self.attrs["y"] = y+yoffset
+        self.attrs["y"] = svgcoord(y+yoffset)
+        (self.lines, self.textOrigin, self.fontSize, self.lineHeight, self.textAnchor) = (lines, (x, y+yoffset), fontsize, lineheight, horizpos)
+        self.fontFamily = canvas.fontFamily
         if objid: self.id = objid
 
+    def getExtent(self, canvas=None):
+        (x, y) = self.textOrigin
+        return textmetrics.textextent(self.lines, x, y, self.fontSize, self.lineHeight, self.textAnchor, self.fontFamily)
+
 class PolylineObject(svg.polyline, ObjectMixin):
     '''Wrapper for SVG polyline. Parameter:
-    pointlist: a list of coordinates for the vertices'''
-    def __init__(self, pointlist=[(0,0)], linecolour="black", linewidth=1, fillcolour="none", objid=None):
-        svg.polyline.__init__(self, style={"stroke":linecolour, "stroke-width":linewidth, "fill":fillcolour})
-        self.pointList = [Point(coords) for coords in pointlist]
+    pointlist: a list of coordinates for the vertices
+    OR flatcoords: the coordinates as a flat list [x0, y0, x1, y1, ...]
+    The coordinates are kept in `flatCoords`; `pointList` is only created (as Points) if it is used.
+    If `classname` is given, the polyline is styled by this CSS class (see `CanvasObject.setClassStyles`) instead of an inline style.'''
+    def __init__(self, pointlist=[(0,0)], linecolour="black", linewidth=1, fillcolour="none", objid=None, flatcoords=None, classname=None):
+        svg.polyline.__init__(self, **styleorclass({"stroke":linecolour, "stroke-width":linewidth, "fill":fillcolour}, classname))
+        self.flatCoords = list(flatcoords) if flatcoords is not None else flatten(pointlist)
+        self._pointList = None
         self._update()
         if objid: self.id = objid
 
     def _update(self):
-        self.attrs["points"] = " ".join([str(point[0])+","+str(point[1]) for point in self.pointList])
+        if self._pointList is not None: self.flatCoords = flatten(self._pointList) #In case the points have been changed in place
+        self.attrs["points"] = flatattribute(self.flatCoords)
+
+    @property
+    def pointList(self):
+        if self._pointList is None: self._pointList = flatpoints(self.flatCoords)
+        return self._pointList
+
+    @pointList.setter
+    def pointList(self, pointlist):
+        self._pointList = None
+        self.flatCoords = flatten(pointlist)
+
+    def getExtent(self, canvas=None):
+        return flatextent(self.flatCoords if self._pointList is None else flatten(self._pointList))
 
 class PolygonObject(svg.polygon, ObjectMixin):
     '''Wrapper for SVG polygon. Parameter:
     pointlist: a list of coordinates for the vertices'''
     def __init__(self, pointlist=[(0,0)], linecolour="black", linewidth=1, fillcolour="yellow", objid=None):
         svg.polygon.__init__(self, style={"stroke":linecolour, "stroke-width":linewidth, "fill":fillcolour})
-        self.attrs["points"] = " ".join([str(point[0])+","+str(point[1]) for point in pointlist])
+        self.attrs["points"] = pointsattribute(pointlist, decimals)
         if objid: self.id = objid
 
     def _update(self):
-        self.attrs["points"] = " ".join([str(point[0])+","+str(point[1]) for point in self._pointList])
+        self.attrs["points"] = pointsattribute(self._pointList, decimals)
 
     def __repr__(self):
         return f"polygon {self.id}" if self.id else f"polygon {id(self)}"
@@ -319,9 +429,10 @@ class RectangleObject(svg.rect, ObjectMixin):
         `height` required height of the rectangle (before any rotation)
     (If only one of `width` and `height` is specified, the rectangle will be a square.)
     `angle`: The angle (in degrees, clockwise) through which the sides of the rectangle
-     are rotated from horizontal and vertical.'''
-    def __init__(self, pointlist=None, centre=(0,0), width=0, height=None, angle=0, linecolour="black", linewidth=1, fillcolour="yellow", objid=None):
-        svg.rect.__init__(self, style={"stroke":linecolour, "stroke-width":linewidth, "fill":fillcolour})
+     are rotated from horizontal and vertical.
+    `classname`: If given, the rectangle is styled by this CSS class (see `CanvasObject.setClassStyles`) instead of an inline style.'''
+    def __init__(self, pointlist=None, centre=(0,0), width=0, height=None, angle=0, linecolour="black", linewidth=1, fillcolour="yellow", objid=None, classname=None):
+        svg.rect.__init__(self, **styleorclass({"stroke":linecolour, "stroke-width":linewidth, "fill":fillcolour}, classname))
         self.angle = angle
         if pointlist:
             self.setPointList(pointlist)
@@ -349,7 +460,7 @@ class RectangleObject(svg.rect, ObjectMixin):
 
         (cx, cy) = self.centre
         self.pointList = [(cx-self._width/2, cy-self._height/2), (cx+self._width/2, cy+self._height/2)]
-        t = svgbase.createSVGTransform()
+        t = getsvgbase().createSVGTransform()
         t.setRotate(self.angle, cx, cy)
         self.pointList = self._transformedpointlist(t.matrix)
         self._update()
@@ -361,17 +472,21 @@ class RectangleObject(svg.rect, ObjectMixin):
         self.centre = Point((cx, cy))
         self.rotatestring = self.style.transform = f"translate({cx}px,{cy}px) rotate({self.angle}deg) translate({-cx}px,{-cy}px)"
 
-        t = svgbase.createSVGTransform()
+        t = getsvgbase().createSVGTransform()
         t.setRotate(-self.angle, cx, cy)
         basepointlist = self._transformedpointlist(t.matrix)
         [(x1, y1), (x2, y2)] = basepointlist
         self._width = abs(x2-x1)
         self._height = abs(y2-y1)
         if self._width != 0: self.currentAspectRatio = self._height/self._width
-        self.attrs["x"] = x2 if x2<x1 else x1
-        self.attrs["y"] = y2 if y2<y1 else y1
-        self.attrs["width"] = self._width
-        self.attrs["height"] = self._height
+        self.attrs["x"] = svgcoord(x2 if x2<x1 else x1)
+        self.attrs["y"] = svgcoord(y2 if y2<y1 else y1)
+        self.attrs["width"] = svgcoord(self._width)
+        self.attrs["height"] = svgcoord(self._height)
+
+    def getExtent(self, canvas=None):
+        if getattr(self, "centre", None) is None: return None
+        return boxextent(self.centre, self._width, self._height, self.angle)
 
 class EllipseObject(svg.ellipse, ObjectMixin):
     '''Wrapper for SVG ellipse.  Parameters:
@@ -414,7 +529,7 @@ class EllipseObject(svg.ellipse, ObjectMixin):
 
         (cx, cy) = self.centre
         self.pointList = [(cx-self._width/2, cy-self._height/2), (cx+self._width/2, cy+self._height/2)]
-        t = svgbase.createSVGTransform()
+        t = getsvgbase().createSVGTransform()
         t.setRotate(self.angle, cx, cy)
         self.pointList = self._transformedpointlist(t.matrix)
         self._update()
@@ -426,17 +541,24 @@ class EllipseObject(svg.ellipse, ObjectMixin):
         self.centre = Point((cx, cy))
         self.rotatestring = self.style.transform = f"translate({cx}px,{cy}px) rotate({self.angle}deg) translate({-cx}px,{-cy}px)"
 
-        t = svgbase.createSVGTransform()
+        t = getsvgbase().createSVGTransform()
         t.setRotate(-self.angle, cx, cy)
         basepointlist = self._transformedpointlist(t.matrix)
         [(x1, y1), (x2, y2)] = basepointlist
         self._width = abs(x2-x1)
         self._height = abs(y2-y1)
         if self._width != 0: self.currentAspectRatio = self._height/self._width
-        self.attrs["cx"] = (x1+x2)/2
-        self.attrs["cy"] = (y1+y2)/2
-        self.attrs["rx"] = self._width/2
-        self.attrs["ry"] = self._height/2
+        self.attrs["cx"] = svgcoord((x1+x2)/2)
+        self.attrs["cy"] = svgcoord((y1+y2)/2)
+        self.attrs["rx"] = svgcoord(self._width/2)
+        self.attrs["ry"] = svgcoord(self._height/2)
+
+    def getExtent(self, canvas=None):
+        (cx, cy) = self.centre
+        (a, b) = (self._width/2, self._height/2)
+        (c, s) = (cos(self.angle*pi/180), sin(self.angle*pi/180))
+        (halfwidth, halfheight) = (hypot(a*c, b*s), hypot(a*s, b*c))
+        return (cx-halfwidth, cy-halfheight, cx+halfwidth, cy+halfheight)
 
 class CircleObject(svg.circle, ObjectMixin):
     '''Wrapper for SVG circle. Parameters:
@@ -454,9 +576,14 @@ class CircleObject(svg.circle, ObjectMixin):
 
     def _update(self):
         [(x1, y1), (x2, y2)] = self.pointList
-        self.attrs["cx"]=x1
-        self.attrs["cy"]=y1
-        self.attrs["r"]=hypot(x2-x1, y2-y1)
+        self.attrs["cx"]=svgcoord(x1)
+        self.attrs["cy"]=svgcoord(y1)
+        self.attrs["r"]=svgcoord(hypot(x2-x1, y2-y1))
+
+    def getExtent(self, canvas=None):
+        [(x1, y1), (x2, y2)] = self.pointList
+        r = hypot(x2-x1, y2-y1)
+        return (x1-r, y1-r, x1+r, y1+r)
 
 class SectorObject(svg.path, ObjectMixin):
     ''' A sector of a circle. Parameters:
@@ -485,324 +612,20 @@ class SectorObject(svg.path, ObjectMixin):
         (x2, y2) = self.pointList[-1]
         r = hypot(x1-x0, y1-y0)
         largeArcFlag = 1 if (self.endangle - self.startangle) % 360 > 180 else 0
+        [x0, y0, x1, y1, x2, y2, r] = [svgcoord(c) for c in (x0, y0, x1, y1, x2, y2, r)]
         self.attrs["d"] = f"M {x0} {y0} L {x1} {y1} A {r} {r} 0 {largeArcFlag} 1 {x2} {y2} Z"
 
-class UseObject(svg.use, ObjectMixin):
-    '''Wrapper for SVG `use` element.  Parameters:
-    `href`: the `#id` of the object being cloned
-    EITHER: `origin`: coordinates on the canvas of the point (0,0) of the object being cloned
-    OR: `centre`: coordinates of the centre of the object's bounding box
-    (If both are specified, the `origin` is used.)
-    `width`: required width of the object (before any rotation)
-    `height` required height of the object(before any rotation)
-    (If only one of `width` and `height` is specified, the other will be set so that the object keeps its actual aspect ratio.
-    If neither is specified, the object will be displayed at its actual size.)
-    `angle`: an optional angle of rotation (clockwise, in degrees).'''
-    def __init__(self, href=None, origin=None, centre=(0,0), width=None, height=None, angle=0, scale=None, objid=None):
-        svg.use.__init__(self, href=href)
-        document <= svgbase
-        tempgroup = svg.g() #Needed to overcome bug in iPad getBBox implementation
-        tempgroup <= self
-        svgbase <= tempgroup
-        bbox = tempgroup.getBBox()
-        svgbase.removeChild(tempgroup)
-        document.body.removeChild(svgbase)
-        self._origwidth = bbox.width
-        self._origheight = bbox.height
-        self._origaspectratio = self._origheight/self._origwidth
-        (cx, cy) = (bbox.x+bbox.width/2, bbox.y+bbox.height/2)
-        self.originoffset = Point((-cx, -cy))
-
-        if width and height:
-            (self._width, self._height) = (width, height)
-        elif width:
-            (self._width, self._height) = (width, width*self._origaspectratio)
-        elif height:
-            (self._width, self._height) = (height/self._origaspectratio, height)
-        else:
-            (self._width, self._height) = (self._origwidth, self._origheight)
-        #if self._width != 0: self.currentAspectRatio = self._height/self._width
-
-        if origin:
-            scalefactors = (self._width/self._origwidth, self._height/self._origheight)
-            self.centre = Point(origin) - self.originoffset*scalefactors
-        else:
-            self.centre = Point(centre)
-        self.angle = angle
-        self.setPosition()
-        if objid: self.id = objid
-
-    def setPosition(self, origin=None, centre=None, width=None, height=None, angle=None, preserveaspectratio=False):
-        '''Change the position, size, and/or angle of the object.
-        If both `origin` and `centre`are specified, the `origin` is used.
-        If only one of `width` and `height` is specified, and `preserveaspectratio` is set to `True`,
-        the other will be set so that the object keeps its current aspect ratio.'''
-        if width:
-            self._width = width
-            if preserveaspectratio and not height: self._height = width*self.currentAspectRatio
-        if height:
-            self._height = height
-            if preserveaspectratio and not width: self._width = height/self.currentAspectRatio
-        if self._width != 0: self.currentAspectRatio = self._height/self._width
-
-        if origin:
-            scalefactors = (self._width/self._origwidth, self._height/self._origheight)
-            self.centre = Point(origin) - self.originoffset*scalefactors
-        elif centre:
-            self.centre = Point(centre)
-        if angle is not None: self.angle = angle
-
-        (cx, cy) = self.centre
-        self.pointList = [(cx-self._width/2, cy-self._height/2), (cx+self._width/2, cy+self._height/2)]
-        t = svgbase.createSVGTransform()
-        t.setRotate(self.angle, cx, cy)
-        self.pointList = self._transformedpointlist(t.matrix)
-        self._update()
-        self._updatehittarget()
-
-    def _update(self):
-        [(x1, y1), (x2, y2)] = self.pointList
-        (cx, cy) = ((x1+x2)/2, (y1+y2)/2)
-        self.centre = Point((cx, cy))
-        self.rotatestring = f"translate({cx}px,{cy}px) rotate({self.angle}deg) translate({-cx}px,{-cy}px)"
-        (xscale, yscale) = (self._width/self._origwidth, self._height/self._origheight)
-        self.scalestring = f"translate({cx}px,{cy}px) scale({xscale},{yscale}) translate({-cx}px,{-cy}px)"
-        self.style.transform = self.rotatestring + self.scalestring
-        self.origin = self.centre + self.originoffset
-        (self.attrs["x"], self.attrs["y"]) = self.origin
-
-class ImageObject(svg.image, ObjectMixin):
-    '''Wrapper for SVG `image` element.  Parameters:
-    `href`: the path to the file containing the image
-    EITHER:
-         `pointlist`: a list of coordinates for two opposite vertices  of the box containing the image
-    OR:
-        `centre`: coordinates of the centre of the image
-        `width`: required width of the image (before any rotation)
-        `height` required height of the image (before any rotation)
-    (If only one of `width` and `height` is specified, the other will be set so that the image keeps its actual aspect ratio.
-    If neither is specified, the image will be displayed at its actual size.)
-    `angle`: an optional angle of rotation (clockwise, in degrees). '''
-    def __init__(self, href=None, pointlist=None, centre=(0,0), width=0, height=None, angle=0, objid=None):
-        def initialise(event):
-            nonlocal width, height
-            self.imageWidth = img.naturalWidth
-            self.imageHeight = img.naturalHeight
-            #print("Image size", self.imageWidth, self.imageHeight)
-            self.imageAspectRatio = self.imageHeight/self.imageWidth
-
-            self.attrs["preserveAspectRatio"] = "none"
-            self.angle = angle
-            if pointlist:
-                self.setPointList(pointlist)
-            else:
-                self.centre = Point(centre)
-                if not width and not height:
-                    width = self.imageWidth
-                    height = self.imageHeight
-                elif not height:
-                    height = width*self.imageAspectRatio
-                elif not width:
-                    width = height/self.imageAspectRatio
-                self._width = width
-                self._height = height
-                self._setuppointlist()
-            self.style.visibility = "visible"
-            self.imageloaded = True
-            loadcomplete = window.Event.new("loadcomplete")
-            self.dispatchEvent(loadcomplete)
-
-        super().__init__()
-        if objid: self.id = objid
-        self.imageloaded = False
-        self.style.visibility = "hidden"
-        if not href: return
-        self.attrs["href"] = href
-        img = html.IMG()
-        img.bind("load", initialise)
-        img.attrs["src"] = href
-
-    def setPosition(self, centre=None, width=None, height=None, angle=None, preserveaspectratio=False):
-        '''Change the position, size, and/or angle of the image.
-        If only one of `width` and `height` is specified, and `preserveaspectratio` is set to `True`,
-        the other will be set so that the image keeps its current aspect ratio.'''
-        def set_position(event=None):
-            #print("Starting set_position")
-            if centre: self.centre = Point(centre)
-            if width:
-                self._width = width
-                if preserveaspectratio and not height: self._height = width*self.currentAspectRatio
-            if height:
-                self._height = height
-                if preserveaspectratio and not width: self._width = height/self.currentAspectRatio
-            if angle is not None: self.angle = angle
-            self._setuppointlist()
-
-        if self.imageloaded:
-            set_position()
-        else:
-            self.bind("loadcomplete", set_position)
-
-    def _setuppointlist(self):
-        (cx, cy) = self.centre
-        self.pointList = [(cx-self._width/2, cy-self._height/2), (cx+self._width/2, cy+self._height/2)]
-        t = svgbase.createSVGTransform()
-        t.setRotate(self.angle, cx, cy)
-        self.pointList = self._transformedpointlist(t.matrix)
-        self._update()
-        self._updatehittarget()
-
-    def _update(self):
-        [(x1, y1), (x2, y2)] = self.pointList
-        (cx, cy) = ((x1+x2)/2, (y1+y2)/2)
-        self.centre = Point((cx, cy))
-        self.rotatestring = self.style.transform = f"translate({cx}px,{cy}px) rotate({self.angle}deg) translate({-cx}px,{-cy}px)"
-
-        t = svgbase.createSVGTransform()
-        t.setRotate(-self.angle, cx, cy)
-        basepointlist = self._transformedpointlist(t.matrix)
-        [(x1, y1), (x2, y2)] = basepointlist
-        self._width = abs(x2-x1)
-        self._height = abs(y2-y1)
-        if self._width != 0: self.currentAspectRatio = self._height/self._width
-        self.attrs["x"] = x2 if x2<x1 else x1
-        self.attrs["y"] = y2 if y2<y1 else y1
-        self.attrs["width"] = self._width
-        self.attrs["height"] = self._height
-
-class BezierObject(svg.path, ObjectMixin):
-    '''Wrapper for svg path element.  Parameter:
-    EITHER pointlist: a list of coordinates for the vertices (in which case the edges will initially be straight lines)
-    OR  pointsetlist: a list of tuples, each tuple consisting of three points:
-    (previous-control-point, vertex, next-control-point).
-    For the first vertex, the previous-control-point must be None,
-    and for the last vertex, the next-control-point must be None.'''
-    def __init__(self, pointsetlist=None, pointlist=[(0,0), (0,0)], linecolour="black", linewidth=1, fillcolour="none", objid=None):
-        def toPoint(coords):
-            return None if coords is None else Point(coords)
-        svg.path.__init__(self, style={"stroke":linecolour, "stroke-width":linewidth, "fill":fillcolour})
-        if pointsetlist:
-            self.pointList = [Point(pointset[1]) for pointset in pointsetlist]
-        else:
-            self.pointList = [Point(coords) for coords in pointlist]
-            pointsetlist = self._getpointsetlist(self.pointList)
-        self.pointsetList = [[toPoint(coords) for coords in pointset] for pointset in pointsetlist]
-        self._update()
-        if objid: self.id = objid
-
-    def _getpointsetlist(self, pointlist):
-        pointsetlist = [[None, pointlist[0], (pointlist[0]+pointlist[1])/2]]
-        for i in range(1, len(pointlist)-1):
-            pointsetlist.append([(pointlist[i-1]+pointlist[i])/2, pointlist[i], (pointlist[i]+pointlist[i+1])/2])
-        pointsetlist.append([(pointlist[-2]+pointlist[-1])/2, pointlist[-1], None])
-        return pointsetlist
-
-    def _updatepointsetlist(self):
-        if len(self.pointList) == 2:
-            self.pointsetList = [[None]+self.pointList, self.pointList+[None]]
-        else:
-            cpoint = (self.pointList[-1]+self.pointList[-2])/2
-            self.pointsetList[-1] = [cpoint, self.pointList[-1], None]
-            self.pointsetList[-2][2] = cpoint
-
-    def _update(self):
-        (dummy, (x1, y1), (c1x, c1y)) = self.pointsetList[0]
-        ((c2x, c2y), (x2, y2), dummy) = self.pointsetList[-1]
-        self.plist = ["M", x1, y1, "C", c1x, c1y]+[x for p in self.pointsetList[1:-1] for c in p for x in c]+[c2x, c2y, x2, y2]
-        self.attrs["d"] = " ".join(str(x) for x in self.plist)
-
-class ClosedBezierObject(BezierObject):
-    '''Wrapper for svg path element.  Parameter:
-    EITHER pointlist: a list of coordinates for the vertices (in which case the edges will initially be stright lines)
-    OR  pointsetlist: a list of tuples, each tuple consisting of three points:
-    (previous-control-point, vertex, next-control-point).
-    The path will be closed (the first vertex does not need to be repeated).'''
-    def __init__(self, pointsetlist=None, pointlist=[(0,0), (0,0)], linecolour="black", linewidth=1, fillcolour="yellow", objid=None):
-        svg.path.__init__(self, style={"stroke":linecolour, "stroke-width":linewidth, "fill":fillcolour})
-        if pointsetlist:
-            self.pointList = [Point(pointset[1]) for pointset in pointsetlist]
-        else:
-            self.pointList = [Point(coords) for coords in pointlist]
-            pointsetlist = self._getpointsetlist(self.pointList)
-        self.pointsetList = [[Point(coords) for coords in pointset] for pointset in pointsetlist]
-        self._update()
-        if objid: self.id = objid
-
-    def _getpointsetlist(self, pointlist):
-        pointsetlist = [[(pointlist[0]+pointlist[-1])/2, pointlist[0], (pointlist[0]+pointlist[1])/2]]
-        for i in range(1, len(pointlist)-1):
-            pointsetlist.append([(pointlist[i-1]+pointlist[i])/2, pointlist[i], (pointlist[i]+pointlist[i+1])/2])
-        pointsetlist.append([(pointlist[-2]+pointlist[-1])/2, pointlist[-1], (pointlist[0]+pointlist[-1])/2])
-        return pointsetlist
-
-    def _updatepointsetlist(self):
-        if len(self.pointList) == 2:
-            self.pointsetList = self._getpointsetlist(self.pointList)
-        else:
-            cpoint1, cpoint2 = (self.pointList[-1]+self.pointList[-2])/2, (self.pointList[-1]+self.pointList[0])/2
-            self.pointsetList[-1] = (cpoint1, self.pointList[-1], cpoint2)
-            self.pointsetList[-2][2] = cpoint1
-            self.pointsetList[0][0] = cpoint2
-
-    def _update(self):
-        ((c1x, c1y), (x, y), (c2x, c2y)) = self.pointsetList[0]
-        self.plist = ["M", x, y, "C", c2x, c2y] + [x for p in self.pointsetList[1:] for c in p for x in c] + [c1x, c1y, x, y]
-        self.attrs["d"] = " ".join(str(x) for x in self.plist)
-
-class SmoothBezierObject(SmoothBezierMixin, BezierObject):
-    '''Wrapper for svg path element.  Parameter:
-    pointlist: a list of vertices.
-    Control points will be calculated automatically so that the curve is smooth at each vertex.'''
-    def __init__(self, pointlist=[(0,0), (0,0)], linecolour="black", linewidth=1, fillcolour="none", objid=None):
-        self.pointList = [Point(coords) for coords in pointlist]
-        pointsetlist = self._getpointsetlist(self.pointList)
-        BezierObject.__init__(self, pointsetlist, linecolour=linecolour, linewidth=linewidth, fillcolour=fillcolour, objid=objid)
-
-    def _getpointsetlist(self, pointlist):
-        if len(pointlist) == 2: return [[None]+pointlist, pointlist+[None]]
-        for i in range(1, len(pointlist)-1):
-            (c1, c2) = self._calculatecontrolpoints(pointlist[i-1:i+2])
-            if i == 1:
-                pointsetlist = [[None, pointlist[0], (pointlist[0]+c1)/2]]
-            pointsetlist.append([c1, pointlist[i], c2])
-        pointsetlist.append([(pointlist[-1]+c2)/2, pointlist[-1], None])
-        return pointsetlist
-
-    def _updatepointsetlist(self):
-        if len(self.pointList) == 2:
-            self.pointsetList = [[None]+self.pointList, self.pointList+[None]]
-        else:
-            (c1, c2) = self._calculatecontrolpoints(self.pointList[-3:])
-            self.pointsetList[-1] = [(self.pointList[-1]+c2)/2, self.pointList[-1], None]
-            self.pointsetList[-2] = [c1, self.pointList[-2], c2]
-
-class SmoothClosedBezierObject(SmoothBezierMixin, ClosedBezierObject):
-    '''Wrapper for svg path element.  Parameter:
-    pointlist: a list of vertices.
-    The path will be closed (the first vertex does not need to be repeated).
-    Control points will be calculated automatically so that the curve is smooth at each vertex.'''
-    def __init__(self, pointlist=[(0,0), (0,0)], linecolour="black", linewidth=1, fillcolour="yellow", objid=None):
-        self.pointList = [Point(coords) for coords in pointlist]
-        pointsetlist = self._getpointsetlist(self.pointList)
-        ClosedBezierObject.__init__(self, pointsetlist, linecolour=linecolour, linewidth=linewidth, fillcolour=fillcolour, objid=objid)
-
-    def _getpointsetlist(self, pointlist):
-        pointlist = [pointlist[-1]]+pointlist[:]+[pointlist[0]]
-        pointsetlist = []
-        for i in range(1, len(pointlist)-1):
-            (c1, c2) = self._calculatecontrolpoints(pointlist[i-1:i+2])
-            pointsetlist.append([c1, pointlist[i], c2])
-        return pointsetlist
-
-    def _updatepointsetlist(self):
-        if len(self.pointList) == 2:
-            self.pointsetList = self._getpointsetlist(self.pointList)
-        else:
-            L = len(self.pointList)
-            pointlist = self.pointList[:]+self.pointList[:2]
-            for j in range(L-2, L+1):
-                (c1, c2) = self._calculatecontrolpoints(pointlist[j-1:j+2])
-                self.pointsetList[j%L] = [c1, pointlist[j], c2]
+    def getExtent(self, canvas=None):
+        '''The box containing the centre, the two ends of the arc, and the points at the top, right, bottom and left of the circle
+        which lie on the arc.'''
+        [(cx, cy), (x1, y1)] = self.pointList[:2]
+        r = hypot(x1-cx, y1-cy)
+        sweep = self.endangle-self.startangle
+        if not 0 <= sweep <= 360: sweep %= 360
+        points = list(self.pointList)
+        for (angle, point) in [(0, (cx, cy-r)), (90, (cx+r, cy)), (180, (cx, cy+r)), (270, (cx-r, cy))]:
+            if (angle-self.startangle)%360 <= sweep or sweep == 360: points.append(point)
+        return pointsextent(points)
 
 class PointObject(svg.circle, ObjectMixin):
     '''A point (small circle) on a diagram. Parameters:
@@ -811,7 +634,7 @@ class PointObject(svg.circle, ObjectMixin):
     def __init__(self, XY=(0,0), colour="black", pointsize=2, canvas=None, objid=None):
         (x, y) = XY
         sf = canvas.scaleFactor if canvas else 1
-        svg.circle.__init__(self, cx=x, cy=y, r=pointsize*sf, style={"stroke":colour, "stroke-width":1, "fill":colour, "vector-effect":"non-scaling-stroke"})
+        svg.circle.__init__(self, cx=svgcoord(x), cy=svgcoord(y), r=pointsize*sf, style={"stroke":colour, "stroke-width":1, "fill":colour, "vector-effect":"non-scaling-stroke"})
         self._XY = None
         self.XY = Point(XY)
         if objid: self.id = objid
@@ -826,30 +649,13 @@ class PointObject(svg.circle, ObjectMixin):
     @XY.setter
     def XY(self, XY):
         self._XY = Point(XY)
-        self.attrs["cx"] = self._XY[0]
-        self.attrs["cy"] = self._XY[1]
-
-class RegularPolygon(PolygonObject):
-    '''A regular polygon.  Parameters:
-    sidecount: the number of sides
-    EITHER centre: the centre of the polygon, OR startpoint: the coordinates of a vertex at the top of the polygon
-    EITHER radius: the radius of the polygon, OR sidelength: the length of each side
-    offsetangle: (optional) the angle (in degrees, clockwise) by which the top edge of the polygon is rotated from the horizontal.'''
-    def __init__(self, sidecount=0, centre=None, radius=None, startpoint=None, sidelength=None, offsetangle=0, linecolour="black", linewidth=1, fillcolour="yellow", objid=None):
-        pointlist = []
-        if sidecount>0:
-            angle = 2*pi/sidecount
-            radoffset = offsetangle*pi/180
-            if not radius: radius = sidelength/(2*sin(pi/sidecount))
-            if not centre:
-                (x, y) = startpoint
-                centre = (x-radius*sin(radoffset), y+radius*cos(radoffset))
-            (cx, cy) = centre
-            for i in range(sidecount):
-                t = radoffset+i*angle
-                pointlist.append(Point((cx+radius*sin(t), cy-radius*cos(t))))
-        PolygonObject.__init__(self, pointlist, linecolour, linewidth, fillcolour, objid)
-        if objid: self.id = objid
+        self.attrs["cx"] = svgcoord(self._XY[0])
+        self.attrs["cy"] = svgcoord(self._XY[1])
+
+    def getExtent(self, canvas=None):
+        (x, y) = self.XY
+        r = float(self.attrs["r"])
+        return (x-r, y-r, x+r, y+r)
 
 class GroupObject(svg.g, ObjectMixin):
     '''Wrapper for SVG `g` element. Parameter:
@@ -872,7 +678,9 @@ class GroupObject(svg.g, ObjectMixin):
 
     def addObject(self, svgobject, fixed=False):
         canvas = self.canvas
-        if canvas is not None: canvas.addObject(svgobject, fixed)
+        if canvas is not None:
+            if canvas.static: svgobject.canvas = canvas
+            else: canvas.addObject(svgobject, fixed)
         self <= svgobject
         svgobject.group = self
         self.objectList.append(svgobject)
@@ -880,7 +688,9 @@ class GroupObject(svg.g, ObjectMixin):
     def addObjects(self, objectlist, fixed=False):
         canvas = self.canvas
         for obj in objectlist:
-            if canvas is not None: canvas.addObject(obj, fixed)
+            if canvas is not None:
+                if canvas.static: obj.canvas = canvas
+                else: canvas.addObject(obj, fixed)
             self <= obj
             obj.group = self
             self.objectList.append(obj)
@@ -900,7 +710,7 @@ class GroupObject(svg.g, ObjectMixin):
 
     def deleteAll(self):
         if self.canvas:
-            for obj in self.objectList: del self.canvas.objectDict[obj.id]
+            for obj in self.objectList: self.canvas.objectDict.pop(obj.id, None)
         while self.firstChild: self.removeChild(self.firstChild)
         self.objectList = []
 
@@ -926,86 +736,74 @@ class GroupObject(svg.g, ObjectMixin):
         self._fixed = fixedvalue
         for obj in self.objectList: obj.fixed = fixedvalue
 
-class Button(GroupObject):
-    '''A clickable button with (multiline) text on it.
-    Parameters:
-    position: coordinates of the top-left of the button
-    size: (width, height) of the button
-    text: text on the button. Use "\n" to insert a new line.
-    onclick: function to be called when the button is clicked
-    fontsize: If this is not specified, the text will be scaled to fit the height (but not width) of the button.
-    fillcolour: background colour of the button. Can be changed after creation using the setFillColour method.
-    canvas: Not used at present'''
-    def __init__(self, position, size, text, onclick, fontsize=None, fillcolour="lightgrey", canvas=None, objid=None):
-        GroupObject.__init__(self)
-        if objid: self.id = objid
-        (x, y), (width, height) = position, size
-        self.button = RectangleObject([(x,y),(x+width, y+height)], fillcolour=fillcolour)
-        self.button.attrs["rx"] = height/3
-        rowcount = text.count("\n") + 1
-        if not fontsize: fontsize = height*0.75/rowcount
-        self.label = TextObject(text,(x+width/2,y+height/2-fontsize/8),anchorposition=5, fontsize=fontsize)
-        self.addObjects([self.button, self.label])
-        self.fixed = True
-        self.bind("mousedown", self._onMouseDown)
-        self.bind("mouseup", self._onMouseUp)
-        self.bind("click", onclick)
-        self.bind("touchstart", onclick)
-        self.attrs["cursor"] = "pointer"
-
-    def _onMouseDown(self, event):
-        event.stopPropagation()
-
-    def _onMouseUp(self, event):
-        event.stopPropagation()
-
-    def setFillColour(self, colour):
-        self.button.style.fill = colour
-
-class ImageButton(GroupObject):
-    '''A clickable button with an SVG image on it. The centre of the image should be at (0,0).
-    For parameters see Button above, except:
-    image: Image on the button. The coordinates of the centre of the image should be at (0,0).
-    canvas: If the canvas is specified, the image will be scaled to fit inside the button.'''
-    def __init__(self, position, size, image, onclick, fontsize=None, fillcolour="lightgrey", canvas=None, objid=None):
-        GroupObject.__init__(self)
-        if objid: self.id = objid
-        (x, y), (width, height) = position, size
-        self.button = RectangleObject([(x,y),(x+width, y+height)], fillcolour=fillcolour)
-        self.button.attrs["rx"] = height/3
-        image.style.transform = f"translate({x+width/2}px,{y+height/2}px)"
-        if canvas:
-            canvas <= image
-            bbox = image.getBBox()
-            canvas.removeChild(image)
-            scalefactor = min(width/bbox.width, height/bbox.height)*0.7
-            image.style.transform += f" scale({scalefactor})"
-        self.addObjects([self.button, image])
-        self.fixed = True
-        self.bind("mousedown", self._onMouseDown)
-        self.bind("mouseup", self._onMouseUp)
-        self.bind("click", onclick)
-        self.bind("touchstart", onclick)
-        self.attrs["cursor"] = "pointer"
-
-    def _onMouseDown(self, event):
-        event.stopPropagation()
-
-    def _onMouseUp(self, event):
-        event.stopPropagation()
-
-    def setFillColour(self, colour):
-        self.button.style.fill = colour
-
-class Definitions(svg.defs):
-    '''Wrapper for SVG `defs` element (mainly for use with `UseObjects`). Parameters:
-    `objlist`: a list of `XxxObjects` in brySVG format.
-    `filename`: a file to be imported, containing shapes defined in standard SVG (not brySVG) format.'''
-    def __init__(self, objlist=[], filename=None):
-        svg.defs.__init__(self)
-        if filename:
-            self.innerHTML = open(filename).read()
-        for obj in objlist: self <= obj
+    def getExtent(self, canvas=None):
+        return unionextent([obj.getExtent(canvas) for obj in self.objectList if hasattr(obj, "getExtent")])
+
+class MarkupBuilder(object):
+    '''Collects the markup for many static SVG elements, so that they can be inserted into the DOM in one operation
+    using `builder.insertInto(parent)`, rather than creating and attaching a Brython element for each one.
+    `attrs` and `style` are dictionaries of SVG attributes and CSS properties. Float attributes are written to the current number of `decimals`.'''
+    def __init__(self):
+        self.markup = []
+
+    def add(self, tag, attrs, style=None):
+        attrstring = " ".join(f'{key}="{svgcoord(value) if isinstance(value, float) else value}"' for (key, value) in attrs.items())
+        if style: attrstring += ' style="' + ";".join(f"{key}:{value}" for (key, value) in style.items()) + '"'
+        self.markup.append(f"<{tag} {attrstring}/>")
+
+    def insertInto(self, parent):
+        parent.insertAdjacentHTML("beforeend", "".join(self.markup))
+        self.markup = []
+
+class Tooltip(svg.g):
+    '''A tooltip which is created once for a canvas and then reused. `show(text, coords)` updates the text and background
+    in place, centred on `coords`, and `hide()` just hides it. The size of the background is estimated using `textwidth()`,
+    so showing the tooltip does not force a layout. Use "\n" within text to separate lines.'''
+    def __init__(self, canvas, fontsize=12, parent=None):
+        svg.g.__init__(self)
+        self.canvas = canvas
+        self.layer = parent if parent is not None else canvas
+        self.fontSize = fontsize
+        self.background = svg.rect(style={"stroke":"#d3d3d3d0", "fill":"#d3d3d3d0"})
+        self.textElement = svg.text("", font_size=fontsize, text_anchor="middle")
+        self.lines = []
+        self <= [self.background, self.textElement]
+        self.style.pointerEvents = "none"
+        self.style.display = "none"
+
+    def show(self, text, coords):
+        strings = text.split("\n")
+        while len(self.lines) < len(strings):
+            tspan = svg.tspan("")
+            self.textElement <= tspan
+            self.lines.append(tspan)
+        lineheight = self.fontSize*1.2
+        width = max(textwidth(string, self.fontSize) for string in strings)
+        height = lineheight*len(strings)
+        (left, top) = self._place(coords, width, height)
+        decimals = self._decimals()
+        c = lambda v: formatcoord(v, decimals)
+        for i, tspan in enumerate(self.lines):
+            tspan.text = strings[i] if i < len(strings) else ""
+            tspan.attrs["x"] = c(left+width/2)
+            tspan.attrs["y"] = c(top+self.fontSize+i*lineheight)
+        (self.background.attrs["x"], self.background.attrs["y"]) = (c(left), c(top))
+        (self.background.attrs["width"], self.background.attrs["height"]) = (c(width), c(height))
+        if self.layer.lastChild != self: self.layer <= self
+        self.style.display = "inline"
+
+    def hide(self):
+        self.style.display = "none"
+
+    def _decimals(self):
+        '''The number of decimal places for the coordinates within the tooltip. The tooltip is shown after the canvas has been
+        built, so this is taken from the canvas rather than from the current `decimals`.'''
+        return self.canvas.decimals
+
+    def _place(self, coords, width, height):
+        '''Returns the top-left of the tooltip's text block, in the tooltip's own coordinates.'''
+        (x, y) = coords
+        return (x-width/2, y-height/2)
 
 class CanvasObject(svg.svg):
     '''Wrapper for SVG svg element.  Parameters:
@@ -1066,6 +864,13 @@ class CanvasObject(svg.svg):
     **Read/write attributes:**
         `canvas.mouseMode` (see above)
         `canvas.lineWidthScaling`: If this is set to `False`, line thicknesses are independent of the scaling of the canvas (default is `True`).
+            This is a single CSS rule in the canvas's <style> element, so changing it does not touch each object.
+        `canvas.static`: If this is set to `True` before objects are added, `addObject` just attaches them, without registering them
+            in `objectDict` or giving them ids. This is quicker and uses less memory, but the objects cannot then be selected,
+            dragged or snapped to (default is `False`).
+        `canvas.precision`: The number of decimal places to which the coordinates of objects are written while the canvas is being
+            built (see `beginBuild`). If this is `None` (the default), it is set by `setViewBox` so that coordinates are accurate
+            to `geometry.PIXELPRECISION` of a pixel at that scale.
         *(Used if snapping required, see above:)*
         `canvas.vertexSnap`
         `canvas.snapDistance`
@@ -1087,10 +892,22 @@ class CanvasObject(svg.svg):
         `canvas.viewWindow` After `canvas.setViewBox()` or `canvas.fitContents()`,
             this gives the SVG coordinates of the top-left and bottom-right of the canvas.
         `canvas.tool` Only available in `MouseMode.DRAW` or `mouseMODE.EDIT` - the current tool (see above)
+        `canvas.destroyed` True after `canvas.destroy()` has been called
+        `canvas.decimals` The number of decimal places used for coordinates (see `canvas.precision`)
+
+    ### Styles
+        Objects which share a style (eg the grid lines of a chart) can be given a CSS class (using the `classname` parameter
+        of `LineObject`, `PolylineObject` and `RectangleObject`) instead of an inline style. The style of each class is set
+        for the canvas with `canvas.setClassStyles({classname: {property: value, ...}, ...})`, and kept as one rule in the
+        canvas's <style> element, so restyling all the objects of a class is a single change.
 
     ### Methods
         These are documents individually below
         '''
+    static = False #A class attribute, so that it can be set before the canvas is initialised (see brycharts.lazyinit)
+    precision = None #Likewise; the number of decimal places for coordinates, or None to derive this from the scale
+    destroyed = False #Likewise, so that a chart can be destroyed before it has been built
+    lazyObserver = None #The IntersectionObserver which builds a lazy chart when it comes into view (see brycharts.lazyinit)
 
     def __init__(self, width=None, height=None, colour="white", objid=None):
         svg.svg.__init__(self, style={"backgroundColor":colour})
@@ -1098,6 +915,8 @@ class CanvasObject(svg.svg):
         if height: self.style.height = height
         self.id = objid if objid else f"canvas{id(self)}"
         self.objectDict = {} # See above
+        self.styleSheet = None #The <style> element of the canvas, created when first needed (see setClassStyles)
+        self.classStyles = {} #The CSS properties of each class of objects on the canvas, by class name
 
         #Attributes intended to be read/write for users - see above for usage
         self.mouseMode = MouseMode.NONE
@@ -1119,9 +938,14 @@ class CanvasObject(svg.svg):
         self.selectedObject = None #The shape which was last clicked on or dragged
         self.dragStartCoords = None #The coordinates at which a drag started
         self.viewWindow = None #After setViewBox or fitContents, this gives the SVG coordinates of the top-left and bottom-right of the canvas
+        self.layoutReads = 0 #The number of DOM reads which may have forced a layout (see beginBuild)
         self.tool = "select" # Only available in MouseMode.DRAW or mouseMODE.EDIT
+        self.destroyed = False #True after destroy()
+        self.decimals = None #The number of decimal places for coordinates, set by setViewBox (see precision)
 
         #Attributes not intended to be used by end-users
+        self.pixelSize = None #While building, the size of the canvas in CSS pixels, read once by beginBuild
+        self.outerDecimals = None #The setting of dragcanvas.decimals before beginBuild, restored by endBuild
         self.panning = False
         self.centre = None
         self.nextid = 0
@@ -1148,7 +972,8 @@ class CanvasObject(svg.svg):
         self.bind("dblclick", self._onDoubleClick)
         self.bind("contextmenu", self._onRightClick)
         self.bind("wheel", self._onWheel)
-        document.bind("keydown", self._onKeyDown)
+        self.keyHandler = self._onKeyDown #Kept so that exactly this handler can be unbound from the document by destroy()
+        document.bind("keydown", self.keyHandler)
 
     # Methods available to end-users
     def setViewBox(self, pointlist):
@@ -1160,35 +985,82 @@ class CanvasObject(svg.svg):
         self.attrs["viewBox"] = f"{x1} {y1} {x2-x1} {y2-y1}"
         self.viewBoxRect = [Point((x1, y1)), Point((x2, y2))]
         self.centre = Point(((x1+x2)/2, (y1+y2)/2))
-        self.xScaleFactor, self.yScaleFactor = self._getScaleFactors()
+        width, height = self._getDimensions()
+        self.xScaleFactor = (x2-x1)/width if width != 0 else 1
+        self.yScaleFactor = (y2-y1)/height if height != 0 else 1
         self.scaleFactor  = max(self.xScaleFactor, self.yScaleFactor)
-        bcr = self.getBoundingClientRect()
-        pt = self.createSVGPoint()
-        (pt.x, pt.y) = (bcr.left, bcr.top)
-        SVGpt =  pt.matrixTransform(self.getScreenCTM().inverse())
-        (x1, y1) = (SVGpt.x, SVGpt.y)
-        (pt.x, pt.y) = (bcr.left+bcr.width, bcr.top+bcr.height)
-        SVGpt =  pt.matrixTransform(self.getScreenCTM().inverse())
-        (x2, y2) = (SVGpt.x, SVGpt.y)
-        self.viewWindow = [Point((x1, y1)), Point((x2, y2))]
+        self.decimals = coorddecimals(self.xScaleFactor, self.yScaleFactor, self.precision)
+        if self.pixelSize is not None: setdecimals(self.decimals)
+        preserveaspectratio = self.attrs["preserveAspectRatio"]
+        if preserveaspectratio == "none" or width == 0 or height == 0:
+            self.viewWindow = [Point((x1, y1)), Point((x2, y2))]
+        elif preserveaspectratio == "xMidYMid meet":
+            (cx, cy) = self.centre
+            (halfwidth, halfheight) = (width*self.scaleFactor/2, height*self.scaleFactor/2)
+            self.viewWindow = [Point((cx-halfwidth, cy-halfheight)), Point((cx+halfwidth, cy+halfheight))]
+        else:
+            self.layoutReads += 1
+            bcr = self.getBoundingClientRect()
+            matrix = self.getScreenCTM().inverse()
+            pt = self.createSVGPoint()
+            (pt.x, pt.y) = (bcr.left, bcr.top)
+            SVGpt =  pt.matrixTransform(matrix)
+            (x1, y1) = (SVGpt.x, SVGpt.y)
+            (pt.x, pt.y) = (bcr.left+bcr.width, bcr.top+bcr.height)
+            SVGpt =  pt.matrixTransform(matrix)
+            (x2, y2) = (SVGpt.x, SVGpt.y)
+            self.viewWindow = [Point((x1, y1)), Point((x2, y2))]
         return self.viewWindow
 
     def _getDimensions(self):
         '''If the canvas was created using non-pixel dimensions (eg percentages),
         call this after adding to the page to set the SVG `width` and `height` attributes as numbers.
-        Returns a tuple `(width, height)`'''
+        Returns a tuple `(width, height)`. While a chart is being built (see `beginBuild`), the size read at the start is used.'''
+        if self.pixelSize: return self.pixelSize
+        self.layoutReads += 1
         bcr = self.getBoundingClientRect()
         self.attrs["width"] = bcr.width
         self.attrs["height"] = bcr.height
         return bcr.width, bcr.height
 
+    def beginBuild(self):
+        '''Starts building a chart on the canvas, which should already have been added to the page.
+        This is the only point where the layout is read (the size of the canvas); until `endBuild()` is called,
+        `setViewBox` and `fitContents` use this size and the geometry of the objects, so that the DOM writes made
+        while building are not interleaved with reads which would force the browser to recalculate the layout.
+        Until then, objects also write their coordinates to the canvas's number of `decimals` (see `setdecimals`).'''
+        self.outerDecimals = setdecimals(self.decimals)
+        self.layoutReads = 0
+        self.pixelSize = None
+        self.pixelSize = self._getDimensions()
+
+    def endBuild(self):
+        '''Ends the building phase begun by `beginBuild()`: the size of the canvas is read from the DOM again when next needed.
+        If `dragcanvas.DEBUG_LAYOUT` is True, prints the number of reads which may have forced a layout while building.'''
+        self.pixelSize = None
+        setdecimals(self.outerDecimals)
+        if DEBUG_LAYOUT: print(f"{self.__class__.__name__} {self.id}: {self.layoutReads} forced layout(s) while building")
+
+    def getExtent(self):
+        '''Returns the (x1, y1, x2, y2) box containing all the objects in `canvas.objectDict`, calculated from their geometry
+        (see `getExtent` on each object) without reading the DOM. Objects added using `<=` are not included.
+        Returns None if there are no such objects, eg if the canvas is `static`, so that its objects are not registered.'''
+        if self.static: return None
+        return unionextent([obj.getExtent(self) for obj in self.objectDict.values() if hasattr(obj, "getExtent")])
+
     def fitContents(self):
         '''Scales the canvas so that all the objects on it are visible. Returns as `Points` (and stores in `canvas.viewwindow`)
-        the coordinates of the top-left and bottom-right of the visible canvas.'''
-        bbox = self.getBBox()
-        if bbox.width == 0 or bbox.height == 0: return
-        wmargin, hmargin = bbox.width/50, bbox.height/50
-        self.viewWindow = self.setViewBox(((bbox.x-wmargin, bbox.y-hmargin), (bbox.x+bbox.width+wmargin, bbox.y+bbox.height+hmargin)))
+        the coordinates of the top-left and bottom-right of the visible canvas.
+        The size of the contents is given by `getExtent()`, or if this is None (no registered objects, eg on a static canvas), by `getBBox()`.'''
+        extent = self.getExtent()
+        if extent is None:
+            self.layoutReads += 1
+            bbox = self.getBBox()
+            extent = (bbox.x, bbox.y, bbox.x+bbox.width, bbox.y+bbox.height)
+        (x1, y1, x2, y2) = extent
+        if x2 == x1 or y2 == y1: return
+        wmargin, hmargin = (x2-x1)/50, (y2-y1)/50
+        self.viewWindow = self.setViewBox(((x1-wmargin, y1-hmargin), (x2+wmargin, y2+hmargin)))
         return self.viewWindow
 
     def getSVGcoords(self, event):
@@ -1207,14 +1079,18 @@ class CanvasObject(svg.svg):
         (Note that referencing using `document[id]` will only give the SVG element, not the Python object.
         If it is not desired that an object should be in the `objectDict`, just add it to the canvas using Brython's <= method.)
         Set `fixed` to `True` (default `False`) if the object should not be capable of being dragged or transformed with mouse actions.
+        If `canvas.static` is `True`, the object is just attached to the canvas.
         '''
+        if self.static:
+            self <= svgobject
+            svgobject.canvas = self
+            return svgobject
+
         def AddToDict(svgobj):
             if not svgobj.id:
                 svgobj.id = f"{self.id}_id{self.nextid}"
                 self.nextid += 1
             self.objectDict[svgobj.id] = svgobj
-            if not getattr(svgobj.style, "vectorEffect", None): #If object already has vectorEffect set, leave it alone
-                if self.lineWidthScaling is False: svgobj.style.vectorEffect = "non-scaling-stroke" #Only set property if necessary
             if isinstance(svgobj, GroupObject):
                 for obj in svgobj.objectList:
                     AddToDict(obj)
@@ -1247,10 +1123,11 @@ class CanvasObject(svg.svg):
         deletefromdict(svgobject)
 
     def deleteAll(self, event=None):
-        '''Clear all elements from the canvas, and from `canvas.objectDict`'''
+        '''Clear all elements from the canvas, and from `canvas.objectDict` (the <style> element of the canvas is kept)'''
         while self.firstChild:
             self.removeChild(self.firstChild)
         self.objectDict = {}
+        if self.styleSheet is not None: self <= self.styleSheet
 
     def deleteSelection(self):
         '''Delete the currently selected object from the canvas, and from `canvas.objectDict`'''
@@ -1275,12 +1152,41 @@ class CanvasObject(svg.svg):
             svgobject.XY += offset
         else:
             svgobject.pointList = [point+offset for point in svgobject.pointList]
-            if isinstance(svgobject, BezierObject):
+            if hasattr(svgobject, "pointsetList"):
                 svgobject.pointsetList = [(p1+offset,p2+offset,p3+offset) for (p1,p2,p3) in svgobject.pointsetList]
             svgobject._update()
             svgobject._updatehittarget()
             if isinstance(svgobject, PolygonObject): svgobject._segments = None
 
+    def destroy(self):
+        '''Removes the canvas from the page, and releases everything which would keep it alive: its handler for keydown events
+        on the document, its event handlers, `objectDict` and hit targets, and the tooltip's reference to it.
+        The canvas should not be used afterwards. A canvas can also be used as a context manager, which destroys it at the end
+        of the `with` block. A lazy or sliced chart can be destroyed before it has been built: it then stops observing the page,
+        and the chartscheduler drops it.'''
+        if self.destroyed: return
+        self.destroyed = True
+        if self.lazyObserver is not None: self.lazyObserver.disconnect()
+        self.lazyObserver = None
+        if hasattr(self, "objectDict"): #Otherwise the chart was destroyed before CanvasObject.__init__ (see brycharts.lazyinit)
+            document.unbind("keydown", self.keyHandler)
+            for event in CANVASEVENTS: self.unbind(event)
+            for hittarget in self.hittargets:
+                for event in MOUSEEVENTS+TOUCHEVENTS: hittarget.unbind(event)
+            tooltip = getattr(self, "tooltip", None)
+            if tooltip is not None: tooltip.canvas = tooltip.layer = None
+            self.tooltip = None
+            self.deleteAll()
+            self.hittargets = []
+            self.mouseOwner = self.selectedObject = self.handles = self.controlhandles = None
+        if self.parentNode is not None: self.parentNode.removeChild(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exctype, excvalue, traceback):
+        self.destroy()
+
     #The following three methods are not compatible with dragging, snapping etc
     def rotateElement(self, element, angle, centre=None):
         '''Rotate `element` clockwise by `angle` degrees around `centre`.
@@ -1291,7 +1197,7 @@ class CanvasObject(svg.svg):
         (cx, cy) = centre
         transformstring = f"translate({cx}px,{cy}px) rotate({angle}deg) translate({-cx}px,{-cy}px)"
         element.style.transform = transformstring + element.style.transform
-        t = svgbase.createSVGTransform()
+        t = getsvgbase().createSVGTransform()
         t.setRotate(angle, *centre)
         #element.transform.baseVal.insertItemBefore(t, 0)
         return t.matrix
@@ -1302,7 +1208,7 @@ class CanvasObject(svg.svg):
         if not yscale: yscale = xscale
         transformstring = f"scale({xscale},{yscale})"
         element.style.transform = transformstring + element.style.transform
-        t = svgbase.createSVGTransform()
+        t = getsvgbase().createSVGTransform()
         t.setScale(xscale, yscale)
         #element.transform.baseVal.insertItemBefore(t, 0)
         return t.matrix
@@ -1312,7 +1218,7 @@ class CanvasObject(svg.svg):
         (dx, dy) = vector
         transformstring = f"translate({dx}px,{dy}px)"
         element.style.transform = transformstring + element.style.transform
-        t = svgbase.createSVGTransform()
+        t = getsvgbase().createSVGTransform()
         t.setTranslate(*vector)
         #element.transform.baseVal.insertItemBefore(t, 0)
         return t.matrix
@@ -1325,6 +1231,7 @@ class CanvasObject(svg.svg):
     @mouseMode.setter
     def mouseMode(self, mm):
         if mm in [MouseMode.DRAG, MouseMode.EDIT, MouseMode.TRANSFORM]:
+            from . import dragtools #Adds the methods needed for dragging and editing
             self.createHitTargets()
         currentmm = getattr(self, "_mouseMode", None)
         if currentmm == mm: return
@@ -1343,17 +1250,26 @@ class CanvasObject(svg.svg):
         currentlws = getattr(self, "_lineWidthScaling", None)
         if currentlws == lws: return
         self._lineWidthScaling = lws
-        for objid in self.objectDict:
-            self.objectDict[objid].style.vectorEffect = "none" if lws else "non-scaling-stroke"
-
-    def _getScaleFactors(self):
-        '''Recalculates self.scaleFactor. This is called automatically by setViewBox or fitContents().'''
-        width, height = self._getDimensions()
-        #if width == 0 or height == 0: return 1
-        vbleft, vbtop, vbwidth, vbheight = [float(x) for x in self.attrs["viewBox"].split()]
-        xScaleFactor = vbwidth/width if width != 0 else 1
-        yScaleFactor = vbheight/height if height!= 0 else 1
-        return xScaleFactor, yScaleFactor
+        if self.styleSheet is not None or not lws: self._writeStyleSheet()
+
+    def setClassStyles(self, styles):
+        '''Sets the style of each class of objects in `styles`, a dict of {classname: {property: value, ...}} (as for an inline style).
+        A key may also combine classes, eg "data-point.series-0" for the objects which have both classes.
+        The rules for all the classes are written to the canvas's <style> element in one operation.'''
+        self.classStyles.update(styles)
+        self._writeStyleSheet()
+
+    def _writeStyleSheet(self):
+        '''Writes the CSS rules of the canvas: vector-effect for all objects (if lineWidthScaling is False), then the class styles.'''
+        if self.styleSheet is None:
+            self.styleSheet = svg.style()
+            self.insertBefore(self.styleSheet, self.firstChild)
+        scope = "#" + window.CSS.escape(self.id) #The id may contain characters (eg "." or ":") which are special in selectors
+        rules = [] if self.lineWidthScaling else [f"{scope} * {{vector-effect:non-scaling-stroke}}"]
+        for (classname, style) in self.classStyles.items():
+            properties = ";".join(f"{key}:{value}" for (key, value) in style.items())
+            rules.append(f"{scope} .{classname} {{{properties}}}")
+        self.styleSheet.text = "\n".join(rules)
 
     def createHitTargets(self):
         try:
@@ -1361,30 +1277,6 @@ class CanvasObject(svg.svg):
         except AttributeError:
             self._createHitTargets()
 
-    def _createHitTargets(self):
-        objlist = list(self.objectDict.values())
-        for obj in objlist:
-            if isinstance(obj, GroupObject): continue
-            if hasattr(obj, "hitTarget"): continue
-            if hasattr(obj, "reference"): continue # A hitTarget doesn't need its own hitTarget
-            if isinstance(obj, UseObject):
-                newobj = RectangleObject(pointlist=obj.pointList, angle=obj.angle)
-            elif obj.style.fill != "none" or obj.fixed:
-                continue
-            else:
-                newobj = obj.cloneObject()
-                newobj.style.strokeWidth = 10*self.scaleFactor if self.mouseDetected else 25*self.scaleFactor
-            newobj.style.opacity = 0
-            for event in MOUSEEVENTS: newobj.bind(event, self._onHitTargetMouseEvent)
-            for event in TOUCHEVENTS: newobj.bind(event, self._onHitTargetTouchEvent)
-            newobj.reference = obj
-            obj.hitTarget = newobj
-            self.hittargets.append(newobj)
-            #if getattr(obj, "group", None):
-            #    obj.group.addObject(newobj)
-            #else:
-            self.addObject(newobj)
-
     def _onWheel(self, event):
         if self.mouseMode == MouseMode.PAN:
             event.preventDefault()
@@ -1416,7 +1308,7 @@ class CanvasObject(svg.svg):
             self.mouseDetected = True
             for obj in self.objectDict.values():
                 if hasattr(obj, "reference"):
-                    if isinstance(obj.reference, UseObject): continue
+                    if obj.reference.nodeName == "use": continue
                     obj.style.strokeWidth = 10*self.scaleFactor
         if event.button > 0: return
         self._onLeftDown(event)
@@ -1458,26 +1350,6 @@ class CanvasObject(svg.svg):
         elif self.mouseMode == MouseMode.EDIT:
             self._endEdit(event)
 
-    def _onHitTargetMouseEvent(self, event):
-        eventdict = {attr: getattr(event, attr) for attr in dir(event)}
-        eventdict["bubbles"] = False
-        newevent = window.MouseEvent.new(event.type, eventdict)
-        obj = self.objectDict[event.target.id]
-        obj.reference.dispatchEvent(newevent)
-
-    def _onHitTargetTouchEvent(self, event):
-        eventdict = {attr: getattr(event, attr) for attr in dir(event)}
-        eventdict["bubbles"] = False
-        newevent = window.TouchEvent.new(event.type, eventdict)
-        obj = self.objectDict[event.target.id]
-        obj.reference.dispatchEvent(newevent)
-        latesttime = time.time()
-        if event.type == "touchend" and latesttime - lasttaptime < 0.6:
-            eventdict["clientX"] = event.changedTouches[0].clientX
-            eventdict["clientY"] = event.changedTouches[0].clientY
-            newevent = window.MouseEvent.new("click", eventdict)
-            obj.reference.dispatchEvent(newevent)
-
     def _onDoubleClick(self, event):
         if self.mouseMode == MouseMode.DRAW:
             self.setTool("select")
@@ -1487,34 +1359,6 @@ class CanvasObject(svg.svg):
     def _onKeyDown(self, event):
         if event.keyCode == 46: self.deleteSelection()
 
-    def _prepareDrag(self, event):
-        self.dragStartCoords = self.getSVGcoords(event)
-        self.selectedObject = self.getSelectedObject(event.target.id)
-        if self.selectedObject and not self.selectedObject.fixed:
-            self.mouseOwner = self.selectedObject
-            self <= self.mouseOwner
-            if (hittarget := getattr(self.mouseOwner, "hitTarget", None)): self <= hittarget
-            self.startx = event.targetTouches[0].clientX if "touch" in event.type else event.clientX
-            self.starty = event.targetTouches[0].clientY if "touch" in event.type else event.clientY
-
-    def _doDrag(self, event):
-        x = event.targetTouches[0].clientX if "touch" in event.type else event.clientX
-        y = event.targetTouches[0].clientY if "touch" in event.type else event.clientY
-        dx, dy = (x-self.startx)*self.scaleFactor, (y-self.starty)*self.scaleFactor
-        self.mouseOwner.style.transform = f"translate({dx}px,{dy}px)"
-        if isinstance(self.mouseOwner, [EllipseObject, RectangleObject, UseObject, ImageObject]):
-            self.mouseOwner.style.transform += self.mouseOwner.rotatestring
-            if isinstance(self.mouseOwner, UseObject): self.mouseOwner.style.transform += self.mouseOwner.scalestring
-
-    def _endDrag(self, event):
-        self.mouseOwner.style.transform = "translate(0px,0px)"
-        currentcoords = self.getSVGcoords(event)
-        offset = currentcoords - self.dragStartCoords
-        self.translateObject(self.mouseOwner, offset)
-        if self.edgeSnap: self._doEdgeSnap(self.mouseOwner)
-        elif self.vertexSnap: self._doVertexSnap(self.mouseOwner)
-        self.mouseOwner = None
-
     def _preparePan(self, event):
         if not self.centre:
             (width, height) = self._getDimensions()
@@ -1571,74 +1415,34 @@ class CanvasObject(svg.svg):
                 svgobj = svgobj.group
         return svgobj
 
-    def _doVertexSnap(self, svgobject, checkpoints=None):
-        if not hasattr(svgobject, "pointList"): return
-        snapd = self.snapDistance
-        bestdx = bestdy = bestd = None
-        bbox = svgobject.getBBox()
-        L, R, T, B = bbox.x, bbox.x+bbox.width, bbox.y, bbox.y+bbox.height
-
-        if checkpoints is None:
-            checkpoints = []
-            for objid in self.objectDict:
-                if objid == svgobject.id: continue
-                obj = self.objectDict[objid]
-                if not hasattr(obj, "pointList"): continue
-                if hasattr(obj, "reference"): continue
-                if obj.style.visibility == "hidden": continue
-                if objgroup := getattr(obj, "group", None) and hasattr(objgroup, "pointList") : continue
-                bbox = obj.getBBox()
-                L1, R1, T1, B1 = bbox.x, bbox.x+bbox.width, bbox.y, bbox.y+bbox.height
-                if L1-R > snapd or R1-L < -snapd or T1-B > snapd or B1-T < -snapd: continue
-                checkpoints.extend(obj.pointList)
-        if not checkpoints: return
-        checkpoints.sort(key=lambda p:p.coords) #all points which could possibly be snapped to
-        objpoints = sorted(svgobject.pointList, key=lambda p:p.coords)
-
-        checkstart = 0
-        for i, point1 in enumerate(objpoints): #vertical sweepline stops at each x-coord of object to be snapped
-            checkpoints = checkpoints[checkstart:] #remove points too far to the left of sweepline
-            if not checkpoints: break
-            try:
-                (tonextx, y) = objpoints[i+1] - point1 #find distance between current and next position of sweepline
-            except IndexError:
-                tonextx = 0
-            checkstart = 0
-            for point2 in checkpoints: #start checking
-                (dx, dy) = point2 - point1
-                if abs(dx) < snapd and abs(dy) < snapd:
-                    d = hypot(dx, dy)
-                    if bestd is None or d < bestd: (bestd, bestdx, bestdy) = (d, dx, dy)
-                if tonextx - dx > snapd: checkstart += 1 #point just checked will be too far to the left when sweepline moves on
-                if dx > snapd: break #point just checked is too far to the right of sweepline - time to move sweepline on
-        if bestd: self.translateObject(svgobject, (bestdx, bestdy))
-
-class Point(object):
-    '''Class to represent coordinates and also give some vector functionality'''
-    def __init__(self, coords):
-        self.coords = list(coords.coords) if isinstance(coords, Point) else list(coords)
+class Point(tuple):
+    '''Class to represent coordinates and also give some vector functionality.
+    A Point is an immutable tuple, so it is compact, and can be used wherever a tuple of coordinates is expected.'''
+    __slots__ = ()
+
+    def __new__(cls, coords):
+        return tuple.__new__(cls, coords)
+
+    @property
+    def coords(self):
+        return self
 
     def __repr__(self):
-        return str(tuple(self.coords))
+        return str(tuple(self))
 
     def __eq__(self, other):
-        if isinstance(other, Point):
-            return (self.coords == other.coords)
-        elif isinstance(other, list):
-            return (self.coords == other)
-        elif isinstance(other, tuple):
-            return (tuple(self.coords) == other)
-        else:
-            return False
+        if isinstance(other, tuple): return tuple.__eq__(self, other)
+        if isinstance(other, list): return tuple.__eq__(self, tuple(other))
+        return False
+
+    def __ne__(self, other):
+        return not self == other
 
-    def __lt__(self, other):
-        return self.coords < other.coords
+    __hash__ = tuple.__hash__
 
     def __add__(self, other):
-        if isinstance(other, Point):
-            return Point([xi+yi for (xi, yi) in zip(self.coords, other.coords)])
-        elif isinstance(other, (list, tuple)):
-            return Point([xi+yi for (xi, yi) in zip(self.coords, other)])
+        if isinstance(other, (list, tuple)):
+            return Point([xi+yi for (xi, yi) in zip(self, other)])
         elif other is None:
             return None
         else:
@@ -1647,31 +1451,22 @@ class Point(object):
     def __radd__(self, other):
         return self + other
 
-    def __iadd__(self, other):
-        if isinstance(other, (list, tuple)):
-            for i in range(len(self.coords)):
-                self.coords[i] += other[i]
-        else:
-            for i in range(len(self.coords)):
-                self.coords[i] += other.coords[i]
-        return self
-
     def __sub__(self, other):
-        return Point([xi-yi for (xi, yi) in zip(self.coords, other.coords)])
+        return Point([xi-yi for (xi, yi) in zip(self, other)])
 
     def __rsub__(self, other):
-        return Point([xi-yi for (xi, yi) in zip(other.coords, self.coords)])
+        return Point([xi-yi for (xi, yi) in zip(other, self)])
 
     def __neg__(self):
-        return Point([-xi for xi in self.coords])
+        return Point([-xi for xi in self])
 
     def __mul__(self, other):
-        if isinstance(other, (int, float)):
-            return Point([other*xi for xi in self.coords])
+        if isinstance(other, Point):
+            return sum([xi*yi for (xi, yi) in zip(self, other)])
+        elif isinstance(other, (int, float)):
+            return Point([other*xi for xi in self])
         elif isinstance(other, (list, tuple)):
-            return Point([xi*yi for (xi, yi) in zip(self.coords, other)])
-        elif isinstance(other, Point):
-            return sum([xi*yi for (xi, yi) in zip(self.coords, other.coords)])
+            return Point([xi*yi for (xi, yi) in zip(self, other)])
         elif isinstance(other, Matrix):
             return Point([self*col for col in other.cols])
         else:
@@ -1679,36 +1474,25 @@ class Point(object):
 
     def __rmul__(self, other):
         if isinstance(other, (int, float)):
-            return Point([other*xi for xi in self.coords])
+            return Point([other*xi for xi in self])
         elif isinstance(other, (list, tuple)):
-           return Point([xi*yi for (xi, yi) in zip(self.coords, other)])
-        elif isinstance(other, Point):
-            return sum([xi*yi for (xi, yi) in zip(self.coords, other.coords)])
+            return Point([xi*yi for (xi, yi) in zip(self, other)])
         else:
             return NotImplemented
 
     def __truediv__(self, other):
-        return Point([xi/other for xi in self.coords])
-
-    def __getitem__(self, i):
-        return self.coords[i]
-
-    def __hash__(self):
-        return hash(tuple(self.coords))
+        return Point([xi/other for xi in self])
 
     def __round__(self, n):
-        (x, y) = self.coords
+        (x, y) = self
         return Point((round(float(x), n), round(float(y), n)))
 
-    def __len__(self):
-        return len(self.coords)
-
     def length(self):
-        (x, y) = self.coords
+        (x, y) = self
         return hypot(x, y)
 
     def angle(self):
-        return atan2(self.coords[1], self.coords[0])
+        return atan2(self[1], self[0])
 
     def anglefrom(self, other):
         dot = other*self
@@ -1718,12 +1502,12 @@ class Point(object):
         return angle
 
     def cross(self, other):
-        x1, y1 = self.coords
-        x2, y2 = other.coords
+        x1, y1 = self
+        x2, y2 = other
         return x1*y2 - y1*x2
 
     def roundsf(self, sf):
-        x, y = self.coords
+        x, y = self
         return Point((roundsf(x, sf), roundsf(y, sf)))
 
 class Matrix(object):
@@ -1745,5 +1529,15 @@ def roundsf(x, sf=3):
     return round(x, sf-int(floor(log10(abs(x))))-1)
 
 shapetypes = {"line":LineObject, "polygon":PolygonObject, "polyline":PolylineObject,
-"rectangle":RectangleObject, "ellipse":EllipseObject, "circle":CircleObject, "sector":SectorObject,
-"bezier":BezierObject, "closedbezier":ClosedBezierObject, "smoothbezier":SmoothBezierObject, "smoothclosedbezier":SmoothClosedBezierObject}
+"rectangle":RectangleObject, "ellipse":EllipseObject, "circle":CircleObject, "sector":SectorObject} #The Bezier shapes are added by dragtools
+
+#The classes and CanvasObject methods used for interactive editing are in dragtools, which is only imported when first needed
+#(by setting mouseMode to DRAG, TRANSFORM or EDIT, or by accessing one of these names).
+DRAGTOOLS = {"UseObject", "ImageObject", "BezierObject", "ClosedBezierObject", "SmoothBezierObject", "SmoothClosedBezierObject",
+             "SmoothBezierMixin", "RegularPolygon", "Button", "ImageButton", "Definitions"}
+
+def __getattr__(name):
+    if name in DRAGTOOLS:
+        from . import dragtools
+        return getattr(dragtools, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
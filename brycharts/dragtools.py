@@ -0,0 +1,587 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2014-2021 Andy Lewis                                          #
+# --------------------------------------------------------------------------- #
+# For details, see the LICENSE file in this repository                        #
+
+#The parts of dragcanvas which are only needed for interactive editing, and which charts never use: Bezier shapes, images,
+#use elements, buttons, and dragging and snapping objects on the canvas. This module is imported by dragcanvas when first needed,
+#so that it is not compiled when the page starts up. It adds its methods to CanvasObject, and its shapes to dragcanvas.shapetypes.
+
+import time
+from browser import document, window
+import browser.svg as svg
+import browser.html as html
+from math import sin, cos, pi, hypot
+from . import dragcanvas
+from .dragcanvas import (getsvgbase, pointsextent, boxextent, ObjectMixin, PolygonObject, RectangleObject, EllipseObject, TextObject,
+    GroupObject, CanvasObject, Point, MOUSEEVENTS, TOUCHEVENTS, shapetypes)
+
+class SmoothBezierMixin(object):
+    '''Extra methods for SmoothBezierObject and SmoothClosedBezierObject.'''
+    def _calculatecontrolpoints(self, points):
+        '''Not intended to be called by end users.'''
+        [(x1, y1), (x2, y2), (x3, y3)] = points
+        (dx1, dy1) = ((x2-x1), (y2-y1))
+        (dx3, dy3) = ((x2-x3), (y2-y3))
+        d1 = hypot(dx1, dy1)
+        d2 = hypot(dx3, dy3)
+        if d1 == 0 or d2 == 0: return ((x2, y2), (x2, y2))
+        cos1, sin1 = dx1/d1, dy1/d1
+        cos2, sin2 = dx3/d2, dy3/d2
+
+        (c1x, c1y) = (x2 - d1*(cos1-cos2)/2, y2 - d1*(sin1-sin2)/2)
+        (c2x, c2y) = (x2 + d2*(cos1-cos2)/2, y2 + d2*(sin1-sin2)/2)
+        c1 = ((c1x+x2)/2, (c1y+y2)/2)
+        c2 = ((c2x+x2)/2, (c2y+y2)/2)
+        return (Point(c1), Point(c2))
+
+class UseObject(svg.use, ObjectMixin):
+    '''Wrapper for SVG `use` element.  Parameters:
+    `href`: the `#id` of the object being cloned
+    EITHER: `origin`: coordinates on the canvas of the point (0,0) of the object being cloned
+    OR: `centre`: coordinates of the centre of the object's bounding box
+    (If both are specified, the `origin` is used.)
+    `width`: required width of the object (before any rotation)
+    `height` required height of the object(before any rotation)
+    (If only one of `width` and `height` is specified, the other will be set so that the object keeps its actual aspect ratio.
+    If neither is specified, the object will be displayed at its actual size.)
+    `angle`: an optional angle of rotation (clockwise, in degrees).'''
+    def __init__(self, href=None, origin=None, centre=(0,0), width=None, height=None, angle=0, scale=None, objid=None):
+        svg.use.__init__(self, href=href)
+        svgbase = getsvgbase()
+        document <= svgbase
+        tempgroup = svg.g() #Needed to overcome bug in iPad getBBox implementation
+        tempgroup <= self
+        svgbase <= tempgroup
+        bbox = tempgroup.getBBox()
+        svgbase.removeChild(tempgroup)
+        document.body.removeChild(svgbase)
+        self._origwidth = bbox.width
+        self._origheight = bbox.height
+        self._origaspectratio = self._origheight/self._origwidth
+        (cx, cy) = (bbox.x+bbox.width/2, bbox.y+bbox.height/2)
+        self.originoffset = Point((-cx, -cy))
+
+        if width and height:
+            (self._width, self._height) = (width, height)
+        elif width:
+            (self._width, self._height) = (width, width*self._origaspectratio)
+        elif height:
+            (self._width, self._height) = (height/self._origaspectratio, height)
+        else:
+            (self._width, self._height) = (self._origwidth, self._origheight)
+        #if self._width != 0: self.currentAspectRatio = self._height/self._width
+
+        if origin:
+            scalefactors = (self._width/self._origwidth, self._height/self._origheight)
+            self.centre = Point(origin) - self.originoffset*scalefactors
+        else:
+            self.centre = Point(centre)
+        self.angle = angle
+        self.setPosition()
+        if objid: self.id = objid
+
+    def setPosition(self, origin=None, centre=None, width=None, height=None, angle=None, preserveaspectratio=False):
+        '''Change the position, size, and/or angle of the object.
+        If both `origin` and `centre`are specified, the `origin` is used.
+        If only one of `width` and `height` is specified, and `preserveaspectratio` is set to `True`,
+        the other will be set so that the object keeps its current aspect ratio.'''
+        if width:
+            self._width = width
+            if preserveaspectratio and not height: self._height = width*self.currentAspectRatio
+        if height:
+            self._height = height
+            if preserveaspectratio and not width: self._width = height/self.currentAspectRatio
+        if self._width != 0: self.currentAspectRatio = self._height/self._width
+
+        if origin:
+            scalefactors = (self._width/self._origwidth, self._height/self._origheight)
+            self.centre = Point(origin) - self.originoffset*scalefactors
+        elif centre:
+            self.centre = Point(centre)
+        if angle is not None: self.angle = angle
+
+        (cx, cy) = self.centre
+        self.pointList = [(cx-self._width/2, cy-self._height/2), (cx+self._width/2, cy+self._height/2)]
+        t = getsvgbase().createSVGTransform()
+        t.setRotate(self.angle, cx, cy)
+        self.pointList = self._transformedpointlist(t.matrix)
+        self._update()
+        self._updatehittarget()
+
+    def _update(self):
+        [(x1, y1), (x2, y2)] = self.pointList
+        (cx, cy) = ((x1+x2)/2, (y1+y2)/2)
+        self.centre = Point((cx, cy))
+        self.rotatestring = f"translate({cx}px,{cy}px) rotate({self.angle}deg) translate({-cx}px,{-cy}px)"
+        (xscale, yscale) = (self._width/self._origwidth, self._height/self._origheight)
+        self.scalestring = f"translate({cx}px,{cy}px) scale({xscale},{yscale}) translate({-cx}px,{-cy}px)"
+        self.style.transform = self.rotatestring + self.scalestring
+        self.origin = self.centre + self.originoffset
+        (self.attrs["x"], self.attrs["y"]) = self.origin
+
+    def getExtent(self, canvas=None):
+        if getattr(self, "centre", None) is None: return None
+        return boxextent(self.centre, self._width, self._height, self.angle)
+
+class ImageObject(svg.image, ObjectMixin):
+    '''Wrapper for SVG `image` element.  Parameters:
+    `href`: the path to the file containing the image
+    EITHER:
+         `pointlist`: a list of coordinates for two opposite vertices  of the box containing the image
+    OR:
+        `centre`: coordinates of the centre of the image
+        `width`: required width of the image (before any rotation)
+        `height` required height of the image (before any rotation)
+    (If only one of `width` and `height` is specified, the other will be set so that the image keeps its actual aspect ratio.
+    If neither is specified, the image will be displayed at its actual size.)
+    `angle`: an optional angle of rotation (clockwise, in degrees). '''
+    def __init__(self, href=None, pointlist=None, centre=(0,0), width=0, height=None, angle=0, objid=None):
+        def initialise(event):
+            nonlocal width, height
+            self.imageWidth = img.naturalWidth
+            self.imageHeight = img.naturalHeight
+            #print("Image size", self.imageWidth, self.imageHeight)
+            self.imageAspectRatio = self.imageHeight/self.imageWidth
+
+            self.attrs["preserveAspectRatio"] = "none"
+            self.angle = angle
+            if pointlist:
+                self.setPointList(pointlist)
+            else:
+                self.centre = Point(centre)
+                if not width and not height:
+                    width = self.imageWidth
+                    height = self.imageHeight
+                elif not height:
+                    height = width*self.imageAspectRatio
+                elif not width:
+                    width = height/self.imageAspectRatio
+                self._width = width
+                self._height = height
+                self._setuppointlist()
+            self.style.visibility = "visible"
+            self.imageloaded = True
+            loadcomplete = window.Event.new("loadcomplete")
+            self.dispatchEvent(loadcomplete)
+
+        super().__init__()
+        if objid: self.id = objid
+        self.imageloaded = False
+        self.style.visibility = "hidden"
+        if not href: return
+        self.attrs["href"] = href
+        img = html.IMG()
+        img.bind("load", initialise)
+        img.attrs["src"] = href
+
+    def setPosition(self, centre=None, width=None, height=None, angle=None, preserveaspectratio=False):
+        '''Change the position, size, and/or angle of the image.
+        If only one of `width` and `height` is specified, and `preserveaspectratio` is set to `True`,
+        the other will be set so that the image keeps its current aspect ratio.'''
+        def set_position(event=None):
+            #print("Starting set_position")
+            if centre: self.centre = Point(centre)
+            if width:
+                self._width = width
+                if preserveaspectratio and not height: self._height = width*self.currentAspectRatio
+            if height:
+                self._height = height
+                if preserveaspectratio and not width: self._width = height/self.currentAspectRatio
+            if angle is not None: self.angle = angle
+            self._setuppointlist()
+
+        if self.imageloaded:
+            set_position()
+        else:
+            self.bind("loadcomplete", set_position)
+
+    def _setuppointlist(self):
+        (cx, cy) = self.centre
+        self.pointList = [(cx-self._width/2, cy-self._height/2), (cx+self._width/2, cy+self._height/2)]
+        t = getsvgbase().createSVGTransform()
+        t.setRotate(self.angle, cx, cy)
+        self.pointList = self._transformedpointlist(t.matrix)
+        self._update()
+        self._updatehittarget()
+
+    def _update(self):
+        [(x1, y1), (x2, y2)] = self.pointList
+        (cx, cy) = ((x1+x2)/2, (y1+y2)/2)
+        self.centre = Point((cx, cy))
+        self.rotatestring = self.style.transform = f"translate({cx}px,{cy}px) rotate({self.angle}deg) translate({-cx}px,{-cy}px)"
+
+        t = getsvgbase().createSVGTransform()
+        t.setRotate(-self.angle, cx, cy)
+        basepointlist = self._transformedpointlist(t.matrix)
+        [(x1, y1), (x2, y2)] = basepointlist
+        self._width = abs(x2-x1)
+        self._height = abs(y2-y1)
+        if self._width != 0: self.currentAspectRatio = self._height/self._width
+        self.attrs["x"] = x2 if x2<x1 else x1
+        self.attrs["y"] = y2 if y2<y1 else y1
+        self.attrs["width"] = self._width
+        self.attrs["height"] = self._height
+
+    def getExtent(self, canvas=None):
+        if getattr(self, "centre", None) is None: return None
+        return boxextent(self.centre, self._width, self._height, self.angle)
+
+class BezierObject(svg.path, ObjectMixin):
+    '''Wrapper for svg path element.  Parameter:
+    EITHER pointlist: a list of coordinates for the vertices (in which case the edges will initially be straight lines)
+    OR  pointsetlist: a list of tuples, each tuple consisting of three points:
+    (previous-control-point, vertex, next-control-point).
+    For the first vertex, the previous-control-point must be None,
+    and for the last vertex, the next-control-point must be None.'''
+    def __init__(self, pointsetlist=None, pointlist=[(0,0), (0,0)], linecolour="black", linewidth=1, fillcolour="none", objid=None):
+        def toPoint(coords):
+            return None if coords is None else Point(coords)
+        svg.path.__init__(self, style={"stroke":linecolour, "stroke-width":linewidth, "fill":fillcolour})
+        if pointsetlist:
+            self.pointList = [Point(pointset[1]) for pointset in pointsetlist]
+        else:
+            self.pointList = [Point(coords) for coords in pointlist]
+            pointsetlist = self._getpointsetlist(self.pointList)
+        self.pointsetList = [[toPoint(coords) for coords in pointset] for pointset in pointsetlist]
+        self._update()
+        if objid: self.id = objid
+
+    def _getpointsetlist(self, pointlist):
+        pointsetlist = [[None, pointlist[0], (pointlist[0]+pointlist[1])/2]]
+        for i in range(1, len(pointlist)-1):
+            pointsetlist.append([(pointlist[i-1]+pointlist[i])/2, pointlist[i], (pointlist[i]+pointlist[i+1])/2])
+        pointsetlist.append([(pointlist[-2]+pointlist[-1])/2, pointlist[-1], None])
+        return pointsetlist
+
+    def _updatepointsetlist(self):
+        if len(self.pointList) == 2:
+            self.pointsetList = [[None]+self.pointList, self.pointList+[None]]
+        else:
+            cpoint = (self.pointList[-1]+self.pointList[-2])/2
+            self.pointsetList[-1] = [cpoint, self.pointList[-1], None]
+            self.pointsetList[-2][2] = cpoint
+
+    def _update(self):
+        (dummy, (x1, y1), (c1x, c1y)) = self.pointsetList[0]
+        ((c2x, c2y), (x2, y2), dummy) = self.pointsetList[-1]
+        self.plist = ["M", x1, y1, "C", c1x, c1y]+[x for p in self.pointsetList[1:-1] for c in p for x in c]+[c2x, c2y, x2, y2]
+        self.attrs["d"] = " ".join(str(x) for x in self.plist)
+
+    def getExtent(self, canvas=None):
+        '''The box containing the vertices and control points (which contains the curve).'''
+        return pointsextent([point for pointset in self.pointsetList for point in pointset if point is not None])
+
+class ClosedBezierObject(BezierObject):
+    '''Wrapper for svg path element.  Parameter:
+    EITHER pointlist: a list of coordinates for the vertices (in which case the edges will initially be stright lines)
+    OR  pointsetlist: a list of tuples, each tuple consisting of three points:
+    (previous-control-point, vertex, next-control-point).
+    The path will be closed (the first vertex does not need to be repeated).'''
+    def __init__(self, pointsetlist=None, pointlist=[(0,0), (0,0)], linecolour="black", linewidth=1, fillcolour="yellow", objid=None):
+        svg.path.__init__(self, style={"stroke":linecolour, "stroke-width":linewidth, "fill":fillcolour})
+        if pointsetlist:
+            self.pointList = [Point(pointset[1]) for pointset in pointsetlist]
+        else:
+            self.pointList = [Point(coords) for coords in pointlist]
+            pointsetlist = self._getpointsetlist(self.pointList)
+        self.pointsetList = [[Point(coords) for coords in pointset] for pointset in pointsetlist]
+        self._update()
+        if objid: self.id = objid
+
+    def _getpointsetlist(self, pointlist):
+        pointsetlist = [[(pointlist[0]+pointlist[-1])/2, pointlist[0], (pointlist[0]+pointlist[1])/2]]
+        for i in range(1, len(pointlist)-1):
+            pointsetlist.append([(pointlist[i-1]+pointlist[i])/2, pointlist[i], (pointlist[i]+pointlist[i+1])/2])
+        pointsetlist.append([(pointlist[-2]+pointlist[-1])/2, pointlist[-1], (pointlist[0]+pointlist[-1])/2])
+        return pointsetlist
+
+    def _updatepointsetlist(self):
+        if len(self.pointList) == 2:
+            self.pointsetList = self._getpointsetlist(self.pointList)
+        else:
+            cpoint1, cpoint2 = (self.pointList[-1]+self.pointList[-2])/2, (self.pointList[-1]+self.pointList[0])/2
+            self.pointsetList[-1] = (cpoint1, self.pointList[-1], cpoint2)
+            self.pointsetList[-2][2] = cpoint1
+            self.pointsetList[0][0] = cpoint2
+
+    def _update(self):
+        ((c1x, c1y), (x, y), (c2x, c2y)) = self.pointsetList[0]
+        self.plist = ["M", x, y, "C", c2x, c2y] + [x for p in self.pointsetList[1:] for c in p for x in c] + [c1x, c1y, x, y]
+        self.attrs["d"] = " ".join(str(x) for x in self.plist)
+
+class SmoothBezierObject(SmoothBezierMixin, BezierObject):
+    '''Wrapper for svg path element.  Parameter:
+    pointlist: a list of vertices.
+    Control points will be calculated automatically so that the curve is smooth at each vertex.'''
+    def __init__(self, pointlist=[(0,0), (0,0)], linecolour="black", linewidth=1, fillcolour="none", objid=None):
+        self.pointList = [Point(coords) for coords in pointlist]
+        pointsetlist = self._getpointsetlist(self.pointList)
+        BezierObject.__init__(self, pointsetlist, linecolour=linecolour, linewidth=linewidth, fillcolour=fillcolour, objid=objid)
+
+    def _getpointsetlist(self, pointlist):
+        if len(pointlist) == 2: return [[None]+pointlist, pointlist+[None]]
+        for i in range(1, len(pointlist)-1):
+            (c1, c2) = self._calculatecontrolpoints(pointlist[i-1:i+2])
+            if i == 1:
+                pointsetlist = [[None, pointlist[0], (pointlist[0]+c1)/2]]
+            pointsetlist.append([c1, pointlist[i], c2])
+        pointsetlist.append([(pointlist[-1]+c2)/2, pointlist[-1], None])
+        return pointsetlist
+
+    def _updatepointsetlist(self):
+        if len(self.pointList) == 2:
+            self.pointsetList = [[None]+self.pointList, self.pointList+[None]]
+        else:
+            (c1, c2) = self._calculatecontrolpoints(self.pointList[-3:])
+            self.pointsetList[-1] = [(self.pointList[-1]+c2)/2, self.pointList[-1], None]
+            self.pointsetList[-2] = [c1, self.pointList[-2], c2]
+
+class SmoothClosedBezierObject(SmoothBezierMixin, ClosedBezierObject):
+    '''Wrapper for svg path element.  Parameter:
+    pointlist: a list of vertices.
+    The path will be closed (the first vertex does not need to be repeated).
+    Control points will be calculated automatically so that the curve is smooth at each vertex.'''
+    def __init__(self, pointlist=[(0,0), (0,0)], linecolour="black", linewidth=1, fillcolour="yellow", objid=None):
+        self.pointList = [Point(coords) for coords in pointlist]
+        pointsetlist = self._getpointsetlist(self.pointList)
+        ClosedBezierObject.__init__(self, pointsetlist, linecolour=linecolour, linewidth=linewidth, fillcolour=fillcolour, objid=objid)
+
+    def _getpointsetlist(self, pointlist):
+        pointlist = [pointlist[-1]]+pointlist[:]+[pointlist[0]]
+        pointsetlist = []
+        for i in range(1, len(pointlist)-1):
+            (c1, c2) = self._calculatecontrolpoints(pointlist[i-1:i+2])
+            pointsetlist.append([c1, pointlist[i], c2])
+        return pointsetlist
+
+    def _updatepointsetlist(self):
+        if len(self.pointList) == 2:
+            self.pointsetList = self._getpointsetlist(self.pointList)
+        else:
+            L = len(self.pointList)
+            pointlist = self.pointList[:]+self.pointList[:2]
+            for j in range(L-2, L+1):
+                (c1, c2) = self._calculatecontrolpoints(pointlist[j-1:j+2])
+                self.pointsetList[j%L] = [c1, pointlist[j], c2]
+
+class RegularPolygon(PolygonObject):
+    '''A regular polygon.  Parameters:
+    sidecount: the number of sides
+    EITHER centre: the centre of the polygon, OR startpoint: the coordinates of a vertex at the top of the polygon
+    EITHER radius: the radius of the polygon, OR sidelength: the length of each side
+    offsetangle: (optional) the angle (in degrees, clockwise) by which the top edge of the polygon is rotated from the horizontal.'''
+    def __init__(self, sidecount=0, centre=None, radius=None, startpoint=None, sidelength=None, offsetangle=0, linecolour="black", linewidth=1, fillcolour="yellow", objid=None):
+        pointlist = []
+        if sidecount>0:
+            angle = 2*pi/sidecount
+            radoffset = offsetangle*pi/180
+            if not radius: radius = sidelength/(2*sin(pi/sidecount))
+            if not centre:
+                (x, y) = startpoint
+                centre = (x-radius*sin(radoffset), y+radius*cos(radoffset))
+            (cx, cy) = centre
+            for i in range(sidecount):
+                t = radoffset+i*angle
+                pointlist.append(Point((cx+radius*sin(t), cy-radius*cos(t))))
+        PolygonObject.__init__(self, pointlist, linecolour, linewidth, fillcolour, objid)
+        if objid: self.id = objid
+
+class Button(GroupObject):
+    '''A clickable button with (multiline) text on it.
+    Parameters:
+    position: coordinates of the top-left of the button
+    size: (width, height) of the button
+    text: text on the button. Use "\n" to insert a new line.
+    onclick: function to be called when the button is clicked
+    fontsize: If this is not specified, the text will be scaled to fit the height (but not width) of the button.
+    fillcolour: background colour of the button. Can be changed after creation using the setFillColour method.
+    canvas: Not used at present'''
+    def __init__(self, position, size, text, onclick, fontsize=None, fillcolour="lightgrey", canvas=None, objid=None):
+        GroupObject.__init__(self)
+        if objid: self.id = objid
+        (x, y), (width, height) = position, size
+        self.button = RectangleObject([(x,y),(x+width, y+height)], fillcolour=fillcolour)
+        self.button.attrs["rx"] = height/3
+        rowcount = text.count("\n") + 1
+        if not fontsize: fontsize = height*0.75/rowcount
+        self.label = TextObject(text,(x+width/2,y+height/2-fontsize/8),anchorposition=5, fontsize=fontsize)
+        self.addObjects([self.button, self.label])
+        self.fixed = True
+        self.bind("mousedown", self._onMouseDown)
+        self.bind("mouseup", self._onMouseUp)
+        self.bind("click", onclick)
+        self.bind("touchstart", onclick)
+        self.attrs["cursor"] = "pointer"
+
+    def _onMouseDown(self, event):
+        event.stopPropagation()
+
+    def _onMouseUp(self, event):
+        event.stopPropagation()
+
+    def setFillColour(self, colour):
+        self.button.style.fill = colour
+
+class ImageButton(GroupObject):
+    '''A clickable button with an SVG image on it. The centre of the image should be at (0,0).
+    For parameters see Button above, except:
+    image: Image on the button. The coordinates of the centre of the image should be at (0,0).
+    canvas: If the canvas is specified, the image will be scaled to fit inside the button.'''
+    def __init__(self, position, size, image, onclick, fontsize=None, fillcolour="lightgrey", canvas=None, objid=None):
+        GroupObject.__init__(self)
+        if objid: self.id = objid
+        (x, y), (width, height) = position, size
+        self.button = RectangleObject([(x,y),(x+width, y+height)], fillcolour=fillcolour)
+        self.button.attrs["rx"] = height/3
+        image.style.transform = f"translate({x+width/2}px,{y+height/2}px)"
+        if canvas:
+            canvas <= image
+            bbox = image.getBBox()
+            canvas.removeChild(image)
+            scalefactor = min(width/bbox.width, height/bbox.height)*0.7
+            image.style.transform += f" scale({scalefactor})"
+        self.addObjects([self.button, image])
+        self.fixed = True
+        self.bind("mousedown", self._onMouseDown)
+        self.bind("mouseup", self._onMouseUp)
+        self.bind("click", onclick)
+        self.bind("touchstart", onclick)
+        self.attrs["cursor"] = "pointer"
+
+    def _onMouseDown(self, event):
+        event.stopPropagation()
+
+    def _onMouseUp(self, event):
+        event.stopPropagation()
+
+    def setFillColour(self, colour):
+        self.button.style.fill = colour
+
+class Definitions(svg.defs):
+    '''Wrapper for SVG `defs` element (mainly for use with `UseObjects`). Parameters:
+    `objlist`: a list of `XxxObjects` in brySVG format.
+    `filename`: a file to be imported, containing shapes defined in standard SVG (not brySVG) format.'''
+    def __init__(self, objlist=[], filename=None):
+        svg.defs.__init__(self)
+        if filename:
+            self.innerHTML = open(filename).read()
+        for obj in objlist: self <= obj
+
+def _createHitTargets(self):
+    objlist = list(self.objectDict.values())
+    for obj in objlist:
+        if isinstance(obj, GroupObject): continue
+        if hasattr(obj, "hitTarget"): continue
+        if hasattr(obj, "reference"): continue # A hitTarget doesn't need its own hitTarget
+        if isinstance(obj, UseObject):
+            newobj = RectangleObject(pointlist=obj.pointList, angle=obj.angle)
+        elif obj.style.fill != "none" or obj.fixed:
+            continue
+        else:
+            newobj = obj.cloneObject()
+            newobj.style.strokeWidth = 10*self.scaleFactor if self.mouseDetected else 25*self.scaleFactor
+        newobj.style.opacity = 0
+        for event in MOUSEEVENTS: newobj.bind(event, self._onHitTargetMouseEvent)
+        for event in TOUCHEVENTS: newobj.bind(event, self._onHitTargetTouchEvent)
+        newobj.reference = obj
+        obj.hitTarget = newobj
+        self.hittargets.append(newobj)
+        #if getattr(obj, "group", None):
+        #    obj.group.addObject(newobj)
+        #else:
+        self.addObject(newobj)
+
+def _onHitTargetMouseEvent(self, event):
+    #The reference's handlers are called directly with the original event, rather than copying it and dispatching a new one
+    obj = self.objectDict[event.target.id]
+    for function in obj.reference.events(event.type):
+        function(event)
+
+def _onHitTargetTouchEvent(self, event):
+    obj = self.objectDict[event.target.id]
+    for function in obj.reference.events(event.type):
+        function(event)
+    latesttime = time.time()
+    if event.type == "touchend" and latesttime - dragcanvas.lasttaptime < 0.6:
+        touch = event.changedTouches[0]
+        eventdict = {"bubbles":False, "clientX":touch.clientX, "clientY":touch.clientY, "screenX":touch.screenX, "screenY":touch.screenY}
+        newevent = window.MouseEvent.new("click", eventdict)
+        obj.reference.dispatchEvent(newevent)
+
+def _prepareDrag(self, event):
+    self.dragStartCoords = self.getSVGcoords(event)
+    self.selectedObject = self.getSelectedObject(event.target.id)
+    if self.selectedObject and not self.selectedObject.fixed:
+        self.mouseOwner = self.selectedObject
+        self <= self.mouseOwner
+        if (hittarget := getattr(self.mouseOwner, "hitTarget", None)): self <= hittarget
+        self.startx = event.targetTouches[0].clientX if "touch" in event.type else event.clientX
+        self.starty = event.targetTouches[0].clientY if "touch" in event.type else event.clientY
+
+def _doDrag(self, event):
+    x = event.targetTouches[0].clientX if "touch" in event.type else event.clientX
+    y = event.targetTouches[0].clientY if "touch" in event.type else event.clientY
+    dx, dy = (x-self.startx)*self.scaleFactor, (y-self.starty)*self.scaleFactor
+    self.mouseOwner.style.transform = f"translate({dx}px,{dy}px)"
+    if isinstance(self.mouseOwner, [EllipseObject, RectangleObject, UseObject, ImageObject]):
+        self.mouseOwner.style.transform += self.mouseOwner.rotatestring
+        if isinstance(self.mouseOwner, UseObject): self.mouseOwner.style.transform += self.mouseOwner.scalestring
+
+def _endDrag(self, event):
+    self.mouseOwner.style.transform = "translate(0px,0px)"
+    currentcoords = self.getSVGcoords(event)
+    offset = currentcoords - self.dragStartCoords
+    self.translateObject(self.mouseOwner, offset)
+    if self.edgeSnap: self._doEdgeSnap(self.mouseOwner)
+    elif self.vertexSnap: self._doVertexSnap(self.mouseOwner)
+    self.mouseOwner = None
+
+def _doVertexSnap(self, svgobject, checkpoints=None):
+    if not hasattr(svgobject, "pointList"): return
+    snapd = self.snapDistance
+    bestdx = bestdy = bestd = None
+    bbox = svgobject.getBBox()
+    L, R, T, B = bbox.x, bbox.x+bbox.width, bbox.y, bbox.y+bbox.height
+
+    if checkpoints is None:
+        checkpoints = []
+        for objid in self.objectDict:
+            if objid == svgobject.id: continue
+            obj = self.objectDict[objid]
+            if not hasattr(obj, "pointList"): continue
+            if hasattr(obj, "reference"): continue
+            if obj.style.visibility == "hidden": continue
+            if objgroup := getattr(obj, "group", None) and hasattr(objgroup, "pointList") : continue
+            bbox = obj.getBBox()
+            L1, R1, T1, B1 = bbox.x, bbox.x+bbox.width, bbox.y, bbox.y+bbox.height
+            if L1-R > snapd or R1-L < -snapd or T1-B > snapd or B1-T < -snapd: continue
+            checkpoints.extend(obj.pointList)
+    if not checkpoints: return
+    checkpoints.sort(key=lambda p:p.coords) #all points which could possibly be snapped to
+    objpoints = sorted(svgobject.pointList, key=lambda p:p.coords)
+
+    checkstart = 0
+    for i, point1 in enumerate(objpoints): #vertical sweepline stops at each x-coord of object to be snapped
+        checkpoints = checkpoints[checkstart:] #remove points too far to the left of sweepline
+        if not checkpoints: break
+        try:
+            (tonextx, y) = objpoints[i+1] - point1 #find distance between current and next position of sweepline
+        except IndexError:
+            tonextx = 0
+        checkstart = 0
+        for point2 in checkpoints: #start checking
+            (dx, dy) = point2 - point1
+            if abs(dx) < snapd and abs(dy) < snapd:
+                d = hypot(dx, dy)
+                if bestd is None or d < bestd: (bestd, bestdx, bestdy) = (d, dx, dy)
+            if tonextx - dx > snapd: checkstart += 1 #point just checked will be too far to the left when sweepline moves on
+            if dx > snapd: break #point just checked is too far to the right of sweepline - time to move sweepline on
+    if bestd: self.translateObject(svgobject, (bestdx, bestdy))
+
+shapetypes.update({"bezier":BezierObject, "closedbezier":ClosedBezierObject, "smoothbezier":SmoothBezierObject, "smoothclosedbezier":SmoothClosedBezierObject})
+
+for function in [_createHitTargets, _onHitTargetMouseEvent, _onHitTargetTouchEvent, _prepareDrag, _doDrag, _endDrag, _doVertexSnap]:
+    setattr(CanvasObject, function.__name__, function)
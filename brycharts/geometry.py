@@ -0,0 +1,107 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 1997-2021 Andy Lewis                                          #
+# --------------------------------------------------------------------------- #
+# For details, see the LICENSE file in this repository                        #
+
+#The geometry of the marks of the charts, calculated separately from the DOM, so that it can also be done in a web worker.
+#This module does not use the browser.
+
+from math import pi, exp, isfinite, ceil, log10
+from .scales import BARUNIT
+
+PIXELPRECISION = 0.01 #By default, coordinates are written accurate to this fraction of a CSS pixel (see coorddecimals)
+
+def coorddecimals(xscalefactor, yscalefactor, precision=None):
+    '''The number of decimal places for the coordinates of a canvas with these scale factors (in units per pixel): `precision` if
+    this is given, or otherwise enough places for the coordinates to be accurate to PIXELPRECISION of a pixel.
+    The finer of the two scales is used for both x and y, since each coordinate pair is written with one number of places,
+    so on a canvas whose x and y scales are very different, the coarser axis is written to more places than it needs.'''
+    if precision is not None: return precision
+    unit = min(abs(xscalefactor), abs(yscalefactor))*PIXELPRECISION
+    return ceil(-log10(unit)) if unit > 0 else None
+
+def formatcoord(x, decimals=None):
+    '''The coordinate `x` as written in an SVG attribute: rounded to `decimals` places (unless this is None),
+    and without a trailing ".0". `decimals` may be negative (eg -3 rounds to the nearest 1000). Infinite and NaN values
+    are written as they are.'''
+    if decimals is None or not isfinite(x): return str(x)
+    x = round(x, decimals)
+    return str(int(x)) if x == int(x) else str(x)
+
+def pointsattribute(coordslist, decimals=None):
+    '''The `points` attribute of a polyline through `coordslist`, with the coordinates rounded to `decimals` places.'''
+    if decimals is None: return " ".join(f"{x},{y}" for (x, y) in coordslist)
+    return " ".join(f"{formatcoord(x, decimals)},{formatcoord(y, decimals)}" for (x, y) in coordslist)
+
+def segmentspath(segments, decimals=None):
+    '''The `d` attribute of a path consisting of separate straight `segments`, each given as ((x1, y1), (x2, y2)).'''
+    c = lambda v: formatcoord(v, decimals)
+    return " ".join(f"M{c(x1)} {c(y1)}L{c(x2)} {c(y2)}" for ((x1, y1), (x2, y2)) in segments)
+
+def scaleddecimals(decimals):
+    '''The decimal places for the coordinates of a text drawn at a constant size (see `scaletransform`), given the `decimals` of
+    its canvas. Its offsets from its anchor point are in pixels, so they are kept accurate to PIXELPRECISION of a pixel.'''
+    return None if decimals is None else max(decimals, ceil(-log10(PIXELPRECISION)))
+
+def scaletransform(anchorpoint, xscalefactor, yscalefactor, decimals=None):
+    '''The `transform` attribute which draws an object on an axes canvas at a constant size, scaling it about `anchorpoint`.
+    The scale factors are written at full precision, since they multiply the sizes of the objects.'''
+    (x, y) = anchorpoint
+    c = lambda v: formatcoord(v, decimals)
+    return f"translate({c(x)},{c(y)}) scale({xscalefactor},{-yscalefactor}) translate({c(-x)},{c(-y)})"
+
+def polylinegeometry(coordslist, decimals=None):
+    '''Returns {"points": the `points` attribute, "extent": [x1, y1, x2, y2]} for a polyline through `coordslist`.'''
+    xvalues = [x for (x, y) in coordslist]
+    yvalues = [y for (x, y) in coordslist]
+    return {"points":pointsattribute(coordslist, decimals), "extent":[min(xvalues), min(yvalues), max(xvalues), max(yvalues)]}
+
+def barrects(data, graphtype=None, index=None, key=None, direction="vertical"):
+    '''Returns a list of (pointlist, tooltiptext) for the bars of a bar chart (see `Bars`).'''
+    if graphtype == "stacked":
+        barminvalues = [sums[index] for sums in data.sums.values()]
+        barmaxvalues = [sums[index+1] for sums in data.sums.values()]
+        barwidth = 0.8*BARUNIT
+        offset = 0.2*BARUNIT
+    elif graphtype == "grouped":
+        barminvalues = [0]*len(data.labels)
+        barmaxvalues = [values[index] for values in data.Values.values()]
+        barwidth = 0.8*BARUNIT/len(data)
+        offset = 0.2*BARUNIT+barwidth*index
+    else:
+        barminvalues = [0]*len(data)
+        barmaxvalues = data.Values
+        barwidth = 0.8*BARUNIT
+        offset = 0.2*BARUNIT
+
+    rects = []
+    for i, label in enumerate(data.labels):
+        [barstart, barend] = [i*BARUNIT+offset, i*BARUNIT+offset+barwidth]
+        value = data.Values[label][index] if key else data.Values[i]
+        if value > 0:
+            pointlist = [(barstart, barmaxvalues[i]), (barend,barminvalues[i])]
+            if direction == "horizontal": pointlist = [(y, x) for (x, y) in pointlist]
+            rects.append((pointlist, f"{key}\n{value}" if key else f"{value}"))
+    return rects
+
+def histogramrects(gfd):
+    '''Returns a list of (pointlist, tooltiptext) for the bars of a histogram of the `GroupedFrequencyData` gfd.'''
+    rects = []
+    for i in range(len(gfd)-1):
+        [barleft, barright] = gfd.boundaries[i:i+2]
+        tooltiptext = f"{barleft}≤x<{barright}\nFrequency: {gfd.frequencies[i]}\nFrequency Density: {gfd.frequencyDensities[i]}"
+        rects.append(([(barleft, gfd.frequencyDensities[i]), (barright, 0)], tooltiptext))
+    return rects
+
+def normalcurve(gfd, steps=200):
+    '''Returns the points of the normal curve fitted to the `GroupedFrequencyData` gfd, and its mean and variance.'''
+    m = gfd.mean()
+    v = gfd.variance()
+    s = v**0.5
+    k = sum(gfd.frequencies)/(s*(2*pi)**0.5)
+    x0 = gfd.xMin
+    dx = (gfd.xMax - x0)/steps
+    points = [(x0+i*dx, k*exp(-0.5*(((x0+i*dx)-m)/s)**2)) for i in range(steps+1)]
+    return (points, m, v)
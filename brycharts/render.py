@@ -0,0 +1,129 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 1997-2021 Andy Lewis                                          #
+# --------------------------------------------------------------------------- #
+# For details, see the LICENSE file in this repository                        #
+
+#Batch rendering of charts to SVG files, using the headless charts in svgrender.
+#Usage:
+#   python -m brycharts.render specs.json [more.json ...] [-o OUTDIR] [-j JOBS] [--force]
+#Each spec file contains a chart spec, or a list of them. A spec looks like this:
+#   {"chart": "BarChart",
+#    "data": {"type": "LabelledData", "data": {"Cats": 3, "Dogs": 5}, "valueslabel": "Number"},
+#    "options": {"title": "Pets", "width": 600, "height": 400},
+#    "output": "pets.svg"}
+#The "data" items other than "type" are passed as keyword arguments to the data structure. For the TimeSeries
+#structures, x values may be ISO format strings. If "output" is omitted, the file is named after the spec file.
+#A hash of the spec is written into each SVG file, and specs whose output already contains the same hash are skipped.
+
+import os, json, time, hashlib, argparse
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from . import svgrender
+from . import datastructures
+from .timeclasses import TimeCoord
+
+HASHPREFIX = "<!-- brycharts-hash: "
+PHASES = ["data", "layout", "serialise", "write"]
+
+def spechash(spec):
+    return hashlib.sha256(json.dumps(spec, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+def storedhash(filename):
+    try:
+        with open(filename, encoding="utf-8") as svgfile:
+            firstline = svgfile.readline()
+    except OSError:
+        return None
+    return firstline[len(HASHPREFIX):len(HASHPREFIX)+64] if firstline.startswith(HASHPREFIX) else None
+
+def totime(x):
+    return datetime.fromisoformat(x) if isinstance(x, str) else x
+
+def makedata(dataspec):
+    '''Builds the data structure described by `dataspec` (a dict with a "type" and the keyword arguments).'''
+    kwargs = dict(dataspec)
+    datatype = kwargs.pop("type")
+    if datatype == "TimeSeriesData":
+        TimeCoord.startfloat = 0 #So that each chart is scaled to its own time range
+        kwargs["data"] = [(totime(x), y) for (x, y) in kwargs["data"]]
+    elif datatype == "TimeSeriesDataDict":
+        kwargs["datadict"] = {key:[(totime(x), y) for (x, y) in data] for (key, data) in kwargs["datadict"].items()}
+    return getattr(datastructures, datatype)(**kwargs)
+
+def renderspec(job):
+    '''Renders one spec to its output file, and returns the time taken by each phase.'''
+    (spec, filename, hashvalue) = job
+    timings = []
+    starttime = time.perf_counter()
+    data = makedata(spec["data"])
+    timings.append(time.perf_counter())
+    chart = getattr(svgrender, spec["chart"])(data, **spec.get("options", {}))
+    timings.append(time.perf_counter())
+    svgstring = chart.toSVG()
+    timings.append(time.perf_counter())
+    with open(filename, "w", encoding="utf-8") as svgfile:
+        svgfile.write(f"{HASHPREFIX}{hashvalue} -->\n{svgstring}")
+    timings.append(time.perf_counter())
+    return [end-start for (start, end) in zip([starttime]+timings, timings)]
+
+def loadspecs(specfiles, outdir):
+    '''Returns a list of (spec, output filename, hash) for all the specs in `specfiles`.'''
+    jobs = []
+    for specfile in specfiles:
+        with open(specfile, encoding="utf-8") as infile:
+            specs = json.load(infile)
+        if isinstance(specs, dict): specs = [specs]
+        stem = os.path.splitext(os.path.basename(specfile))[0]
+        for (i, spec) in enumerate(specs):
+            output = spec.get("output", f"{stem}.svg" if len(specs) == 1 else f"{stem}-{i}.svg")
+            jobs.append((spec, os.path.join(outdir, output), spechash(spec)))
+    return jobs
+
+def render(specfiles, outdir=".", jobs=None, force=False, report=print):
+    '''Renders all the specs in `specfiles` to SVG files in `outdir`, using `jobs` processes (default: one per core).
+    Returns a dict of statistics: counts, and total time in each phase.'''
+    stats = {"specs":0, "skipped":0, "rendered":0}
+    phasetimes = dict.fromkeys(["load", "hash check"]+PHASES, 0.0)
+    starttime = time.perf_counter()
+    alljobs = loadspecs(specfiles, outdir)
+    checktime = time.perf_counter()
+    phasetimes["load"] = checktime-starttime
+    todo = alljobs if force else [job for job in alljobs if storedhash(job[1]) != job[2]]
+    for directory in {os.path.dirname(job[1]) for job in todo}:
+        if directory: os.makedirs(directory, exist_ok=True)
+    rendertime = time.perf_counter()
+    phasetimes["hash check"] = rendertime-checktime
+    stats["specs"], stats["skipped"] = len(alljobs), len(alljobs)-len(todo)
+    if todo:
+        workers = jobs or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(todo)//(4*workers))
+            for timings in executor.map(renderspec, todo, chunksize=chunksize):
+                for (phase, t) in zip(PHASES, timings): phasetimes[phase] += t
+                stats["rendered"] += 1
+    endtime = time.perf_counter()
+    stats["render wall time"] = endtime-rendertime
+    stats["total time"] = endtime-starttime
+    stats["phases"] = phasetimes
+    if report:
+        throughput = stats["rendered"]/stats["render wall time"] if stats["rendered"] else 0
+        report(f"{stats['specs']} specs: {stats['rendered']} rendered, {stats['skipped']} skipped (unchanged) "
+               f"in {stats['total time']:.2f}s ({throughput:.1f} charts/s)")
+        report("Time per phase (data to write are summed across processes):")
+        for (phase, t) in phasetimes.items():
+            report(f"  {phase:<12}{t:9.3f}s")
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m brycharts.render", description="Render JSON chart specs to SVG files.")
+    parser.add_argument("specfiles", nargs="+", help="JSON files containing a chart spec or a list of chart specs")
+    parser.add_argument("-o", "--outdir", default=".", help="directory for the SVG files (default: current directory)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of worker processes (default: one per core)")
+    parser.add_argument("--force", action="store_true", help="render all specs, even if the output is up to date")
+    args = parser.parse_args(argv)
+    render(args.specfiles, args.outdir, args.jobs, args.force)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 1997-2021 Andy Lewis                                          #
+# --------------------------------------------------------------------------- #
+# For details, see the LICENSE file in this repository                        #
+
+#Calculation of axis scales, and other settings shared by all the charts.
+#This module does not use the browser, so it can also be used with the headless renderer in svgrender.
+
+from math import log10, floor, ceil
+from .timeclasses import *
+
+DEFAULT_COLOURS = [f"hsl({a%360+22.5*(a//1080)},{(3-a//810)*100//3}%, 50%)" for a in range(0,2160,135)]
+BARUNIT = 10
+AXESSTYLES = { #The CSS classes of the parts of an AxesCanvas, which are set once for the canvas (see dragcanvas.CanvasObject.setClassStyles)
+    "axis-line": {"stroke":"black", "stroke-width":1, "fill":"none", "vector-effect":"non-scaling-stroke"},
+    "ticks": {"stroke":"black", "stroke-width":1, "fill":"none", "vector-effect":"non-scaling-stroke"},
+    "major-grid": {"stroke":"grey", "stroke-dasharray":"10,5", "stroke-width":1, "fill":"none", "vector-effect":"non-scaling-stroke"},
+    "minor-grid": {"stroke":"lightgrey", "stroke-dasharray":"2,2", "stroke-width":1, "fill":"none", "vector-effect":"non-scaling-stroke"},
+    "bar": {"stroke":"black", "stroke-width":1, "vector-effect":"non-scaling-stroke"},
+    "data-point": {"stroke":"#00000000", "stroke-width":5, "vector-effect":"non-scaling-stroke"},
+    }
+
+def seriesstyles(colours, linewidth=2):
+    '''The styles of the CSS classes "series-0", "series-1", ... for the lines and data points drawn in each of `colours`.'''
+    styles = {}
+    for (i, colour) in enumerate(colours):
+        styles[f"series-{i}"] = {"stroke":colour, "stroke-width":linewidth, "fill":"none"}
+        styles[f"data-point.series-{i}"] = dict(AXESSTYLES["data-point"], fill=colour)
+    return styles
+
+
+def rounddown (x, n):
+    return floor(x/n) * n
+
+def roundup (x, n):
+    return ceil(x/n) * n
+
+def getscaleintervals (xmin, xmax, mindivs):
+    interval = xmax - xmin
+    if interval == 0: return 1, 1, 1
+    if mindivs < 2: return interval, interval, interval
+    X = interval/(mindivs - 1)
+    L = 10**floor(log10(X))
+    xx = X / L
+    Y = 1 if xx<=2 else 2 if xx<=5 else 5 if xx<=10 else 10
+    scaleinterval = Y * L
+    if Y  in {1, 2, 10}:
+        majordivisor, minordivisor = 2, 5
+    elif Y == 5:
+        majordivisor, minordivisor = 1, 5
+    return scaleinterval, majordivisor, minordivisor
+
+class Axis(object):
+    def __init__(self, minvalue, maxvalue, label="", axisoptions={}):
+        defaults = {"showAxis":True, "axisType":"float", "showArrow":False, "fontSize":12,
+                    "showScale":True, "scaleInterval":None, "majorDivisor":None, "minorDivisor":None,
+                    "showMajorTicks":True, "showMinorTicks":True, "showMajorGrid":True, "showMinorGrid":False}
+        self.label = label
+        defaults.update(axisoptions)
+        for argname, value in defaults.items():
+            setattr(self, argname, value)
+        self.setRange(minvalue, maxvalue)
+
+    def setRange(self, minvalue, maxvalue):
+        '''Sets the scale intervals for the range from minvalue to maxvalue, and extends the range to whole scale intervals.'''
+        self.calculateDefaultTicks(minvalue, maxvalue, 5)
+        self.min = roundtimedown(minvalue, self.scaleInterval) if self.axisType == "time" else rounddown(minvalue, self.scaleInterval)
+        self.max = roundtimeup(maxvalue, self.scaleInterval) if self.axisType == "time" else roundup(maxvalue, self.scaleInterval)
+
+    def calculateDefaultTicks(self, minvalue, maxvalue, mindivs):
+        if self.axisType == "time":
+            self.scaleInterval, self.majorDivisor, self.minorDivisor = gettimescaleintervals(minvalue, maxvalue, mindivs)
+        else:
+            self.scaleInterval, self.majorDivisor, self.minorDivisor = getscaleintervals(minvalue, maxvalue, mindivs)
+        #print(self.scaleInterval, self.majorTickInterval, self.minorTickInterval)
+
+def tickvalues(axis, origin, vmin, vmax, intervals=None):
+    '''Sets `axis.majorTickValues` and `axis.minorTickValues` to the ticks of `axis` between `vmin` and `vmax`, counted from `origin`.
+    `intervals` is (scale interval, major divisor, minor divisor), by default those of the axis.
+    Minor ticks which would be too close together to be seen are left out.'''
+    (scaleinterval, majordivisor, minordivisor) = intervals or (axis.scaleInterval, axis.majorDivisor, axis.minorDivisor)
+    majorinterval = float(scaleinterval)/majordivisor
+    minorinterval = majorinterval/minordivisor
+    first = ceil(round((vmin-origin)/minorinterval, 6))
+    last = floor(round((vmax-origin)/minorinterval, 6))
+    ticks = [(i, origin+i*minorinterval) for i in range(first, last+1)]
+    axismax = float(axis.max)
+    axis.majorTickValues = [v for (i, v) in ticks if i%minordivisor == 0 and not (axis.showArrow and v > axismax-minorinterval/2)]
+    axis.minorTickValues = [v for (i, v) in ticks if i%minordivisor != 0] if minorinterval > 0.5*axis.arrowLength else []
+
+def scalevalues(axis, start, end, scaleinterval=None):
+    '''Returns a list of (value, string) for the scale of `axis`, from `start` to `end` in steps of `scaleinterval`
+    (by default `axis.scaleInterval`).'''
+    if scaleinterval is None: scaleinterval = axis.scaleInterval
+    values = []
+    v = start
+    while v <= end:
+        v1 = float(v)
+        if v1 != axis.omitScale:
+            n = int(1-log10(scaleinterval))
+            scalestring=str(v) if axis.axisType=="time" else str(int(v)) if int(v) == v else f"{v:.{n}f}"
+            values.append((v1, scalestring))
+        v += scaleinterval
+    return values
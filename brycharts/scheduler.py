@@ -0,0 +1,104 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 1997-2021 Andy Lewis                                          #
+# --------------------------------------------------------------------------- #
+# For details, see the LICENSE file in this repository                        #
+
+#Cooperative scheduling of chart construction, so that building large charts does not block the page.
+#A chart created with sliced=True is built by a generator (its constructor), one step at a time. The steps of all such charts
+#are run by `chartscheduler` for up to `budget` ms per animation frame, or in idle time if none of the charts is in view.
+#A step which needs a result from elsewhere (eg a web worker) yields a `Pending`, and the chart is resumed once this is resolved.
+#If the Pending is rejected instead, the chart is dropped and the error is raised.
+#Charts which are destroyed before they have been built are dropped.
+
+from browser import window
+
+class Pending(object):
+    '''A result which a construction step is waiting for. Pass `resolve` as the callback which receives the result,
+    and `reject` as the one which receives an error.'''
+    def __init__(self):
+        self.done = False
+        self.result = None
+        self.error = None
+
+    def resolve(self, result):
+        (self.done, self.result) = (True, result)
+        chartscheduler._schedule()
+
+    def reject(self, error):
+        (self.done, self.error) = (True, error)
+        chartscheduler._schedule()
+
+class ChartTask(object):
+    def __init__(self, chart, steps, onready):
+        (self.chart, self.steps, self.onready) = (chart, steps, onready)
+        self.visible = True
+        self.observer = None
+        self.waiting = None
+
+class Scheduler(object):
+    '''Runs the construction of charts in steps, giving priority to charts which are in view.'''
+    def __init__(self, budget=8):
+        self.budget = budget
+        self.tasks = []
+        self.pending = False
+
+    def add(self, chart, steps, onready=None):
+        '''Schedules the generator `steps`, which builds `chart`. `onready(chart)` is called when it has finished.'''
+        task = ChartTask(chart, steps, onready)
+        if hasattr(window, "IntersectionObserver"):
+            def onintersect(entries, observer):
+                for entry in entries: task.visible = entry.isIntersecting
+            task.observer = window.IntersectionObserver.new(onintersect)
+            task.observer.observe(chart)
+        self.tasks.append(task)
+        self._schedule()
+
+    def _runnable(self):
+        for task in [task for task in self.tasks if getattr(task.chart, "destroyed", False)]: self._finish(task)
+        return [task for task in self.tasks if task.waiting is None or task.waiting.done]
+
+    def _schedule(self):
+        runnable = self._runnable()
+        if self.pending or not runnable: return
+        self.pending = True
+        if any(task.visible for task in runnable) or not hasattr(window, "requestIdleCallback"):
+            window.requestAnimationFrame(self._runFrame)
+        else:
+            window.requestIdleCallback(self._runIdle)
+
+    def _runFrame(self, timestamp):
+        self._run(self.budget)
+
+    def _runIdle(self, deadline):
+        self._run(deadline.timeRemaining())
+
+    def _run(self, budget):
+        self.pending = False
+        endtime = window.performance.now() + budget
+        try:
+            while window.performance.now() < endtime:
+                runnable = self._runnable()
+                if not runnable: break
+                task = next((task for task in runnable if task.visible), runnable[0])
+                if task.waiting is not None and task.waiting.error is not None:
+                    self._finish(task)
+                    raise RuntimeError(f"building {task.chart.id} failed: {task.waiting.error}")
+                try:
+                    step = next(task.steps)
+                    task.waiting = step if isinstance(step, Pending) else None
+                except StopIteration:
+                    self._finish(task)
+                    if task.onready: task.onready(task.chart)
+                except Exception:
+                    self._finish(task)
+                    raise
+        finally:
+            self._schedule()
+
+    def _finish(self, task):
+        self.tasks.remove(task)
+        if task.observer: task.observer.disconnect()
+
+chartscheduler = Scheduler()
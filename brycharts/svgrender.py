@@ -0,0 +1,544 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 1997-2021 Andy Lewis                                          #
+# --------------------------------------------------------------------------- #
+# For details, see the LICENSE file in this repository                        #
+
+#Headless versions of the charts, which are built as SVG strings in plain Python, without a browser or DOM.
+#They take the same data structures and options as the charts in brycharts.py (except that there is no `parent`,
+#and `width` and `height` must be numbers of pixels). Anything which the browser versions measure in the DOM
+#(getBBox etc) is calculated here from the geometry of the shapes and from the font metrics in textmetrics.
+#The geometry, ticks, CSS classes and coordinate precision are shared with the browser versions (see scales and geometry).
+#Example:
+#   from brycharts import FrequencyData, svgrender
+#   svgrender.PieChart(FrequencyData(rawdata=list("HELLOWORLD"))).save("hello.svg")
+
+from math import sin, cos, pi
+from html import escape
+from hashlib import md5
+from .datastructures import *
+from .statfns import regressioninfo
+from .scales import Axis, DEFAULT_COLOURS, BARUNIT, AXESSTYLES, seriesstyles, tickvalues, scalevalues
+from .textmetrics import wraplines, textextent
+from .geometry import barrects, histogramrects, normalcurve, formatcoord, pointsattribute, segmentspath, scaletransform, scaleddecimals, coorddecimals
+
+COORDINATES = {"x", "y", "x1", "y1", "x2", "y2", "cx", "cy", "rx", "ry", "width", "height"} #Attributes written to the decimals of the canvas
+
+def num(x):
+    return str(x) if isinstance(x, int) else str(float(x))
+
+def attrvalue(key, value, decimals):
+    if callable(value): return value(decimals)
+    if key in COORDINATES: return formatcoord(value, decimals)
+    return num(value) if isinstance(value, (int, float)) else escape(str(value))
+
+def attrstring(attrs, style=None, decimals=None):
+    '''The attributes and inline style of an element. Coordinates are written to `decimals` places, and a value may also be
+    a function of `decimals` (eg the `d` of a path), which is only called when the chart is written.'''
+    items = [f'{key}="{attrvalue(key, value, decimals)}"' for (key, value) in attrs.items()]
+    if style: items.append('style="' + ";".join(f"{key}:{value}" for (key, value) in style.items()) + '"')
+    return " ".join(items)
+
+def cssidentifier(name):
+    '''`name` escaped for use in a CSS selector, like CSS.escape in the browser.'''
+    name = "".join(ch if ch.isalnum() or ch in "-_" else "\\"+ch for ch in name)
+    return f"\\3{name[0]} {name[1:]}" if name[:1].isdigit() else name
+
+def linestyle(linecolour, linewidth, dasharray=None):
+    style = {"stroke":linecolour, "stroke-width":linewidth, "fill":"none"}
+    if dasharray: style["stroke-dasharray"] = dasharray
+    return style
+
+class Shape(object):
+    '''Any SVG element whose bounding box is given by its `points`. If `classname` is given, the element is styled by this
+    CSS class (see `SVGCanvas.setClassStyles`), and `style` only gives any properties of its own (eg the fill of a bar).'''
+    def __init__(self, tag, attrs, points, style=None, classname=None):
+        self.tag = tag
+        self.attrs = attrs
+        self.points = points
+        self.style = style
+        if classname: self.attrs["class"] = classname
+
+    def bbox(self, canvas):
+        xvalues = [float(x) for (x, y) in self.points]
+        yvalues = [float(y) for (x, y) in self.points]
+        return (min(xvalues), min(yvalues), max(xvalues), max(yvalues))
+
+    def toSVG(self, canvas):
+        return f"<{self.tag} {attrstring(self.attrs, self.style, canvas.decimals)}/>"
+
+def Line(pointlist, linecolour="black", linewidth=1, dasharray=None, classname=None):
+    [(x1, y1), (x2, y2)] = pointlist
+    style = None if classname else linestyle(linecolour, linewidth, dasharray)
+    return Shape("line", {"x1":x1, "y1":y1, "x2":x2, "y2":y2}, pointlist, style, classname)
+
+def Segments(segments, linecolour="black", linewidth=1, dasharray=None, classname=None):
+    '''Separate straight lines, each given as ((x1, y1), (x2, y2)), drawn as one path.'''
+    style = None if classname else linestyle(linecolour, linewidth, dasharray)
+    points = [point for segment in segments for point in segment]
+    return Shape("path", {"d":lambda decimals: segmentspath(segments, decimals)}, points, style, classname)
+
+def Polyline(pointlist, linecolour="black", linewidth=1, classname=None):
+    style = None if classname else linestyle(linecolour, linewidth)
+    return Shape("polyline", {"points":lambda decimals: pointsattribute(pointlist, decimals)}, pointlist, style, classname)
+
+def Rectangle(pointlist, fillcolour="yellow", linecolour="black", classname=None):
+    [(x1, y1), (x2, y2)] = pointlist
+    attrs = {"x":min(x1, x2), "y":min(y1, y2), "width":abs(x2-x1), "height":abs(y2-y1)}
+    style = {"fill":fillcolour} if classname else {"stroke":linecolour, "stroke-width":1, "fill":fillcolour}
+    return Shape("rect", attrs, pointlist, style, classname)
+
+def Ellipse(pointlist, fillcolour="yellow"):
+    [(x1, y1), (x2, y2)] = pointlist
+    attrs = {"cx":(x1+x2)/2, "cy":(y1+y2)/2, "rx":abs(x2-x1)/2, "ry":abs(y2-y1)/2}
+    return Shape("ellipse", attrs, pointlist, {"stroke":"black", "stroke-width":1, "fill":fillcolour})
+
+def Sector(centre, radius, startangle, endangle, fillcolour="yellow"):
+    (cx, cy) = centre
+    def pointat(angle):
+        return (cx+radius*sin(angle*pi/180), cy-radius*cos(angle*pi/180))
+    (x1, y1), (x2, y2) = pointat(startangle), pointat(endangle)
+    largearcflag = 1 if (endangle - startangle) % 360 > 180 else 0
+    def d(decimals):
+        c = lambda v: formatcoord(v, decimals)
+        return f"M {c(cx)} {c(cy)} L {c(x1)} {c(y1)} A {c(radius)} {c(radius)} 0 {largearcflag} 1 {c(x2)} {c(y2)} Z"
+    points = [centre, (x1, y1), (x2, y2)] + [pointat(a) for a in range(0, 360, 90) if startangle < a < endangle]
+    return Shape("path", {"d":d}, points, {"stroke":"black", "stroke-width":1, "fill":fillcolour})
+
+class ScaledPoint(Shape):
+    '''A point on an axes chart, which stays circular whatever the scaling of the axes.
+    It is coloured by the CSS class `classname` of its series (see `seriesclasses`).'''
+    def __init__(self, XY, classname="series-0"):
+        (x, y) = XY
+        super().__init__("circle", {"cx":x, "cy":y, "r":3}, [XY], classname=f"data-point {classname}")
+
+    def bbox(self, canvas):
+        (x, y) = self.points[0]
+        (rx, ry) = (3*canvas.xScaleFactor, 3*canvas.yScaleFactor)
+        return (x-rx, y-ry, x+rx, y+ry)
+
+    def toSVG(self, canvas):
+        self.attrs["transform"] = scaletransform(self.points[0], canvas.xScaleFactor, canvas.yScaleFactor, canvas.decimals)
+        return super().toSVG(canvas)
+
+class Text(object):
+    '''A (multiline) text, laid out in the same way as dragcanvas.TextObject, or as WrappingTextObject if `wrapwidth` is given.
+    If `scaled` is True, it is drawn on an axes chart at a constant size, like the AxesTextObjects in bryaxes.'''
+    def __init__(self, string, anchorpoint=(0,0), anchorposition=1, fontsize=12, wrapwidth=None, scaled=False):
+        string = str(string)
+        self.lines = string.split("\n") if wrapwidth is None else wraplines(string, wrapwidth, fontsize)
+        self.wrapping = wrapwidth is not None
+        self.anchorPoint = (float(anchorpoint[0]), float(anchorpoint[1]))
+        self.anchorPosition = anchorposition
+        self.fontSize = fontsize
+        self.scaled = scaled
+
+    def _layout(self):
+        (x, y) = self.anchorPoint
+        (fontsize, rowcount, anchorposition) = (self.fontSize, len(self.lines), self.anchorPosition)
+        lineheight = fontsize*1.2
+        horizpos = "end" if anchorposition in [3, 6, 9] else "middle" if anchorposition in [2, 5, 8] else "start"
+        if anchorposition in [1, 2, 3]:
+            yoffset = fontsize
+        elif anchorposition in [4, 5, 6]:
+            yoffset = fontsize*(1-rowcount/2) if self.wrapping else fontsize - lineheight*rowcount/2
+        else:
+            yoffset = fontsize*(1-rowcount) if self.wrapping else fontsize - lineheight*rowcount
+        return (x, y+yoffset, lineheight, horizpos)
+
+    def _scale(self, canvas):
+        return (canvas.xScaleFactor, -canvas.yScaleFactor) if self.scaled else (1, 1)
+
+    def bbox(self, canvas):
+        (x, y, lineheight, horizpos) = self._layout()
+        (left, top, right, bottom) = textextent(self.lines, x, y, self.fontSize, lineheight, horizpos)
+        (ax, ay), (sx, sy) = self.anchorPoint, self._scale(canvas)
+        (x1, x2) = (ax+(left-ax)*sx, ax+(right-ax)*sx)
+        (y1, y2) = (ay+(top-ay)*sy, ay+(bottom-ay)*sy)
+        return (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+
+    def toSVG(self, canvas):
+        (x, y, lineheight, horizpos) = self._layout()
+        decimals = scaleddecimals(canvas.decimals) if self.scaled else canvas.decimals
+        attrs = {"x":x, "y":y, "font-size":self.fontSize, "text-anchor":horizpos}
+        if self.scaled:
+            attrs["transform"] = scaletransform(self.anchorPoint, canvas.xScaleFactor, canvas.yScaleFactor, decimals)
+        tspans = "".join(f'<tspan x="{formatcoord(x, decimals)}" dy="{num(lineheight)}">{escape(line)}</tspan>' for line in self.lines[1:])
+        return f"<text {attrstring(attrs, None, decimals)}>{escape(self.lines[0])}{tspans}</text>"
+
+class SVGCanvas(object):
+    '''Base class for the headless charts. `width` and `height` are in pixels.
+    Use `chart.toSVG()` to get the chart as a string, or `chart.save(filename)` to write it to a file.
+    As in dragcanvas.CanvasObject, coordinates are written to `chart.decimals` places, which is set from the scale by `setViewBox`
+    (or to `chart.precision` if this is set), and objects which share a style are given CSS classes (see `setClassStyles`).
+    The style rules are scoped to `chart.id`, which by default is made from a hash of the chart, so that charts can share a page.'''
+    precision = None #The number of decimal places for coordinates, or None to derive this from the scale
+
+    def __init__(self, width=800, height=600):
+        self.width = width
+        self.height = height
+        self.objects = []
+        self.viewBox = (0, 0, width, height)
+        self.xScaleFactor = self.yScaleFactor = 1
+        self.decimals = None
+        self.preserveAspectRatio = "xMidYMid meet"
+        self.lineWidthScaling = True
+        self.classStyles = {}
+        self.id = None
+
+    def addObject(self, obj):
+        self.objects.append(obj)
+
+    def addObjects(self, objectlist):
+        for obj in objectlist:
+            if isinstance(obj, (list, tuple)):
+                self.addObjects(obj)
+            else:
+                self.addObject(obj)
+
+    def setViewBox(self, pointlist):
+        ((x1, y1), (x2, y2)) = pointlist
+        self.viewBox = (x1, y1, x2-x1, y2-y1)
+        self.xScaleFactor, self.yScaleFactor = (x2-x1)/self.width, (y2-y1)/self.height
+        self.decimals = coorddecimals(self.xScaleFactor, self.yScaleFactor, self.precision)
+        return [(x1, y1), (x2, y2)]
+
+    def setClassStyles(self, styles):
+        '''Sets the style of each class of objects in `styles`, a dict of {classname: {property: value, ...}}, as for
+        dragcanvas.CanvasObject.setClassStyles. The rules are written in a <style> element by `toSVG`.'''
+        self.classStyles.update(styles)
+
+    def _styleSheet(self, chartid):
+        scope = "#" + cssidentifier(chartid)
+        rules = [] if self.lineWidthScaling else [f"{scope} * {{vector-effect:non-scaling-stroke}}"]
+        for (classname, style) in self.classStyles.items():
+            properties = ";".join(f"{key}:{value}" for (key, value) in style.items())
+            rules.append(f"{scope} .{classname} {{{properties}}}")
+        return "<style>" + "\n".join(rules) + "</style>"
+
+    def _svgbbox(self, obj):
+        return obj.bbox(self)
+
+    def getBBox(self):
+        bboxes = [self._svgbbox(obj) for obj in self.objects]
+        if not bboxes: return None
+        return (min(b[0] for b in bboxes), min(b[1] for b in bboxes), max(b[2] for b in bboxes), max(b[3] for b in bboxes))
+
+    def fitContents(self):
+        bbox = self.getBBox()
+        if not bbox: return
+        (x1, y1, x2, y2) = bbox
+        if x2 == x1 or y2 == y1: return
+        wmargin, hmargin = (x2-x1)/50, (y2-y1)/50
+        return self.setViewBox(((x1-wmargin, y1-hmargin), (x2+wmargin, y2+hmargin)))
+
+    def _body(self):
+        return "".join(obj.toSVG(self) for obj in self.objects)
+
+    def toSVG(self):
+        self.decimals = coorddecimals(self.xScaleFactor, self.yScaleFactor, self.precision) #In case the precision has been set since
+        body = self._body()
+        viewbox = " ".join(num(x) for x in self.viewBox)
+        idattr = stylesheet = ""
+        if self.classStyles or not self.lineWidthScaling:
+            chartid = self.id or "chart-" + md5(body.encode("utf-8")).hexdigest()[:8]
+            (idattr, stylesheet) = (f'id="{escape(chartid)}" ', self._styleSheet(chartid))
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" {idattr}width="{self.width}" height="{self.height}" viewBox="{viewbox}" '
+                f'preserveAspectRatio="{self.preserveAspectRatio}" font-family="sans-serif">{stylesheet}{body}</svg>')
+
+    def save(self, filename):
+        with open(filename, "w", encoding="utf-8") as outfile:
+            outfile.write(self.toSVG())
+
+class AxesCanvas(SVGCanvas):
+    '''Headless equivalent of bryaxes.AxesCanvas. Objects are given in data coordinates (y upwards).'''
+    def __init__(self, width, height, xAxis=None, yAxis=None, title=None):
+        super().__init__(width, height)
+        self.preserveAspectRatio = "none"
+        self.lineWidthScaling = False
+        self.setClassStyles(AXESSTYLES)
+        self.title = title
+        self.bestFit = None
+        self.drawAxes(xAxis, yAxis)
+
+    def _svgbbox(self, obj):
+        (x1, y1, x2, y2) = obj.bbox(self)
+        return (x1, -y2, x2, -y1)
+
+    def _body(self):
+        return f'<g transform="scale(1,-1)">{super()._body()}</g>'
+
+    def fitContents(self):
+        if self.bestFit:
+            self.setViewBox(self.bestFit)
+            return self.bestFit
+        super().fitContents() #The sizes of texts and points depend on the scale, so fit a second time after rescaling
+        return super().fitContents()
+
+    def drawAxes(self, xAxis, yAxis):
+        xmin, xmax, ymin, ymax = float(xAxis.min), float(xAxis.max), float(yAxis.min), float(yAxis.max)
+        if xmax <= xmin or ymax <= ymin: return
+        self.setViewBox([(xmin, -ymax), (xmax, -ymin)])
+        (xAxis.direction, yAxis.direction) = ("x", "y")
+        xAxis.tickLength = yAxis.arrowLength = 0.75*xAxis.fontSize*self.yScaleFactor
+        yAxis.tickLength = xAxis.arrowLength = 0.75*yAxis.fontSize*self.xScaleFactor
+        xAxis.position = ymin if ymin > 0 else ymax if ymax < 0 else 0
+        yAxis.position = xmin if xmin > 0 else xmax if xmax < 0 else 0
+        xAxis.omitScale = yAxis.position if yAxis.showAxis and ymin < xAxis.position else None
+        yAxis.omitScale = xAxis.position if xAxis.showAxis and xmin < yAxis.position else None
+        xAxis.gridMin, xAxis.gridMax = ymin, ymax
+        yAxis.gridMin, yAxis.gridMax = xmin, xmax
+
+        for axis in [xAxis, yAxis]:
+            if not axis.showAxis: continue
+            self._drawBasicAxis(axis)
+            tickvalues(axis, float(axis.min), float(axis.min), float(axis.max))
+            if axis.showMinorTicks:
+                self._drawTicks(axis, axis.minorTickValues, axis.tickLength/2)
+            if axis.showMajorTicks:
+                self._drawTicks(axis, axis.majorTickValues, axis.tickLength)
+            if axis.showScale:
+                self._drawScaleValues(axis)
+            if axis.showMinorGrid:
+                self._drawGridLines(axis, axis.minorTickValues, "minor")
+            if axis.showMajorGrid:
+                self._drawGridLines(axis, axis.majorTickValues, "major")
+
+        self.xAxis = xAxis
+        self.yAxis = yAxis
+        if self.title:
+            self.addObject(Text(self.title, ((xmin+xmax)/2, ymax+1.5*yAxis.fontSize*self.yScaleFactor), 8, yAxis.fontSize*1.25, scaled=True))
+        self.fitContents()
+
+    def _drawBasicAxis(self, axis):
+        axismin, axismax, pos = float(axis.min), float(axis.max), axis.position
+        if axis.direction == "x":
+            self.addObjects([Line([(axismin, pos), (axismax, pos)], classname="axis-line"),
+                             Text(axis.label, (axismax, pos-3*axis.tickLength), 3, axis.fontSize, scaled=True)])
+            if axis.showArrow:
+                self.addObjects([Line([(axismax, pos), (axismax-axis.arrowLength, pos-axis.tickLength)], classname="axis-line"),
+                                 Line([(axismax, pos), (axismax-axis.arrowLength, pos+axis.tickLength)], classname="axis-line")])
+        else:
+            self.addObjects([Line([(pos, axismin), (pos, axismax)], classname="axis-line"),
+                             Text(axis.label, (pos, axismax), 7, axis.fontSize, scaled=True)])
+            if axis.showArrow:
+                self.addObjects([Line([(pos, axismax), (pos-axis.tickLength, axismax-axis.arrowLength)], classname="axis-line"),
+                                 Line([(pos, axismax), (pos+axis.tickLength, axismax-axis.arrowLength)], classname="axis-line")])
+
+    def _drawTicks(self, axis, values, ticklength):
+        tickend = axis.position-ticklength
+        segments = [((v, axis.position), (v, tickend)) if axis.direction == "x" else ((axis.position, v), (tickend, v)) for v in values]
+        if segments: self.addObject(Segments(segments, classname="ticks"))
+
+    def _drawGridLines(self, axis, values, gridtype):
+        segments = [((v, axis.gridMin), (v, axis.gridMax)) if axis.direction == "x" else ((axis.gridMin, v), (axis.gridMax, v)) for v in values]
+        if segments: self.addObject(Segments(segments, classname=f"{gridtype}-grid"))
+
+    def _drawScaleValues(self, axis):
+        for (v, scalestring) in scalevalues(axis, axis.min, axis.max):
+            if axis.direction == "x":
+                self.addObject(Text(scalestring, (v, axis.position-axis.tickLength), 2, axis.fontSize, scaled=True))
+            else:
+                self.addObject(Text(scalestring, (axis.position-axis.tickLength, v), 6, axis.fontSize, scaled=True))
+
+    def _drawKey(self, keys, markers, fontsize, keypos, marker="rectangle", step=None):
+        '''Draws a key of `keys`. `markers` are the colours of the rectangles or ellipses, or for the "line" marker,
+        the CSS classes of the series (see `seriesclasses`).'''
+        keywidth = 20*self.xScaleFactor
+        keyheight = fontsize*2*self.yScaleFactor
+        (x, y) = keypos
+        for key, markerstyle in zip(keys, markers):
+            if marker == "line":
+                self.addObjects([Line([(x, y), (x+keywidth, y)], classname=markerstyle), Text(key, (x+keywidth*1.25, y), 4, fontsize, scaled=True)])
+            else:
+                shape = Ellipse if marker == "ellipse" else Rectangle
+                self.addObjects([shape([(x, y), (x+keywidth, y+keyheight/2)], markerstyle), Text(key, (x+keywidth*1.25, y), 7, fontsize, scaled=True)])
+            y += keyheight if step is None else step*keyheight
+
+    def _drawCategoryLabels(self, labels, direction, fontsize):
+        for i, label in enumerate(labels):
+            if direction == "horizontal":
+                self.addObject(Text(label, (-10*self.xScaleFactor, (i+0.6)*BARUNIT), 6, fontsize, wrapwidth=80/self.xScaleFactor, scaled=True))
+            else:
+                self.addObject(Text(label, ((i+0.6)*BARUNIT, 0), 2, fontsize, wrapwidth=0.8*BARUNIT/self.xScaleFactor, scaled=True))
+
+def seriesclasses(canvas, colours, linewidth=2):
+    '''Sets the CSS classes "series-0", "series-1", ... of `canvas` for the lines and data points drawn in each of `colours`,
+    and returns their names (as brycharts.seriesclasses).'''
+    canvas.setClassStyles(seriesstyles(colours, linewidth))
+    return [f"series-{i}" for i in range(len(colours))]
+
+def bars(data, graphtype=None, index=None, key=None, direction="vertical", colour="yellow"):
+    return [Rectangle(pointlist, colour, classname="bar") for (pointlist, tooltiptext) in barrects(data, graphtype, index, key, direction)]
+
+def regressionline(data, colour="black"):
+    points = data.values() if isinstance(data, LabelledPairedData) else data
+    pmcc, gradient, yintercept = regressioninfo(points)
+    x1, x2 = data.xMin, data.xMax
+    return Polyline([(x1, gradient*x1 + yintercept), (x2, gradient*x2 + yintercept)], colour, 2)
+
+def datapoints(data, classname):
+    coordslist = data.values() if isinstance(data, LabelledPairedData) else data
+    return [ScaledPoint((float(x), y), classname) for (x, y) in coordslist]
+
+class PieChart(SVGCanvas):
+    def __init__(self, data, title="", colours=None, usekey=True, fontsize=14, width=800, height=600):
+        super().__init__(width, height)
+        if not colours: colours = DEFAULT_COLOURS
+        if not usekey:
+            D = data.items()
+            n = len(D)
+            L = sorted(D, key = lambda x:x[1])
+            M = []
+            for pair in zip(L[n//2:], L[:n//2]): M.extend(pair)
+            if n%2 == 1: M.append(L[-1])
+            data = LabelledData(M, data.valuesLabel)
+        angles = [0]
+        for percentage in data.percentages:
+            angles.append(angles[-1] + percentage*3.6)
+        self.addObjects([Sector((0,0), 100, angles[i], angles[i+1], colours[i]) for i in range(len(angles)-1)])
+        if usekey:
+            keysize = fontsize*1.25
+            (x, y) = (140, -len(data.labels)*keysize/2)
+            for i, label in enumerate(data.labels):
+                self.addObjects([Rectangle([(x, y), (x+fontsize, y+fontsize)], colours[i]), Text(label, (x+keysize, y+fontsize/2), 4, fontsize)])
+                y += keysize
+            titlepos = (120, -110)
+        else:
+            anchorpositions = [7, 4, 1, 3, 6, 9]
+            for i, label in enumerate(data.labels):
+                anglepos = (angles[i] + angles[i+1]) / 2
+                anchorpoint = (105*sin(anglepos*pi/180), -105*cos(anglepos*pi/180))
+                self.addObject(Text(label, anchorpoint, anchorpositions[int(anglepos//60)], fontsize))
+            titlepos = (0, -130)
+        if title: self.addObject(Text(title, titlepos, 8, fontsize*1.25))
+        self.fitContents()
+
+class BarChart(AxesCanvas):
+    def __init__(self, data, title="", direction="vertical", colour="yellow", fontsize=14, axisoptions={}, width=800, height=600):
+        xaxisoptions = {"showScale":False, "showMajorTicks":False, "showMinorTicks":False, "showMajorGrid":False}
+        xaxis = Axis(0, BARUNIT*len(data), "", xaxisoptions)
+        yaxis = Axis(0, data.maxValue, data.valuesLabel, axisoptions)
+        if direction == "horizontal": xaxis, yaxis = yaxis, xaxis
+        super().__init__(width, height, xAxis=xaxis, yAxis=yaxis, title=title)
+        self.addObjects(bars(data, direction=direction, colour=colour))
+        self._drawCategoryLabels(data.labels, direction, fontsize)
+        self.fitContents()
+
+class StackedBarChart(AxesCanvas):
+    def __init__(self, data, title="", direction="vertical", colours=None, fontsize=14, axisoptions={}, width=800, height=600, graphtype="stacked"):
+        if not colours: colours = DEFAULT_COLOURS
+        xaxisoptions = {"showScale":False, "showMajorTicks":False, "showMinorTicks":False, "showMajorGrid":False}
+        xaxis = Axis(0, BARUNIT*len(data.labels), "", xaxisoptions)
+        yaxis = Axis(0, data.maxSum if graphtype == "stacked" else data.maxValue, data.valuesLabel, axisoptions)
+        if direction == "horizontal": xaxis, yaxis = yaxis, xaxis
+        super().__init__(width, height, xAxis=xaxis, yAxis=yaxis, title=title)
+        for i, key in enumerate(data.keys()):
+            self.addObjects(bars(data, graphtype, i, key, direction, colours[i]))
+        self._drawCategoryLabels(data.labels, direction, fontsize)
+        keypos = (float(self.xAxis.max) + 20*self.xScaleFactor, float(self.yAxis.min) + fontsize*2*self.yScaleFactor)
+        self._drawKey(data.keys(), colours, fontsize, keypos)
+        self.bestFit = self.fitContents()
+
+class GroupedBarChart(StackedBarChart):
+    def __init__(self, data, title="", direction="vertical", colours=None, fontsize=14, axisoptions={}, width=800, height=600):
+        super().__init__(data, title, direction, colours, fontsize, axisoptions, width, height, graphtype="grouped")
+
+class ScatterGraph(AxesCanvas):
+    def __init__(self, data, title="", colour="red", showregressionline=False, fontsize=14, xaxisoptions={}, yaxisoptions={}, width=800, height=600):
+        xaxis = Axis(data.xMin, data.xMax, data.xLabel, xaxisoptions)
+        yaxis = Axis(data.yMin, data.yMax, data.yLabel, yaxisoptions)
+        super().__init__(width, height, xAxis=xaxis, yAxis=yaxis, title=title)
+        if showregressionline: self.addObject(regressionline(data))
+        [classname] = seriesclasses(self, [colour])
+        self.addObjects(datapoints(data, classname))
+
+BasicScatterGraph = ScatterGraph
+
+class MultiScatterGraph(AxesCanvas):
+    def __init__(self, data, title="", colours=None, showregressionlines=False, fontsize=14, xaxisoptions={}, yaxisoptions={}, width=800, height=600):
+        xaxis = Axis(data.xMin, data.xMax, data.xLabel, xaxisoptions)
+        yaxis = Axis(data.yMin, data.yMax, data.yLabel, yaxisoptions)
+        super().__init__(width, height, xAxis=xaxis, yAxis=yaxis, title=title)
+        if not colours: colours = DEFAULT_COLOURS
+        if showregressionlines==True: showregressionlines = [True]*len(data)
+        if showregressionlines==False: showregressionlines = [False]*len(data)
+        classnames = seriesclasses(self, colours[:len(data)])
+        for i, dataset in enumerate(data.values()):
+            if showregressionlines[i]: self.addObject(regressionline(dataset, colours[i]))
+            self.addObjects(datapoints(dataset, classnames[i]))
+        keypos = (float(self.xAxis.max) + 20*self.xScaleFactor, float(self.yAxis.min) + fontsize*2*self.yScaleFactor)
+        self._drawKey(data.keys(), colours, fontsize, keypos, marker="ellipse")
+        self.bestFit = self.fitContents()
+
+class LineGraph(AxesCanvas):
+    def __init__(self, data, title="", colours=None, fontsize=14, xaxisoptions={}, yaxisoptions={}, width=800, height=600):
+        xaxisoptions = dict(xaxisoptions, axisType="time" if isinstance(data, (TimeSeriesData, TimeSeriesDataDict)) else "float")
+        xaxis = Axis(data.xMin, data.xMax, data.xLabel, xaxisoptions)
+        yaxis = Axis(data.yMin, data.yMax, data.yLabel, yaxisoptions)
+        super().__init__(width, height, xAxis=xaxis, yAxis=yaxis, title=title)
+        if not colours: colours = DEFAULT_COLOURS
+        if isinstance(data, PairedData):
+            self.addObject(Polyline([(float(x), y) for (x, y) in data], colours[0]))
+        else:
+            keydata = []
+            classnames = seriesclasses(self, colours[:len(data)])
+            for i, (key, pd) in enumerate(data.items()):
+                coordslist = [(float(x), y) for (x, y) in pd]
+                self.addObject(Polyline(coordslist, classname=classnames[i]))
+                self.addObjects([ScaledPoint(coords, classnames[i]) for coords in coordslist])
+                keydata.append((coordslist[-1][1], key, classnames[i]))
+            keydata.sort(key = lambda x: -x[0])
+            keypos = (float(self.xAxis.max) + 20*self.xScaleFactor, float(self.yAxis.max))
+            self._drawKey([key for (_, key, _) in keydata], [classname for (_, _, classname) in keydata], fontsize, keypos, marker="line", step=-1)
+            self.bestFit = self.fitContents()
+
+class BoxPlotCanvas(AxesCanvas):
+    def __init__(self, data, title="", colour="yellow", fontsize=14, axisoptions={}, width=800, height=600):
+        if isinstance(data, BoxPlotData): data = BoxPlotDataDict(data.valuesLabel, {"":data})
+        xaxis = Axis(data.xMin, data.xMax, data.valuesLabel, axisoptions)
+        yaxis = Axis(0, 50*len(data), "", {"showAxis":False})
+        super().__init__(width, height, xAxis=xaxis, yAxis=yaxis, title=title)
+        self.fitContents()
+        yheight = 25
+        for label, (xmin, Q1, Q2, Q3, xmax) in data.items():
+            self.addObjects([Line([(xmin, yheight-5), (xmin, yheight+5)]), Line([(xmin, yheight), (Q1, yheight)]),
+                             Rectangle([(Q1, yheight-15), (Q2, yheight+15)], colour), Rectangle([(Q2, yheight-15), (Q3, yheight+15)], colour),
+                             Line([(Q3, yheight), (xmax, yheight)]), Line([(xmax, yheight-5), (xmax, yheight+5)])])
+            if label: self.addObject(Text(label, (xaxis.min-10*self.xScaleFactor, yheight), 6, fontsize, wrapwidth=100/self.xScaleFactor, scaled=True))
+            yheight += 50
+        self.bestFit = self.fitContents()
+
+class Histogram(AxesCanvas):
+    def __init__(self, data, title="", shownormalcurve=False, colour="yellow", fontsize=14, xaxisoptions={}, yaxisoptions={}, width=800, height=600):
+        xaxis = Axis(data.xMin, data.xMax, data.valuesLabel, xaxisoptions)
+        yaxis = Axis(0, data.maxFrequencyDensity, "Frequency density", yaxisoptions)
+        super().__init__(width, height, xAxis=xaxis, yAxis=yaxis, title=title)
+        self.addObjects([Rectangle(pointlist, colour, classname="bar") for (pointlist, tooltiptext) in histogramrects(data)])
+        if shownormalcurve:
+            (points, m, v) = normalcurve(data)
+            self.addObject(Polyline(points, linewidth=2))
+
+class CumulativeFrequencyGraph(AxesCanvas):
+    def __init__(self, data, title="", colours=None, fontsize=14, xaxisoptions={}, yaxisoptions={}, width=800, height=600, percentages=False):
+        if isinstance(data, CumulativeFrequencyData): data = CumulativeFrequencyDataDict(data.valuesLabel, {"":data})
+        xaxis = Axis(data.xMin, data.xMax, data.valuesLabel, xaxisoptions)
+        if percentages:
+            yaxis = Axis(0, 100, "Cumulative percentage", yaxisoptions)
+        else:
+            yaxis = Axis(0, data.maxTotalFrequency, "Cumulative frequency", yaxisoptions)
+        super().__init__(width, height, xAxis=xaxis, yAxis=yaxis, title=title)
+        if not colours: colours = DEFAULT_COLOURS
+        classnames = seriesclasses(self, colours[:len(data)])
+        for i, cfd in enumerate(data.values()):
+            points = [(x, 100*y/cfd.totalFrequency) for (x, y) in cfd] if percentages else list(cfd)
+            self.addObject(Polyline(points, classname=classnames[i]))
+        if len(data) > 1:
+            keypos = (float(self.xAxis.max) + 20*self.xScaleFactor, float(self.yAxis.max))
+            self._drawKey(data.keys(), classnames, fontsize, keypos, marker="line", step=-1)
+            self.bestFit = self.fitContents()
+
+class CumulativePercentageGraph(CumulativeFrequencyGraph):
+    def __init__(self, data, title="", colours=None, fontsize=14, xaxisoptions={}, yaxisoptions={}, width=800, height=600):
+        super().__init__(data, title, colours, fontsize, xaxisoptions, yaxisoptions, width, height, percentages=True)
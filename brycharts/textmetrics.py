@@ -0,0 +1,68 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 1997-2021 Andy Lewis                                          #
+# --------------------------------------------------------------------------- #
+# For details, see the LICENSE file in this repository                        #
+
+#Text sizes, so that labels and tooltips can be laid out without measuring them in the DOM.
+#Widths are cached per (font-family, font-size, string). In the browser, dragcanvas sets a measurer which measures
+#uncached strings in a batch with a canvas 2D context (which does not force a layout); otherwise they are estimated.
+#This module does not use the browser, so it can also be used with the headless renderer in svgrender.
+
+CHARWIDTHS = {c:width for (chars, width) in [(" .,:;'!|ijl", 0.28), ("()[]{}/\\-frtI", 0.33),
+    ("0123456789$#?_abcdeghknopqsuvxyz", 0.56), ("ABCDEFGHJKLNOPQRSTUVXYZ&", 0.67), ("mwMW%@", 0.86)] for c in chars}
+widthcache = {} #(fontfamily, fontsize): {string: width}
+measurer = None
+
+def setmeasurer(function):
+    '''Sets the function used to measure strings: `function(strings, fontsize, fontfamily)` must return a list of their widths.'''
+    global measurer
+    measurer = function
+    widthcache.clear()
+
+def estimatewidths(strings, fontsize=12, fontfamily="sans-serif"):
+    '''Estimated widths of `strings` in a sans-serif font.'''
+    return [sum(CHARWIDTHS.get(c, 0.56) for c in string)*fontsize for string in strings]
+
+def textwidths(strings, fontsize=12, fontfamily="sans-serif"):
+    '''Widths of all the `strings`. Those which are not already cached are measured together in one batch.'''
+    cache = widthcache.setdefault((fontfamily, fontsize), {})
+    missing = list({string for string in strings if string not in cache})
+    if missing: cache.update(zip(missing, (measurer or estimatewidths)(missing, fontsize, fontfamily)))
+    return [cache[string] for string in strings]
+
+def textwidth(string, fontsize=12, fontfamily="sans-serif"):
+    '''Width of a single string.'''
+    try:
+        return widthcache[(fontfamily, fontsize)][string]
+    except KeyError:
+        return textwidths([string], fontsize, fontfamily)[0]
+
+def measurewords(strings, fontsize=12, fontfamily="sans-serif"):
+    '''Measures (and caches) all the words in `strings` in one batch, so that they can then be wrapped without further measuring.'''
+    textwidths([word for string in strings for word in string.split()]+[" "], fontsize, fontfamily)
+
+def wraplines(string, width, fontsize=12, fontfamily="sans-serif"):
+    '''Splits `string` at word boundaries into lines no wider than `width` (as far as possible), adding up the widths of the words.'''
+    words = string.split()
+    if not words: return [""]
+    widths = textwidths(words+[" "], fontsize, fontfamily)
+    spacewidth = widths.pop()
+    lines = [words[0]]
+    linewidth = widths[0]
+    for (word, wordwidth) in zip(words[1:], widths[1:]):
+        if linewidth+spacewidth+wordwidth > width:
+            lines.append(word)
+            linewidth = wordwidth
+        else:
+            lines[-1] += " "+word
+            linewidth += spacewidth+wordwidth
+    return lines
+
+def textextent(lines, x, y, fontsize=12, lineheight=None, textanchor="start", fontfamily="sans-serif"):
+    '''The (x1, y1, x2, y2) box around `lines` of text whose first baseline starts at (x, y), as getBBox would give it (approximately).'''
+    if lineheight is None: lineheight = fontsize*1.2
+    width = max(textwidths(lines, fontsize, fontfamily))
+    left = x-width if textanchor == "end" else x-width/2 if textanchor == "middle" else x
+    return (left, y-0.9*fontsize, left+width, y+(len(lines)-1)*lineheight+0.25*fontsize)
@@ -104,6 +104,10 @@ def gettimescaleintervals(tc1, tc2, mindivs=5):
 
     return TimeInterval(scaleinterval, unitindex), majordivisor, minordivisor
 
+def floattotime(x, timeformat=None):
+    '''The `TimeCoord` whose float value is `x`.'''
+    return TimeCoord(datetime.datetime.fromtimestamp(x*TimeCoord.scalefloat+TimeCoord.startfloat), timeformat)
+
 def roundtimedown(tc, scaleinterval):
     i = scaleinterval.unitIndex
     x = tc.unitlist[i]
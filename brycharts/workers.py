@@ -0,0 +1,124 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 1997-2021 Andy Lewis                                          #
+# --------------------------------------------------------------------------- #
+# For details, see the LICENSE file in this repository                        #
+
+#A pool of web workers which prepare the data structures for charts from raw data, so that the page stays responsive
+#while large data sets are summarised. The workers run dataworker.py, which must be included in the page (see there).
+#Example:
+#   pool = brycharts.WorkerPool()
+#   pool.groupedFrequencyData("Height", heights, callback=lambda data: brycharts.Histogram(parent, data, "Heights"))
+
+import json
+from browser import window, worker
+from .datastructures import *
+
+class WorkerPool(object):
+    '''Sends data preparation to `size` web workers (default: one per core). Each method takes the parameters of the
+    corresponding data structure, and calls `callback` with the data structure when it is ready.
+    The data structures with a `rawdatadict` are prepared one data set per task, so that they are summarised in parallel.
+    If a task fails, `onerror` (if given to the method) is called with the error instead of `callback`; otherwise the error
+    is passed to the `onerror` of the pool, or printed.
+    Numeric raw data is sent to the workers as (transferred) Float64Arrays, and other data as JSON.'''
+    def __init__(self, size=None, workerid="brycharts-dataworker", onerror=None):
+        self.size = size or window.navigator.hardwareConcurrency or 2
+        self.onError = onerror
+        self.workers = [] #[worker, number of tasks sent but not finished]
+        self.queue = []
+        self.callbacks = {} #id: ([worker, ...], callback, onerror) for the tasks sent to the workers
+        self.nextid = 0
+        for i in range(self.size):
+            worker.create_worker(workerid, self._onready, self._onmessage, self._onerror)
+
+    def frequencyData(self, rawdata, valueslabel="Frequency", callback=None, onerror=None):
+        self._submit("frequencies", rawdata, [], lambda result: callback(FrequencyData(data=[tuple(item) for item in result], valueslabel=valueslabel)), onerror)
+
+    def frequencyDataDict(self, rawdatadict, valueslabel="Frequency", callback=None, onerror=None):
+        self._gather("frequencies", rawdatadict, [],
+                     lambda results: callback(FrequencyDataDict(datadict={key:[tuple(item) for item in result] for (key, result) in results.items()}, valueslabel=valueslabel)), onerror)
+
+    def groupedFrequencyData(self, valueslabel, rawdata, boundaries=None, classwidth=None, callback=None, onerror=None):
+        self._submit("groupedfrequencies", rawdata, [boundaries, classwidth], lambda result: callback(GroupedFrequencyData(valueslabel, data=[tuple(item) for item in result])), onerror)
+
+    def groupedFrequencyDataDict(self, valueslabel, rawdatadict, boundaries=None, classwidth=None, callback=None, onerror=None):
+        self._gather("groupedfrequencies", rawdatadict, [boundaries, classwidth],
+                     lambda results: callback(GroupedFrequencyDataDict(valueslabel, datadict={key:[tuple(item) for item in result] for (key, result) in results.items()})), onerror)
+
+    def boxPlotData(self, valueslabel, rawdata, callback=None, onerror=None):
+        self._submit("boxplot", rawdata, [], lambda result: callback(BoxPlotData(valueslabel, boxplotdata=result)), onerror)
+
+    def boxPlotDataDict(self, valueslabel, rawdatadict, callback=None, onerror=None):
+        self._gather("boxplot", rawdatadict, [], lambda results: callback(BoxPlotDataDict(valueslabel, boxplotdatadict=results)), onerror)
+
+    def regressionInfo(self, points, callback=None, onerror=None):
+        '''Calls `callback(pmcc, gradient, yintercept)` for the list of (x, y) `points`.'''
+        self._submit("regression", [v for point in points for v in point], [], lambda result: callback(*result), onerror)
+
+    def polylineGeometry(self, coordslist, callback=None, decimals=None, onerror=None):
+        '''Calls `callback` with the `points` attribute and extent of a polyline through `coordslist` (see `geometry.polylinegeometry`),
+        with the coordinates rounded to `decimals` places (eg `canvas.decimals`).'''
+        self._submit("polyline", [v for coords in coordslist for v in coords], [decimals], callback, onerror)
+
+    def _gather(self, task, rawdatadict, args, callback, onerror=None):
+        '''Submits a task for each data set in `rawdatadict`, and calls `callback` with all the results, or `onerror` once
+        with the first error.'''
+        if not rawdatadict:
+            callback({})
+            return
+        results = {}
+        failed = []
+        def collect(key):
+            def oncomplete(result):
+                results[key] = result
+                if len(results) == len(rawdatadict): callback({key:results[key] for key in rawdatadict})
+            return oncomplete
+        def onfail(error):
+            if failed: return
+            failed.append(error)
+            if onerror:
+                onerror(error)
+            else:
+                self._onerror(error)
+        for (key, rawdata) in rawdatadict.items():
+            self._submit(task, rawdata, args, collect(key), onfail)
+
+    def _submit(self, task, rawdata, args, callback, onerror=None):
+        message = {"id":self.nextid, "task":task, "args":json.dumps(args), "column":None, "values":None}
+        if task != "frequencies" or all(isinstance(x, (int, float)) for x in rawdata[:100]):
+            message["column"] = window.Float64Array.new(rawdata)
+        else:
+            message["values"] = json.dumps(list(rawdata))
+        self.nextid += 1
+        self.queue.append((message, callback, onerror))
+        self._dispatch()
+
+    def _dispatch(self):
+        while self.queue and self.workers:
+            entry = min(self.workers, key=lambda entry: entry[1])
+            (message, callback, onerror) = self.queue.pop(0)
+            entry[0].send(message, [message["column"].buffer] if message["column"] is not None else [])
+            entry[1] += 1
+            self.callbacks[message["id"]] = (entry, callback, onerror)
+
+    def _onready(self, newworker):
+        self.workers.append([newworker, 0])
+        self._dispatch()
+
+    def _onmessage(self, event):
+        reply = json.loads(event.data)
+        (entry, callback, onerror) = self.callbacks.pop(reply["id"])
+        entry[1] -= 1
+        if "error" in reply and onerror:
+            onerror(reply["error"])
+        elif "error" in reply:
+            self._onerror(reply["error"])
+        else:
+            callback(reply["result"])
+
+    def _onerror(self, error):
+        if self.onError:
+            self.onError(error)
+        else:
+            print("brycharts worker error:", error)
@@ -0,0 +1,103 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 1997-2021 Andy Lewis                                          #
+# --------------------------------------------------------------------------- #
+# For details, see the LICENSE file in this repository                        #
+
+#Builds brycharts.brython.js, the bundle which pages load instead of fetching each module separately. Usage:
+#   python makepackage.py [-o OUTPUT]
+#The modules are stored in Brython's VFS format, with comments and docstrings removed and one space per indentation level,
+#so that there is less to download and parse. Line numbers are preserved, so tracebacks still refer to the source.
+#Brython only compiles a module when it is first imported, so modules such as dragtools which are imported lazily cost nothing at startup.
+#Modules which only run in CPython (the headless renderer) or in a web worker are left out.
+
+import os, io, ast, json, time, tokenize, argparse
+
+PACKAGE = "brycharts"
+EXCLUDED = {"render.py", "svgrender.py", "dataworker.py"}
+HEADER = "__BRYTHON__.use_VFS = true;\nvar scripts = "
+FOOTER = "\n__BRYTHON__.update_VFS(scripts)\n"
+
+def minify(source):
+    '''Returns `source` without comments or docstrings (or other bare strings), and with one space per indentation level.'''
+    lines = source.splitlines(keepends=True)
+    tokens = [token for token in tokenize.generate_tokens(io.StringIO(source).readline)]
+    significant = [token for token in tokens if token.type not in (tokenize.NL, tokenize.COMMENT)]
+    removed = [] #(start, end, replacement) spans
+    for token in tokens:
+        if token.type == tokenize.COMMENT: removed.append((token.start, token.end, ""))
+    for i, token in enumerate(significant):
+        if token.type != tokenize.STRING: continue
+        previous = significant[i-1].type if i > 0 else tokenize.NEWLINE
+        following = significant[i+1].type if i+1 < len(significant) else tokenize.ENDMARKER
+        if previous not in (tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT, tokenize.ENCODING) or following != tokenize.NEWLINE: continue
+        after = significant[i+2].type if i+2 < len(significant) else tokenize.ENDMARKER
+        emptyblock = previous == tokenize.INDENT and after in (tokenize.DEDENT, tokenize.ENDMARKER)
+        removed.append((token.start, token.end, "pass" if emptyblock else ""))
+
+    #Rows which start a logical line are re-indented, and continuation lines lose their indentation,
+    #but rows inside a multiline string are left alone
+    (indents, level, starts, instring) = ({}, 0, set(), set())
+    atstart = True
+    for token in tokens:
+        if token.type == tokenize.INDENT: level += 1
+        elif token.type == tokenize.DEDENT: level -= 1
+        elif token.type in (tokenize.NEWLINE, tokenize.NL): atstart = token.type == tokenize.NEWLINE or atstart
+        elif token.type not in (tokenize.COMMENT, tokenize.ENCODING, tokenize.ENDMARKER):
+            if atstart: indents[token.start[0]] = level
+            starts.add(token.start[0])
+            instring.update(range(token.start[0]+1, token.end[0]+1))
+            atstart = False
+
+    for ((row1, col1), (row2, col2), replacement) in sorted(removed, reverse=True):
+        (first, last) = (lines[row1-1], lines[row2-1])
+        lines[row1-1:row2] = [first[:col1] + replacement + last[col2:]] + ["\n"]*(row2-row1)
+    output = []
+    for (row, line) in enumerate(lines, 1):
+        if row not in instring:
+            line = line.rstrip()
+            if line.strip() == "": line = ""
+            elif row in indents: line = " "*indents[row] + line.lstrip()
+            elif row in starts: line = line.lstrip()
+            line += "\n"
+        output.append(line)
+    return "".join(output)
+
+def imports(source, modulename, ispackage):
+    '''The names of the modules imported by `source`, with relative imports resolved (as in Brython's own packages).'''
+    packageparts = modulename.split(".") if ispackage else modulename.split(".")[:-1]
+    names = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level == 0:
+                names.add(node.module)
+            else:
+                base = packageparts[:len(packageparts)-node.level+1]
+                names.add(".".join(base + ([node.module] if node.module else [])))
+    return sorted(names - {modulename})
+
+def makepackage(directory, output):
+    scripts = {"$timestamp": int(time.time()*1000)}
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".py") or filename in EXCLUDED: continue
+        with open(os.path.join(directory, filename), encoding="utf-8") as f: source = f.read()
+        ispackage = filename == "__init__.py"
+        modulename = PACKAGE if ispackage else f"{PACKAGE}.{filename[:-3]}"
+        entry = [".py", minify(source), imports(source, modulename, ispackage)]
+        if ispackage: entry.append(1)
+        scripts[modulename] = entry
+        compile(entry[1], filename, "exec") #Check that the minified module is still valid Python
+    with open(output, "w", encoding="utf-8") as f: f.write(HEADER + json.dumps(scripts) + FOOTER)
+    return scripts
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build brycharts.brython.js")
+    parser.add_argument("-o", "--output", default="brycharts.brython.js")
+    args = parser.parse_args()
+    here = os.path.dirname(os.path.abspath(__file__))
+    scripts = makepackage(os.path.join(here, PACKAGE), args.output)
+    size = os.path.getsize(args.output)
+    print(f"{args.output}: {len(scripts)-1} modules, {size//1024} KB")